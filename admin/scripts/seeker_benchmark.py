@@ -0,0 +1,501 @@
+"""
+Benchmarks the file seekers against the real device path lists.
+
+This script builds synthetic extractions from the path inventories stored in
+admin/data/filepath-lists (one CSV per device, zipped): a file system folder,
+a tar archive, a zip archive and an iTunes backup (Manifest.db and hashed
+files) holding an empty or sized placeholder file for each path of the list.
+
+Each seeker (FileSeekerDir, FileSeekerTar, FileSeekerZip, FileSeekerItunes) is
+then run the way ileapp.py runs it, with the search patterns of all the
+artifact modules, and the time spent in each phase is measured:
+- listing: creation of the seeker (file listing and path index),
+- prefetch: resolution of all the search patterns in one go,
+- pre_extract: extraction of the matched files ahead of the searches
+  (only with --pre-extract),
+- search: the search() calls of all the modules, in plugin order, which
+  extract the matched files unless they were pre-extracted.
+
+The results are written to a JSON report. When a previous report is given
+with --baseline, the phases that got slower than the threshold are listed and
+the script exits with an error code, to catch regressions in pattern-matching
+or extraction cost.
+
+Usage:
+    python admin/scripts/seeker_benchmark.py [--limit N] [--size BYTES] [--seekers fs tar zip itunes]
+                                             [--lists NAME ...] [--repeat N] [--pre-extract]
+                                             [--output PATH] [--baseline PATH] [--threshold RATIO]
+"""
+import os
+import csv
+import sys
+import glob
+import json
+import sqlite3
+import hashlib
+import plistlib
+import platform
+import tarfile
+import zipfile
+import argparse
+import tempfile
+from io import BytesIO, TextIOWrapper
+from time import perf_counter, strftime, gmtime
+from shutil import rmtree
+
+# Add the root directory to Python path
+root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root_dir)
+
+# pylint: disable=wrong-import-position
+import scripts.plugin_loader as plugin_loader
+from scripts.search_files import domains, FileSeekerDir, FileSeekerTar, FileSeekerZip, FileSeekerItunes
+from scripts.version_info import leapp_version
+# pylint: enable=wrong-import-position
+
+# Define paths
+FILEPATH_LISTS_DIR = os.path.join(root_dir, 'admin', 'data', 'filepath-lists')
+JSON_OUTPUT_FILE = os.path.join(root_dir, 'admin', 'data', 'generated', 'seeker_benchmark.json')
+
+SEEKER_TYPES = ('fs', 'tar', 'zip', 'itunes')
+PHASES = ('listing', 'prefetch', 'pre_extract', 'search')
+SLOWEST_PATTERNS = 10
+# Roots under which path lists store the data partition (/private/var), e.g. the
+# second file system of the extractions listing the partitions separately
+DATA_PARTITION_ROOTS = ('filesystem2/',)
+
+
+def read_path_list(zip_file, limit=None):
+    """
+    Read the paths of a device path list.
+
+    Paths are made relative, paths with '..' components are dropped and
+    paths which are also the parent folder of other paths are kept as
+    folders only, so that every path can be created as a file.
+
+    Args:
+        zip_file (str): The path to the zipped CSV path list.
+        limit (int): The maximum number of paths to read, all if None.
+
+    Returns:
+        dict: A dict mapping each file path to its modification time.
+    """
+    paths = {}
+    with zipfile.ZipFile(zip_file, 'r') as zf:
+        csv_files = [f for f in zf.namelist() if f.endswith('.csv') and not os.path.basename(f).startswith('.')]
+        for csv_file in csv_files:
+            with zf.open(csv_file) as file:
+                reader = csv.reader(TextIOWrapper(file, encoding='utf-8', errors='replace', newline=''))
+                next(reader, None)  # Skip header
+                for row in reader:
+                    if limit is not None and len(paths) >= limit:
+                        break
+                    if not row:
+                        continue
+                    path = row[0].replace('\\', '/').strip('/')
+                    components = path.split('/')
+                    if not path or '..' in components or '.' in components or '' in components:
+                        continue
+                    modified = row[1] if len(row) > 1 else ''
+                    paths[path] = int(modified) if modified.isdigit() else 0
+
+    folders = set()
+    for path in paths:
+        parent = path.rpartition('/')[0]
+        while parent and parent not in folders:
+            folders.add(parent)
+            parent = parent.rpartition('/')[0]
+    return {path: modified for path, modified in paths.items() if path not in folders}
+
+
+def build_folder(paths, folder, content):
+    """
+    Create a placeholder file for each path under a folder.
+
+    Args:
+        paths (dict): A dict mapping each file path to its modification time.
+        folder (str): The folder in which the files are created.
+        content (bytes): The content of each placeholder file.
+    """
+    for path, modified in paths.items():
+        file_path = os.path.join(folder, path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as file:
+            file.write(content)
+        if modified:
+            os.utime(file_path, (modified, modified))
+
+
+def build_tar(paths, tar_path, content):
+    """
+    Create a tar archive holding a placeholder file for each path.
+
+    Args:
+        paths (dict): A dict mapping each file path to its modification time.
+        tar_path (str): The path of the tar archive, gzipped if it ends with gz.
+        content (bytes): The content of each placeholder file.
+    """
+    with tarfile.open(tar_path, 'w:gz' if tar_path.endswith('gz') else 'w') as tar:
+        for path, modified in paths.items():
+            member = tarfile.TarInfo(path)
+            member.size = len(content)
+            member.mtime = modified
+            tar.addfile(member, BytesIO(content))
+
+
+def build_zip(paths, zip_path, content):
+    """
+    Create a zip archive holding a placeholder file for each path.
+
+    Args:
+        paths (dict): A dict mapping each file path to its modification time.
+        zip_path (str): The path of the zip archive.
+        content (bytes): The content of each placeholder file.
+    """
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zf:
+        for path, modified in paths.items():
+            date_time = gmtime(max(modified, 315532800))[:6]  # zip dates start in 1980
+            zf.writestr(zipfile.ZipInfo(path, date_time), content)
+
+
+def get_backup_domain(path, domain_roots):
+    """
+    Find the iTunes backup domain and relative path of a file system path.
+
+    Args:
+        path (str): The file system path, with or without a prefix before 'private/var/',
+                    or under one of DATA_PARTITION_ROOTS.
+        domain_roots (list): (root path, domain) tuples, longest root paths first.
+
+    Returns:
+        tuple: The domain and the path relative to its root, or None if the
+               path is not part of a backup.
+    """
+    position = path.find('private/var/')
+    if position >= 0:
+        path = path[position:]
+    else:
+        data_root = next((root for root in DATA_PARTITION_ROOTS if path.startswith(root)), None)
+        if data_root is None:
+            return None
+        path = 'private/var/' + path[len(data_root):]
+    for root_path, domain in domain_roots:
+        if path.startswith(root_path + '/'):
+            relative_path = path[len(root_path) + 1:]
+            if domain.endswith('-'):
+                # App domains are named after the container folder
+                container, _, relative_path = relative_path.partition('/')
+                if not relative_path:
+                    return None
+                domain += container
+            return domain, relative_path
+    return None
+
+
+def build_itunes_backup(paths, backup_folder, content):
+    """
+    Create an unencrypted iTunes backup (Manifest.db and hashed files)
+    holding a placeholder file for each path found in a backup domain.
+
+    Args:
+        paths (dict): A dict mapping each file path to its modification time.
+        backup_folder (str): The folder of the backup.
+        content (bytes): The content of each placeholder file.
+
+    Returns:
+        tuple: The number of files in the backup and the number of paths left out,
+               not being part of a backup domain.
+    """
+    domain_roots = {}
+    for domain, root_path in domains.items():
+        domain_roots.setdefault(root_path, domain)
+    domain_roots = sorted(domain_roots.items(), key=lambda item: len(item[0]), reverse=True)
+
+    os.makedirs(backup_folder, exist_ok=True)
+    db = sqlite3.connect(os.path.join(backup_folder, 'Manifest.db'))
+    db.execute('CREATE TABLE Files (fileID TEXT PRIMARY KEY, domain TEXT, relativePath TEXT, flags INTEGER, file BLOB)')
+    rows = {}
+    dropped = 0
+    for path, modified in paths.items():
+        backup_path = get_backup_domain(path, domain_roots)
+        if backup_path is None:
+            dropped += 1
+            continue
+        domain, relative_path = backup_path
+        file_id = hashlib.sha1(f'{domain}-{relative_path}'.encode('utf-8')).hexdigest()
+        metadata = plistlib.dumps({'Birth': modified, 'LastModified': modified, 'Size': len(content)},
+                                  fmt=plistlib.FMT_BINARY)
+        rows[file_id] = (file_id, domain, relative_path, 1, metadata)
+        file_path = os.path.join(backup_folder, file_id[:2], file_id)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as file:
+            file.write(content)
+    db.executemany('INSERT INTO Files VALUES (?, ?, ?, ?, ?)', rows.values())
+    db.commit()
+    db.close()
+    return len(rows), dropped
+
+
+def get_plugin_patterns():
+    """
+    Load the search patterns of all the artifact modules, as ileapp.py does.
+
+    Returns:
+        list: (artifact name, list of patterns) tuples, in plugin loading order.
+    """
+    loader = plugin_loader.PluginLoader()
+    plugin_patterns = []
+    for plugin in loader.plugins:
+        if plugin.search is None:
+            continue
+        patterns = list(plugin.search) if isinstance(plugin.search, (list, tuple)) else [plugin.search]
+        plugin_patterns.append((plugin.name, patterns))
+    return plugin_patterns
+
+
+def create_seeker(seeker_type, input_path, data_folder, all_patterns, pre_extract):
+    """
+    Create a seeker the way ileapp.py does for an extraction type.
+
+    Args:
+        seeker_type (str): One of SEEKER_TYPES.
+        input_path (str): The path to the synthetic extraction.
+        data_folder (str): The folder where the seeker copies or extracts files.
+        all_patterns (list): The search patterns of all the modules.
+        pre_extract (bool): True to stream the tar archive once for all the patterns.
+
+    Returns:
+        FileSeekerBase: The seeker.
+    """
+    if seeker_type == 'fs':
+        return FileSeekerDir(input_path, data_folder)
+    if seeker_type == 'tar':
+        return FileSeekerTar(input_path, data_folder, all_patterns if pre_extract else None)
+    if seeker_type == 'zip':
+        return FileSeekerZip(input_path, data_folder)
+    return FileSeekerItunes(input_path, data_folder, 'db', None)
+
+
+def run_seeker(seeker_type, input_path, data_folder, plugin_patterns, pre_extract):
+    """
+    Run a seeker with the search patterns of all the modules and time each phase.
+
+    Args:
+        seeker_type (str): One of SEEKER_TYPES.
+        input_path (str): The path to the synthetic extraction.
+        data_folder (str): The folder where the seeker copies or extracts files, emptied first.
+        plugin_patterns (list): (artifact name, list of patterns) tuples.
+        pre_extract (bool): True to extract the matched files before the searches.
+
+    Returns:
+        dict: The time of each phase in seconds, the counts of files and the
+              slowest search() calls.
+    """
+    if os.path.exists(data_folder):
+        rmtree(data_folder)
+    os.makedirs(data_folder)
+    all_patterns = [pattern for _, patterns in plugin_patterns for pattern in patterns]
+    timings = dict.fromkeys(PHASES, 0.0)
+
+    start_time = perf_counter()
+    seeker = create_seeker(seeker_type, input_path, data_folder, all_patterns, pre_extract)
+    timings['listing'] = perf_counter() - start_time
+    try:
+        start_time = perf_counter()
+        seeker.prefetch(all_patterns)
+        timings['prefetch'] = perf_counter() - start_time
+
+        if pre_extract:
+            start_time = perf_counter()
+            seeker.pre_extract(all_patterns)
+            timings['pre_extract'] = perf_counter() - start_time
+
+        pattern_times = []
+        files_found = set()
+        patterns_with_hits = 0
+        search_start_time = perf_counter()
+        for artifact_name, patterns in plugin_patterns:
+            for pattern in patterns:
+                start_time = perf_counter()
+                found = seeker.search(pattern)
+                pattern_times.append((perf_counter() - start_time, artifact_name, pattern, len(found)))
+                if found:
+                    patterns_with_hits += 1
+                    files_found.update(found)
+        timings['search'] = perf_counter() - search_start_time
+
+        pattern_times.sort(reverse=True)
+        return {
+            'timings': {phase: round(seconds, 4) for phase, seconds in timings.items()},
+            'total': round(sum(timings.values()), 4),
+            'files_listed': len(seeker.path_index.paths) if seeker.path_index is not None else 0,
+            'files_found': len(files_found),
+            'files_extracted': len(seeker.copied),
+            'patterns': len(pattern_times),
+            'patterns_with_hits': patterns_with_hits,
+            'slowest_searches': [
+                {'artifact': artifact_name, 'pattern': pattern, 'found': found, 'seconds': round(seconds, 4)}
+                for seconds, artifact_name, pattern, found in pattern_times[:SLOWEST_PATTERNS]],
+        }
+    finally:
+        seeker.cleanup()
+
+
+def benchmark_path_list(zip_file, args, plugin_patterns, work_folder):
+    """
+    Build the synthetic extractions of a path list and benchmark each seeker on them.
+
+    Args:
+        zip_file (str): The path to the zipped CSV path list.
+        args (argparse.Namespace): The command-line arguments.
+        plugin_patterns (list): (artifact name, list of patterns) tuples.
+        work_folder (str): The folder in which the extractions are built.
+
+    Returns:
+        dict: The results of the path list, with the results of each seeker.
+    """
+    list_name = os.path.basename(zip_file).replace('.zip', '').replace('.csv', '')
+    paths = read_path_list(zip_file, args.limit)
+    content = b'\x00' * args.size
+    print(f"{list_name}: {len(paths)} files")
+
+    builders = {
+        'fs': ('fs', build_folder),
+        'tar': ('extraction.tar', build_tar),
+        'zip': ('extraction.zip', build_zip),
+        'itunes': ('itunes', build_itunes_backup),
+    }
+    result = {'files': len(paths), 'build_seconds': {}, 'seekers': {}}
+    for seeker_type in args.seekers:
+        input_name, builder = builders[seeker_type]
+        input_path = os.path.join(work_folder, input_name)
+        start_time = perf_counter()
+        built = builder(paths, input_path, content)
+        result['build_seconds'][seeker_type] = round(perf_counter() - start_time, 4)
+        if seeker_type == 'itunes':
+            # the files outside the backup domains are not in the backup, the timings only
+            # compare with the other seekers when few of them are left out
+            result['itunes_files'], result['itunes_paths_dropped'] = built
+            print(f"  itunes: {built[0]} files in the backup, {built[1]} paths outside the backup domains left out")
+
+        runs = []
+        for _ in range(args.repeat):
+            runs.append(run_seeker(seeker_type, input_path, os.path.join(work_folder, 'data'),
+                                   plugin_patterns, args.pre_extract))
+        # Keep the fastest run of each phase, the least disturbed by the rest of the system
+        seeker_result = min(runs, key=lambda run: run['total'])
+        seeker_result['timings'] = {phase: min(run['timings'][phase] for run in runs) for phase in PHASES}
+        seeker_result['total'] = min(run['total'] for run in runs)
+        result['seekers'][seeker_type] = seeker_result
+        print(f"  {seeker_type}: " + ', '.join(
+            f"{phase} {seconds:.3f}s" for phase, seconds in seeker_result['timings'].items()))
+
+        if os.path.isdir(input_path):
+            rmtree(input_path)
+        else:
+            os.remove(input_path)
+    return result
+
+
+def compare_with_baseline(report, baseline_file, threshold):
+    """
+    List the phases slower than in a baseline report by more than a ratio.
+
+    Phases taking less than 10 ms in the baseline are ignored as too noisy.
+
+    Args:
+        report (dict): The current benchmark report.
+        baseline_file (str): The path to the baseline JSON report.
+        threshold (float): The ratio of the current to the baseline time above
+                           which a phase is reported.
+
+    Returns:
+        list: A description of each regression found.
+    """
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for list_name, list_result in report['path_lists'].items():
+        baseline_list = baseline.get('path_lists', {}).get(list_name)
+        if not baseline_list or baseline_list.get('files') != list_result['files']:
+            continue
+        for seeker_type, seeker_result in list_result['seekers'].items():
+            baseline_seeker = baseline_list['seekers'].get(seeker_type)
+            if not baseline_seeker:
+                continue
+            for phase, seconds in seeker_result['timings'].items():
+                baseline_seconds = baseline_seeker['timings'].get(phase, 0)
+                if baseline_seconds >= 0.01 and seconds > baseline_seconds * threshold:
+                    regressions.append(f"{list_name} {seeker_type} {phase}: "
+                                       f"{baseline_seconds:.3f}s -> {seconds:.3f}s")
+    return regressions
+
+
+def main():
+    """
+    Main function to run the benchmark.
+
+    Parses command-line arguments, benchmarks the seekers on each path list,
+    writes the JSON report and compares it with the baseline report, if any.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the file seekers against the device path lists.')
+    parser.add_argument('--limit', type=int, default=None, help='Maximum number of paths read from each list')
+    parser.add_argument('--size', type=int, default=0, help='Size in bytes of each placeholder file (default: 0)')
+    parser.add_argument('--seekers', nargs='+', choices=SEEKER_TYPES, default=list(SEEKER_TYPES),
+                        help='Seekers to benchmark (default: all)')
+    parser.add_argument('--lists', nargs='+', default=None,
+                        help='Names of the path lists to use, e.g. josh-hickman-ios15 (default: all)')
+    parser.add_argument('--repeat', type=int, default=1, help='Number of runs of each seeker, the fastest is kept')
+    parser.add_argument('--pre-extract', action='store_true',
+                        help='Extract the matched files before the searches, as ileapp.py --pre_extract does')
+    parser.add_argument('--workdir', default=None, help='Folder for the synthetic extractions (default: temporary)')
+    parser.add_argument('--output', default=JSON_OUTPUT_FILE, help=f'JSON report path (default: {JSON_OUTPUT_FILE})')
+    parser.add_argument('--baseline', default=None, help='JSON report of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown ratio reported as a regression (default: 1.25)')
+    args = parser.parse_args()
+
+    filepath_zip_files = sorted(glob.glob(os.path.join(FILEPATH_LISTS_DIR, '*.zip')))
+    if args.lists:
+        filepath_zip_files = [zip_file for zip_file in filepath_zip_files
+                              if os.path.basename(zip_file).replace('.zip', '').replace('.csv', '') in args.lists]
+    if not filepath_zip_files:
+        print(f"No path list found in {FILEPATH_LISTS_DIR}")
+        return 1
+
+    plugin_patterns = get_plugin_patterns()
+    print(f"{len(plugin_patterns)} artifacts, {sum(len(patterns) for _, patterns in plugin_patterns)} search patterns\n")
+
+    report = {
+        'date': strftime('%Y-%m-%d %H:%M:%S', gmtime()),
+        'ileapp_version': leapp_version,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'arguments': {'limit': args.limit, 'size': args.size, 'repeat': args.repeat,
+                      'pre_extract': args.pre_extract},
+        'path_lists': {},
+    }
+    with tempfile.TemporaryDirectory(dir=args.workdir) as work_folder:
+        for zip_file in filepath_zip_files:
+            list_name = os.path.basename(zip_file).replace('.zip', '').replace('.csv', '')
+            report['path_lists'][list_name] = benchmark_path_list(zip_file, args, plugin_patterns, work_folder)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(report, args.baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions (slower than {args.threshold}x the baseline):")
+            for regression in regressions:
+                print(f"- {regression}")
+            return 1
+        print("\nNo regression found compared with the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -187,6 +187,9 @@ def process_artifact(zip_path, module_name, artifact_name, artifact_data, target
                                                                mock_seeker,
                                                                mock_wrap_text,
                                                                timezone_offset)
+                # Artifacts yielding their rows run when the rows are read
+                if not isinstance(data_list, (list, tuple)):
+                    data_list = list(data_list)
             finally:
                 Context.clear()
 
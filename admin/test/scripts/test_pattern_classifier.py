@@ -0,0 +1,89 @@
+"""
+Checks that PatternClassifier tags strings like the SQLite LIKE predicates it replaces,
+on randomized strings built from pieces of the patterns, wildcards and non-ASCII letters.
+
+Run from the root of the repository:
+    python -m unittest admin/test/scripts/test_pattern_classifier.py
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from scripts.pattern_classifier import PatternClassifier
+from scripts.artifacts.logarchive import logarchive_artifacts_patterns
+
+wildcard_patterns = {
+    'underscore': ('a_c', 'x__y', '_z'),
+    'percent': ('ab%cd', 'q%', '%r%s'),
+    'mixed': ('k_l%m', 'Ü_ß', 'é%É'),
+    'literal': ('ABC', 'straße', 'İi', '100%', 'snake_case'),
+}
+extra_pieces = ('_', '%', '\\', 'ä', 'Ä', 'é', 'É', 'ß', 'ẞ', 'İ', 'ı', 'K', 'k', 'K', ' ', '\n')
+
+
+def random_string(rng, pieces):
+    parts = []
+    for _ in range(rng.randint(0, 6)):
+        piece = rng.choice(pieces)
+        if len(piece) > 2 and rng.random() < 0.3:
+            # cut, change a character or swap the case of the piece
+            position = rng.randrange(len(piece))
+            choice = rng.random()
+            if choice < 0.3:
+                piece = piece[:position]
+            elif choice < 0.6:
+                piece = piece[:position] + rng.choice(extra_pieces) + piece[position + 1:]
+            else:
+                piece = piece.swapcase()
+        parts.append(piece)
+    return ''.join(parts)
+
+
+class TestPatternClassifier(unittest.TestCase):
+
+    def check_like_equivalence(self, categories, count=5000, seed=0):
+        rng = random.Random(seed)
+        pieces = [pattern for patterns in categories.values() for pattern in patterns]
+        pieces += [pattern.upper() for pattern in pieces] + list(extra_pieces)
+        texts = [random_string(rng, pieces) for _ in range(count)]
+
+        db = sqlite3.connect(':memory:')
+        db.execute('CREATE TABLE texts (text TEXT)')
+        db.execute('CREATE TABLE patterns (category INTEGER, pattern TEXT)')
+        db.executemany('INSERT INTO texts (rowid, text) VALUES (?, ?)', enumerate(texts, 1))
+        db.executemany('INSERT INTO patterns VALUES (?, ?)',
+                       [(index, pattern) for index, patterns in enumerate(categories.values())
+                        for pattern in patterns])
+        expected = [[] for _ in texts]
+        for rowid, category in db.execute('''
+            SELECT DISTINCT texts.rowid, patterns.category FROM texts JOIN patterns
+            ON texts.text LIKE '%' || patterns.pattern || '%'
+            ORDER BY texts.rowid, patterns.category
+            '''):
+            expected[rowid - 1].append(list(categories)[category])
+        db.close()
+
+        classifier = PatternClassifier(categories)
+        for text, categories_found in zip(texts, expected):
+            self.assertEqual(classifier.classify(text), categories_found, repr(text))
+        # the randomized strings must exercise both outcomes
+        self.assertTrue(any(expected))
+        self.assertFalse(all(expected))
+
+    def test_logarchive_patterns(self):
+        self.check_like_equivalence(logarchive_artifacts_patterns)
+
+    def test_wildcards_and_case_folding(self):
+        self.check_like_equivalence(wildcard_patterns)
+
+    def test_empty_string(self):
+        self.assertEqual(PatternClassifier(wildcard_patterns).classify(''), [])
+        self.assertEqual(PatternClassifier(wildcard_patterns).classify(None), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
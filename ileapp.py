@@ -3,15 +3,24 @@
 import json
 import argparse
 import io
+import multiprocessing
 import pytz
 import os.path
 import typing
 import scripts.report as report
 import traceback
+import stat
 import sys
 
+import scripts.artifact_cache as artifact_cache
+import scripts.artifact_profiler as artifact_profiler
+import scripts.cost_model as cost_model
 import scripts.plugin_loader as plugin_loader
+import scripts.write_journal as write_journal
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 from shutil import copy2
 from getpass import getpass
 from scripts.search_files import *
@@ -21,6 +30,10 @@ from time import process_time, gmtime, strftime, perf_counter
 from scripts.lavafuncs import *
 from scripts.context import Context
 
+# loader and seeker of a worker process running artifacts in parallel
+worker_loader = None
+worker_seeker = None
+
 def validate_args(args):
     if args.artifact_paths or args.create_profile_casedata:
         return  # Skip further validation if --artifact_paths is used
@@ -62,6 +75,19 @@ def validate_args(args):
     if args.load_profile and not os.path.exists(args.load_profile):
         raise argparse.ArgumentError(None, 'iLEAPP Profile file not found! Run the program again.')
 
+    if args.jobs < 1:
+        raise argparse.ArgumentError(None, 'The number of JOBS must be at least 1. Run the program again.')
+
+    if args.profile < 0:
+        raise argparse.ArgumentError(None, 'The number of PROFILE artifacts cannot be negative. Run the program again.')
+
+    if args.budget:
+        try:
+            cost_model.parse_duration(args.budget)
+        except ValueError:
+            raise argparse.ArgumentError(None, f'Invalid BUDGET \'{args.budget}\', e.g. 90s, 30m or 1h30m. '
+                                               'Run the program again.')
+
     try:
         timezone = pytz.timezone(args.timezone)
     except pytz.UnknownTimeZoneError:
@@ -181,13 +207,32 @@ def main():
                               "This argument is meant to be used alone, without any other arguments."))
     parser.add_argument('--custom_output_folder', required=False, action="store", help="Custom name for the output folder")
     parser.add_argument('--itunes_password', required=False, action="store", help="Password used for encrypted iTunes backup")
+    parser.add_argument('--pre_extract', required=False, action="store_true",
+                        help=("Copy or extract all the files matched by the selected modules before running them. "
+                              "Recommended for network-attached evidence."))
+    parser.add_argument('-j', '--jobs', required=False, action="store", default=1, type=int,
+                        help=("Number of artifacts to run in parallel worker processes (default: 1). "
+                              "Reports are still written by the main process."))
+    parser.add_argument('--incremental', required=False, action="store_true",
+                        help=("Keep the results of the artifacts in a case cache in the OUTPUT folder and reuse them "
+                              "when the same input is processed again (e.g. with another profile or timezone)."))
+    parser.add_argument('--profile', required=False, action="store", default=0, type=int, metavar='N',
+                        help=("Profile the artifacts with cProfile and keep the profiles of the N slowest ones in "
+                              "_Script_Logs/profiles. The metrics of all the artifacts are written to "
+                              "_Script_Logs/performance.json in any case."))
+    parser.add_argument('--budget', required=False, action="store",
+                        help=("Time budget of the processing, e.g. 90s, 30m or 1h30m. The artifacts whose predicted "
+                              "time, learnt from the performance.json of previous reports, does not fit are skipped."))
+    parser.add_argument('--timings', required=False, action="append", default=[], metavar='PATH',
+                        help=("performance.json file or folder of previous reports used to predict the time of the "
+                              "artifacts, in addition to the reports in the OUTPUT folder. Can be repeated."))
 
     available_plugins = []
     loader = plugin_loader.PluginLoader()
     for plugin in sorted(loader.plugins, key=lambda p: p.category):
         if (plugin.module_name == 'iTunesBackupInfo'
                 or plugin.name == 'last_build'
-                or plugin.module_name == 'logarchive' and plugin.name != 'logarchive'):
+                or get_dependencies(plugin)):
             continue
         else:
             available_plugins.append(plugin)
@@ -329,15 +374,104 @@ def main():
     initialize_lava(input_path, out_params.output_folder_base, extracttype)
 
     crunch_artifacts(selected_plugins, extracttype, input_path, out_params, wrap_text, loader, casedata, time_offset,
-        profile_filename, itunes_backup_password)
+        profile_filename, itunes_backup_password, pre_extract=args.pre_extract, jobs=args.jobs,
+        incremental=args.incremental, profile_count=args.profile,
+        budget_seconds=cost_model.parse_duration(args.budget) if args.budget else None, timings_paths=args.timings)
 
     lava_finalize_output(out_params.output_folder_base)
 
+def get_search_regexes(plugin):
+    '''Returns the search patterns of a plugin as a list, or None if it has no patterns'''
+    if isinstance(plugin.search, list) or isinstance(plugin.search, tuple):
+        return plugin.search
+    elif plugin.search is None:
+        return plugin.search
+    else:
+        return [plugin.search]
+
+def uses_app_containers(plugin):
+    '''Returns True if a plugin reads the app containers of the extraction through the Context'''
+    method = getattr(plugin.method, '__wrapped__', plugin.method)
+    return 'get_app_containers' in method.__code__.co_names
+
+def get_dependencies(plugin):
+    '''Returns the names of the artifacts listed in the depends_on key of a plugin artifact info'''
+    depends_on = plugin.artifact_info.get('depends_on') or ()
+    return (depends_on,) if isinstance(depends_on, str) else tuple(depends_on)
+
+def get_dependent_plugins(loader, plugin):
+    '''Returns the plugins depending on a plugin, in loading order'''
+    return [dependent for dependent in loader.plugins if plugin.name in get_dependencies(dependent)]
+
+def init_artifact_worker(loader, seeker, lava_db_path):
+    '''Prepares a forked worker process to run artifacts, journaling its report writes for the main process'''
+    global worker_loader, worker_seeker
+    GuiWindow.window_handle = None
+    seeker.reopen()
+    lava_connect_readonly(lava_db_path)
+    write_journal.start()
+    # only the metrics of the artifacts run by the worker are sent to the main process
+    artifact_profiler.collect()
+    worker_loader = loader
+    worker_seeker = seeker
+
+def run_artifact_in_worker(plugin_name, files_found, category_folder, wrap_text, time_offset):
+    '''
+    Runs an artifact in a worker process.
+    Returns the journal of its report writes, the error and its traceback if it failed, and its performance metrics.
+    '''
+    error = None
+    try:
+        artifact_profiler.run(plugin_name, worker_loader[plugin_name].method,
+                              files_found, category_folder, worker_seeker, wrap_text, time_offset)
+    except Exception as ex:
+        error = (str(ex), traceback.format_exc())
+    return write_journal.collect(), error, artifact_profiler.collect()
+
+def predict_wall_time(plugin_costs, jobs):
+    '''Returns the predicted wall time of running plugins of the given costs with a number of worker processes'''
+    plugin_costs = list(plugin_costs)
+    if not plugin_costs:
+        return 0
+    return max(sum(plugin_costs) / jobs, max(plugin_costs))
+
+def predict_plugin_cost(costs, loader, plugin, input_bytes=None):
+    '''Returns the predicted processing time of a plugin and of the plugins depending on it'''
+    return costs.predict(plugin.name, input_bytes) + sum(
+        predict_plugin_cost(costs, loader, dependent) for dependent in get_dependent_plugins(loader, plugin))
+
+def log_predicted_time(plugins, loader, seeker, costs, jobs):
+    '''Logs the predicted processing time of the plugins with files found by the prefetch of the seeker'''
+    if not costs.run_count:
+        logfunc('No timings of previous runs found, the processing time cannot be predicted.')
+        return
+    search_seconds = 0
+    plugin_costs = []
+    known_count = 0
+    for plugin in plugins:
+        search_seconds += costs.predict_search(plugin.name)
+        search_regexes = get_search_regexes(plugin)
+        if search_regexes and seeker.path_index is not None and not any(
+                seeker.prefetched.get(search_regex) or seeker.searched.get(search_regex)
+                for search_regex in search_regexes):
+            continue  # no file to process
+        known_count += costs.has_history(plugin.name)
+        plugin_costs.append(predict_plugin_cost(costs, loader, plugin))
+    predicted_seconds = search_seconds + predict_wall_time(plugin_costs, jobs)
+    logfunc(f'Predicted processing time: {strftime("%H:%M:%S", gmtime(predicted_seconds))} '
+            f'({known_count} of {len(plugin_costs)} artifacts with files to process have recorded timings)')
+
 def crunch_artifacts(
         plugins: typing.Sequence[plugin_loader.PluginSpec], extracttype, input_path, out_params, wrap_text,
-        loader: plugin_loader.PluginLoader, casedata, time_offset, profile_filename, itunes_backup_password=None, decryption_keys=None):
+        loader: plugin_loader.PluginLoader, casedata, time_offset, profile_filename, itunes_backup_password=None, decryption_keys=None,
+        pre_extract=False, jobs=1, incremental=False, profile_count=0, budget_seconds=None, timings_paths=()):
     start = process_time()
     start_wall = perf_counter()
+    script_logs_folder = os.path.join(out_params.output_folder_base, '_HTML', '_Script_Logs')
+    artifact_profiler.start(
+        os.path.join(script_logs_folder, artifact_profiler.profiles_folder_name) if profile_count else None)
+    # the reports of previous runs in the output folder tell how long the artifacts take
+    costs = cost_model.CostModel.load([os.path.dirname(out_params.output_folder_base), *timings_paths])
 
     logfunc('Processing started. Please wait. This may take a few minutes...')
 
@@ -349,6 +483,16 @@ def crunch_artifacts(
     logdevinfo()
     seeker = None
     password = itunes_backup_password
+
+    # add last_build at the start except for iTunes backups
+    if extracttype != 'itunes':
+        plugins.insert(0, loader["last_build"])
+    all_search_regexes = [search_regex for plugin in plugins for search_regex in get_search_regexes(plugin) or []]
+    # the app container metadata is read once for the plugins using it, in the same pass as the plugin files
+    read_app_containers = any(uses_app_containers(plugin) for plugin in plugins)
+    if read_app_containers:
+        all_search_regexes.extend(app_container_patterns.values())
+
     try:
         if extracttype == 'fs':
             seeker = FileSeekerDir(input_path, out_params.data_folder)
@@ -357,7 +501,8 @@ def crunch_artifacts(
             seeker = FileSeekerFile(input_path, out_params.data_folder)
 
         elif extracttype in ('tar', 'gz'):
-            seeker = FileSeekerTar(input_path, out_params.data_folder)
+            # with pre-extraction, the archive is streamed once for all the search patterns
+            seeker = FileSeekerTar(input_path, out_params.data_folder, all_search_regexes if pre_extract else None)
 
         elif extracttype == 'zip':
             seeker = FileSeekerZip(input_path, out_params.data_folder)
@@ -395,11 +540,9 @@ def crunch_artifacts(
         temp_file.close()
         return False
 
-    # Now ready to run
-    # add last_build at the start except for iTunes backups
-    if extracttype != 'itunes':
-        plugins.insert(0, loader["last_build"])
+    Context.set_app_containers(get_app_containers(seeker) if read_app_containers else {})
 
+    # Now ready to run
     logfunc(f'Info: {len(loader) - 2} modules loaded.') # excluding last_build and iTunesBackupInfo
     if profile_filename:
         logfunc(f'Loaded profile: {profile_filename}')
@@ -407,7 +550,7 @@ def crunch_artifacts(
     logfunc(f'File/Directory selected: {input_path}')
     logfunc('\n--------------------------------------------------------------------------------------')
 
-    log = open(os.path.join(out_params.output_folder_base, '_HTML', '_Script_Logs', 'ProcessedFilesLog.html'), 'w+', encoding='utf8')
+    log = open(os.path.join(script_logs_folder, 'ProcessedFilesLog.html'), 'w+', encoding='utf8')
     log.write(f'Extraction/Path selected: {input_path}<br><br>')
     log.write(f'Timezone selected: {time_offset}<br><br>')
 
@@ -439,29 +582,58 @@ def crunch_artifacts(
             logfunc('Info.plist not found for iTunes Backup!')
             log.write('Info.plist not found for iTunes Backup!')
 
+    if incremental:
+        cache_folder = os.path.join(os.path.dirname(out_params.output_folder_base), artifact_cache.cache_name)
+        artifact_cache.initialize_cache(cache_folder)
+        logfunc(f'Case cache: {cache_folder}')
+
+    # Resolve the search patterns of all the selected plugins in one go
+    seeker.prefetch(all_search_regexes)
+    log_predicted_time(plugins, loader, seeker, costs, jobs)
+    if pre_extract:
+        logfunc('Pre-extracting files matched by the selected modules...')
+        staged_files = seeker.pre_extract(all_search_regexes)
+        logfunc(f'Pre-extraction complete - {staged_files} files')
+
     # Search for the files per the arguments
     parsed_modules = 0
     lava_only = False
     artifact_search_pattern_id = 0
     file_path_ids = set()
-
-    for plugin_number, plugin in enumerate(plugins, start=1):
-        logfunc()
-        logfunc('[{}/{}] {} [{}] artifact started'.format(plugin_number, len(plugins),
-                                                              plugin.name, plugin.module_name))
-        output_types = plugin.artifact_info.get('output_types', '')
-        if isinstance(plugin.search, list) or isinstance(plugin.search, tuple):
-            search_regexes = plugin.search
-        elif plugin.search is None:
-            search_regexes = plugin.search
-        else:
-            search_regexes = [plugin.search]
+    lava_db_path = os.path.join(out_params.output_folder_base, '_lava_artifacts.db')
+
+    def search_plugin_files(plugin):
+        '''Searches the files of a plugin, listing them in the processed files log and the LAVA database'''
+        artifact_profiler.register(plugin.name, plugin.module_name, plugin.category)
+        copied_count = len(seeker.copied)
+        with artifact_profiler.measure(plugin.name, 'search_seconds'):
+            files_found = search_plugin_patterns(plugin)
+        # the files copied or extracted by the search are the last ones added to seeker.copied
+        extracted = set(islice(seeker.copied.values(), copied_count, None))
+        input_bytes = extracted_bytes = 0
+        for file_found in set(files_found):
+            try:
+                file_stat = os.stat(file_found)
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                input_bytes += file_stat.st_size
+                if file_found in extracted:
+                    extracted_bytes += file_stat.st_size
+        artifact_profiler.add(plugin.name, files_found=len(files_found), input_bytes=input_bytes,
+                              extracted_bytes=extracted_bytes)
+        return files_found
+
+    def search_plugin_patterns(plugin):
+        '''Searches the patterns of a plugin and returns the files found'''
+        nonlocal artifact_search_pattern_id
+        search_regexes = get_search_regexes(plugin)
         files_found = []
         log.write(f'<b>For {plugin.name} module</b>')
         if search_regexes is None:
             log.write(f'<ul><li>No search regexes provided for {plugin.name} module.')
             log.write("<ul><li><i>'_lava_artifacts.db'</i> used as source file.</li></ul></li></ul>")
-            files_found = [os.path.join(out_params.output_folder_base, '_lava_artifacts.db')]
+            files_found = [lava_db_path]
         else:
             for artifact_search_regex in search_regexes:
                 artifact_search_pattern_id += 1
@@ -491,35 +663,116 @@ def crunch_artifacts(
                             lava_insert_sqlite_artifact_link_pattern_to_file(artifact_search_pattern_id, file_path_id)
                     log.write(f'</li></ul>')
                     files_found.extend(found)
+        return files_found
+
+    def get_category_folder(plugin):
+        '''Returns the report folder of the category of a plugin, or None if it cannot be created'''
+        category_folder = os.path.join(out_params.output_folder_base, '_HTML', plugin.category)
+        if not os.path.exists(category_folder):
+            try:
+                os.makedirs(category_folder)
+            except (FileExistsError, FileNotFoundError) as ex:
+                logfunc('Error creating {} report directory at path {}'.format(plugin.name, category_folder))
+                logfunc('Error was {}'.format(str(ex)))
+                return None
+        return category_folder
+
+    def log_plugin_error(plugin, error, error_traceback):
+        artifact_profiler.add(plugin.name, errors=1)
+        logfunc('Reading {} artifact had errors!'.format(plugin.name))
+        logfunc('Error was {}'.format(error))
+        logfunc('Exception Traceback: {}'.format(error_traceback))
+
+    def run_plugin_method(plugin, files_found, category_folder):
+        '''Runs a plugin in the main process. Returns False if it had errors'''
+        try:
+            artifact_profiler.run(plugin.name, plugin.method, files_found, category_folder, seeker, wrap_text, time_offset)
+        except Exception as ex:
+            log_plugin_error(plugin, str(ex), traceback.format_exc())
+            return False
+        return True
+
+    def get_dependents_to_run(plugin):
+        '''
+        Returns the plugins depending on a plugin that has run (e.g. the logarchive
+        artifacts after logarchive), if it created its table in the LAVA database
+        '''
+        # the dependents read the rows of the plugin from the database
+        lava_commit()
+        if not lava_does_table_exist(sanitize_sql_name(plugin.name)):
+            return []
+        dependents = get_dependent_plugins(loader, plugin)
+        for dependent in dependents:
+            artifact_profiler.register(dependent.name, dependent.module_name, dependent.category)
+        return dependents
+
+    def run_plugin(plugin, files_found):
+        '''Runs a plugin, then the plugins depending on it. Returns False if it had errors'''
+        category_folder = get_category_folder(plugin)
+        if category_folder is None:
+            return False
+        if not run_plugin_method(plugin, files_found, category_folder):
+            return False
+        for dependent in get_dependents_to_run(plugin):
+            run_plugin(dependent, [lava_db_path])
+        return True
+
+    def schedule_plugins(pending_plugins):
+        '''
+        Returns the plugins waiting to run in the order they are run: longest predicted first in parallel,
+        so that the longest jobs do not start last, and in plugin order otherwise. With a time budget,
+        the plugins not fitting in the remaining time are skipped, the cheapest ones being kept first.
+        '''
+        nonlocal parsed_modules
+        plugin_costs = {plugin.name: predict_plugin_cost(costs, loader, plugin,
+                                                         artifact_profiler.get(plugin.name, 'input_bytes'))
+                        for plugin, _ in pending_plugins}
+        if costs.run_count:
+            logfunc(f'Predicted time of the {len(pending_plugins)} artifacts to run: '
+                    f'{strftime("%H:%M:%S", gmtime(predict_wall_time(plugin_costs.values(), jobs)))}')
+        if budget_seconds is not None and not costs.run_count:
+            logfunc('Warning: no timings of previous runs found, every artifact is predicted to take no time, '
+                    'the time budget only stops the artifacts left once it is exhausted.')
+        if budget_seconds is not None:
+            capacity = (budget_seconds - (perf_counter() - start_wall)) * jobs
+            selected = set()
+            for plugin, _ in sorted(pending_plugins, key=lambda pending: plugin_costs[pending[0].name]):
+                if plugin_costs[plugin.name] <= capacity:
+                    selected.add(plugin.name)
+                    capacity -= plugin_costs[plugin.name]
+                else:
+                    skipped_plugins.append(plugin.name)
+                    logfunc(f'{plugin.name} [{plugin.module_name}] artifact skipped - predicted time of '
+                            f'{plugin_costs[plugin.name]:.1f}s exceeds the time budget')
+                    parsed_modules += 1
+                    GuiWindow.SetProgressBar(parsed_modules, len(plugins))
+            pending_plugins = [pending for pending in pending_plugins if pending[0].name in selected]
+        if jobs > 1:
+            pending_plugins.sort(key=lambda pending: plugin_costs[pending[0].name], reverse=True)
+        return pending_plugins
+
+    if jobs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        logfunc('Running artifacts in parallel is not supported on this platform, they will be run one at a time.')
+        jobs = 1
+
+    skipped_plugins = []
+    pending_plugins = []
+    for plugin_number, plugin in enumerate(plugins, start=1):
+        logfunc()
+        logfunc('[{}/{}] {} [{}] artifact started'.format(plugin_number, len(plugins),
+                                                              plugin.name, plugin.module_name))
+        output_types = plugin.artifact_info.get('output_types', '')
+        files_found = search_plugin_files(plugin)
         if files_found:
             if not lava_only and 'lava_only' in output_types:
                 lava_only = True
-            category_folder = os.path.join(out_params.output_folder_base, '_HTML', plugin.category)
-            if not os.path.exists(category_folder):
-                try:
-                    os.makedirs(category_folder)
-                except (FileExistsError, FileNotFoundError) as ex:
-                    logfunc('Error creating {} report directory at path {}'.format(plugin.name, category_folder))
-                    logfunc('Error was {}'.format(str(ex)))
-                    continue  # cannot do work
-            try:
-                plugin.method(files_found, category_folder, seeker, wrap_text, time_offset)
-                if plugin.name == 'logarchive':
-                    lava_db_path = os.path.join(out_params.output_folder_base, '_lava_artifacts.db')
-                    if does_table_exist_in_db(lava_db_path, 'logarchive'):
-                        loader["logarchive_artifacts"].method([lava_db_path], category_folder, seeker, wrap_text, time_offset)
-                    if does_table_exist_in_db(lava_db_path, 'logarchive_artifacts'):
-                        unifed_logs_artifacts = []
-                        unifed_logs_artifacts = [plugin.name for plugin in loader.plugins
-                                                 if plugin.module_name=='logarchive'
-                                                 and plugin.name != 'logarchive'
-                                                 and plugin.name != 'logarchive_artifacts']
-                        for unifed_log_artifact in unifed_logs_artifacts:
-                            loader[unifed_log_artifact].method([lava_db_path], category_folder, seeker, wrap_text, time_offset)
-            except Exception as ex:
-                logfunc('Reading {} artifact had errors!'.format(plugin.name))
-                logfunc('Error was {}'.format(str(ex)))
-                logfunc('Exception Traceback: {}'.format(traceback.format_exc()))
+            if (jobs > 1 or budget_seconds is not None) and plugin.name != 'last_build':
+                # run once all the files are searched, last_build sets the iOS version first,
+                # so that the artifacts can be scheduled by their predicted cost
+                pending_plugins.append((plugin, files_found))
+                log.flush()
+                continue
+            if not run_plugin(plugin, files_found):
                 continue  # nope
         else:
             logfunc(f"No file found")
@@ -527,13 +780,115 @@ def crunch_artifacts(
         parsed_modules += 1
         GuiWindow.SetProgressBar(parsed_modules, len(plugins))
         log.flush()
+
+    if pending_plugins:
+        logfunc()
+        pending_plugins = schedule_plugins(pending_plugins)
+
+    def budget_exhausted(plugin):
+        '''Returns True, with the plugin recorded as skipped, if the time budget is spent'''
+        if budget_seconds is None or perf_counter() - start_wall <= budget_seconds:
+            return False
+        # the predictions were too optimistic
+        skipped_plugins.append(plugin.name)
+        logfunc(f'{plugin.name} [{plugin.module_name}] artifact skipped - the time budget is exhausted')
+        return True
+
+    if pending_plugins and jobs == 1:
+        for plugin, files_found in pending_plugins:
+            logfunc()
+            if not budget_exhausted(plugin):
+                logfunc('{} [{}] artifact started'.format(plugin.name, plugin.module_name))
+                if run_plugin(plugin, files_found):
+                    logfunc('{} [{}] artifact completed'.format(plugin.name, plugin.module_name))
+            parsed_modules += 1
+            GuiWindow.SetProgressBar(parsed_modules, len(plugins))
+            log.flush()
+    elif pending_plugins:
+        # Artifacts run in forked worker processes, which inherit the seeker with all the
+        # files searched. Their report writes are journaled and replayed here, so that the
+        # main process is the only writer of the LAVA database, TSV files and timeline.
+        logfunc()
+        logfunc(f'Running {len(pending_plugins)} artifacts with {jobs} worker processes...')
+        lava_commit()
+        close_sqlite_dbs()
+        with ProcessPoolExecutor(jobs, mp_context=multiprocessing.get_context('fork'),
+                                 initializer=init_artifact_worker,
+                                 initargs=(loader, seeker, lava_db_path)) as executor:
+            running = {}
+
+            def submit(plugin, files_found, is_dependent=False):
+                '''Submits a plugin to the workers, modules without artifact_processor run in the main process'''
+                category_folder = get_category_folder(plugin)
+                if category_folder is None:
+                    return
+                if hasattr(plugin.method, '__wrapped__'):
+                    try:
+                        future = executor.submit(run_artifact_in_worker, plugin.name, files_found,
+                                                 category_folder, wrap_text, time_offset)
+                        running[future] = (plugin, files_found, category_folder, is_dependent)
+                        return
+                    except RuntimeError as ex:
+                        logfunc(f'Could not run {plugin.name} in a worker process: {ex}')
+                completed(plugin, run_plugin_method(plugin, files_found, category_folder), is_dependent)
+
+            def completed(plugin, succeeded, is_dependent):
+                nonlocal parsed_modules
+                if succeeded:
+                    for dependent in get_dependents_to_run(plugin):
+                        submit(dependent, [lava_db_path], True)
+                    logfunc('{} [{}] artifact completed'.format(plugin.name, plugin.module_name))
+                if not is_dependent:
+                    parsed_modules += 1
+                    GuiWindow.SetProgressBar(parsed_modules, len(plugins))
+
+            def submit_pending():
+                '''Submits the pending plugins as the workers become free, until the time budget is spent'''
+                nonlocal parsed_modules
+                while pending_plugins and len(running) < jobs:
+                    plugin, files_found = pending_plugins.popleft()
+                    if budget_exhausted(plugin):
+                        parsed_modules += 1
+                        GuiWindow.SetProgressBar(parsed_modules, len(plugins))
+                    else:
+                        submit(plugin, files_found)
+
+            pending_plugins = deque(pending_plugins)
+            submit_pending()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    plugin, files_found, category_folder, is_dependent = running.pop(future)
+                    try:
+                        journal, error, metrics = future.result()
+                    except Exception as ex:
+                        # e.g. rows that cannot be pickled, or a worker process that died
+                        logfunc(f'Could not run {plugin.name} in a worker process: {ex}')
+                        completed(plugin, run_plugin_method(plugin, files_found, category_folder), is_dependent)
+                        continue
+                    artifact_profiler.merge(metrics)
+                    replay_start = perf_counter()
+                    try:
+                        set_artifact_context(plugin.method.__wrapped__, files_found, category_folder, seeker)
+                        write_journal.replay(journal)
+                    except Exception as ex:
+                        error = (str(ex), traceback.format_exc())
+                    replay_seconds = perf_counter() - replay_start
+                    artifact_profiler.add(plugin.name, replay_seconds=replay_seconds, write_seconds=replay_seconds)
+                    if error:
+                        log_plugin_error(plugin, *error)
+                    completed(plugin, error is None, is_dependent)
+                submit_pending()
+        log.flush()
     log.close()
+    close_sqlite_dbs()
 
     write_device_info()
     if lava_only:
         write_lava_only_log()
     logfunc('')
     logfunc('Processes completed.')
+    logfunc(f'Media files copied (not linked) to the report: {get_copied_media_bytes()} bytes')
     end = process_time()
     end_wall = perf_counter()
     run_time_secs =  end - start
@@ -543,6 +898,17 @@ def crunch_artifacts(
     run_time_HMS = strftime('%H:%M:%S', gmtime(run_time_secs))
     logfunc("Processing time (wall)= {}".format(run_time_HMS))
 
+    performance = artifact_profiler.write_report(script_logs_folder, profile_count, {
+        'processing_seconds': round(end - start, 6), 'wall_seconds': round(run_time_secs, 6),
+        'extraction_type': extracttype, 'jobs': jobs, 'pre_extract': pre_extract,
+        'budget_seconds': budget_seconds, 'skipped_artifacts': skipped_plugins})
+    lava_insert_sqlite_artifact_performance(performance)
+    slowest = sorted(performance, key=lambda artifact: artifact['total_seconds'], reverse=True)[:5]
+    if slowest:
+        logfunc('Slowest artifacts: ' + ', '.join(
+            f"{artifact['artifact_name']} ({artifact['total_seconds']:.1f}s)" for artifact in slowest))
+    logfunc(f'Artifact performance metrics: {os.path.join(script_logs_folder, artifact_profiler.performance_file_name)}')
+
     logfunc('')
     logfunc('Report generation started.')
     # remove the \\?\ prefix we added to input and output paths, so it does not reflect in report
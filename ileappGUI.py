@@ -24,15 +24,15 @@ def pickModules():
     '''Create a list of available modules:
         - itunes_backup_info, itunes_backup_installed_applications, last_build and Ph100-UFED-device-values-Plist that need
         to be executed first are excluded
-        - logarchive_artifacts is also excluded as it uses the LAVA SQLite database to extract
-        relevant event messages from the logarchive table and must be executed only if logarchive
-        module has been already executed
+        - logarchive_artifacts and the other artifacts with a depends_on key are also excluded as
+        they use the LAVA SQLite database to extract relevant records from the table of the artifact
+        they depend on and are executed only after it
         - ones that take a long time to run are deselected by default'''
     global mlist
     for plugin in sorted(loader.plugins, key=lambda p: p.category.upper()):
         if (plugin.module_name == 'iTunesBackupInfo'
                 or plugin.name == 'last_build'
-                or plugin.module_name == 'logarchive' and plugin.name != 'logarchive'):
+                or ileapp.get_dependencies(plugin)):
             continue
         # Items that take a long time to execute are deselected by default
         # and referenced in the modules_to_exclude list in an external file (modules_to_exclude.py).
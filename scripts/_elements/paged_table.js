@@ -0,0 +1,121 @@
+// Paged tables of the artifact reports with too many rows to be written in the page.
+// The rows are stored in chunk files (chunk_<n>.js) calling leappTableChunk, which are
+// loaded with script tags, as reports are opened from the file system.
+// Only the chunks of the displayed page are loaded, unless the table is searched or sorted.
+
+var leappChunks = {};
+
+function leappTableChunk(tableId, index, rows) {
+    leappChunks[tableId][index] = rows;
+}
+
+function leappPagedTable(tableId, chunkFolder, total, chunkSize) {
+    var chunkCount = Math.ceil(total / chunkSize);
+    var loaded = leappChunks[tableId] = {};
+    var lastQuery = null;
+    var lastRows = null;
+
+    function loadChunk(index) {
+        return new Promise(function(resolve, reject) {
+            if (loaded[index]) {
+                resolve(loaded[index]);
+                return;
+            }
+            var script = document.createElement('script');
+            script.src = chunkFolder + '/chunk_' + index + '.js';
+            script.onload = function() {
+                document.head.removeChild(script);
+                resolve(loaded[index]);
+            };
+            script.onerror = function() {
+                document.head.removeChild(script);
+                reject(new Error('Could not load ' + script.src));
+            };
+            document.head.appendChild(script);
+        });
+    }
+
+    function loadChunks(first, last) {
+        var chunks = [];
+        for (var index = first; index <= last && index < chunkCount; index++) {
+            chunks.push(loadChunk(index));
+        }
+        return Promise.all(chunks).then(function(chunks) {
+            return [].concat.apply([], chunks);
+        });
+    }
+
+    function cellText(cell) {
+        return cell.indexOf('<') >= 0 ? cell.replace(/<[^>]*>/g, '') : cell;
+    }
+
+    function compareCells(a, b) {
+        var numberA = parseFloat(a), numberB = parseFloat(b);
+        if (!isNaN(numberA) && !isNaN(numberB) && String(numberA) === a && String(numberB) === b) {
+            return numberA - numberB;
+        }
+        return a < b ? -1 : (a > b ? 1 : 0);
+    }
+
+    // Searched and sorted rows, kept while the search and order do not change
+    function queryRows(search, order) {
+        var query = JSON.stringify([search, order]);
+        if (query === lastQuery) {
+            return Promise.resolve(lastRows);
+        }
+        return loadChunks(0, chunkCount - 1).then(function(rows) {
+            if (search) {
+                rows = rows.filter(function(row) {
+                    return row.some(function(cell) {
+                        return cellText(cell).toLowerCase().indexOf(search) >= 0;
+                    });
+                });
+            }
+            if (order.length) {
+                var column = order[0].column;
+                var direction = order[0].dir === 'desc' ? -1 : 1;
+                rows = rows.map(function(row, index) { return [cellText(row[column] || ''), index, row]; });
+                rows.sort(function(a, b) { return direction * compareCells(a[0], b[0]) || a[1] - b[1]; });
+                rows = rows.map(function(item) { return item[2]; });
+            }
+            lastQuery = query;
+            lastRows = rows;
+            return rows;
+        });
+    }
+
+    $('#' + tableId).DataTable({
+        serverSide: true,
+        processing: true,
+        order: [],
+        searchDelay: 500,
+        aLengthMenu: [[15, 50, 100, 500], [15, 50, 100, 500]],
+        ajax: function(request, callback) {
+            var search = request.search.value.toLowerCase();
+            var rows;
+            if (search || request.order.length) {
+                rows = queryRows(search, request.order).then(function(rows) {
+                    return {filtered: rows.length, page: rows.slice(request.start, request.start + request.length)};
+                });
+            } else {
+                var first = Math.floor(request.start / chunkSize);
+                var last = Math.floor((request.start + request.length - 1) / chunkSize);
+                rows = loadChunks(first, last).then(function(rows) {
+                    var start = request.start - first * chunkSize;
+                    return {filtered: total, page: rows.slice(start, start + request.length)};
+                });
+            }
+            rows.then(function(result) {
+                callback({
+                    draw: request.draw,
+                    recordsTotal: total,
+                    recordsFiltered: result.filtered,
+                    data: result.page
+                });
+            }, function(error) {
+                console.error(error);
+                callback({draw: request.draw, recordsTotal: total, recordsFiltered: 0, data: []});
+            });
+        }
+    });
+}
@@ -0,0 +1,153 @@
+"""
+This module provides the persistent case cache used by the incremental mode,
+so that re-runs on the same extraction (e.g. with another profile or timezone)
+skip the parsing of the artifacts whose inputs did not change.
+
+The result of an artifact (data_headers, data_list, source_path) is stored in
+the cache folder, next to the report folders, under a key made of:
+    - the LEAPP version and the hash of the artifact module,
+    - the source path, dates and size of each matched file (from FileInfo),
+    - the parameters of the run (timezone offset, text wrapping).
+On a cache hit, the artifact function is not called and only the report
+writers run. Paths of the previous report folder found in the result are
+rewritten to the current one.
+
+Only results of artifacts without side effects (device info, media, LAVA or
+report writes of their own) are stored, as these would not be reproduced.
+
+Global Variables:
+    cache_folder (str): The folder of the cache, None if the incremental mode is off.
+
+Functions:
+    initialize_cache: Enables the cache in the given folder.
+    get_cache_key: Computes the cache key of an artifact run.
+    get_cached_result: Returns the cached result of an artifact.
+    store_result: Stores the result of an artifact in the cache.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+
+from scripts.version_info import leapp_version
+
+cache_folder = None
+cache_name = '_iLEAPP_cache'
+_module_hashes = {}
+
+
+def initialize_cache(folder):
+    '''
+    Enables the case cache.
+    Args:
+        folder: The folder where the results are stored, created if needed.
+    '''
+    global cache_folder
+    os.makedirs(folder, exist_ok=True)
+    cache_folder = folder
+
+
+def _get_module_hash(module_file_path):
+    if module_file_path not in _module_hashes:
+        with open(module_file_path, 'rb') as module_file:
+            _module_hashes[module_file_path] = hashlib.sha1(module_file.read()).hexdigest()
+    return _module_hashes[module_file_path]
+
+
+def get_cache_key(func_name, module_file_path, files_found, seeker, parameters):
+    '''
+    Computes the cache key of an artifact run.
+    Args:
+        func_name: The name of the artifact function.
+        module_file_path: The path of the artifact module.
+        files_found: The files found for the artifact.
+        seeker: The seeker of the extraction, holding the FileInfo of the files found.
+        parameters: The parameters of the run that change the result.
+    Returns:
+        The key, or None if the cache is off or the artifact cannot be cached
+        (e.g. it reads the LAVA database of the current run).
+    '''
+    if cache_folder is None or not files_found:
+        return None
+    data_folder = getattr(seeker, 'data_folder', '')
+    files = []
+    for file_found in files_found:
+        file_found = str(file_found)
+        file_info = seeker.file_infos.get(file_found)
+        if file_info:
+            files.append((file_info.source_path, file_info.creation_date, file_info.modification_date,
+                          os.path.getsize(file_found) if os.path.isfile(file_found) else None))
+        elif data_folder and file_found.startswith(data_folder):
+            # folders of the extraction
+            files.append((os.path.relpath(file_found, data_folder),))
+        else:
+            return None
+    key_data = [leapp_version, func_name, _get_module_hash(module_file_path), sorted(files), parameters]
+    return hashlib.sha256(json.dumps(key_data, default=str).encode()).hexdigest()
+
+
+def _replace_path(value, old_path, new_path):
+    if isinstance(value, str):
+        return value.replace(old_path, new_path)
+    if isinstance(value, list):
+        return [_replace_path(item, old_path, new_path) for item in value]
+    return value
+
+
+def _replace_paths(data_list, old_path, new_path):
+    return [tuple(_replace_path(value, old_path, new_path) for value in row) for row in data_list]
+
+
+def get_cached_result(cache_key, output_folder_base):
+    '''
+    Returns the cached result of an artifact, or None on a cache miss.
+    Args:
+        cache_key: The key returned by get_cache_key.
+        output_folder_base: The report folder of the current run.
+    Returns:
+        A (data_headers, data_list, source_path) tuple, or None.
+    '''
+    cache_path = os.path.join(cache_folder, f'{cache_key}.pickle')
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            cached_folder_base, data_headers, data_list, source_path = pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    if cached_folder_base != output_folder_base:
+        if isinstance(data_list, tuple):
+            data_list = tuple(_replace_paths(rows, cached_folder_base, output_folder_base) for rows in data_list)
+        else:
+            data_list = _replace_paths(data_list, cached_folder_base, output_folder_base)
+        source_path = _replace_path(source_path, cached_folder_base, output_folder_base)
+    return data_headers, data_list, source_path
+
+
+def store_result(cache_key, output_folder_base, data_headers, data_list, source_path):
+    '''
+    Stores the result of an artifact in the cache.
+    Args:
+        cache_key: The key returned by get_cache_key.
+        output_folder_base: The report folder of the current run.
+        data_headers: The headers returned by the artifact function.
+        data_list: The rows returned by the artifact function.
+        source_path: The source path returned by the artifact function.
+    '''
+    if isinstance(data_list, tuple):
+        data_list = tuple([tuple(row) for row in rows] for rows in data_list)
+    else:
+        data_list = [tuple(row) if isinstance(row, sqlite3.Row) else row for row in data_list]
+    cache_path = os.path.join(cache_folder, f'{cache_key}.pickle')
+    temp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump((output_folder_base, data_headers, data_list, source_path), cache_file,
+                        pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        # results holding objects that cannot be stored are not cached
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,235 @@
+"""
+Performance metrics of the artifacts run by crunch_artifacts.
+
+The metrics of each artifact are added by the steps of its processing: the
+search of its files (search time, files found, input and extracted bytes), its
+run (run time, peak RSS), the parsing and the writing of its outputs measured by
+artifact_processor (parse and write time, rows). Artifacts run in worker processes
+return their metrics with their write journal, and the main process merges them.
+
+At the end of the run, the metrics are written to _Script_Logs/performance.json
+and to the _artifact_performance table of the LAVA database. With profiling
+enabled, each artifact run is profiled with cProfile and the profiles of the
+slowest artifacts are kept next to performance.json.
+
+Global Variables:
+    metric_names: The names of the metrics, in the order they are reported.
+    performance_file_name: The name of the JSON file of the metrics.
+    profiles_folder_name: The name of the folder of the cProfile dumps.
+
+Functions:
+    start: Starts collecting the metrics of a run.
+    register: Records the module and category of an artifact.
+    add: Adds values to the metrics of an artifact.
+    get: Returns a metric of an artifact.
+    measure: Context manager adding the time spent in a block to a metric.
+    timed_rows: Yields the rows of a generator, timing the time spent producing them.
+    run: Runs an artifact, timing it and profiling it if enabled.
+    collect: Returns the metrics collected so far and empties them.
+    merge: Adds metrics collected by another process.
+    get_peak_rss: Returns the peak resident set size of the current process.
+    get_report: Returns the metrics of all the artifacts.
+    write_report: Writes performance.json and keeps the profiles of the slowest artifacts.
+"""
+
+import cProfile
+import json
+import os
+import sys
+
+from contextlib import contextmanager
+from itertools import islice
+from time import perf_counter
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+metric_names = ('search_seconds', 'files_found', 'input_bytes', 'extracted_bytes', 'parse_seconds', 'rows',
+                'write_seconds', 'replay_seconds', 'run_seconds', 'total_seconds', 'peak_rss_bytes',
+                'rss_increase_bytes', 'cached', 'errors')
+performance_file_name = 'performance.json'
+profiles_folder_name = 'profiles'
+
+# peak values are kept, all the other metrics are summed
+_peak_metrics = {'peak_rss_bytes'}
+_timed_rows_chunk_size = 1000
+
+_artifacts = {}
+_metrics = {}
+_profile_folder = None
+
+
+def start(profile_folder=None):
+    '''
+    Starts collecting the metrics of a run.
+    Args:
+        profile_folder: The folder where the cProfile dump of each artifact run is written, None to not profile.
+    '''
+    global _profile_folder
+    _artifacts.clear()
+    _metrics.clear()
+    _profile_folder = profile_folder
+    if profile_folder:
+        os.makedirs(profile_folder, exist_ok=True)
+
+
+def register(artifact_name, module_name, category):
+    '''Records the module and category of an artifact, reported with its metrics'''
+    _artifacts[artifact_name] = {'module_name': module_name, 'category': category}
+
+
+def add(artifact_name, **values):
+    '''
+    Adds values to the metrics of an artifact.
+    Args:
+        artifact_name: The name of the artifact function.
+        **values: The values of the metrics, summed to the previous values except the peaks.
+    '''
+    metrics = _metrics.setdefault(artifact_name, {})
+    for metric, value in values.items():
+        if value is None:
+            continue
+        if metric in _peak_metrics:
+            metrics[metric] = max(metrics.get(metric, 0), value)
+        else:
+            metrics[metric] = metrics.get(metric, 0) + value
+
+
+def get(artifact_name, metric):
+    '''Returns a metric of an artifact, 0 if it was not measured'''
+    return _metrics.get(artifact_name, {}).get(metric, 0)
+
+
+@contextmanager
+def measure(artifact_name, metric, exclude=None):
+    '''
+    Adds the time spent in a block to a metric of an artifact.
+    Args:
+        artifact_name: The name of the artifact function.
+        metric: The name of the metric.
+        exclude: The name of a metric whose time added during the block is not counted,
+            e.g. the time spent parsing the rows of a generator while writing them.
+    '''
+    excluded_seconds = get(artifact_name, exclude) if exclude else 0
+    start_time = perf_counter()
+    try:
+        yield
+    finally:
+        seconds = perf_counter() - start_time
+        if exclude:
+            seconds -= get(artifact_name, exclude) - excluded_seconds
+        add(artifact_name, **{metric: max(seconds, 0)})
+
+
+def timed_rows(artifact_name, rows, metric='parse_seconds'):
+    '''
+    Yields the rows of an iterable (e.g. the generator of an artifact function), adding the time
+    spent producing them to a metric. The time is measured by chunks of rows to keep it cheap.
+    '''
+    rows = iter(rows)
+    while True:
+        start_time = perf_counter()
+        chunk = list(islice(rows, _timed_rows_chunk_size))
+        add(artifact_name, **{metric: perf_counter() - start_time})
+        if not chunk:
+            return
+        yield from chunk
+
+
+def get_peak_rss():
+    '''Returns the peak resident set size of the current process in bytes, or None if it is not available'''
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+
+def run(artifact_name, method, *args):
+    '''
+    Runs an artifact, adding its run time and memory use to its metrics,
+    and writes its cProfile dump if profiling is enabled.
+    Args:
+        artifact_name: The name of the artifact function.
+        method: The function of the artifact.
+        *args: The arguments of the function.
+    Returns:
+        The return value of the function.
+    '''
+    peak_rss = get_peak_rss()
+    profiler = cProfile.Profile() if _profile_folder else None
+    start_time = perf_counter()
+    try:
+        if profiler:
+            return profiler.runcall(method, *args)
+        return method(*args)
+    finally:
+        add(artifact_name, run_seconds=perf_counter() - start_time)
+        if peak_rss is not None:
+            new_peak_rss = get_peak_rss()
+            add(artifact_name, peak_rss_bytes=new_peak_rss, rss_increase_bytes=new_peak_rss - peak_rss)
+        if profiler:
+            profiler.dump_stats(os.path.join(_profile_folder, f'{artifact_name}.prof'))
+
+
+def collect():
+    '''Returns the metrics collected so far by the current (worker) process and empties them'''
+    metrics = {artifact_name: dict(values) for artifact_name, values in _metrics.items()}
+    _metrics.clear()
+    return metrics
+
+
+def merge(metrics):
+    '''Adds the metrics collected by another process with collect()'''
+    for artifact_name, values in metrics.items():
+        add(artifact_name, **values)
+
+
+def get_report():
+    '''
+    Returns the metrics of all the artifacts, in the order they were first measured.
+    Returns:
+        A list of dicts with the name, module name and category of each artifact and all its metrics.
+    '''
+    report = []
+    for artifact_name, values in _metrics.items():
+        artifact = {'artifact_name': artifact_name}
+        artifact.update(_artifacts.get(artifact_name, {'module_name': '', 'category': ''}))
+        artifact.update({metric: values.get(metric, 0) for metric in metric_names})
+        artifact['total_seconds'] = values.get('search_seconds', 0) + values.get('run_seconds', 0) + \
+            values.get('replay_seconds', 0)
+        for metric in metric_names:
+            if metric.endswith('_seconds'):
+                artifact[metric] = round(artifact[metric], 6)
+        report.append(artifact)
+    return report
+
+
+def write_report(folder, profile_count=0, run_info=None):
+    '''
+    Writes the metrics of all the artifacts to performance.json and removes the
+    cProfile dumps of all the artifacts but the profile_count slowest ones.
+    Args:
+        folder: The folder of performance.json (_Script_Logs).
+        profile_count: The number of profiles kept.
+        run_info: A dict of values describing the whole run, written with the metrics.
+    Returns:
+        The metrics of all the artifacts, as returned by get_report().
+    '''
+    report = get_report()
+    profiles = []
+    if _profile_folder:
+        slowest = sorted(report, key=lambda artifact: artifact['total_seconds'], reverse=True)[:profile_count]
+        kept = {f"{artifact['artifact_name']}.prof" for artifact in slowest}
+        for file_name in os.listdir(_profile_folder):
+            if file_name in kept:
+                profiles.append(os.path.join(profiles_folder_name, file_name))
+            else:
+                os.remove(os.path.join(_profile_folder, file_name))
+
+    with open(os.path.join(folder, performance_file_name), 'w', encoding='utf-8') as performance_file:
+        json.dump({'run': run_info or {}, 'artifacts': report, 'profiles': sorted(profiles)},
+                  performance_file, indent=4)
+    return report
@@ -1,31 +1,82 @@
 import html
+import json
 import os
 import sys
+from itertools import repeat
+from urllib.parse import quote
+import scripts.write_journal as write_journal
 from scripts.html_parts import *
 #from scripts.ilapfuncs import is_platform_windows
 from scripts.version_info import leapp_version
 
+# Artifact pages of the report, as (html_folder, category, page_name) tuples, listed in the sidebar by
+# report.generate_report
+report_pages = []
+
+
+def register_report_page(html_folder, category, page_name):
+    '''Adds an artifact page to the list of pages shown in the sidebar of the report'''
+    if write_journal.record(register_report_page, html_folder, category, page_name):
+        return
+    report_pages.append((html_folder, category, page_name))
+
+
+def get_page_file_name(page_name):
+    '''Returns the file name of the HTML page of an artifact'''
+    return f'{page_name}.html'.replace(' ', '_')
+
+
+def get_unused_page_name(html_folder, page_name):
+    '''Returns page_name, or page_name-xx if a page with that name was already written'''
+    used_names = {get_page_file_name(name) for folder, _, name in report_pages if folder == html_folder}
+    new_name = page_name
+    num = 1
+    while get_page_file_name(new_name) in used_names or \
+            os.path.exists(os.path.join(html_folder, get_page_file_name(new_name))):
+        new_name = f'{page_name}-{num:02}'
+        num += 1
+    return new_name
+
+
 class ArtifactHtmlReport:
 
+    # Number of rows per chunk file of a paged table
+    paged_chunk_size = 2000
+
     def __init__(self, artifact_name, artifact_category=''):
         self.report_file = None
         self.report_file_path = ''
         self.script_code = ''
         self.artifact_name = artifact_name
         self.artifact_category = artifact_category # unused
+        self.num_entries = 0
+        self.total_position = None
+        self.paged_table_id = None
+        self.paged_folder = ''
+        self.paged_rows = []
+        self.paged_chunk_count = 0
 
     def __del__(self):
         if self.report_file:
             self.end_artifact_report()
 
     def start_artifact_report(self, report_folder, artifact_file_name, artifact_description=''):
-        '''Creates the report HTML file and writes the artifact name as a heading'''
-        # artifact_file_name =  artifact_file_name.replace(" ", "_") # Replace " " with "_" in HTML filenames
-        self.report_file = open(os.path.join(report_folder, f'{artifact_file_name}.temphtml'), 'w', encoding='utf8')
+        '''
+        Creates the report HTML file and writes the artifact name as a heading.
+        The page is written in the HTML folder of the report (the parent of report_folder),
+        and listed in the sidebar under the category of report_folder.
+        '''
+        write_journal.note_write()
+        report_folder = os.path.normpath(report_folder)
+        html_folder = os.path.dirname(report_folder)
+        page_name = get_unused_page_name(html_folder, artifact_file_name)
+        self.report_file_path = os.path.join(html_folder, get_page_file_name(page_name))
+        register_report_page(html_folder, os.path.basename(report_folder), page_name)
+        self.report_file = open(self.report_file_path, 'w', encoding='utf8')
         self.report_file.write(page_header.format(f'iLEAPP - {self.artifact_name} report'))
         self.report_file.write(body_start.format(f'iLEAPP {leapp_version}'))
         self.report_file.write(body_sidebar_setup)
-        self.report_file.write(body_sidebar_dynamic_data_placeholder) # placeholder for sidebar data
+        self.report_file.write(body_sidebar_include + nav_bar_script)
         self.report_file.write(body_sidebar_trailer)
         self.report_file.write(body_main_header)
         self.report_file.write(body_main_data_title.format(f'{self.artifact_name} report', artifact_description))
@@ -81,8 +132,28 @@ class ArtifactHtmlReport:
         if (not self.report_file):
             raise ValueError('Output report file is closed/unavailable!')
 
-        num_entries = len(data_list)
-        if write_total:
+        self.start_artifact_data_table(data_headers, source_path, len(data_list) if write_total else False,
+                                       write_location, table_responsive, table_style, table_id)
+        self.write_artifact_data_rows(data_headers, data_list, html_escape, html_no_escape)
+        self.end_artifact_data_table(data_headers, cols_repeated_at_bottom, table_responsive)
+
+    def start_artifact_data_table(self, data_headers, source_path, num_entries=None, write_location=True,
+                                  table_responsive=True, table_style='', table_id='dtBasicExample'):
+        ''' Writes info about data and the head of the table, for a table written in several parts
+            with write_artifact_data_rows and end_artifact_data_table.
+            If num_entries is None, the total is written by end_artifact_data_table, when the rows
+            are streamed. If it is False, no total is written.
+        '''
+        if (not self.report_file):
+            raise ValueError('Output report file is closed/unavailable!')
+
+        self.num_entries = 0
+        self.total_position = None
+        if num_entries is None:
+            # Placeholder overwritten once all the rows are written
+            self.total_position = self.report_file.tell()
+            self.write_minor_header(f'Total number of entries: {"":<20}', 'h6')
+        elif num_entries is not False:
             self.write_minor_header(f'Total number of entries: {num_entries}', 'h6')
         if write_location:
             if sys.platform == 'win32':
@@ -103,20 +174,80 @@ class ArtifactHtmlReport:
             '<tr>' + ''.join(('<th class="th-sm">{}</th>'.format(html.escape(str(x))) for x in data_headers)) + '</tr>')
         self.report_file.write('</thead><tbody>')
 
-        if html_escape:
-            for row in data_list:
-                if html_no_escape:
-                    self.report_file.write('<tr>' + ''.join(('<td>{}</td>'.format(html.escape(
-                        str(x) if x not in [None, 'N/A'] else '')) if h not in html_no_escape else '<td>{}</td>'.format(
-                        str(x) if x not in [None, 'N/A'] else '') for x, h in zip(row, data_headers))) + '</tr>')
-                else:
-                    self.report_file.write('<tr>' + ''.join(
-                        ('<td>{}</td>'.format(html.escape(str(x) if x not in [None, 'N/A'] else '')) for x in
-                         row)) + '</tr>')
+    @staticmethod
+    def get_html_cells(data_headers, data_list, html_escape=True, html_no_escape=()):
+        '''Returns the rows of data_list as lists of cell contents, HTML escaped except the html_no_escape columns'''
+        escape = html.escape
+        if html_escape and html_no_escape:
+            escape_flags = [header not in html_no_escape for header in data_headers]
         else:
-            for row in data_list:
-                self.report_file.write('<tr>' + ''.join( ('<td>{}</td>'.format(str(x) if x not in [None, 'N/A'] else '') for x in row) ) + '</tr>')
-        
+            escape_flags = None
+        for row in data_list:
+            cells = []
+            for x, escape_cell in zip(row, escape_flags or repeat(html_escape)):
+                if x is None or (x.__class__ is str and x == 'N/A'):
+                    cells.append('')
+                else:
+                    x = x if x.__class__ is str else str(x)
+                    cells.append(escape(x) if escape_cell else x)
+            yield cells
+
+    def write_artifact_data_rows(self, data_headers, data_list, html_escape=True, html_no_escape=()):
+        '''Writes rows of a table started with start_artifact_data_table'''
+        rows = []
+        for cells in self.get_html_cells(data_headers, data_list, html_escape, html_no_escape):
+            rows.append(('<tr><td>' + '</td><td>'.join(cells) + '</td></tr>') if cells else '<tr></tr>')
+        self.report_file.write(''.join(rows))
+        self.num_entries += len(rows)
+
+    def write_paged_data_table(self, data_headers, data_list, source_path, html_no_escape=()):
+        '''
+        Writes info about data, then a table whose rows are stored in chunk files loaded by the
+        page on demand, for tables with too many rows to be written in the page.
+        Replaces add_script, as the table is not initialized by the default script.
+        '''
+        self.start_paged_data_table(data_headers, source_path)
+        self.write_paged_data_rows(data_headers, data_list, html_no_escape)
+        self.end_paged_data_table(data_headers)
+
+    def start_paged_data_table(self, data_headers, source_path, table_id='dtBasicExample'):
+        '''Starts a paged table, written in several parts with write_paged_data_rows and end_paged_data_table'''
+        self.start_artifact_data_table(data_headers, source_path, None, table_id=table_id)
+        # The chunks are stored next to the page, in _HTML/_data/<page name>
+        html_folder, page_file_name = os.path.split(self.report_file_path)
+        self.paged_folder = os.path.join(html_folder, '_data', os.path.splitext(page_file_name)[0])
+        os.makedirs(self.paged_folder, exist_ok=True)
+        self.paged_table_id = table_id
+        self.paged_rows = []
+        self.paged_chunk_count = 0
+
+    def write_paged_rows_chunk(self):
+        with open(os.path.join(self.paged_folder, f'chunk_{self.paged_chunk_count}.js'), 'w', encoding='utf8') as f:
+            f.write(f'leappTableChunk({json.dumps(self.paged_table_id)},{self.paged_chunk_count},')
+            f.write(json.dumps(self.paged_rows, ensure_ascii=False, separators=(',', ':')))
+            f.write(');')
+        self.paged_chunk_count += 1
+        self.paged_rows = []
+
+    def write_paged_data_rows(self, data_headers, data_list, html_no_escape=()):
+        '''Writes rows of a table started with start_paged_data_table to its chunk files'''
+        for cells in self.get_html_cells(data_headers, data_list, True, html_no_escape):
+            self.paged_rows.append(cells)
+            self.num_entries += 1
+            if len(self.paged_rows) == self.paged_chunk_size:
+                self.write_paged_rows_chunk()
+
+    def end_paged_data_table(self, data_headers):
+        '''Ends a table started with start_paged_data_table'''
+        if self.paged_rows:
+            self.write_paged_rows_chunk()
+        self.end_artifact_data_table(data_headers)
+        chunk_folder = quote(f'_data/{os.path.basename(self.paged_folder)}')
+        self.add_script(paged_table_script.format(self.paged_table_id, chunk_folder, self.num_entries,
+                                                  self.paged_chunk_size))
+
+    def end_artifact_data_table(self, data_headers, cols_repeated_at_bottom=True, table_responsive=True):
+        '''Ends a table started with start_artifact_data_table'''
         self.report_file.write('</tbody>')
         if cols_repeated_at_bottom:
             self.report_file.write('<tfoot><tr>' + ''.join(
@@ -124,6 +255,12 @@ class ArtifactHtmlReport:
         self.report_file.write('</table>')
         if table_responsive:
             self.report_file.write("</div>")
+        if self.total_position is not None:
+            end_position = self.report_file.tell()
+            self.report_file.seek(self.total_position)
+            self.write_minor_header(f'Total number of entries: {self.num_entries:<20}', 'h6')
+            self.report_file.seek(end_position)
+            self.total_position = None
 
     def add_section_heading(self, heading, size='h2'):
         heading = html.escape(heading)
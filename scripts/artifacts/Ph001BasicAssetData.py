@@ -47,8 +47,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -61,10 +60,14 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -115,12 +118,6 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -142,11 +139,11 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
             'zAddAssetAttr-zPK-17',
             'zAsset-UUID = store.cloudphotodb-18',
             'zAddAssetAttr-Master Fingerprint-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -203,12 +200,6 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                          row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                          row[19], row[20], row[21]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -233,11 +224,11 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
             'zAsset-UUID = store.cloudphotodb-20',
             'zAddAssetAttr-Master Fingerprint-21')
 
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -311,12 +302,6 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
         '''
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -343,11 +328,11 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
             'zAddAssetAttr-zPK-22',
             'zAsset-UUID = store.cloudphotodb-23',
             'zAddAssetAttr-Master Fingerprint-24')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -427,12 +412,6 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
             LEFT JOIN ZCLOUDMASTER zCldMast ON zAsset.ZMASTER = zCldMast.Z_PK
         ORDER BY zAsset.ZDATECREATED
         '''
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -461,11 +440,11 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
             'zAddAssetAttr-zPK-24',
             'zAsset-UUID = store.cloudphotodb-25',
             'zAddAssetAttr-Master Fingerprint-26')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -552,13 +531,6 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -590,7 +562,7 @@ def Ph001_1AssetBasicDataPhDaPsql(files_found, report_folder, seeker, wrap_text,
             'zAddAssetAttr-Original Stable Hash-27',
             'zAddAssetAttr.Adjusted Stable Hash-28')
 
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -605,10 +577,14 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -659,12 +635,6 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -686,11 +656,11 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
             'zAddAssetAttr-zPK-17',
             'zAsset-UUID = store.cloudphotodb-18',
             'zAddAssetAttr-Master Fingerprint-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -747,12 +717,6 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -776,11 +740,11 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
             'zAddAssetAttr-zPK-19',
             'zAsset-UUID = store.cloudphotodb-20',
             'zAddAssetAttr-Master Fingerprint-21')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -855,12 +819,6 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -887,11 +845,11 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
             'zAddAssetAttr-zPK-22',
             'zAsset-UUID = store.cloudphotodb-23',
             'zAddAssetAttr-Master Fingerprint-24')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -972,12 +930,6 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -1006,11 +958,11 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
             'zAddAssetAttr-zPK-24',
             'zAsset-UUID = store.cloudphotodb-25',
             'zAddAssetAttr-Master Fingerprint-26')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1097,13 +1049,6 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -1134,7 +1079,7 @@ def Ph001_2AssetBasicDataSyndPL(files_found, report_folder, seeker, wrap_text, t
             'zAsset-UUID = store.cloudphotodb-26',
             'zAddAssetAttr-Original Stable Hash-27',
             'zAddAssetAttr.Adjusted Stable Hash-28')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -1149,10 +1094,14 @@ def Ph001_3AssetBasicDataGenPlayPsql(files_found, report_folder, seeker, wrap_te
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1239,13 +1188,6 @@ def Ph001_3AssetBasicDataGenPlayPsql(files_found, report_folder, seeker, wrap_te
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28]))
-
         data_headers = (
             ('zAsset-Date Created-0', 'datetime'),
             ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -1277,6 +1219,6 @@ def Ph001_3AssetBasicDataGenPlayPsql(files_found, report_folder, seeker, wrap_te
             'zAddAssetAttr-Original Stable Hash-27',
             'zAddAssetAttr.Adjusted Stable Hash-28')
 
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
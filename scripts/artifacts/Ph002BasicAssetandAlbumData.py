@@ -60,8 +60,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -74,10 +73,14 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("12")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -225,15 +228,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                  row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                  row[46], row[47]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -282,11 +276,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-45',
                         'zAsset-UUID = store.cloudphotodb-46',
                         'zAddAssetAttr-Master Fingerprint-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
+    elif (ios_version >= parse_version("12")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -434,15 +428,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                  row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                  row[46], row[47]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -491,11 +476,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-45',
                         'zAsset-UUID = store.cloudphotodb-46',
                         'zAddAssetAttr-Master Fingerprint-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -707,17 +692,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                  row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                  row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                  row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                  row[64], row[65]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -784,11 +758,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-63',
                         'zAsset-UUID = store.cloudphotodb-64',
                         'zAddAssetAttr-Master Fingerprint-65')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1014,17 +988,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -1098,11 +1061,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-70',
                         'zAsset-UUID = store.cloudphotodb-71',
                         'zAddAssetAttr-Master Fingerprint-72')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1349,18 +1312,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -1439,11 +1390,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-75',
                         'zAsset-UUID = store.cloudphotodb-76',
                         'zAddAssetAttr-Master Fingerprint-77')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1696,18 +1647,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77], row[78], row[79]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -1788,11 +1727,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-77',
                         'zAsset-UUID = store.cloudphotodb-78',
                         'zAddAssetAttr-Master Fingerprint-79')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("17")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2046,18 +1985,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -2139,11 +2066,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-78',
                         'zAsset-UUID = store.cloudphotodb-79',
                         'zAddAssetAttr-Master Fingerprint-80')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2397,18 +2324,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -2490,11 +2405,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-78',
                         'zAsset-UUID = store.cloudphotodb-79',
                         'zAddAssetAttr-Master Fingerprint-80')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2755,19 +2670,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                                row[82], row[83]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -2852,11 +2754,11 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAsset-UUID = store.cloudphotodb-81',
                         'zAddAssetAttr-Original Stable Hash-82',
                         'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3117,19 +3019,6 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                                row[82], row[83]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -3214,7 +3103,7 @@ def Ph002_1AssetBasicGenAlbumDataPhDaPsql(files_found, report_folder, seeker, wr
                         'zAsset-UUID = store.cloudphotodb-81',
                         'zAddAssetAttr-Original Stable Hash-82',
                         'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -3229,10 +3118,14 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("12")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3381,15 +3274,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -3438,11 +3322,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-45',
                         'zAsset-UUID = store.cloudphotodb-46',
                         'zAddAssetAttr-Master Fingerprint-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
+    elif (ios_version >= parse_version("12")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3591,15 +3475,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -3648,11 +3523,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-45',
                         'zAsset-UUID = store.cloudphotodb-46',
                         'zAddAssetAttr-Master Fingerprint-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3865,17 +3740,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -3942,11 +3806,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-63',
                         'zAsset-UUID = store.cloudphotodb-64',
                         'zAddAssetAttr-Master Fingerprint-65')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -4172,17 +4036,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
             LEFT JOIN ZGENERICALBUM zGenAlbum ON zGenAlbum.Z_PK = z26Assets.Z_26ALBUMS
         ORDER BY zAsset.ZDATECREATED
         '''
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -4256,11 +4109,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-70',
                         'zAsset-UUID = store.cloudphotodb-71',
                         'zAddAssetAttr-Master Fingerprint-72')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -4508,18 +4361,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -4598,11 +4439,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-75',
                         'zAsset-UUID = store.cloudphotodb-76',
                         'zAddAssetAttr-Master Fingerprint-77')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -4856,18 +4697,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77], row[78], row[79]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -4948,11 +4777,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-77',
                         'zAsset-UUID = store.cloudphotodb-78',
                         'zAddAssetAttr-Master Fingerprint-79')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("17")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -5206,18 +5035,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -5299,11 +5116,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-78',
                         'zAsset-UUID = store.cloudphotodb-79',
                         'zAddAssetAttr-Master Fingerprint-80')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):	
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):	
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -5557,18 +5374,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -5650,11 +5455,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-78',
                         'zAsset-UUID = store.cloudphotodb-79',
                         'zAddAssetAttr-Master Fingerprint-80')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -5915,19 +5720,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                  row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                  row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                  row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                  row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                  row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                                  row[82], row[83]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -6012,11 +5804,11 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAsset-UUID = store.cloudphotodb-81',
                         'zAddAssetAttr-Original Stable Hash-82',
                         'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -6277,19 +6069,6 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                  row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                  row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                  row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                  row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                  row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                                  row[82], row[83]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -6374,7 +6153,7 @@ def Ph002_2AssetBasicConversationDataSyndPL(files_found, report_folder, seeker,
                         'zAsset-UUID = store.cloudphotodb-81',
                         'zAddAssetAttr-Original Stable Hash-82',
                         'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -6389,10 +6168,14 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(files_found, report_folder, seeker, wra
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -6653,19 +6436,6 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                  row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                  row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                  row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                  row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                  row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                                  row[82], row[83]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -6750,11 +6520,11 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(files_found, report_folder, seeker, wra
                         'zAsset-UUID = store.cloudphotodb-81',
                         'zAddAssetAttr-Original Stable Hash-82',
                         'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -7015,19 +6785,6 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                  row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                  row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                  row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                  row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                  row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                  row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                  row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                                  row[82], row[83]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -7112,7 +6869,7 @@ def Ph002_3AssetBasicGenAlbumGenPlayPsql(files_found, report_folder, seeker, wra
                         'zAsset-UUID = store.cloudphotodb-81',
                         'zAddAssetAttr-Original Stable Hash-82',
                         'zAddAssetAttr.Adjusted Stable Hash-83')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
     
\ No newline at end of file
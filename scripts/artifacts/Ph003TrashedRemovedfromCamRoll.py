@@ -51,8 +51,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -65,10 +64,14 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -99,11 +102,6 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZTRASHEDSTATE      
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10]))
-
         data_headers = (('zAsset-Trashed Date-0', 'datetime'),
                         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
                         'zAsset-Directory-Path-2',
@@ -115,11 +113,11 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-8',
                         'zAsset-UUID = store.cloudphotodb-9',
                         'zAddAssetAttr-Master Fingerprint-10')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -150,11 +148,6 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZTRASHEDSTATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10]))
-
         data_headers = (('zAsset-Trashed Date-0', 'datetime'),
                         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
                         'zAsset-Directory-Path-2',
@@ -166,11 +159,11 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-8',
                         'zAsset-UUID = store.cloudphotodb-9',
                         'zAddAssetAttr-Master Fingerprint-10')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -212,11 +205,6 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZTRASHEDSTATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12]))
-
         data_headers = (('zAsset-Trashed Date-0', 'datetime'),
                         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
                         'zAsset-Directory-Path-2',
@@ -230,11 +218,11 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-10',
                         'zAsset-UUID = store.cloudphotodb-11',
                         'zAddAssetAttr-Master Fingerprint-12')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -283,11 +271,6 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZTRASHEDSTATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16]))
-
         data_headers = (('zAsset-Trashed Date-0', 'datetime'),
                         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
                         'zAsset-Trashed by Participant= zShareParticipant_zPK-2',
@@ -305,11 +288,11 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-14',
                         'zAsset-UUID = store.cloudphotodb-15',
                         'zAddAssetAttr-Master Fingerprint-16')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -359,11 +342,6 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZTRASHEDSTATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17]))
-
         data_headers = (('zAsset-Trashed Date-0', 'datetime'),
                         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
                         'zAsset-Trashed by Participant= zShareParticipant_zPK-2',
@@ -382,7 +360,7 @@ def Ph003_1TrashedRecentlyDeletedPhDaPsql(files_found, report_folder, seeker, wr
                         'zAsset-UUID = store.cloudphotodb-15',
                         'zAddAssetAttr-Original Stable Hash-16',
                         'zAddAssetAttr.Adjusted Stable Hash-17')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -397,10 +375,14 @@ def Ph003_2RemovedfromCameraRollSyndPL(files_found, report_folder, seeker, wrap_
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("14.8.1")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    if (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -444,11 +426,6 @@ def Ph003_2RemovedfromCameraRollSyndPL(files_found, report_folder, seeker, wrap_
         ORDER BY zAddAssetAttr.ZLASTUPLOADATTEMPTDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                      row[10], row[11], row[12], row[13]))
-
         data_headers = (('zAddAssetAttr-Last Upload Attempt Date-SWY_Files-0', 'datetime'),
                         'zAsset-Syndication State-1',
                         'zAsset-Directory-Path-2',
@@ -463,11 +440,11 @@ def Ph003_2RemovedfromCameraRollSyndPL(files_found, report_folder, seeker, wrap_
                         'zAddAssetAttr-zPK-11',
                         'zAsset-UUID = store.cloudphotodb-12',
                         'zAddAssetAttr-Master Fingerprint-13')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -518,11 +495,6 @@ def Ph003_2RemovedfromCameraRollSyndPL(files_found, report_folder, seeker, wrap_
         ORDER BY zAddAssetAttr.ZLASTUPLOADATTEMPTDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                      row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17]))
-
         data_headers = (('zAddAssetAttr-Last Upload Attempt Date-SWY_Files-0', 'datetime'),
                         'zAsset-Syndication State-1',
                         'zAsset-Directory-Path-2',
@@ -541,11 +513,11 @@ def Ph003_2RemovedfromCameraRollSyndPL(files_found, report_folder, seeker, wrap_
                         'zAddAssetAttr-zPK-15',
                         'zAsset-UUID = store.cloudphotodb-16',
                         'zAddAssetAttr-Master Fingerprint-17')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -595,11 +567,6 @@ def Ph003_2RemovedfromCameraRollSyndPL(files_found, report_folder, seeker, wrap_
         ORDER BY zAsset.ZTRASHEDSTATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                      row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17]))
-
         data_headers = (('zAsset-Trashed Date-0', 'datetime'),
                         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
                         'zAsset-Trashed by Participant= zShareParticipant_zPK-2',
@@ -618,7 +585,7 @@ def Ph003_2RemovedfromCameraRollSyndPL(files_found, report_folder, seeker, wrap_
                         'zAsset-UUID = store.cloudphotodb-15',
                         'zAddAssetAttr-Original Stable Hash-16',
                         'zAddAssetAttr.Adjusted Stable Hash-17')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -633,10 +600,14 @@ def Ph003_3TrashedRecentlyDeletedGenPlayPsql(files_found, report_folder, seeker,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -686,11 +657,6 @@ def Ph003_3TrashedRecentlyDeletedGenPlayPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZTRASHEDSTATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17]))
-
         data_headers = (('zAsset-Trashed Date-0', 'datetime'),
                         'zAsset-Trashed State-LocalAssetRecentlyDeleted-1',
                         'zAsset-Trashed by Participant= zShareParticipant_zPK-2',
@@ -709,6 +675,6 @@ def Ph003_3TrashedRecentlyDeletedGenPlayPsql(files_found, report_folder, seeker,
                         'zAsset-UUID = store.cloudphotodb-15',
                         'zAddAssetAttr-Original Stable Hash-16',
                         'zAddAssetAttr.Adjusted Stable Hash-17')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
@@ -34,8 +34,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -48,10 +47,14 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -82,11 +85,6 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10]))
-
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Hidden-1',
                         'zAsset-Directory-Path-2',
@@ -98,11 +96,11 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
                         'zAddAssetAttr-zPK-8',
                         'zAsset-UUID = store.cloudphotodb-9',
                         'zAddAssetAttr-Master Fingerprint-10')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -133,11 +131,6 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10]))
-
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Hidden-1',
                         'zAsset-Directory-Path-2',
@@ -149,11 +142,11 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
                         'zAddAssetAttr-zPK-8',
                         'zAsset-UUID = store.cloudphotodb-9',
                         'zAddAssetAttr-Master Fingerprint-10')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -185,11 +178,6 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11]))
-
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Hidden-1',
                         'zAsset-Directory-Path-2',
@@ -202,11 +190,11 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
                         'zAddAssetAttr-zPK-9',
                         'zAsset-UUID = store.cloudphotodb-10',
                         'zAddAssetAttr-Master Fingerprint-11')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -239,11 +227,6 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12]))
-                
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Hidden-1',
                         'zAsset-Directory-Path-2',
@@ -257,7 +240,7 @@ def Ph004_1HiddenPhDaPsql(files_found, report_folder, seeker, wrap_text, timezon
                         'zAsset-UUID = store.cloudphotodb-10',
                         'zAddAssetAttr-Original Stable Hash-11',
                         'zAddAssetAttr.Adjusted Stable Hash-12')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -272,10 +255,14 @@ def Ph004_3HiddenGenPlayPsql(files_found, report_folder, seeker, wrap_text, time
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenerativePlayground-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenerativePlayground-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -308,11 +295,6 @@ def Ph004_3HiddenGenPlayPsql(files_found, report_folder, seeker, wrap_text, time
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                  row[10], row[11], row[12]))
-                
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Hidden-1',
                         'zAsset-Directory-Path-2',
@@ -326,6 +308,6 @@ def Ph004_3HiddenGenPlayPsql(files_found, report_folder, seeker, wrap_text, time
                         'zAsset-UUID = store.cloudphotodb-10',
                         'zAddAssetAttr-Original Stable Hash-11',
                         'zAddAssetAttr.Adjusted Stable Hash-12')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
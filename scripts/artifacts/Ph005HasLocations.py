@@ -53,10 +53,7 @@ __artifacts_v2__ = {
 }
 
 import os
-import plistlib
-import nska_deserialize as nd
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -69,10 +66,14 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotosData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotosData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("13")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -126,43 +127,20 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_geoplaceresult = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_geoplaceresult = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[4] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[10])
 
-                with open(pathto, "rb") as fp:
-                    plist = plistlib.load(fp)
-                    for key, val in plist.items():
-                        if key == "geoPlaceResult":
-                            aaashiftedlocation_geoplaceresult = val
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[13] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[4] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[13])
 
-                with open(pathto, "rb") as fp:
-                    plist = plistlib.load(fp)
-                    for key, val in plist.items():
-                        if key == "geoPlaceResult":
-                            aaareverselocation_geoplaceresult = val
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            aaashiftedlocation_geoplaceresult,
-                            row[11], row[12],
-                            aaareverselocation_geoplaceresult,
-                            row[14], row[15], row[16], row[17]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zAsset-Longitude-2',
@@ -181,11 +159,11 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-15',
                         'zAsset-UUID = store.cloudphotodb-16',
                         'zAddAssetAttr-Master Fingerprint-17')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -269,54 +247,20 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[4] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[10])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[4])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[4])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[13] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[4] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[13])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[4])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[4])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            aaashiftedlocation_postal_address,
-                            row[11], row[12],
-                            aaareverselocation_postal_address,
-                            row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zAsset-Longitude-2',
@@ -341,11 +285,11 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-21',
                         'zAsset-UUID = store.cloudphotodb-22',
                         'zAddAssetAttr-Master Fingerprint-23')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -437,55 +381,20 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[13] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[13])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[16] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[16])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12],
-                            aaashiftedlocation_postal_address,
-                            row[14], row[15],
-                            aaareverselocation_postal_address,
-                            row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zExtAttr-Latitude-2',
@@ -513,11 +422,11 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-24',
                         'zAsset-UUID = store.cloudphotodb-25',
                         'zAddAssetAttr-Master Fingerprint-26')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -610,55 +519,20 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[14] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[14])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[17] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[17])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13],
-                            aaashiftedlocation_postal_address,
-                            row[15], row[16],
-                            aaareverselocation_postal_address,
-                            row[18], row[19], row[20], row[21], row[22], row[23], row[24], row[25],
-                            row[26], row[27]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zExtAttr-Latitude-2',
@@ -687,11 +561,11 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
                         'zAddAssetAttr-zPK-25',
                         'zAsset-UUID = store.cloudphotodb-26',
                         'zAddAssetAttr-Master Fingerprint-27')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -785,55 +659,20 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[14] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[14])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[17] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[17])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13],
-                            aaashiftedlocation_postal_address,
-                            row[15], row[16],
-                            aaareverselocation_postal_address,
-                            row[18], row[19], row[20], row[21], row[22], row[23], row[24], row[25],
-                            row[26], row[27], row[28]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zExtAttr-Latitude-2',
@@ -863,7 +702,7 @@ def Ph005_1AssetshavevalidlocationsPhDaPsql(files_found, report_folder, seeker,
                         'zAsset-UUID = store.cloudphotodb-26',
                         'zAddAssetAttr-Original Stable Hash-27',
                         'zAddAssetAttr.Adjusted Stable Hash-28')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
@@ -878,10 +717,14 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("13")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -935,43 +778,20 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_geoplaceresult = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_geoplaceresult = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[4] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[10])
 
-                with open(pathto, "rb") as fp:
-                    plist = plistlib.load(fp)
-                    for key, val in plist.items():
-                        if key == "geoPlaceResult":
-                            aaashiftedlocation_geoplaceresult = val
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[13] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[4] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[13])
 
-                with open(pathto, "rb") as fp:
-                    plist = plistlib.load(fp)
-                    for key, val in plist.items():
-                        if key == "geoPlaceResult":
-                            aaareverselocation_geoplaceresult = val
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              aaashiftedlocation_geoplaceresult,
-                              row[11], row[12],
-                              aaareverselocation_geoplaceresult,
-                              row[14], row[15], row[16], row[17]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zAsset-Longitude-2',
@@ -990,11 +810,11 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-15',
                         'zAsset-UUID = store.cloudphotodb-16',
                         'zAddAssetAttr-Master Fingerprint-17')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1078,54 +898,20 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[4] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[10])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[4])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[4])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[13] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[4] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[13])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[4])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[4])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              aaashiftedlocation_postal_address,
-                              row[11], row[12],
-                              aaareverselocation_postal_address,
-                              row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zAsset-Longitude-2',
@@ -1150,11 +936,11 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-21',
                         'zAsset-UUID = store.cloudphotodb-22',
                         'zAddAssetAttr-Master Fingerprint-23')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1246,55 +1032,20 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[13] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[13])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[16] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[16])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12],
-                              aaashiftedlocation_postal_address,
-                              row[14], row[15],
-                              aaareverselocation_postal_address,
-                              row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zExtAttr-Latitude-2',
@@ -1322,11 +1073,11 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-24',
                         'zAsset-UUID = store.cloudphotodb-25',
                         'zAddAssetAttr-Master Fingerprint-26')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1419,55 +1170,20 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[14] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[14])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[17] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[17])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13],
-                              aaashiftedlocation_postal_address,
-                              row[15], row[16],
-                              aaareverselocation_postal_address,
-                              row[18], row[19], row[20], row[21], row[22], row[23], row[24], row[25],
-                              row[26], row[27]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zExtAttr-Latitude-2',
@@ -1496,11 +1212,11 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
                         'zAddAssetAttr-zPK-25',
                         'zAsset-UUID = store.cloudphotodb-26',
                         'zAddAssetAttr-Master Fingerprint-27')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1594,55 +1310,20 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[14] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[14])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[17] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[17])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13],
-                              aaashiftedlocation_postal_address,
-                              row[15], row[16],
-                              aaareverselocation_postal_address,
-                              row[18], row[19], row[20], row[21], row[22], row[23], row[24], row[25],
-                              row[26], row[27], row[28]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zExtAttr-Latitude-2',
@@ -1672,7 +1353,7 @@ def Ph005_2AssetshavevalidlocationsSyndPL(files_found, report_folder, seeker, wr
                         'zAsset-UUID = store.cloudphotodb-26',
                         'zAddAssetAttr-Original Stable Hash-27',
                         'zAddAssetAttr.Adjusted Stable Hash-28')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
@@ -1687,10 +1368,14 @@ def Ph005_3AssetshavevalidlocationsGenPlayPsql(files_found, report_folder, seeke
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1784,55 +1469,20 @@ def Ph005_3AssetshavevalidlocationsGenPlayPsql(files_found, report_folder, seeke
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
-            aaashiftedlocation_postal_address = ''
-            # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
-            aaareverselocation_postal_address = ''
-
             # zAddAssetAttr.ZSHIFTEDLOCATIONDATA-PLIST
             if row[14] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ShiftedLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[14])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaashiftedlocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
             # zAddAssetAttr.ZREVERSELOCATIONDATA-PLIST
             if row[17] is not None:
                 pathto = os.path.join(report_folder, 'AAA_ReverseLocationData' + row[7] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[17])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        aaareverselocation_postal_address = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[7])
-                        else:
-                            logfunc('Error reading exported plist from zAsset-Filename ' + row[7])
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13],
-                            aaashiftedlocation_postal_address,
-                            row[15], row[16],
-                            aaareverselocation_postal_address,
-                            row[18], row[19], row[20], row[21], row[22], row[23], row[24], row[25],
-                            row[26], row[27], row[28]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Latitude-1',
                         'zExtAttr-Latitude-2',
@@ -1862,6 +1512,6 @@ def Ph005_3AssetshavevalidlocationsGenPlayPsql(files_found, report_folder, seeke
                         'zAsset-UUID = store.cloudphotodb-26',
                         'zAddAssetAttr-Original Stable Hash-27',
                         'zAddAssetAttr.Adjusted Stable Hash-28')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
\ No newline at end of file
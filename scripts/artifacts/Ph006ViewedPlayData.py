@@ -56,8 +56,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -70,10 +69,14 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotosData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotosData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("13")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -104,11 +107,6 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAddAssetAttr- Pending View Count',
                         'zAddAssetAttr- View Count',
@@ -123,11 +121,11 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -160,11 +158,6 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAsset-Analysis State Modification Date',
                         'zAddAssetAttr- Pending View Count',
@@ -180,11 +173,11 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -217,11 +210,6 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAsset-Analysis State Modification Date',
                         'zAddAssetAttr- Pending View Count',
@@ -237,11 +225,11 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -275,11 +263,6 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAsset-Analysis State Modification Date',
                         'zAddAssetAttr- Pending View Count',
@@ -296,11 +279,11 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) <= version.parse("16.5.1")):
+    elif (ios_version >= parse_version("16")) & (ios_version <= parse_version("16.5.1")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -334,11 +317,6 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAsset-Analysis State Modification Date',
                         'zAddAssetAttr- Pending View Count',
@@ -355,11 +333,11 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("16.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -394,11 +372,6 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16]))
-
         data_headers = (('zAddAssetAttr-Last Viewed Date-0', 'datetime'),
                         'zAsset-Modification Date-1',
                         ('zAsset-Analysis State Modification Date-2', 'datetime'),
@@ -416,11 +389,11 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
                         'zAddAssetAttr-zPK-14',
                         'zAsset-UUID = store.cloudphotodb-15',
                         'zAddAssetAttr-Master Fingerprint-16')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -461,11 +434,6 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18]))
-
         data_headers = (('zAddAssetAttr-Last Viewed Date-0', 'datetime'),
                         'zAsset-Modification Date-1',
                         ('zAsset-Analysis State Modification Date-2', 'datetime'),
@@ -485,7 +453,7 @@ def Ph006_1ViewandPlayDataPhDaPsql(files_found, report_folder, seeker, wrap_text
                         'zAsset-UUID = store.cloudphotodb-16',
                         'zAddAssetAttr-Original Stable Hash-17',
                         'zAddAssetAttr.Adjusted Stable Hash-18')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -500,10 +468,14 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotosData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotosData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("13")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -534,11 +506,6 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAddAssetAttr- Pending View Count',
                         'zAddAssetAttr- View Count',
@@ -553,11 +520,11 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -590,11 +557,6 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAsset-Analysis State Modification Date',
                         'zAddAssetAttr- Pending View Count',
@@ -610,11 +572,11 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -647,11 +609,6 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAsset-Analysis State Modification Date',
                         'zAddAssetAttr- Pending View Count',
@@ -667,11 +624,11 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -705,11 +662,6 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAsset-Analysis State Modification Date',
                         'zAddAssetAttr- Pending View Count',
@@ -726,11 +678,11 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) <= version.parse("16.5.1")):
+    elif (ios_version >= parse_version("16")) & (ios_version <= parse_version("16.5.1")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -764,11 +716,6 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15]))
-
         data_headers = (('zAsset-Modification Date', 'datetime'),
                         'zAsset-Analysis State Modification Date',
                         'zAddAssetAttr- Pending View Count',
@@ -785,11 +732,11 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("16.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -824,11 +771,6 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16]))
-
         data_headers = (('zAddAssetAttr-Last Viewed Date-0', 'datetime'),
                         'zAsset-Modification Date-1',
                         ('zAsset-Analysis State Modification Date-2', 'datetime'),
@@ -846,11 +788,11 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK-14',
                         'zAsset-UUID = store.cloudphotodb-15',
                         'zAddAssetAttr-Master Fingerprint-16')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -891,11 +833,6 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18]))
-
         data_headers = (('zAddAssetAttr-Last Viewed Date-0', 'datetime'),
                         'zAsset-Modification Date-1',
                         ('zAsset-Analysis State Modification Date-2', 'datetime'),
@@ -915,7 +852,7 @@ def Ph006_2ViewandPlayDataSyndPL(files_found, report_folder, seeker, wrap_text,
                         'zAsset-UUID = store.cloudphotodb-16',
                         'zAddAssetAttr-Original Stable Hash-17',
                         'zAddAssetAttr.Adjusted Stable Hash-18')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -930,10 +867,14 @@ def Ph006_3ViewandPlayDataGenPlayPsql(files_found, report_folder, seeker, wrap_t
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -974,11 +915,6 @@ def Ph006_3ViewandPlayDataGenPlayPsql(files_found, report_folder, seeker, wrap_t
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18]))
-
         data_headers = (('zAddAssetAttr-Last Viewed Date-0', 'datetime'),
                         'zAsset-Modification Date-1',
                         ('zAsset-Analysis State Modification Date-2', 'datetime'),
@@ -998,6 +934,6 @@ def Ph006_3ViewandPlayDataGenPlayPsql(files_found, report_folder, seeker, wrap_t
                         'zAsset-UUID = store.cloudphotodb-16',
                         'zAddAssetAttr-Original Stable Hash-17',
                         'zAddAssetAttr.Adjusted Stable Hash-18')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
@@ -34,8 +34,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -48,10 +47,14 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -81,11 +84,6 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10]))
-
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Favorite-1',
                         'zAsset-Directory-Path-2',
@@ -97,11 +95,11 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
                         'zAddAssetAttr-zPK-8',
                         'zAsset-UUID = store.cloudphotodb-9',
                         'zAddAssetAttr-Master Fingerprint-10')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -131,11 +129,6 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10]))
-
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Favorite-1',
                         'zAsset-Directory-Path-2',
@@ -147,11 +140,11 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
                         'zAddAssetAttr-zPK-8',
                         'zAsset-UUID = store.cloudphotodb-9',
                         'zAddAssetAttr-Master Fingerprint-10')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -182,11 +175,6 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11]))
-
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Favorite-1',
                         'zAsset-Directory-Path-2',
@@ -199,11 +187,11 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
                         'zAddAssetAttr-zPK-9',
                         'zAsset-UUID = store.cloudphotodb-10',
                         'zAddAssetAttr-Master Fingerprint-11')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -235,11 +223,6 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12]))
-
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Favorite-1',
                         'zAsset-Directory-Path-2',
@@ -253,7 +236,7 @@ def Ph007_1FavoritePhDaPsql(files_found, report_folder, seeker, wrap_text, timez
                         'zAsset-UUID = store.cloudphotodb-10',
                         'zAddAssetAttr-Original Stable Hash-11',
                         'zAddAssetAttr.Adjusted Stable Hash-12')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -268,10 +251,14 @@ def Ph007_3FavoriteGenPlayPsql(files_found, report_folder, seeker, wrap_text, ti
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -303,11 +290,6 @@ def Ph007_3FavoriteGenPlayPsql(files_found, report_folder, seeker, wrap_text, ti
         ORDER BY zAsset.ZMODIFICATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12]))
-
         data_headers = (('zAsset-Modification Date-0', 'datetime'),
                         'zAsset-Favorite-1',
                         'zAsset-Directory-Path-2',
@@ -321,6 +303,6 @@ def Ph007_3FavoriteGenPlayPsql(files_found, report_folder, seeker, wrap_text, ti
                         'zAsset-UUID = store.cloudphotodb-10',
                         'zAddAssetAttr-Original Stable Hash-11',
                         'zAddAssetAttr.Adjusted Stable Hash-12')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
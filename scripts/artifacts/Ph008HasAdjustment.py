@@ -34,8 +34,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph008_1HasAdjustmentPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -48,10 +47,14 @@ def Ph008_1HasAdjustmentPhDaPsql(files_found, report_folder, seeker, wrap_text,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -108,11 +111,6 @@ def Ph008_1HasAdjustmentPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zUnmAdj.ZADJUSTMENTTIMESTAMP
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15]))
-
         data_headers = (('zUnmAdj-Adjustment Timestamp', 'datetime'),
                         'zAsset-Has Adjustments-Camera-Effects-Filters',
                         'zAddAssetAttr-Editor Bundle ID',
@@ -129,11 +127,11 @@ def Ph008_1HasAdjustmentPhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK',
                         'zAsset-UUID = store.cloudphotodb',
                         'zAddAssetAttr-Master Fingerprint')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -191,11 +189,6 @@ def Ph008_1HasAdjustmentPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zUnmAdj.ZADJUSTMENTTIMESTAMP
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16]))
-
         data_headers = (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
                         'zAsset-Has Adjustments-Camera-Effects-Filters-1',
                         'zAddAssetAttr-Editor Bundle ID-2',
@@ -213,11 +206,11 @@ def Ph008_1HasAdjustmentPhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zAsset-UUID = store.cloudphotodb-14',
                         'zAddAssetAttr-Master Fingerprint-15',
                         'zAddAssetAttr.Adjusted Fingerprint-16')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -310,13 +303,6 @@ def Ph008_1HasAdjustmentPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zUnmAdj.ZADJUSTMENTTIMESTAMP
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32]))
-
         data_headers = (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
                         'zAsset-Adjustments_State/Camera-Effects-Filters-1',
                         'zCompSyncAttr-Cloud_Compute_State_Last_Updated_Date-2',
@@ -350,7 +336,7 @@ def Ph008_1HasAdjustmentPhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zCompSyncAttr-Cloud_Compute_State_Adjustment_Fingerprint-30',
                         'zExtAttr-Generative_AI_Type-31',
                         'zExtAttr-Credit-32')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -365,10 +351,14 @@ def Ph008_3HasAdjustmentGenPlayPsql(files_found, report_folder, seeker, wrap_tex
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -461,13 +451,6 @@ def Ph008_3HasAdjustmentGenPlayPsql(files_found, report_folder, seeker, wrap_tex
         ORDER BY zUnmAdj.ZADJUSTMENTTIMESTAMP
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32]))
-
         data_headers = (('zUnmAdj-Adjustment Timestamp-0', 'datetime'),
                         'zAsset-Adjustments_State/Camera-Effects-Filters-1',
                         'zCompSyncAttr-Cloud_Compute_State_Last_Updated_Date-2',
@@ -501,6 +484,6 @@ def Ph008_3HasAdjustmentGenPlayPsql(files_found, report_folder, seeker, wrap_tex
                         'zCompSyncAttr-Cloud_Compute_State_Adjustment_Fingerprint-30',
                         'zExtAttr-Generative_AI_Type-31',
                         'zExtAttr-Credit-32')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
@@ -34,8 +34,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph009_1BurstAvalanchePhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -48,10 +47,14 @@ def Ph009_1BurstAvalanchePhDaPsql(files_found, report_folder, seeker, wrap_text,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -103,11 +106,6 @@ def Ph009_1BurstAvalanchePhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZDATECREATED    
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Avalanche_Pick_Type-BurstAsset-1',
                         'zAddAssetAttr-Cloud_Avalanche_Pick_Type-BurstAsset-2',
@@ -121,11 +119,11 @@ def Ph009_1BurstAvalanchePhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK-10',
                         'zAsset-UUID = store.cloudphotodb-11',
                         'zAddAssetAttr-Master Fingerprint-12')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -177,11 +175,6 @@ def Ph009_1BurstAvalanchePhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZDATECREATED    
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Avalanche_Pick_Type-BurstAsset-1',
                         'zAddAssetAttr-Cloud_Avalanche_Pick_Type-BurstAsset-2',
@@ -195,11 +188,11 @@ def Ph009_1BurstAvalanchePhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zAddAssetAttr-zPK-10',
                         'zAsset-UUID = store.cloudphotodb-11',
                         'zAddAssetAttr-Master Fingerprint-12')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -257,11 +250,6 @@ def Ph009_1BurstAvalanchePhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zAsset.ZDATECREATED    
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Avalanche_Kind-1',
                         'zAsset-Avalanche_Pick_Type-BurstAsset-2',
@@ -277,7 +265,7 @@ def Ph009_1BurstAvalanchePhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zAsset-UUID = store.cloudphotodb-12',
                         'zAddAssetAttr-Original Stable Hash-13',
                         'zAddAssetAttr.Adjusted Stable Hash-14')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -292,10 +280,14 @@ def Ph009_3BurstAvalancheGenPlayPsql(files_found, report_folder, seeker, wrap_te
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -353,11 +345,6 @@ def Ph009_3BurstAvalancheGenPlayPsql(files_found, report_folder, seeker, wrap_te
         ORDER BY zAsset.ZDATECREATED    
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-Avalanche_Kind-1',
                         'zAsset-Avalanche_Pick_Type-BurstAsset-2',
@@ -373,6 +360,6 @@ def Ph009_3BurstAvalancheGenPlayPsql(files_found, report_folder, seeker, wrap_te
                         'zAsset-UUID = store.cloudphotodb-12',
                         'zAddAssetAttr-Original Stable Hash-13',
                         'zAddAssetAttr.Adjusted Stable Hash-14')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
@@ -46,8 +46,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -60,10 +59,14 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    if (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -213,17 +216,6 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
         ORDER BY zAsset.ZDATECREATED        
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -295,11 +287,11 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
                         'zAddAssetAttr-zPK-68',
                         'zAsset-UUID = store.cloudphotodb-69',
                         'zAddAssetAttr-Master Fingerprint-70')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -473,18 +465,6 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
         ORDER BY zAsset.ZDATECREATED        
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -561,11 +541,11 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
                         'zAddAssetAttr-zPK-73',
                         'zAsset-UUID = store.cloudphotodb-74',
                         'zAddAssetAttr-Master Fingerprint-75')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -745,18 +725,6 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
         ORDER BY zAsset.ZDATECREATED        
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -835,11 +803,11 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
                         'zAddAssetAttr-zPK-75',
                         'zAsset-UUID = store.cloudphotodb-76',
                         'zAddAssetAttr-Master Fingerprint-77')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1019,18 +987,6 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
         ORDER BY zAsset.ZDATECREATED        
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                                row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                                row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                                row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                                row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                                row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                                row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                                row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                                row[73], row[74], row[75], row[76], row[77]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -1109,11 +1065,11 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
                         'zAddAssetAttr-zPK-75',
                         'zAsset-UUID = store.cloudphotodb-76',
                         'zAddAssetAttr-Master Fingerprint-77')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1299,18 +1255,6 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
         ORDER BY zAsset.ZDATECREATED       
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -1391,11 +1335,11 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
                         'zAsset-UUID = store.cloudphotodb-77',
                         'zAddAssetAttr-Original Stable Hash-78',
                         'zAddAssetAttr.Adjusted Stable Hash-79')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1581,18 +1525,6 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
         ORDER BY zAsset.ZDATECREATED       
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -1673,7 +1605,7 @@ def Ph011_1KwrdsCapsTitlesDescripsLikesBasicAsstDataPhDaPsql(files_found, report
                         'zAsset-UUID = store.cloudphotodb-77',
                         'zAddAssetAttr-Original Stable Hash-78',
                         'zAddAssetAttr.Adjusted Stable Hash-79')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -1688,10 +1620,14 @@ def Ph011_3KwrdsCapsTitlesDescripsLikesBasicAsstDataGenPlayPsql(files_found, rep
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    if (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1877,18 +1813,6 @@ def Ph011_3KwrdsCapsTitlesDescripsLikesBasicAsstDataGenPlayPsql(files_found, rep
         ORDER BY zAsset.ZDATECREATED       
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -1969,11 +1893,11 @@ def Ph011_3KwrdsCapsTitlesDescripsLikesBasicAsstDataGenPlayPsql(files_found, rep
                         'zAsset-UUID = store.cloudphotodb-77',
                         'zAddAssetAttr-Original Stable Hash-78',
                         'zAddAssetAttr.Adjusted Stable Hash-79')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2159,18 +2083,6 @@ def Ph011_3KwrdsCapsTitlesDescripsLikesBasicAsstDataGenPlayPsql(files_found, rep
         ORDER BY zAsset.ZDATECREATED       
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
                         ('zAsset-Added Date-2', 'datetime'),
@@ -2251,6 +2163,6 @@ def Ph011_3KwrdsCapsTitlesDescripsLikesBasicAsstDataGenPlayPsql(files_found, rep
                         'zAsset-UUID = store.cloudphotodb-77',
                         'zAddAssetAttr-Original Stable Hash-78',
                         'zAddAssetAttr.Adjusted Stable Hash-79')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
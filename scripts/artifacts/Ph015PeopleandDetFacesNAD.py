@@ -33,9 +33,7 @@ __artifacts_v2__ = {
 }
 
 import os
-import nska_deserialize as nd
-from packaging import version
-from scripts.ilapfuncs import media_to_html, artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -48,10 +46,14 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    if (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -328,51 +330,19 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[3] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[89] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[3])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[89])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[89])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[87] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[10])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2],
-                            personcontactmatchingdictionary,
-                            row[4], row[5], row[6], row[7], row[8], row[9],
-                            facecropresourcedata_blob,
-                            row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zFaceCrop-Asset Key-1',
@@ -466,11 +436,11 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zPerson-Person UUID-89',
                         'zPerson-Person URI-90',
                         'zDetFaceGroup-UUID-91')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -835,52 +805,19 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[3] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[105] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[3])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[105])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[105])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[103] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[10])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2],
-                            personcontactmatchingdictionary,
-                            row[4], row[5], row[6], row[7], row[8], row[9],
-                            facecropresourcedata_blob,
-                            row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zFaceCrop-Asset Key-1',
@@ -990,11 +927,11 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zPerson-Person UUID-105',
                         'zPerson-Person URI-106',
                         'zDetFaceGroup-UUID-107')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1361,53 +1298,19 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[3] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[107] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[3])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[107])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[107])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[105] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[10])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2],
-                            personcontactmatchingdictionary,
-                            row[4], row[5], row[6], row[7], row[8], row[9],
-                            facecropresourcedata_blob,
-                            row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zFaceCrop-Asset Key-1',
@@ -1519,11 +1422,11 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zPerson-Person UUID-107',
                         'zPerson-Person URI-108',
                         'zDetFaceGroup-UUID-109')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1894,53 +1797,19 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[5] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[111] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[5])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[111])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[111])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[12] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[109] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[12])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4],
-                            personcontactmatchingdictionary,
-                            row[6], row[7], row[8], row[9], row[10], row[11],
-                            facecropresourcedata_blob,
-                            row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109], row[110], row[111], row[112], row[113]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zDetFace-AssetForTorso= zAsset-zPK-1',
@@ -2056,11 +1925,11 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zPerson-Person UUID-111',
                         'zPerson-Person URI-112',
                         'zDetFaceGroup-UUID-113')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2432,53 +2301,19 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[5] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[112] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[5])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[112])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[112])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[13] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[110] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[13])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4],
-                            personcontactmatchingdictionary,
-                            row[6], row[7], row[8], row[9], row[10], row[11], row[12],
-                            facecropresourcedata_blob,
-                            row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109], row[110], row[111], row[112], row[113], row[114]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zDetFace-AssetForTorso= zAsset-zPK-1',
@@ -2595,7 +2430,7 @@ def Ph015_1PeopleFacesNADPhDaPsql(files_found, report_folder, seeker, wrap_text,
                         'zPerson-Person UUID-112',
                         'zPerson-Person URI-113',
                         'zDetFaceGroup-UUID-114')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
@@ -2610,10 +2445,14 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    if (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2890,51 +2729,19 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[3] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[89] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[3])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[89])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[89])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[87] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[10])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2],
-                              personcontactmatchingdictionary,
-                              row[4], row[5], row[6], row[7], row[8], row[9],
-                              facecropresourcedata_blob,
-                              row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zFaceCrop-Asset Key-1',
@@ -3028,11 +2835,11 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
                         'zPerson-Person UUID-89',
                         'zPerson-Person URI-90',
                         'zDetFaceGroup-UUID-91')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3397,52 +3204,19 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[3] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[105] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[3])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[105])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[105])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[103] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[10])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2],
-                              personcontactmatchingdictionary,
-                              row[4], row[5], row[6], row[7], row[8], row[9],
-                              facecropresourcedata_blob,
-                              row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                              row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zFaceCrop-Asset Key-1',
@@ -3552,11 +3326,11 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
                         'zPerson-Person UUID-105',
                         'zPerson-Person URI-106',
                         'zDetFaceGroup-UUID-107')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3923,53 +3697,19 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[3] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[107] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[3])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[107])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[107])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[10] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[105] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[10])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2],
-                              personcontactmatchingdictionary,
-                              row[4], row[5], row[6], row[7], row[8], row[9],
-                              facecropresourcedata_blob,
-                              row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                              row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                              row[108], row[109]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zFaceCrop-Asset Key-1',
@@ -4081,11 +3821,11 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
                         'zPerson-Person UUID-107',
                         'zPerson-Person URI-108',
                         'zDetFaceGroup-UUID-109')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -4456,53 +4196,19 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[5] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[111] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[5])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[111])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[111])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[12] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[109] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[12])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4],
-                              personcontactmatchingdictionary,
-                              row[6], row[7], row[8], row[9], row[10], row[11],
-                              facecropresourcedata_blob,
-                              row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                              row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                              row[108], row[109], row[110], row[111], row[112], row[113]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zDetFace-AssetForTorso= zAsset-zPK-1',
@@ -4618,11 +4324,11 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
                         'zPerson-Person UUID-111',
                         'zPerson-Person URI-112',
                         'zDetFaceGroup-UUID-113')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -4994,54 +4700,19 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
         ORDER BY zDetFace.Z_PK
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[5] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[112] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[5])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[112])
-                        else:
-                            logfunc(
-                                'Error reading exported plist from zPerson-Contact Matching Dictionary' + row[112])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[13] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[110] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[13])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4],
-                              personcontactmatchingdictionary,
-                              row[6], row[7], row[8], row[9], row[10], row[11], row[12],
-                              facecropresourcedata_blob,
-                              row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                              row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                              row[108], row[109], row[110], row[111], row[112], row[113], row[114]))
 
         data_headers = ('zDetFace-AssetForFace= zAsset-zPK-0',
                         'zDetFace-AssetForTorso= zAsset-zPK-1',
@@ -5158,7 +4829,7 @@ def Ph015_2PeopleFacesNADSyndPL(files_found, report_folder, seeker, wrap_text, t
                         'zPerson-Person UUID-112',
                         'zPerson-Person URI-113',
                         'zDetFaceGroup-UUID-114')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
         
@@ -34,9 +34,7 @@ __artifacts_v2__ = {
 }
 
 import os
-import nska_deserialize as nd
-from packaging import version
-from scripts.ilapfuncs import media_to_html, artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -49,10 +47,14 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):   
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("27")):   
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    if (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -378,54 +380,19 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[22] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[108] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[22])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[108])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[108])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[29] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[106] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[29])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21],
-                            personcontactmatchingdictionary,
-                            row[23], row[24], row[25], row[26], row[27], row[28],
-                            facecropresourcedata_blob,
-                            row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                            row[116]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -544,11 +511,11 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
                         'zAddAssetAttr-zPK-114',
                         'zAsset-UUID = store.cloudphotodb-115',
                         'zAddAssetAttr-Master Fingerprint-116')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -965,57 +932,19 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[25] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[127] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[25])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[127])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[127])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[32] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[125] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[32])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24],
-                            personcontactmatchingdictionary,
-                            row[26], row[27],
-                            row[28], row[29], row[30], row[31],
-                            facecropresourcedata_blob,
-                            row[33], row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-                            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-                            row[132], row[133], row[134], row[135]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -1153,11 +1082,11 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
                         'zAddAssetAttr-zPK-133',
                         'zAsset-UUID = store.cloudphotodb-134',
                         'zAddAssetAttr-Master Fingerprint-135')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1577,56 +1506,19 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[26] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[130] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[26])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[130])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[130])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[33] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[128] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[33])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25],
-                            personcontactmatchingdictionary,
-                            row[27], row[28], row[29], row[30], row[31], row[32],
-                            facecropresourcedata_blob,
-                            row[34], row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-                            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-                            row[132], row[133], row[134], row[135], row[136], row[137], row[138]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -1767,11 +1659,11 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
                         'zAddAssetAttr-zPK-136',
                         'zAsset-UUID = store.cloudphotodb-137',
                         'zAddAssetAttr-Master Fingerprint-138')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2195,57 +2087,19 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[27] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[133] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[27])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[133])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[133])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[34] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[131] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[34])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26],
-                            personcontactmatchingdictionary,
-                            row[28], row[29], row[30], row[31], row[32], row[33],
-                            facecropresourcedata_blob,
-                            row[35], row[36],
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-                            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-                            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-                            row[140], row[141], row[142]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -2390,11 +2244,11 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
                         'zAddAssetAttr-zPK-140',
                         'zAsset-UUID = store.cloudphotodb-141',
                         'zAddAssetAttr-Master Fingerprint-142')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2825,56 +2679,19 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[28] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[135] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[28])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[135])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[135])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[36] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[133] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[36])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            personcontactmatchingdictionary,
-                            row[29], row[30], row[31], row[32], row[33], row[34], row[35],
-                            facecropresourcedata_blob,
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-                            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-                            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-                            row[140], row[141], row[142], row[143], row[144], row[145]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -3022,7 +2839,7 @@ def Ph016_1PeopleFacesAssetDataPhDaPsql(files_found, report_folder, seeker, wrap
                         'zAsset-UUID = store.cloudphotodb-143',
                         'zAddAssetAttr-Original Stable Hash-144',
                         'zAddAssetAttr.Adjusted Stable Hash-145')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
@@ -3037,10 +2854,14 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("27")):   
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("27")):   
         logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    if (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3366,54 +3187,19 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[22] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[108] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[22])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[108])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[108])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[29] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[106] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[29])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21],
-                              personcontactmatchingdictionary,
-                              row[23], row[24], row[25], row[26], row[27], row[28],
-                              facecropresourcedata_blob,
-                              row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                              row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                              row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                              row[116]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -3532,11 +3318,11 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
                         'zAddAssetAttr-zPK-114',
                         'zAsset-UUID = store.cloudphotodb-115',
                         'zAddAssetAttr-Master Fingerprint-116')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3953,57 +3739,19 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[25] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[127] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[25])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[127])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[127])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[32] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[125] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[32])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24],
-                              personcontactmatchingdictionary,
-                              row[26], row[27],
-                              row[28], row[29], row[30], row[31],
-                              facecropresourcedata_blob,
-                              row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                              row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                              row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                              row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-                              row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-                              row[132], row[133], row[134], row[135]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -4141,11 +3889,11 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
                         'zAddAssetAttr-zPK-133',
                         'zAsset-UUID = store.cloudphotodb-134',
                         'zAddAssetAttr-Master Fingerprint-135')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -4565,56 +4313,19 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[26] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[130] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[26])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[130])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[130])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[33] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[128] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[33])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25],
-                              personcontactmatchingdictionary,
-                              row[27], row[28], row[29], row[30], row[31], row[32],
-                              facecropresourcedata_blob,
-                              row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                              row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                              row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                              row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-                              row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-                              row[132], row[133], row[134], row[135], row[136], row[137], row[138]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -4755,11 +4466,11 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
                         'zAddAssetAttr-zPK-136',
                         'zAsset-UUID = store.cloudphotodb-137',
                         'zAddAssetAttr-Master Fingerprint-138')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("17")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -5183,57 +4894,19 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[27] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[133] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[27])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[133])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[133])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[34] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[131] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[34])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26],
-                              personcontactmatchingdictionary,
-                              row[28], row[29], row[30], row[31], row[32], row[33],
-                              facecropresourcedata_blob,
-                              row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                              row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                              row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                              row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-                              row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-                              row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-                              row[140], row[141], row[142]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -5378,11 +5051,11 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
                         'zAddAssetAttr-zPK-140',
                         'zAsset-UUID = store.cloudphotodb-141',
                         'zAddAssetAttr-Master Fingerprint-142')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -5813,56 +5486,19 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
         ORDER BY zAsset.ZDATECREATED
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
+        db_records = get_photos_db_records(source_path, query)
         for row in db_records:
-            # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
-            personcontactmatchingdictionary = ''
-            # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
-            facecropresourcedata_blob = ''
-
             # zPerson.ZCONTACTMATCHINGDICTIONARY-PLIST
             if row[28] is not None:
                 pathto = os.path.join(report_folder, 'zPerson-ContactMatchingDict_' + row[135] + '.plist')
                 with open(pathto, 'ab') as wf:
                     wf.write(row[28])
 
-                with open(pathto, 'rb') as f:
-                    try:
-                        deserialized_plist = nd.deserialize_plist(f)
-                        personcontactmatchingdictionary = deserialized_plist
-
-                    except (KeyError, ValueError, TypeError) as ex:
-                        if str(ex).find("does not contain an '$archiver' key") >= 0:
-                            logfunc('plist was Not an NSKeyedArchive ' + row[135])
-                        else:
-                            logfunc('Error reading exported plist from zPerson-Contact Matching Dictionary' + row[135])
-
             # zFaceCrop.ZRESOURCEDATA-BLOB_JPG
             if row[36] is not None:
                 pathto = os.path.join(report_folder, 'FaceCropFor_' + row[133] + '.jpg')
                 with open(pathto, 'wb') as file:
                     file.write(row[36])
-                facecropresourcedata_blob = media_to_html(pathto, files_found, report_folder)
-
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                            row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                            row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                            personcontactmatchingdictionary,
-                            row[29], row[30], row[31], row[32], row[33], row[34], row[35],
-                            facecropresourcedata_blob,
-                            row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                            row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                            row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                            row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                            row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                            row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                            row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-                            row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-                            row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-                            row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-                            row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-                            row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-                            row[140], row[141], row[142], row[143], row[144], row[145]))
 
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('zAsset- SortToken -CameraRoll-1', 'datetime'),
@@ -6010,6 +5646,6 @@ def Ph016_2PeopleFacesAssetDataSyndPL(files_found, report_folder, seeker, wrap_t
                         'zAsset-UUID = store.cloudphotodb-143',
                         'zAddAssetAttr-Original Stable Hash-144',
                         'zAddAssetAttr.Adjusted Stable Hash-145')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = db_records
 
         return data_headers, data_list, source_path
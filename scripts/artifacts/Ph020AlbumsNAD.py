@@ -59,8 +59,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -73,10 +72,14 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
     if report_folder.endswith('-') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -119,11 +122,6 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zGenAlbum.ZSTARTDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11]))
-
         data_headers = (('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
                         'zGenAlbum-Album Kind',
@@ -136,11 +134,11 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-UUID',
                         'zGenAlbum-Cloud GUID')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -185,11 +183,6 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11], row[12], row[13]))
-
         data_headers = (('zGenAlbum-Creation Date', 'datetime'),
                         ('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
@@ -204,11 +197,11 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-UUID',
                         'zGenAlbum-Cloud GUID')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -253,11 +246,6 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11], row[12], row[13]))
-
         data_headers = (('zGenAlbum-Creation Date', 'datetime'),
                         ('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
@@ -272,11 +260,11 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-UUID',
                         'zGenAlbum-Cloud GUID')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -321,11 +309,6 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11], row[12], row[13]))
-
         data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -340,7 +323,7 @@ def Ph020_1AlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_
                         ('zGenAlbum-Trash Date-11', 'datetime'),
                         'zGenAlbum-UUID-12',
                         'zGenAlbum-Cloud GUID-13')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -355,10 +338,14 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("14")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -401,11 +388,6 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zGenAlbum.ZSTARTDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11]))
-
         data_headers = (('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
                         'zGenAlbum-Album Kind',
@@ -418,11 +400,11 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-UUID',
                         'zGenAlbum-Cloud GUID')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -467,11 +449,6 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11], row[12], row[13]))
-
         data_headers = (('zGenAlbum-Creation Date', 'datetime'),
                         ('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
@@ -486,11 +463,11 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-UUID',
                         'zGenAlbum-Cloud GUID')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -535,11 +512,6 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11], row[12], row[13]))
-
         data_headers = (('zGenAlbum-Creation Date', 'datetime'),
                         ('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
@@ -554,11 +526,11 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-UUID',
                         'zGenAlbum-Cloud GUID')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -603,11 +575,6 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11], row[12], row[13]))
-
         data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -622,7 +589,7 @@ def Ph020_2AlbumRecordswithNADSyndPL(files_found, report_folder, seeker, wrap_te
                         ('zGenAlbum-Trash Date-11', 'datetime'),
                         'zGenAlbum-UUID-12',
                         'zGenAlbum-Cloud GUID-13')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -637,10 +604,14 @@ def Ph020_3AlbumRecordswithNADGenPlayPsql(files_found, report_folder, seeker, wr
     if report_folder.endswith('-') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for GenPlay-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for GenPlay-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -685,11 +656,6 @@ def Ph020_3AlbumRecordswithNADGenPlayPsql(files_found, report_folder, seeker, wr
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
 
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7],
-                              row[8], row[9], row[10], row[11], row[12], row[13]))
-
         data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -704,6 +670,6 @@ def Ph020_3AlbumRecordswithNADGenPlayPsql(files_found, report_folder, seeker, wr
                         ('zGenAlbum-Trash Date-11', 'datetime'),
                         'zGenAlbum-UUID-12',
                         'zGenAlbum-Cloud GUID-13')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
\ No newline at end of file
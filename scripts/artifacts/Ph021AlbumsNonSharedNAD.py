@@ -18,8 +18,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -32,10 +31,14 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("12")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -185,13 +188,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZSTARTDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35]))
-
         data_headers = (('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
                         'ParentzGenAlbum-UUID',
@@ -228,11 +224,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Custom Query Type',
                         'zGenAlbum-Trashed State',
                         ('zGenAlbum-Trash Date', 'datetime'))
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
+    elif (ios_version >= parse_version("12")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -392,14 +388,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZSTARTDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37]))
-
         data_headers = (('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
                         'ParentzGenAlbum-UUID',
@@ -438,11 +426,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Trashed State',
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-Cloud Delete State')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -612,14 +600,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40]))
-
         data_headers = (('zGenAlbum-Creation Date', 'datetime'),
                         ('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
@@ -661,11 +641,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Trashed State',
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-Cloud Delete State')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -846,14 +826,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44]))
-
         data_headers = (('zGenAlbum-Creation Date', 'datetime'),
                         ('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
@@ -899,11 +871,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Trashed State',
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-Cloud Delete State')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1084,14 +1056,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44]))
-
         data_headers = (('zGenAlbum-Creation Date', 'datetime'),
                         ('zGenAlbum-Start Date', 'datetime'),
                         ('zGenAlbum-End Date', 'datetime'),
@@ -1137,11 +1101,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Trashed State',
                         ('zGenAlbum-Trash Date', 'datetime'),
                         'zGenAlbum-Cloud Delete State')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1340,15 +1304,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47]))
-
         data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -1397,11 +1352,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Search Index Rebuild State-45',
                         'zGenAlbum-Duplicate Type-46',
                         'zGenAlbum-Privacy State-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1600,15 +1555,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47]))
-
         data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -1657,11 +1603,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Search Index Rebuild State-45',
                         'zGenAlbum-Duplicate Type-46',
                         'zGenAlbum-Privacy State-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1860,15 +1806,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47]))
-
         data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -1917,11 +1854,11 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Search Index Rebuild State-45',
                         'zGenAlbum-Duplicate Type-46',
                         'zGenAlbum-Privacy State-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2120,15 +2057,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47]))
-
         data_headers = (('zGenAlbum-Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -2177,6 +2105,6 @@ def Ph021NonSharedAlbumRecordswithNADPhDaPsql(files_found, report_folder, seeker
                         'zGenAlbum-Search Index Rebuild State-45',
                         'zGenAlbum-Duplicate Type-46',
                         'zGenAlbum-Privacy State-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
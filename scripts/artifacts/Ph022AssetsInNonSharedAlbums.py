@@ -17,8 +17,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -31,10 +30,14 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("12")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -222,16 +225,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -288,11 +281,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Custom Query Type-53',
                         'zGenAlbum-Trashed State-54',
                         ('zGenAlbum-Trash Date-55', 'datetime'))
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
+    elif (ios_version >= parse_version("12")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -490,16 +483,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -558,11 +541,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Trashed State-55',
                         ('zGenAlbum-Trash Date-56', 'datetime'),
                         'zGenAlbum-Cloud Delete State-57')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -770,16 +753,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -841,11 +814,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Trashed State-58',
                         ('zGenAlbum-Trash Date-59', 'datetime'),
                         'zGenAlbum-Cloud Delete State-60')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1070,17 +1043,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -1148,11 +1110,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Trashed State-64',
                         ('zGenAlbum-Trash Date-65', 'datetime'),
                         'zGenAlbum-Cloud Delete State-66')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1396,17 +1358,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -1477,11 +1428,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Trashed State-67',
                         ('zGenAlbum-Trash Date-68', 'datetime'),
                         'zGenAlbum-Cloud Delete State-69')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1748,18 +1699,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -1835,11 +1774,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Search Index Rebuild State-72',
                         'zGenAlbum-Duplicate Type-73',
                         'zGenAlbum-Privacy State-74')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2106,18 +2045,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -2193,11 +2120,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Search Index Rebuild State-72',
                         'zGenAlbum-Duplicate Type-73',
                         'zGenAlbum-Privacy State-74')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2470,18 +2397,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -2559,11 +2474,11 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Search Index Rebuild State-74',
                         'zGenAlbum-Duplicate Type-75',
                         'zGenAlbum-Privacy State-76')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2836,18 +2751,6 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -2925,7 +2828,7 @@ def Ph022AssetsinNonSharedAlbumsPhDaPsql(files_found, report_folder, seeker, wra
                         'zGenAlbum-Search Index Rebuild State-74',
                         'zGenAlbum-Duplicate Type-75',
                         'zGenAlbum-Privacy State-76')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
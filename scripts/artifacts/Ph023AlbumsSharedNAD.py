@@ -18,8 +18,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -32,10 +31,14 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("26")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("26")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("12")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -225,16 +228,6 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zGenAlbum.ZSTARTDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57]))
-
         data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -293,11 +286,11 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
                         'zCldShareAlbumInvRec-Album GUID-55',
                         'zCldShareAlbumInvRec-Cloud GUID-56',
                         'zAlbumList-Needs Reordering Number-57')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
+    elif (ios_version >= parse_version("12")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -491,16 +484,6 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zGenAlbum.ZSTARTDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57]))
-
         data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
                         ('zGenAlbum-Start Date-1', 'datetime'),
                         ('zGenAlbum-End Date-2', 'datetime'),
@@ -559,11 +542,11 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
                         'zCldShareAlbumInvRec-Album GUID-55',
                         'zCldShareAlbumInvRec-Cloud GUID-56',
                         'zAlbumList-Needs Reordering Number-57')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -766,16 +749,6 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63]))
-
         data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
                         ('zGenAlbum-Creation Date-1', 'datetime'),
                         ('zGenAlbum-Start Date-2', 'datetime'),
@@ -840,11 +813,11 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
                         'zCldShareAlbumInvRec-Cloud GUID-61',
                         'zGenAlbum-Project Render UUID-62',
                         'zAlbumList-Needs Reordering Number-63')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1053,17 +1026,6 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65]))
-
         data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
                         ('zGenAlbum-Creation Date-1', 'datetime'),
                         ('zGenAlbum-Start Date-2', 'datetime'),
@@ -1130,11 +1092,11 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
                         'zCldShareAlbumInvRec-Cloud GUID-63',
                         'zGenAlbum-Project Render UUID-64',
                         'zAlbumList-Needs Reordering Number-65')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1343,17 +1305,6 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65]))
-
         data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
                         ('zGenAlbum-Creation Date-1', 'datetime'),
                         ('zGenAlbum-Start Date-2', 'datetime'),
@@ -1420,11 +1371,11 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
                         'zCldShareAlbumInvRec-Cloud GUID-63',
                         'zGenAlbum-Project Render UUID-64',
                         'zAlbumList-Needs Reordering Number-65')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1652,17 +1603,6 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69]))
-
         data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
                         ('zGenAlbum-Creation Date-1', 'datetime'),
                         ('zGenAlbum-Start Date-2', 'datetime'),
@@ -1733,11 +1673,11 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
                         'zCldShareAlbumInvRec-Cloud GUID-67',
                         'zGenAlbum-Project Render UUID-68',
                         'zAlbumList-Needs Reordering Number-69')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1965,17 +1905,6 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69]))
-
         data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
                         ('zGenAlbum-Creation Date-1', 'datetime'),
                         ('zGenAlbum-Start Date-2', 'datetime'),
@@ -2046,11 +1975,11 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
                         'zCldShareAlbumInvRec-Cloud GUID-67',
                         'zGenAlbum-Project Render UUID-68',
                         'zAlbumList-Needs Reordering Number-69')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2278,17 +2207,6 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zGenAlbum.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69]))
-
         data_headers = (('zGenAlbum-Cloud Creation Date-0', 'datetime'),
                         ('zGenAlbum-Creation Date-1', 'datetime'),
                         ('zGenAlbum-Start Date-2', 'datetime'),
@@ -2359,7 +2277,7 @@ def Ph023SharedAlbumRecordsInviteswithNADPhDaPsql(files_found, report_folder, se
                         'zCldShareAlbumInvRec-Cloud GUID-67',
                         'zGenAlbum-Project Render UUID-68',
                         'zAlbumList-Needs Reordering Number-69')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
                 
@@ -17,8 +17,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -31,10 +30,14 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("10.3.4")) or (version.parse(iosversion) >= version.parse("26")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("10.3.4")) or (ios_version >= parse_version("26")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("11")) & (version.parse(iosversion) < version.parse("12")):
+    if (ios_version >= parse_version("11")) & (ios_version < parse_version("12")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -264,18 +267,6 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -354,11 +345,11 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
                         'zCldShareAlbumInvRec-Album GUID-75',
                         'zCldShareAlbumInvRec-Cloud GUID-76',
                         'zAlbumList-Needs Reordering Number-77')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("12")) & (version.parse(iosversion) < version.parse("13")):
+    elif (ios_version >= parse_version("12")) & (ios_version < parse_version("13")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -592,18 +583,6 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -682,11 +661,11 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
                         'zCldShareAlbumInvRec-Album GUID-75',
                         'zCldShareAlbumInvRec-Cloud GUID-76',
                         'zAlbumList-Needs Reordering Number-77')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("13")) & (version.parse(iosversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -929,19 +908,6 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -1026,11 +992,11 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
                         'zCldShareAlbumInvRec-Cloud GUID-81',
                         'zGenAlbum-Project Render UUID-82',
                         'zAlbumList-Needs Reordering Number-83')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+    elif (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1285,19 +1251,6 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -1386,11 +1339,11 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
                         'zCldShareAlbumInvRec-Cloud GUID-85',
                         'zGenAlbum-Project Render UUID-86',
                         'zAlbumList-Needs Reordering Number-87')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    elif (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1663,19 +1616,6 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -1767,11 +1707,11 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
                         'zCldShareAlbumInvRec-Cloud GUID-88',
                         'zGenAlbum-Project Render UUID-89',
                         'zAlbumList-Needs Reordering Number-90')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2069,20 +2009,6 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -2180,11 +2106,11 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
                         'zCldShareAlbumInvRec-Cloud GUID-94',
                         'zGenAlbum-Project Render UUID-95',
                         'zAlbumList-Needs Reordering Number-96')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2482,20 +2408,6 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -2593,11 +2505,11 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
                         'zCldShareAlbumInvRec-Cloud GUID-94',
                         'zGenAlbum-Project Render UUID-95',
                         'zAlbumList-Needs Reordering Number-96')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2896,20 +2808,6 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
         ORDER BY zAsset.ZDATECREATED        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-                              row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-                              row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-                              row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-                              row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-                              row[91], row[92], row[93], row[94], row[95], row[96], row[97]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         'zAsset-zPK-1',
                         'zAsset-Directory-Path-2',
@@ -3008,7 +2906,7 @@ def Ph024AssetinSharedAlbumsInvitesPhDaPsql(files_found, report_folder, seeker,
                         'zCldShareAlbumInvRec-Cloud GUID-95',
                         'zGenAlbum-Project Render UUID-96',
                         'zAlbumList-Needs Reordering Number-97')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
           
@@ -35,8 +35,7 @@ __artifacts_v2__ = {
 
 import glob
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -49,10 +48,14 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("14.8.1")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    if (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -145,11 +148,6 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date', 'datetime'),
                         ('SWYConverszGenAlbum-End Date', 'datetime'),
@@ -169,11 +167,11 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
                         'SWYConverszGenAlbum-Trashed State',
                         ('SWYConverszGenAlbum-Trash Date', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -272,12 +270,6 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
@@ -298,11 +290,11 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
                         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-18',
                         'SWYConverszGenAlbum-Privacy State-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -401,12 +393,6 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
@@ -427,11 +413,11 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
                         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-18',
                         'SWYConverszGenAlbum-Privacy State-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -530,12 +516,6 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
@@ -556,11 +536,11 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
                         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-18',
                         'SWYConverszGenAlbum-Privacy State-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -659,12 +639,6 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
@@ -685,7 +659,7 @@ def Ph025_1SWYConversationRecordswithNADPhDaPsql(files_found, report_folder, see
                         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-18',
                         'SWYConverszGenAlbum-Privacy State-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -700,10 +674,14 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("14.8.1")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version for Syndication.photoslibrary iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    if (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -796,11 +774,6 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date', 'datetime'),
                         ('SWYConverszGenAlbum-End Date', 'datetime'),
@@ -820,11 +793,11 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
                         'SWYConverszGenAlbum-Trashed State',
                         ('SWYConverszGenAlbum-Trash Date', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -923,12 +896,6 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
@@ -949,11 +916,11 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
                         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-18',
                         'SWYConverszGenAlbum-Privacy State-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1052,12 +1019,6 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
@@ -1078,11 +1039,11 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
                         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-18',
                         'SWYConverszGenAlbum-Privacy State-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1181,12 +1142,6 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
@@ -1207,11 +1162,11 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
                         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-18',
                         'SWYConverszGenAlbum-Privacy State-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1310,12 +1265,6 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
         ORDER BY SWYConverszGenAlbum.ZCREATIONDATE        
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19]))
-
         data_headers = (('SWYConverszGenAlbum-Creation Date-0', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-End Date-2', 'datetime'),
@@ -1336,7 +1285,7 @@ def Ph025_2SWYConversationRecordswithNADSyndPL(files_found, report_folder, seeke
                         ('SWYConverszGenAlbum-Trash Date-17', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-18',
                         'SWYConverszGenAlbum-Privacy State-19')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
\ No newline at end of file
@@ -53,8 +53,7 @@ __artifacts_v2__ = {
 
 import glob
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -67,10 +66,14 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("14.8.1")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version from PhotoData-Photos.sqlite for iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    if (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -221,14 +224,6 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -273,11 +268,11 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
                         'SWYConverszGenAlbum-Trashed State-41',
                         ('SWYConverszGenAlbum-Trash Date-42', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-43')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -440,15 +435,6 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -496,11 +482,11 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
                         ('SWYConverszGenAlbum-Trash Date-44', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-45',
                         'SWYConverszGenAlbum-Privacy State-46')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -663,15 +649,6 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -719,11 +696,11 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
                         ('SWYConverszGenAlbum-Trash Date-44', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-45',
                         'SWYConverszGenAlbum-Privacy State-46')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -887,15 +864,6 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -944,11 +912,11 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
                         ('SWYConverszGenAlbum-Trash Date-45', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-46',
                         'SWYConverszGenAlbum-Privacy State-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1112,15 +1080,6 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -1169,7 +1128,7 @@ def Ph026_1SyndicationIDAssetsPhDaPsql(files_found, report_folder, seeker, wrap_
                         ('SWYConverszGenAlbum-Trash Date-45', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-46',
                         'SWYConverszGenAlbum-Privacy State-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
@@ -1184,10 +1143,14 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("14.8.1")) or (version.parse(iosversion) >= version.parse("27")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Syndication.photoslibrary")
+        return (), [], source_path
+    if (ios_version <= parse_version("14.8.1")) or (ios_version >= parse_version("27")):
         logfunc("Unsupported version from Syndication.photoslibrary for iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("15")) & (version.parse(iosversion) < version.parse("16")):
+    if (ios_version >= parse_version("15")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1338,14 +1301,6 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -1390,11 +1345,11 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
                         'SWYConverszGenAlbum-Trashed State-41',
                         ('SWYConverszGenAlbum-Trash Date-42', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-43')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1557,15 +1512,6 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -1613,11 +1559,11 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
                         ('SWYConverszGenAlbum-Trash Date-44', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-45',
                         'SWYConverszGenAlbum-Privacy State-46')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -1780,15 +1726,6 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -1836,11 +1773,11 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
                         ('SWYConverszGenAlbum-Trash Date-44', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-45',
                         'SWYConverszGenAlbum-Privacy State-46')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2004,15 +1941,6 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -2061,11 +1989,11 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
                         ('SWYConverszGenAlbum-Trash Date-45', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-46',
                         'SWYConverszGenAlbum-Privacy State-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("26")) & (version.parse(iosversion) < version.parse("27")):
+    elif (ios_version >= parse_version("26")) & (ios_version < parse_version("27")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -2229,15 +2157,6 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
         ORDER BY zAsset.ZDATECREATED
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-                              row[46], row[47]))
-
         data_headers = (('zAsset-Date Created-0', 'datetime'),
                         ('SWYConverszGenAlbum-Creation Date-1', 'datetime'),
                         ('SWYConverszGenAlbum-Start Date-2', 'datetime'),
@@ -2286,6 +2205,6 @@ def Ph026_2SyndicationPLAssetsSyndPL(files_found, report_folder, seeker, wrap_te
                         ('SWYConverszGenAlbum-Trash Date-45', 'datetime'),
                         'SWYConverszGenAlbum-Cloud Delete State-46',
                         'SWYConverszGenAlbum-Privacy State-47')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
@@ -18,8 +18,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -32,10 +31,14 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iosversion = iOS.get_version()
-    if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("26")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+        return (), [], source_path
+    if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("26")):
         logfunc("Unsupported version for PhotoData-Photos.sqlite iOS " + iosversion)
         return (), [], source_path
-    if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("16")):
+    if (ios_version >= parse_version("14")) & (ios_version < parse_version("16")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -126,12 +129,6 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zShare.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25]))
-
         data_headers = (('zShare-Creation Date-0', 'datetime'),
                         ('zShare-Start Date-1', 'datetime'),
                         ('zShare-End Date-2', 'datetime'),
@@ -158,11 +155,11 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
                         'zShare-Trashed State-23',
                         'zShare-Cloud Delete State-24',
                         'zShare-zENT-25')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("16")) & (version.parse(iosversion) < version.parse("17.6")):
+    elif (ios_version >= parse_version("16")) & (ios_version < parse_version("17.6")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -306,14 +303,6 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zShare.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43]))
-
         data_headers = (('zShare-Creation Date-0', 'datetime'),
                         ('zShare-Start Date-1', 'datetime'),
                         ('zShare-End Date-2', 'datetime'),
@@ -358,11 +347,11 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
                         ('zShare-LastParticipant Asset Trash Notification Date-41', 'datetime'),
                         ('zShare-Last Participant Asset Trash Notification View Date-42', 'datetime'),
                         'zShare-zENT-43')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 	
-    elif (version.parse(iosversion) >= version.parse("17.6")) & (version.parse(iosversion) < version.parse("18")):
+    elif (ios_version >= parse_version("17.6")) & (ios_version < parse_version("18")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -506,14 +495,6 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zShare.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43]))
-
         data_headers = (('zShare-Creation Date-0', 'datetime'),
                         ('zShare-Start Date-1', 'datetime'),
                         ('zShare-End Date-2', 'datetime'),
@@ -558,11 +539,11 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
                         ('zShare-LastParticipant Asset Trash Notification Date-41', 'datetime'),
                         ('zShare-Last Participant Asset Trash Notification View Date-42', 'datetime'),
                         'zShare-zENT-43')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
 
-    elif (version.parse(iosversion) >= version.parse("18")) & (version.parse(iosversion) < version.parse("26")):
+    elif (ios_version >= parse_version("18")) & (ios_version < parse_version("26")):
         source_path = get_file_path(files_found,"Photos.sqlite")
         if source_path is None or not os.path.exists(source_path):
             logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -706,14 +687,6 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
         ORDER BY zShare.ZCREATIONDATE
         '''
         
-        db_records = get_sqlite_db_records(source_path, query)
-        for row in db_records:
-            data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-                              row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-                              row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-                              row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-                              row[37], row[38], row[39], row[40], row[41], row[42], row[43]))
-
         data_headers = (('zShare-Creation Date-0', 'datetime'),
                         ('zShare-Start Date-1', 'datetime'),
                         ('zShare-End Date-2', 'datetime'),
@@ -758,7 +731,7 @@ def Ph031iCloudSPLwithParticipantswithNADPhDaPsql(files_found, report_folder, se
                         ('zShare-LastParticipant Asset Trash Notification Date-41', 'datetime'),
                         ('zShare-Last Participant Asset Trash Notification View Date-42', 'datetime'),
                         'zShare-zENT-43')
-        data_list = get_sqlite_db_records(source_path, query)
+        data_list = get_photos_db_records(source_path, query)
 
         return data_headers, data_list, source_path
         
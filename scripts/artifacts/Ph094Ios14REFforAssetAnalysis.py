@@ -38,8 +38,7 @@ __artifacts_v2__ = {
 }
 
 import os
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_sqlite_db_records, logfunc, iOS
+from scripts.ilapfuncs import artifact_processor, get_file_path, open_sqlite_db_readonly, get_photos_db_records, logfunc, iOS, parse_version
 
 @artifact_processor
 def Ph094_1iOS14RefforAssetAnalysisPhDaPsql(files_found, report_folder, seeker, wrap_text, timezone_offset):
@@ -52,10 +51,14 @@ def Ph094_1iOS14RefforAssetAnalysisPhDaPsql(files_found, report_folder, seeker,
 	if report_folder.endswith('/') or report_folder.endswith('\\'):
 		report_folder = report_folder[:-1]
 	iosversion = iOS.get_version()
-	if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("15")):
+	ios_version = iOS.get_version_tuple()
+	if ios_version is None:
+		logfunc("Unknown iOS version for PhotoData-Photos.sqlite")
+		return (), [], source_path
+	if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("15")):
 		logfunc("Unsupported version for PhotoData-Photos.sqlite for iOS " + iosversion)
 		return (), [], source_path
-	if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+	if (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
 		source_path = get_file_path(files_found, "Photos.sqlite")
 		if source_path is None or not os.path.exists(source_path):
 			logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -3120,172 +3123,6 @@ def Ph094_1iOS14RefforAssetAnalysisPhDaPsql(files_found, report_folder, seeker,
 		ORDER BY zAsset.ZADDEDDATE
         '''
 
-		db_records = get_sqlite_db_records(source_path, query)
-		for row in db_records:
-			data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-							row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-							row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-							row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-							row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-							row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-							row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-							row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-							row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-							row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-							row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-							row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-							row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-							row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-							row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-							row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-							row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-							row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-							row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-							row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-							row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-							row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-							row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-							row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-							row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-							row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-							row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-							row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-							row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-							row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-							row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-							row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-							row[268], row[269], row[270], row[271], row[272], row[273], row[274], row[275],
-							row[276], row[277], row[278], row[279], row[280], row[281], row[282], row[283],
-							row[284], row[285], row[286], row[287], row[288], row[289], row[290], row[291],
-							row[292], row[293], row[294], row[295], row[296], row[297], row[298], row[299],
-							row[300], row[301], row[302], row[303], row[304], row[305], row[306], row[307],
-							row[308], row[309], row[310], row[311], row[312], row[313], row[314], row[315],
-							row[316], row[317], row[318], row[319], row[320], row[321], row[322], row[323],
-							row[324], row[325], row[326], row[327], row[328], row[329], row[330], row[331],
-							row[332], row[333], row[334], row[335], row[336], row[337], row[338], row[339],
-							row[340], row[341], row[342], row[343], row[344], row[345], row[346], row[347],
-							row[348], row[349], row[350], row[351], row[352], row[353], row[354], row[355],
-							row[356], row[357], row[358], row[359], row[360], row[361], row[362], row[363],
-							row[364], row[365], row[366], row[367], row[368], row[369], row[370], row[371],
-							row[372], row[373], row[374], row[375], row[376], row[377], row[378], row[379],
-							row[380], row[381], row[382], row[383], row[384], row[385], row[386], row[387],
-							row[388], row[389], row[390], row[391], row[392], row[393], row[394], row[395],
-							row[396], row[397], row[398], row[399], row[400], row[401], row[402], row[403],
-							row[404], row[405], row[406], row[407], row[408], row[409], row[410], row[411],
-							row[412], row[413], row[414], row[415], row[416], row[417], row[418], row[419],
-							row[420], row[421], row[422], row[423], row[424], row[425], row[426], row[427],
-							row[428], row[429], row[430], row[431], row[432], row[433], row[434], row[435],
-							row[436], row[437], row[438], row[439], row[440], row[441], row[442], row[443],
-							row[444], row[445], row[446], row[447], row[448], row[449], row[450], row[451],
-							row[452], row[453], row[454], row[455], row[456], row[457], row[458], row[459],
-							row[460], row[461], row[462], row[463], row[464], row[465], row[466], row[467],
-							row[468], row[469], row[470], row[471], row[472], row[473], row[474], row[475],
-							row[476], row[477], row[478], row[479], row[480], row[481], row[482], row[483],
-							row[484], row[485], row[486], row[487], row[488], row[489], row[490], row[491],
-							row[492], row[493], row[494], row[495], row[496], row[497], row[498], row[499],
-							row[500], row[501], row[502], row[503], row[504], row[505], row[506], row[507],
-							row[508], row[509], row[510], row[511], row[512], row[513], row[514], row[515],
-							row[516], row[517], row[518], row[519], row[520], row[521], row[522], row[523],
-							row[524], row[525], row[526], row[527], row[528], row[529], row[530], row[531],
-							row[532], row[533], row[534], row[535], row[536], row[537], row[538], row[539],
-							row[540], row[541], row[542], row[543], row[544], row[545], row[546], row[547],
-							row[548], row[549], row[550], row[551], row[552], row[553], row[554], row[555],
-							row[556], row[557], row[558], row[559], row[560], row[561], row[562], row[563],
-							row[564], row[565], row[566], row[567], row[568], row[569], row[570], row[571],
-							row[572], row[573], row[574], row[575], row[576], row[577], row[578], row[579],
-							row[580], row[581], row[582], row[583], row[584], row[585], row[586], row[587],
-							row[588], row[589], row[590], row[591], row[592], row[593], row[594], row[595],
-							row[596], row[597], row[598], row[599], row[600], row[601], row[602], row[603],
-							row[604], row[605], row[606], row[607], row[608], row[609], row[610], row[611],
-							row[612], row[613], row[614], row[615], row[616], row[617], row[618], row[619],
-							row[620], row[621], row[622], row[623], row[624], row[625], row[626], row[627],
-							row[628], row[629], row[630], row[631], row[632], row[633], row[634], row[635],
-							row[636], row[637], row[638], row[639], row[640], row[641], row[642], row[643],
-							row[644], row[645], row[646], row[647], row[648], row[649], row[650], row[651],
-							row[652], row[653], row[654], row[655], row[656], row[657], row[658], row[659],
-							row[660], row[661], row[662], row[663], row[664], row[665], row[666], row[667],
-							row[668], row[669], row[670], row[671], row[672], row[673], row[674], row[675],
-							row[676], row[677], row[678], row[679], row[680], row[681], row[682], row[683],
-							row[684], row[685], row[686], row[687], row[688], row[689], row[690], row[691],
-							row[692], row[693], row[694], row[695], row[696], row[697], row[698], row[699],
-							row[700], row[701], row[702], row[703], row[704], row[705], row[706], row[707],
-							row[708], row[709], row[710], row[711], row[712], row[713], row[714], row[715],
-							row[716], row[717], row[718], row[719], row[720], row[721], row[722], row[723],
-							row[724], row[725], row[726], row[727], row[728], row[729], row[730], row[731],
-							row[732], row[733], row[734], row[735], row[736], row[737], row[738], row[739],
-							row[740], row[741], row[742], row[743], row[744], row[745], row[746], row[747],
-							row[748], row[749], row[750], row[751], row[752], row[753], row[754], row[755],
-							row[756], row[757], row[758], row[759], row[760], row[761], row[762], row[763],
-							row[764], row[765], row[766], row[767], row[768], row[769], row[770], row[771],
-							row[772], row[773], row[774], row[775], row[776], row[777], row[778], row[779],
-							row[780], row[781], row[782], row[783], row[784], row[785], row[786], row[787],
-							row[788], row[789], row[790], row[791], row[792], row[793], row[794], row[795],
-							row[796], row[797], row[798], row[799], row[800], row[801], row[802], row[803],
-							row[804], row[805], row[806], row[807], row[808], row[809], row[810], row[811],
-							row[812], row[813], row[814], row[815], row[816], row[817], row[818], row[819],
-							row[820], row[821], row[822], row[823], row[824], row[825], row[826], row[827],
-							row[828], row[829], row[830], row[831], row[832], row[833], row[834], row[835],
-							row[836], row[837], row[838], row[839], row[840], row[841], row[842], row[843],
-							row[844], row[845], row[846], row[847], row[848], row[849], row[850], row[851],
-							row[852], row[853], row[854], row[855], row[856], row[857], row[858], row[859],
-							row[860], row[861], row[862], row[863], row[864], row[865], row[866], row[867],
-							row[868], row[869], row[870], row[871], row[872], row[873], row[874], row[875],
-							row[876], row[877], row[878], row[879], row[880], row[881], row[882], row[883],
-							row[884], row[885], row[886], row[887], row[888], row[889], row[890], row[891],
-							row[892], row[893], row[894], row[895], row[896], row[897], row[898], row[899],
-							row[900], row[901], row[902], row[903], row[904], row[905], row[906], row[907],
-							row[908], row[909], row[910], row[911], row[912], row[913], row[914], row[915],
-							row[916], row[917], row[918], row[919], row[920], row[921], row[922], row[923],
-							row[924], row[925], row[926], row[927], row[928], row[929], row[930], row[931],
-							row[932], row[933], row[934], row[935], row[936], row[937], row[938], row[939],
-							row[940], row[941], row[942], row[943], row[944], row[945], row[946], row[947],
-							row[948], row[949], row[950], row[951], row[952], row[953], row[954], row[955],
-							row[956], row[957], row[958], row[959], row[960], row[961], row[962], row[963],
-							row[964], row[965], row[966], row[967], row[968], row[969], row[970], row[971],
-							row[972], row[973], row[974], row[975], row[976], row[977], row[978], row[979],
-							row[980], row[981], row[982], row[983], row[984], row[985], row[986], row[987],
-							row[988], row[989], row[990], row[991], row[992], row[993], row[994], row[995],
-							row[996], row[997], row[998], row[999], row[1000], row[1001], row[1002],
-							row[1003], row[1004], row[1005], row[1006], row[1007], row[1008], row[1009],
-							row[1010], row[1011], row[1012], row[1013], row[1014], row[1015], row[1016],
-							row[1017], row[1018], row[1019], row[1020], row[1021], row[1022], row[1023],
-							row[1024], row[1025], row[1026], row[1027], row[1028], row[1029], row[1030],
-							row[1031], row[1032], row[1033], row[1034], row[1035], row[1036], row[1037],
-							row[1038], row[1039], row[1040], row[1041], row[1042], row[1043], row[1044],
-							row[1045], row[1046], row[1047], row[1048], row[1049], row[1050], row[1051],
-							row[1052], row[1053], row[1054], row[1055], row[1056], row[1057], row[1058],
-							row[1059], row[1060], row[1061], row[1062], row[1063], row[1064], row[1065],
-							row[1066], row[1067], row[1068], row[1069], row[1070], row[1071], row[1072],
-							row[1073], row[1074], row[1075], row[1076], row[1077], row[1078], row[1079],
-							row[1080], row[1081], row[1082], row[1083], row[1084], row[1085], row[1086],
-							row[1087], row[1088], row[1089], row[1090], row[1091], row[1092], row[1093],
-							row[1094], row[1095], row[1096], row[1097], row[1098], row[1099], row[1100],
-							row[1101], row[1102], row[1103], row[1104], row[1105], row[1106], row[1107],
-							row[1108], row[1109], row[1110], row[1111], row[1112], row[1113], row[1114],
-							row[1115], row[1116], row[1117], row[1118], row[1119], row[1120], row[1121],
-							row[1122], row[1123], row[1124], row[1125], row[1126], row[1127], row[1128],
-							row[1129], row[1130], row[1131], row[1132], row[1133], row[1134], row[1135],
-							row[1136], row[1137], row[1138], row[1139], row[1140], row[1141], row[1142],
-							row[1143], row[1144], row[1145], row[1146], row[1147], row[1148], row[1149],
-							row[1150], row[1151], row[1152], row[1153], row[1154], row[1155], row[1156],
-							row[1157], row[1158], row[1159], row[1160], row[1161], row[1162], row[1163],
-							row[1164], row[1165], row[1166], row[1167], row[1168], row[1169], row[1170],
-							row[1171], row[1172], row[1173], row[1174], row[1175], row[1176], row[1177],
-							row[1178], row[1179], row[1180], row[1181], row[1182], row[1183], row[1184],
-							row[1185], row[1186], row[1187], row[1188], row[1189], row[1190], row[1191],
-							row[1192], row[1193], row[1194], row[1195], row[1196], row[1197], row[1198],
-							row[1199], row[1200], row[1201], row[1202], row[1203], row[1204], row[1205],
-							row[1206], row[1207], row[1208], row[1209], row[1210], row[1211], row[1212],
-							row[1213], row[1214], row[1215], row[1216], row[1217], row[1218], row[1219],
-							row[1220], row[1221], row[1222], row[1223], row[1224], row[1225], row[1226],
-							row[1227], row[1228], row[1229], row[1230], row[1231], row[1232], row[1233],
-							row[1234], row[1235], row[1236], row[1237], row[1238], row[1239], row[1240],
-							row[1241], row[1242], row[1243], row[1244], row[1245], row[1246], row[1247],
-							row[1248], row[1249], row[1250], row[1251], row[1252], row[1253], row[1254],
-							row[1255], row[1256], row[1257], row[1258], row[1259], row[1260], row[1261],
-							row[1262], row[1263], row[1264], row[1265], row[1266], row[1267], row[1268],
-							row[1269]))
-
 		data_headers = (('zAsset-Added Date-0', 'datetime'),
 						'zAsset- SortToken -CameraRoll-1',
 						'zAsset Complete-2',
@@ -4556,7 +4393,7 @@ def Ph094_1iOS14RefforAssetAnalysisPhDaPsql(files_found, report_folder, seeker,
 						'z26Assets-26Albums= zGenAlbum-zPK-1267',
 						'z26Assets-3Asset Key= zAsset-zPK in the Album-1268',
 						'z26Asset-FOK-3Assets= zAsset.Z_FOK_CLOUDFEEDASSETSENTRY-1269')
-		data_list = get_sqlite_db_records(source_path, query)
+		data_list = get_photos_db_records(source_path, query)
 
 		return data_headers, data_list, source_path
 
@@ -4571,10 +4408,14 @@ def Ph094_2iOS14RefforAssetAnalysisSyndPL(files_found, report_folder, seeker, wr
 	if report_folder.endswith('/') or report_folder.endswith('\\'):
 		report_folder = report_folder[:-1]
 	iosversion = iOS.get_version()
-	if (version.parse(iosversion) <= version.parse("13.7")) or (version.parse(iosversion) >= version.parse("15")):
+	ios_version = iOS.get_version_tuple()
+	if ios_version is None:
+		logfunc("Unknown iOS version for Syndication.photoslibrary")
+		return (), [], source_path
+	if (ios_version <= parse_version("13.7")) or (ios_version >= parse_version("15")):
 		logfunc("Unsupported version for Syndication.photoslibrary for iOS " + iosversion)
 		return (), [], source_path
-	if (version.parse(iosversion) >= version.parse("14")) & (version.parse(iosversion) < version.parse("15")):
+	if (ios_version >= parse_version("14")) & (ios_version < parse_version("15")):
 		source_path = get_file_path(files_found, "Photos.sqlite")
 		if source_path is None or not os.path.exists(source_path):
 			logfunc(f"Photos.sqlite not found for iOS version {iosversion}")
@@ -7639,172 +7480,6 @@ def Ph094_2iOS14RefforAssetAnalysisSyndPL(files_found, report_folder, seeker, wr
 		ORDER BY zAsset.ZADDEDDATE
 		'''
 
-		db_records = get_sqlite_db_records(source_path, query)
-		for row in db_records:
-			data_list.append((row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], row[8], row[9],
-							row[10], row[11], row[12], row[13], row[14], row[15], row[16], row[17], row[18],
-							row[19], row[20], row[21], row[22], row[23], row[24], row[25], row[26], row[27],
-							row[28], row[29], row[30], row[31], row[32], row[33], row[34], row[35], row[36],
-							row[37], row[38], row[39], row[40], row[41], row[42], row[43], row[44], row[45],
-							row[46], row[47], row[48], row[49], row[50], row[51], row[52], row[53], row[54],
-							row[55], row[56], row[57], row[58], row[59], row[60], row[61], row[62], row[63],
-							row[64], row[65], row[66], row[67], row[68], row[69], row[70], row[71], row[72],
-							row[73], row[74], row[75], row[76], row[77], row[78], row[79], row[80], row[81],
-							row[82], row[83], row[84], row[85], row[86], row[87], row[88], row[89], row[90],
-							row[91], row[92], row[93], row[94], row[95], row[96], row[97], row[98], row[99],
-							row[100], row[101], row[102], row[103], row[104], row[105], row[106], row[107],
-							row[108], row[109], row[110], row[111], row[112], row[113], row[114], row[115],
-							row[116], row[117], row[118], row[119], row[120], row[121], row[122], row[123],
-							row[124], row[125], row[126], row[127], row[128], row[129], row[130], row[131],
-							row[132], row[133], row[134], row[135], row[136], row[137], row[138], row[139],
-							row[140], row[141], row[142], row[143], row[144], row[145], row[146], row[147],
-							row[148], row[149], row[150], row[151], row[152], row[153], row[154], row[155],
-							row[156], row[157], row[158], row[159], row[160], row[161], row[162], row[163],
-							row[164], row[165], row[166], row[167], row[168], row[169], row[170], row[171],
-							row[172], row[173], row[174], row[175], row[176], row[177], row[178], row[179],
-							row[180], row[181], row[182], row[183], row[184], row[185], row[186], row[187],
-							row[188], row[189], row[190], row[191], row[192], row[193], row[194], row[195],
-							row[196], row[197], row[198], row[199], row[200], row[201], row[202], row[203],
-							row[204], row[205], row[206], row[207], row[208], row[209], row[210], row[211],
-							row[212], row[213], row[214], row[215], row[216], row[217], row[218], row[219],
-							row[220], row[221], row[222], row[223], row[224], row[225], row[226], row[227],
-							row[228], row[229], row[230], row[231], row[232], row[233], row[234], row[235],
-							row[236], row[237], row[238], row[239], row[240], row[241], row[242], row[243],
-							row[244], row[245], row[246], row[247], row[248], row[249], row[250], row[251],
-							row[252], row[253], row[254], row[255], row[256], row[257], row[258], row[259],
-							row[260], row[261], row[262], row[263], row[264], row[265], row[266], row[267],
-							row[268], row[269], row[270], row[271], row[272], row[273], row[274], row[275],
-							row[276], row[277], row[278], row[279], row[280], row[281], row[282], row[283],
-							row[284], row[285], row[286], row[287], row[288], row[289], row[290], row[291],
-							row[292], row[293], row[294], row[295], row[296], row[297], row[298], row[299],
-							row[300], row[301], row[302], row[303], row[304], row[305], row[306], row[307],
-							row[308], row[309], row[310], row[311], row[312], row[313], row[314], row[315],
-							row[316], row[317], row[318], row[319], row[320], row[321], row[322], row[323],
-							row[324], row[325], row[326], row[327], row[328], row[329], row[330], row[331],
-							row[332], row[333], row[334], row[335], row[336], row[337], row[338], row[339],
-							row[340], row[341], row[342], row[343], row[344], row[345], row[346], row[347],
-							row[348], row[349], row[350], row[351], row[352], row[353], row[354], row[355],
-							row[356], row[357], row[358], row[359], row[360], row[361], row[362], row[363],
-							row[364], row[365], row[366], row[367], row[368], row[369], row[370], row[371],
-							row[372], row[373], row[374], row[375], row[376], row[377], row[378], row[379],
-							row[380], row[381], row[382], row[383], row[384], row[385], row[386], row[387],
-							row[388], row[389], row[390], row[391], row[392], row[393], row[394], row[395],
-							row[396], row[397], row[398], row[399], row[400], row[401], row[402], row[403],
-							row[404], row[405], row[406], row[407], row[408], row[409], row[410], row[411],
-							row[412], row[413], row[414], row[415], row[416], row[417], row[418], row[419],
-							row[420], row[421], row[422], row[423], row[424], row[425], row[426], row[427],
-							row[428], row[429], row[430], row[431], row[432], row[433], row[434], row[435],
-							row[436], row[437], row[438], row[439], row[440], row[441], row[442], row[443],
-							row[444], row[445], row[446], row[447], row[448], row[449], row[450], row[451],
-							row[452], row[453], row[454], row[455], row[456], row[457], row[458], row[459],
-							row[460], row[461], row[462], row[463], row[464], row[465], row[466], row[467],
-							row[468], row[469], row[470], row[471], row[472], row[473], row[474], row[475],
-							row[476], row[477], row[478], row[479], row[480], row[481], row[482], row[483],
-							row[484], row[485], row[486], row[487], row[488], row[489], row[490], row[491],
-							row[492], row[493], row[494], row[495], row[496], row[497], row[498], row[499],
-							row[500], row[501], row[502], row[503], row[504], row[505], row[506], row[507],
-							row[508], row[509], row[510], row[511], row[512], row[513], row[514], row[515],
-							row[516], row[517], row[518], row[519], row[520], row[521], row[522], row[523],
-							row[524], row[525], row[526], row[527], row[528], row[529], row[530], row[531],
-							row[532], row[533], row[534], row[535], row[536], row[537], row[538], row[539],
-							row[540], row[541], row[542], row[543], row[544], row[545], row[546], row[547],
-							row[548], row[549], row[550], row[551], row[552], row[553], row[554], row[555],
-							row[556], row[557], row[558], row[559], row[560], row[561], row[562], row[563],
-							row[564], row[565], row[566], row[567], row[568], row[569], row[570], row[571],
-							row[572], row[573], row[574], row[575], row[576], row[577], row[578], row[579],
-							row[580], row[581], row[582], row[583], row[584], row[585], row[586], row[587],
-							row[588], row[589], row[590], row[591], row[592], row[593], row[594], row[595],
-							row[596], row[597], row[598], row[599], row[600], row[601], row[602], row[603],
-							row[604], row[605], row[606], row[607], row[608], row[609], row[610], row[611],
-							row[612], row[613], row[614], row[615], row[616], row[617], row[618], row[619],
-							row[620], row[621], row[622], row[623], row[624], row[625], row[626], row[627],
-							row[628], row[629], row[630], row[631], row[632], row[633], row[634], row[635],
-							row[636], row[637], row[638], row[639], row[640], row[641], row[642], row[643],
-							row[644], row[645], row[646], row[647], row[648], row[649], row[650], row[651],
-							row[652], row[653], row[654], row[655], row[656], row[657], row[658], row[659],
-							row[660], row[661], row[662], row[663], row[664], row[665], row[666], row[667],
-							row[668], row[669], row[670], row[671], row[672], row[673], row[674], row[675],
-							row[676], row[677], row[678], row[679], row[680], row[681], row[682], row[683],
-							row[684], row[685], row[686], row[687], row[688], row[689], row[690], row[691],
-							row[692], row[693], row[694], row[695], row[696], row[697], row[698], row[699],
-							row[700], row[701], row[702], row[703], row[704], row[705], row[706], row[707],
-							row[708], row[709], row[710], row[711], row[712], row[713], row[714], row[715],
-							row[716], row[717], row[718], row[719], row[720], row[721], row[722], row[723],
-							row[724], row[725], row[726], row[727], row[728], row[729], row[730], row[731],
-							row[732], row[733], row[734], row[735], row[736], row[737], row[738], row[739],
-							row[740], row[741], row[742], row[743], row[744], row[745], row[746], row[747],
-							row[748], row[749], row[750], row[751], row[752], row[753], row[754], row[755],
-							row[756], row[757], row[758], row[759], row[760], row[761], row[762], row[763],
-							row[764], row[765], row[766], row[767], row[768], row[769], row[770], row[771],
-							row[772], row[773], row[774], row[775], row[776], row[777], row[778], row[779],
-							row[780], row[781], row[782], row[783], row[784], row[785], row[786], row[787],
-							row[788], row[789], row[790], row[791], row[792], row[793], row[794], row[795],
-							row[796], row[797], row[798], row[799], row[800], row[801], row[802], row[803],
-							row[804], row[805], row[806], row[807], row[808], row[809], row[810], row[811],
-							row[812], row[813], row[814], row[815], row[816], row[817], row[818], row[819],
-							row[820], row[821], row[822], row[823], row[824], row[825], row[826], row[827],
-							row[828], row[829], row[830], row[831], row[832], row[833], row[834], row[835],
-							row[836], row[837], row[838], row[839], row[840], row[841], row[842], row[843],
-							row[844], row[845], row[846], row[847], row[848], row[849], row[850], row[851],
-							row[852], row[853], row[854], row[855], row[856], row[857], row[858], row[859],
-							row[860], row[861], row[862], row[863], row[864], row[865], row[866], row[867],
-							row[868], row[869], row[870], row[871], row[872], row[873], row[874], row[875],
-							row[876], row[877], row[878], row[879], row[880], row[881], row[882], row[883],
-							row[884], row[885], row[886], row[887], row[888], row[889], row[890], row[891],
-							row[892], row[893], row[894], row[895], row[896], row[897], row[898], row[899],
-							row[900], row[901], row[902], row[903], row[904], row[905], row[906], row[907],
-							row[908], row[909], row[910], row[911], row[912], row[913], row[914], row[915],
-							row[916], row[917], row[918], row[919], row[920], row[921], row[922], row[923],
-							row[924], row[925], row[926], row[927], row[928], row[929], row[930], row[931],
-							row[932], row[933], row[934], row[935], row[936], row[937], row[938], row[939],
-							row[940], row[941], row[942], row[943], row[944], row[945], row[946], row[947],
-							row[948], row[949], row[950], row[951], row[952], row[953], row[954], row[955],
-							row[956], row[957], row[958], row[959], row[960], row[961], row[962], row[963],
-							row[964], row[965], row[966], row[967], row[968], row[969], row[970], row[971],
-							row[972], row[973], row[974], row[975], row[976], row[977], row[978], row[979],
-							row[980], row[981], row[982], row[983], row[984], row[985], row[986], row[987],
-							row[988], row[989], row[990], row[991], row[992], row[993], row[994], row[995],
-							row[996], row[997], row[998], row[999], row[1000], row[1001], row[1002],
-							row[1003], row[1004], row[1005], row[1006], row[1007], row[1008], row[1009],
-							row[1010], row[1011], row[1012], row[1013], row[1014], row[1015], row[1016],
-							row[1017], row[1018], row[1019], row[1020], row[1021], row[1022], row[1023],
-							row[1024], row[1025], row[1026], row[1027], row[1028], row[1029], row[1030],
-							row[1031], row[1032], row[1033], row[1034], row[1035], row[1036], row[1037],
-							row[1038], row[1039], row[1040], row[1041], row[1042], row[1043], row[1044],
-							row[1045], row[1046], row[1047], row[1048], row[1049], row[1050], row[1051],
-							row[1052], row[1053], row[1054], row[1055], row[1056], row[1057], row[1058],
-							row[1059], row[1060], row[1061], row[1062], row[1063], row[1064], row[1065],
-							row[1066], row[1067], row[1068], row[1069], row[1070], row[1071], row[1072],
-							row[1073], row[1074], row[1075], row[1076], row[1077], row[1078], row[1079],
-							row[1080], row[1081], row[1082], row[1083], row[1084], row[1085], row[1086],
-							row[1087], row[1088], row[1089], row[1090], row[1091], row[1092], row[1093],
-							row[1094], row[1095], row[1096], row[1097], row[1098], row[1099], row[1100],
-							row[1101], row[1102], row[1103], row[1104], row[1105], row[1106], row[1107],
-							row[1108], row[1109], row[1110], row[1111], row[1112], row[1113], row[1114],
-							row[1115], row[1116], row[1117], row[1118], row[1119], row[1120], row[1121],
-							row[1122], row[1123], row[1124], row[1125], row[1126], row[1127], row[1128],
-							row[1129], row[1130], row[1131], row[1132], row[1133], row[1134], row[1135],
-							row[1136], row[1137], row[1138], row[1139], row[1140], row[1141], row[1142],
-							row[1143], row[1144], row[1145], row[1146], row[1147], row[1148], row[1149],
-							row[1150], row[1151], row[1152], row[1153], row[1154], row[1155], row[1156],
-							row[1157], row[1158], row[1159], row[1160], row[1161], row[1162], row[1163],
-							row[1164], row[1165], row[1166], row[1167], row[1168], row[1169], row[1170],
-							row[1171], row[1172], row[1173], row[1174], row[1175], row[1176], row[1177],
-							row[1178], row[1179], row[1180], row[1181], row[1182], row[1183], row[1184],
-							row[1185], row[1186], row[1187], row[1188], row[1189], row[1190], row[1191],
-							row[1192], row[1193], row[1194], row[1195], row[1196], row[1197], row[1198],
-							row[1199], row[1200], row[1201], row[1202], row[1203], row[1204], row[1205],
-							row[1206], row[1207], row[1208], row[1209], row[1210], row[1211], row[1212],
-							row[1213], row[1214], row[1215], row[1216], row[1217], row[1218], row[1219],
-							row[1220], row[1221], row[1222], row[1223], row[1224], row[1225], row[1226],
-							row[1227], row[1228], row[1229], row[1230], row[1231], row[1232], row[1233],
-							row[1234], row[1235], row[1236], row[1237], row[1238], row[1239], row[1240],
-							row[1241], row[1242], row[1243], row[1244], row[1245], row[1246], row[1247],
-							row[1248], row[1249], row[1250], row[1251], row[1252], row[1253], row[1254],
-							row[1255], row[1256], row[1257], row[1258], row[1259], row[1260], row[1261],
-							row[1262], row[1263], row[1264], row[1265], row[1266], row[1267], row[1268],
-							row[1269]))
-
 		data_headers = (('zAsset-Added Date-0', 'datetime'),
 						'zAsset- SortToken -CameraRoll-1',
 						'zAsset Complete-2',
@@ -9075,6 +8750,6 @@ def Ph094_2iOS14RefforAssetAnalysisSyndPL(files_found, report_folder, seeker, wr
 						'z26Assets-26Albums= zGenAlbum-zPK-1267',
 						'z26Assets-3Asset Key= zAsset-zPK in the Album-1268',
 						'z26Asset-FOK-3Assets= zAsset.Z_FOK_CLOUDFEEDASSETSENTRY-1269')
-		data_list = get_sqlite_db_records(source_path, query)
+		data_list = get_photos_db_records(source_path, query)
 
 		return data_headers, data_list, source_path
@@ -19,41 +19,84 @@ __artifacts_v2__ = {
     },
 }
 
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from PIL import Image
-from scripts.ktx.ios_ktx2png import KTX_reader
-from scripts.ilapfuncs import artifact_processor, check_in_media, lava_get_full_media_info, logfunc, convert_unix_ts_to_utc
+import scripts.artifact_cache as artifact_cache
+import scripts.write_journal as write_journal
+from scripts.ktx.ios_ktx2png import convert_ktx_file_to_png
+from scripts.ilapfuncs import artifact_processor, check_in_media_many, lava_get_full_media_info, logfunc, \
+    convert_unix_ts_to_utc
 
 
-def save_ktx_to_png_if_valid(ktx_path, save_to_path):
-    '''Excludes all white or all black blank images'''
+def convert_snapshots(ktx_paths):
+    '''
+    Converts KTX snapshots to PNG in a process pool, leaving out the blank ones. Snapshots are
+    keyed by the hash of their content, so that duplicated snapshots are decoded once and, in
+    incremental mode, the PNG files converted by previous runs are reused from the case cache.
+    Args:
+        ktx_paths: The paths of the KTX files.
+    Returns:
+        A dict mapping each KTX path to the path of its PNG file, or None if it is not valid.
+    '''
+    cache_folder = None
+    if artifact_cache.cache_folder:
+        cache_folder = os.path.join(artifact_cache.cache_folder, 'snapshots')
+        os.makedirs(cache_folder, exist_ok=True)
 
-    with open(ktx_path, 'rb') as f:
-        ktx = KTX_reader()
-        try:
-            if ktx.validate_header(f):
-                data = ktx.get_uncompressed_texture_data(f)
-                dec_img = Image.frombytes('RGBA', (ktx.pixelWidth, ktx.pixelHeight), data, 'astc', (4, 4, False))
-                # either all black or all white https://stackoverflow.com/questions/14041562/python-pil-detect-if-an-image-is-completely-black-or-white
-                # if sum(dec_img.convert("L").getextrema()) in (0, 2):
-                #     logfunc('Skipping image as it is blank')
-                #     return False
-                    
-                dec_img.save(save_to_path, "PNG", compress_type=3)
-                #                                    ^
-                # as per https://github.com/python-pillow/Pillow/issues/5986
+    content_hashes = {}
+    png_paths = {}
+    pending = {}
+    for ktx_path in ktx_paths:
+        with open(ktx_path, 'rb') as ktx_file:
+            content_hash = hashlib.sha256(ktx_file.read()).hexdigest()
+        content_hashes[ktx_path] = content_hash
+        if content_hash in png_paths or content_hash in pending:
+            continue
+        if cache_folder:
+            png_path = os.path.join(cache_folder, f'{content_hash}.png')
+            if os.path.exists(png_path):
+                png_paths[content_hash] = png_path
+                continue
+            if os.path.exists(f'{png_path}.invalid'):
+                png_paths[content_hash] = None
+                continue
+        else:
+            png_path = str(Path(ktx_path).with_suffix('.png'))
+        pending[content_hash] = (ktx_path, png_path)
+
+    convert = partial(convert_ktx_file_to_png, skip_blank=True)
+    # in a worker process of --jobs, the other workers already use the CPUs
+    if len(pending) > 1 and 'fork' in multiprocessing.get_all_start_methods() and not write_journal.is_recording():
+        with ProcessPoolExecutor(min(len(pending), os.cpu_count() or 1),
+                                 mp_context=multiprocessing.get_context('fork')) as executor:
+            results = list(executor.map(convert, *zip(*pending.values())))
+    else:
+        results = [convert(ktx_path, png_path) for ktx_path, png_path in pending.values()]
 
-                return True
-        except (OSError, ValueError) as ex:
-            logfunc(f'Had an exception - {str(ex)}')
-    return False
+    for (content_hash, (ktx_path, png_path)), (error, invalid) in zip(pending.items(), results):
+        if error:
+            logfunc(f'Could not convert {ktx_path} to PNG: {error}')
+            png_paths[content_hash] = None
+            if cache_folder and invalid:
+                # snapshots that cannot be decoded are remembered so that they are not decoded again,
+                # read and write errors are retried by the next run
+                open(f'{png_path}.invalid', 'wb').close()
+        else:
+            png_paths[content_hash] = png_path
+    return {ktx_path: png_paths[content_hash] for ktx_path, content_hash in content_hashes.items()}
 
 
 @artifact_processor
 def applicationSnapshots(context): #files_found, report_folder, seeker, wrap_text, timezone_offset):
     # artifact_info = inspect.stack()[0]
     data_list = []
+    snapshots = []
+    ktx_paths = []
     
     for file_found in context.get_files_found():
         media_path = Path(file_found)
@@ -68,17 +111,19 @@ def applicationSnapshots(context): #files_found, report_folder, seeker, wrap_tex
         if file_found.lower().endswith('.ktx'):
             if media_path.stat().st_size < 2500: # too small, they are blank
                 continue
-            png_path = media_path.with_suffix((".png"))
-            if save_ktx_to_png_if_valid(media_path, png_path):
-                media_item = check_in_media(file_found, app_name, png_path)
-            else:
-                continue
-        else:
-            media_item = check_in_media(file_found, app_name)
-        
+            ktx_paths.append(file_found)
+        snapshots.append((file_found, app_name))
+
+    # KTX snapshots are checked in with their PNG conversion, the invalid ones are left out
+    png_paths = convert_snapshots(ktx_paths)
+    snapshots = [snapshot + (png_paths[snapshot[0]],) if snapshot[0] in png_paths else snapshot
+                 for snapshot in snapshots if png_paths.get(snapshot[0], True)]
+
+    for snapshot, media_item in zip(snapshots, check_in_media_many(snapshots)):
         if not media_item:
             continue
-            
+
+        file_found, app_name = snapshot[:2]
         last_modified_date = convert_unix_ts_to_utc(lava_get_full_media_info(media_item)[-1])
         data_list.append([last_modified_date, app_name, file_found, media_item])
     
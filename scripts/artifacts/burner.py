@@ -8,7 +8,7 @@ __artifacts_v2__ = {
         "requirements": "none",
         "category": "Burner",
         "notes": "App version tested: 4.0.18, 4.3.3, 5.3.8, 5.4.11",
-        "paths": ('*/mobile/Containers/Shared/AppGroup/*/Phoenix.sqlite*'),
+        "paths": ('*/mobile/Containers/Shared/AppGroup/*/Phoenix.sqlite*',),
         "output_types": ["lava", "tsv", "timeline"]
     },
     "get_burner_messages": {
@@ -20,8 +20,7 @@ __artifacts_v2__ = {
         "requirements": "none",
         "category": "Burner",
         "notes": "App version tested: 4.0.18, 4.3.3, 5.3.8, 5.4.11",
-        "paths": ('*/mobile/Containers/Shared/AppGroup/*/Phoenix.sqlite*',
-                  '*/mobile/Containers/Data/Application/*/.com.apple.mobile_container_manager.metadata.plist'),
+        "paths": ('*/mobile/Containers/Shared/AppGroup/*/Phoenix.sqlite*',),
         "output_types": ["lava", "tsv"],
         "data_views": {
             "chat": {
@@ -44,7 +43,7 @@ __artifacts_v2__ = {
         "requirements": "none",
         "category": "Burner",
         "notes": "App version tested: 4.0.18, 4.3.3, 5.3.8, 5.4.11",
-        "paths": ('*/mobile/Containers/Shared/AppGroup/*/Phoenix.sqlite*'),
+        "paths": ('*/mobile/Containers/Shared/AppGroup/*/Phoenix.sqlite*',),
         "output_types": ["lava", "tsv"]
     },
     "get_burner_numbers": {
@@ -56,19 +55,19 @@ __artifacts_v2__ = {
         "requirements": "none",
         "category": "Burner",
         "notes": "App version tested: 4.0.18, 4.3.3, 5.3.8, 5.4.11",
-        "paths": ('*/mobile/Containers/Shared/AppGroup/*/Phoenix.sqlite*'),
+        "paths": ('*/mobile/Containers/Shared/AppGroup/*/Phoenix.sqlite*',),
         "output_types": ["lava", "tsv", "timeline"]
 
     }
 }
 
 import os
-import plistlib
 import shutil
 
 from pathlib import Path
 from base64 import b64encode
 from scripts.artifact_report import ArtifactHtmlReport
+from scripts.context import Context
 from scripts.ilapfuncs import open_sqlite_db_readonly, does_column_exist_in_db, convert_ts_int_to_utc, convert_utc_human_to_timezone, artifact_processor
 from scripts.filetype import image_match
 
@@ -397,26 +396,18 @@ def get_burner_messages(files_found, report_folder, seeker, wrap_text, timezone_
     report_file = 'Unknown'
 
     mediafilepaths = []
-    for file_foundm in files_found:
-        if file_foundm.endswith('.com.apple.mobile_container_manager.metadata.plist'):
-            report_file = file_foundm
-            with open(file_foundm, 'rb') as f:
-                pl = plistlib.load(f)
-                if pl['MCMMetadataIdentifier'] == 'com.adhoclabs.burner':
-                    fulldir = (os.path.dirname(file_foundm))
-                    identifier = (os.path.basename(fulldir))
-
-                    # outgoingPhotos
-                    media_files = seeker.search(f'*/{identifier}/Library/Caches/outgoingPhotos/**')
-
-                    # thumbnails
-                    temp = seeker.search(f'*/{identifier}/Library/Caches/thumbnails/**')
-                    if len(temp) > 0:
-                        media_files.extend(temp)
-                    mediafilepaths = media_files
-                    break
-
-                f.close()
+    for app_container in Context.get_app_containers('com.adhoclabs.burner', 'Application')[:1]:
+        report_file = os.path.join(app_container.path, '.com.apple.mobile_container_manager.metadata.plist')
+        identifier = app_container.guid
+
+        # outgoingPhotos
+        media_files = seeker.search(f'*/{identifier}/Library/Caches/outgoingPhotos/**')
+
+        # thumbnails
+        temp = seeker.search(f'*/{identifier}/Library/Caches/thumbnails/**')
+        if len(temp) > 0:
+            media_files.extend(temp)
+        mediafilepaths = media_files
 
 
 
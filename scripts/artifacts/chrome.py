@@ -218,7 +218,7 @@ from Crypto.Cipher import AES
 from Crypto.Protocol.KDF import PBKDF2
 
 from scripts.artifact_report import ArtifactHtmlReport
-from scripts.ilapfuncs import logfunc, tsv, timeline, get_next_unused_name, open_sqlite_db_readonly, does_table_exist_in_db, does_column_exist_in_db, lava_process_artifact, lava_insert_sqlite_data, artifact_processor, convert_utc_human_to_timezone, convert_ts_human_to_utc
+from scripts.ilapfuncs import logfunc, tsv, timeline, open_sqlite_db_readonly, does_table_exist_in_db, does_column_exist_in_db, lava_process_artifact, lava_insert_sqlite_data, artifact_processor, convert_utc_human_to_timezone, convert_ts_human_to_utc
 
 
 def get_browser_name(file_name):
@@ -317,10 +317,7 @@ def chromeWebHistory(files_found, report_folder, seeker, wrap_text, timezone_off
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Web History'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9] # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
 
@@ -427,10 +424,7 @@ def chromeWebVisits(files_found, report_folder, seeker, wrap_text, timezone_offs
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Web Visits'
             report = ArtifactHtmlReport(report_name)
-            #check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9] # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
 
             data_list = []
@@ -509,10 +503,7 @@ def chromeWebSearch(files_found, report_folder, seeker, wrap_text, timezone_offs
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Web Search'
             report = ArtifactHtmlReport(report_name)
-            #check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9] # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
 
             data_list = []
@@ -678,10 +669,7 @@ def chromeDownloads(files_found, report_folder, seeker, wrap_text, timezone_offs
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Downloads'
             report = ArtifactHtmlReport(report_name)
-            #check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9] # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -756,10 +744,7 @@ def chromeKeywordSearchTerms(files_found, report_folder, seeker, wrap_text, time
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Keyword Search Terms'
             report = ArtifactHtmlReport(report_name)
-            #check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9] # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -843,10 +828,7 @@ def chromeAutofillEntries(files_found, report_folder, seeker, wrap_text, timezon
             if len(all_rows) > 0:
                 report_name = f'{browser_name} - Autofill - Entries'
                 report = ArtifactHtmlReport(report_name)
-                # check for existing and get next name for report file, so report from another file does not get overwritten
-                report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-                report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-                report.start_artifact_report(report_folder, os.path.basename(report_path))
+                report.start_artifact_report(report_folder, report_name)
                 report.add_script()
 
                 data_list = []
@@ -889,10 +871,7 @@ def chromeAutofillEntries(files_found, report_folder, seeker, wrap_text, timezon
             if len(all_rows) > 0:
                 report_name = f'{browser_name} - Autofill - Entries'
                 report = ArtifactHtmlReport(report_name)
-                # check for existing and get next name for report file, so report from another file does not get overwritten
-                report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-                report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-                report.start_artifact_report(report_folder, os.path.basename(report_path))
+                report.start_artifact_report(report_folder, report_name)
                 report.add_script()
                 data_list = []
                 for row in all_rows:
@@ -980,10 +959,7 @@ def chromeAutofillProfiles(files_found, report_folder, seeker, wrap_text, timezo
             if len(all_rows) > 0:
                 report_name = f'{browser_name} - Autofill - Profiles'
                 report = ArtifactHtmlReport(report_name)
-                # check for existing and get next name for report file, so report from another file does not get overwritten
-                report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-                report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-                report.start_artifact_report(report_folder, os.path.basename(report_path))
+                report.start_artifact_report(report_folder, report_name)
                 report.add_script()
 
                 data_list = []
@@ -1078,10 +1054,7 @@ def chromeBookmarks(files_found, report_folder, seeker, wrap_text, timezone_offs
         if len(data_list) > 0:
             report_name = f'{browser_name} - Bookmarks'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
 
             report.write_artifact_data_table(data_headers, data_list, file_found)
@@ -1178,10 +1151,7 @@ def chromeCookies(files_found, report_folder, seeker, wrap_text, timezone_offset
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Cookies'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -1266,10 +1236,7 @@ def chromeLoginData(files_found, report_folder, seeker, wrap_text, timezone_offs
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Login Data'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -1350,10 +1317,7 @@ def chromeTopSites(files_found, report_folder, seeker, wrap_text, timezone_offse
         if usageentries > 0:
             report_name = f'{browser_name} - Top Sites'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -1430,10 +1394,7 @@ def chromeOfflinePages(files_found, report_folder, seeker, wrap_text, timezone_o
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Offline Pages'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -1517,10 +1478,7 @@ def chromeMediaHistorySessions(files_found, report_folder, seeker, wrap_text, ti
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Media History - Sessions'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -1602,10 +1560,7 @@ def chromeMediaHistoryPlaybacks(files_found, report_folder, seeker, wrap_text, t
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Media History - Playbacks'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -1679,10 +1634,7 @@ def chromeMediaHistoryOrigins(files_found, report_folder, seeker, wrap_text, tim
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Media History - Origins'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
             data_list = []
             for row in all_rows:
@@ -1756,10 +1708,7 @@ def chromeNetworkActionPredictor(files_found, report_folder, seeker, wrap_text,
         if len(all_rows) > 0:
             report_name = f'{browser_name} - Network Action Predictor'
             report = ArtifactHtmlReport(report_name)
-            # check for existing and get next name for report file, so report from another file does not get overwritten
-            report_path = os.path.join(report_folder, f'{report_name}.temphtml')
-            report_path = get_next_unused_name(report_path)[:-9]  # remove .temphtml
-            report.start_artifact_report(report_folder, os.path.basename(report_path))
+            report.start_artifact_report(report_folder, report_name)
             report.add_script()
 
             data_list = []
@@ -21,7 +21,7 @@ import math
 import os
 import re
 
-from scripts.ilapfuncs import artifact_processor, logfunc, get_resolution_for_model_id, get_file_path, get_sqlite_db_records, check_in_media
+from scripts.ilapfuncs import artifact_processor, logfunc, get_resolution_for_model_id, get_file_path, get_sqlite_db_records, check_in_media_many
 
 @artifact_processor
 def discordChats(context):
@@ -116,8 +116,9 @@ def discordChats(context):
                             if any(proxy_url_md5 in string for string in files_found):
                                 #If Yes, generate thumbnail
                                 #attachmentsArray.append(media_to_html(proxy_url_md5, files_found, report_folder))
-                                attachment_file = check_in_media(proxy_url_md5)
-                                attachmentsArray.append([attachment_file, proxy_url_md5])
+                                # checked in with the other attachments once all the messages are read
+                                attachmentsArray.append([len(media_files), proxy_url_md5])
+                                media_files.append(proxy_url_md5)
                             else:
                                 #If no, show the URL, but also show the filename we think should exist in case it can be located elsewhere
                                 attachmentsArray.append([None, a.get('proxy_url') + f' ({proxy_url_md5})'])
@@ -206,6 +207,7 @@ def discordChats(context):
         logfunc("Cannot link attachments due to missing resolution")
 
     data_list = []
+    media_files = []
 
     for file_found in files_found:
         file_found = str(file_found)
@@ -236,6 +238,10 @@ def discordChats(context):
         except ValueError as e:
             logfunc(f"Error parsing JSON from {file_found}: {str(e)}")
 
+    media_ref_ids = check_in_media_many(media_files)
+    data_list = [row[:5] + (media_ref_ids[row[5]],) + row[6:] if isinstance(row[5], int) else row
+                 for row in data_list]
+
     data_headers = (('Timestamp', 'datetime'), ('Edited Timestamp', 'datetime'), 'Username', 'Bot?', 'Content', ('Attachment', 'media'), 'Attachment Link',
                     'User ID', 'Channel ID', 'Embedded Author', 'Author URL', 'Author Icon URL', 'Embedded URL', 'Embedded Script',
                     'Footer Text', 'Footer Icon URL', 'Source File')   
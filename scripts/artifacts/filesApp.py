@@ -112,8 +112,7 @@ __artifacts_v2__ = {
     }
 }
 
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_file_path, \
+from scripts.ilapfuncs import parse_version, is_query_supported_by_db, artifact_processor, get_file_path, \
     attach_sqlite_db_readonly, get_sqlite_db_records, get_plist_content, \
     convert_bytes_to_unit, convert_unix_ts_to_utc
 
@@ -180,16 +179,22 @@ def icloud_application_list(context):
     source_path = get_file_path(files_found, "client.db")
     data_list = []
 
-    os_version = context.get_installed_os_version()
-    if version.parse(os_version) < version.parse('18'):
-        query = '''
-        SELECT
-            app_libraries.app_library_name,
-            app_libraries.auto_client_item_count - app_libraries.auto_document_count,
-            app_libraries.auto_document_count,
-            app_libraries.auto_aggregate_size
-        FROM app_libraries
-        '''
+    counts_query = '''
+    SELECT
+        app_libraries.app_library_name,
+        app_libraries.auto_client_item_count - app_libraries.auto_document_count,
+        app_libraries.auto_document_count,
+        app_libraries.auto_aggregate_size
+    FROM app_libraries
+    '''
+    os_version = parse_version(context.get_installed_os_version())
+    if os_version is None:
+        # Without the iOS version, the counts are read if the db has their columns (before iOS 18)
+        with_counts = is_query_supported_by_db(source_path, counts_query)
+    else:
+        with_counts = os_version < parse_version('18')
+    if with_counts:
+        query = counts_query
         data_headers = (
             'Application Bundle ID', 'Number of folders', 'Number of files',
             ('Total size in bytes', 'bytes')
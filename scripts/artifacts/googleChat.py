@@ -271,6 +271,7 @@ def get_googleChat(files_found, report_folder, seeker, wrap_text, timezone_offse
             usageentries = len(all_rows)
             if usageentries > 0:
                 data_list = []
+                attachments = {}
 
                 for row in all_rows:
                     thumb = ''
@@ -316,12 +317,7 @@ def get_googleChat(files_found, report_folder, seeker, wrap_text, timezone_offse
                             if checkkeyten is not None:
                                 mediafilename = (protostuff['1']['10']['3'])
                                 mediafilename = (mediafilename.decode())
-                                attachment = seeker.search('*/'+guid+'/tmp/'+mediafilename, return_on_first_hit=True)
-
-                                if len(attachment) < 1:
-                                    thumb = ''
-                                else:
-                                    thumb = media_to_html(attachment, (attachment,), report_folder)
+                                attachments[len(data_list)] = f'/{guid}/tmp/{mediafilename}'
                             else:
                                 mediafilename = ''
                                 media = ''
@@ -330,6 +326,13 @@ def get_googleChat(files_found, report_folder, seeker, wrap_text, timezone_offse
                     data_list.append((timestamp, row[1], row[2], row[3], row[4], row[7], mediafilename, thumb, reaction, reactionuser, account_id))
                     mediafilename = thumb = reaction = reactionuser = ''
 
+                attachment_files = seeker.resolve_many(attachments.values())
+                for index, attachment_path in attachments.items():
+                    attachment = attachment_files[attachment_path]
+                    if attachment:
+                        row = data_list[index]
+                        data_list[index] = row[:7] + (media_to_html(attachment, (attachment,), report_folder),) + row[8:]
+
         data_headers = (('Timestamp', 'datetime'), 'Group Type', 'Conversation Name', 'Message Author', 'Message',
                         'Is Sent', 'Filename', 'Media', 'Reaction', 'Reaction User', 'Account ID')
 
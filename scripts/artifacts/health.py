@@ -252,8 +252,7 @@ __artifacts_v2__ = {
     }
 }
 
-from packaging import version
-from scripts.ilapfuncs import artifact_processor, get_sqlite_db_records, \
+from scripts.ilapfuncs import parse_version, logfunc, artifact_processor, get_sqlite_db_records, \
     attach_sqlite_db_readonly, does_table_exist_in_db, convert_cocoa_core_data_ts_to_utc, \
     does_column_exist_in_db
 
@@ -663,7 +662,10 @@ def health_heart_rate(context):
     healthdb = context.get_source_file_path('healthdb.sqlite')
 
     data_list = []
-    os_version = context.get_installed_os_version()
+    os_version = parse_version(context.get_installed_os_version())
+    if os_version is None:
+        logfunc('Unknown iOS version for the heart rate samples')
+        return (), data_list, data_source
 
     attach_query = attach_sqlite_db_readonly(healthdb, 'healthdb')
 
@@ -716,7 +718,7 @@ def health_heart_rate(context):
         end_timestamp = convert_cocoa_core_data_ts_to_utc(record[1])
         added_timestamp = convert_cocoa_core_data_ts_to_utc(record[4])
         device_model = context.get_device_model(record[7])
-        if version.parse(os_version) >= version.parse("15"):
+        if os_version >= parse_version("15"):
             if record[11] and record[12] > 0:
                 quantity_series_data_query = '''
                 SELECT
@@ -742,7 +744,7 @@ def health_heart_rate(context):
                 (start_timestamp, end_timestamp, record[2], record[3], added_timestamp,
                  record[5], record[6], record[7], device_model, record[8], record[9], record[10]))
 
-    if version.parse(os_version) >= version.parse("15"):
+    if os_version >= parse_version("15"):
         data_headers = (
             ('Date', 'datetime'), 'Heart Rate (BPM)', 'Heart Rate Context',
             ('Date added to Health', 'datetime'), 'Device ID', 'Device Model',
@@ -3,10 +3,9 @@ import os
 import pathlib
 import plistlib
 import sqlite3
-from packaging import version #use to search per version number
 
 from scripts.artifact_report import ArtifactHtmlReport
-from scripts.ilapfuncs import logfunc, tsv, timeline, is_platform_windows, open_sqlite_db_readonly, convert_ts_human_to_utc, convert_utc_human_to_timezone, iOS
+from scripts.ilapfuncs import logfunc, tsv, timeline, is_platform_windows, open_sqlite_db_readonly, convert_ts_human_to_utc, convert_utc_human_to_timezone, iOS, parse_version
 
 def get_interactionCcontacts(files_found, report_folder, seeker, wrap_text, timezone_offset):
     for file_found in files_found:
@@ -15,10 +14,14 @@ def get_interactionCcontacts(files_found, report_folder, seeker, wrap_text, time
         if file_found.endswith('.db'):
             break
     
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc('Unknown iOS version for interactionC contacts')
+        return
+
     db = open_sqlite_db_readonly(file_found)
     
-    iOSversion = iOS.get_version()
-    if version.parse(iOSversion) >= version.parse("10"):
+    if ios_version >= parse_version("10"):
         cursor = db.cursor()
         cursor.execute('''
         select
@@ -45,7 +48,7 @@ def get_interactionCcontacts(files_found, report_folder, seeker, wrap_text, time
     if usageentries > 0:
         data_list = []
         
-        if version.parse(iOSversion) >= version.parse("10"):
+        if ios_version >= parse_version("10"):
             for row in all_rows:
                 starttime = convert_ts_human_to_utc(row[0])
                 starttime = convert_utc_human_to_timezone(starttime,timezone_offset)
@@ -81,7 +84,7 @@ def get_interactionCcontacts(files_found, report_folder, seeker, wrap_text, time
     else:
         logfunc('No data available in InteractionC Contacts')
         
-    if version.parse(iOSversion) >= version.parse("10"):
+    if ios_version >= parse_version("10"):
         cursor = db.cursor()
         cursor.execute('''
         select
@@ -103,7 +106,7 @@ def get_interactionCcontacts(files_found, report_folder, seeker, wrap_text, time
     if usageentries > 0:
         data_list = []
         
-        if version.parse(iOSversion) >= version.parse("10"):
+        if ios_version >= parse_version("10"):
             for row in all_rows:
                 creationdate = convert_ts_human_to_utc(row[0])
                 creationdate = convert_utc_human_to_timezone(creationdate,timezone_offset)
@@ -14,9 +14,8 @@ __artifacts_v2__ = {
 }
 
 import sqlite3
-from packaging import version
 from scripts.artifact_report import ArtifactHtmlReport
-from scripts.ilapfuncs import logfunc, tsv, open_sqlite_db_readonly, iOS
+from scripts.ilapfuncs import logfunc, tsv, open_sqlite_db_readonly, iOS, parse_version
 
 def get_line(files_found, report_folder, seeker, wrap_text, timezone_offset):
     
@@ -24,7 +23,10 @@ def get_line(files_found, report_folder, seeker, wrap_text, timezone_offset):
         file_found = str(file_found)
         
         iOSversion = iOS.get_version()
-        if version.parse(iOSversion) < version.parse('15'):
+        ios_version = iOS.get_version_tuple()
+        if ios_version is None:
+            logfunc('Line parsing has not been tested on an unknown iOS version')
+        elif ios_version < parse_version('15'):
             logfunc('Line parsing has not been tested on iOS version ' + iOSversion)
             
         if file_found.endswith('Line.sqlite'):
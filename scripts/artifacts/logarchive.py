@@ -10,6 +10,7 @@ __artifacts_v2__ = {
         "notes": "",
         "paths": ('*/logarchive*.json',),
         "output_types": "lava_only",
+        "lava_indexes": ('Matched Artifacts',),
         "artifact_icon": "database",
     },
     "logarchive_artifacts": {
@@ -19,12 +20,28 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-19",
         "last_update_date": "2025-05-21",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
         "output_types": "lava_only",
         "artifact_icon": "database",
     },
+    "logarchive_artifact_tags": {
+        "name": "logarchive artifact tags",
+        "description": "Lists the artifacts extracting each entry of the logarchive table of LAVA db, one row per artifact",
+        "author": "@AlexisBrignoni, @JohannPLW",
+        "creation_date": "2026-10-18",
+        "last_update_date": "2026-10-18",
+        "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive",
+        "category": "Unified Logs",
+        "notes": "",
+        "paths": None,
+        "output_types": "lava_only",
+        "lava_indexes": ('Artifact',),
+        "artifact_icon": "database",
+    },
     "logarchive_time_change": {
         "name": "logarchive time change",
         "description": "Identify time changes",
@@ -32,6 +49,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-22",
         "last_update_date": "2025-05-22",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -45,6 +63,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-25",
         "last_update_date": "2025-05-25",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -58,6 +77,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-26",
         "last_update_date": "2025-05-26",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -71,6 +91,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-27",
         "last_update_date": "2025-05-27",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -84,6 +105,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-27",
         "last_update_date": "2025-05-27",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -97,6 +119,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-28",
         "last_update_date": "2025-05-28",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -110,6 +133,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-28",
         "last_update_date": "2025-05-28",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -123,6 +147,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-05-28",
         "last_update_date": "2025-05-28",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -136,6 +161,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-06-02",
         "last_update_date": "2025-06-02",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -149,6 +175,7 @@ __artifacts_v2__ = {
         "creation_date": "2026-04-30",
         "last_update_date": "2025-04-30",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -162,6 +189,7 @@ __artifacts_v2__ = {
         "creation_date": "2025-07-25",
         "last_update_date": "2025-07-25",
         "requirements": "logarchive module must be executed first",
+        "depends_on": "logarchive_artifact_tags",
         "category": "Unified Logs",
         "notes": "",
         "paths": None,
@@ -172,7 +200,288 @@ __artifacts_v2__ = {
 
 import ijson
 from datetime import datetime, timezone
+from itertools import islice
 from scripts.ilapfuncs import artifact_processor, get_file_path, get_sqlite_db_records, logfunc
+from scripts.pattern_classifier import PatternClassifier
+
+logarchive_batch_size = 10000
+
+# Patterns of the event messages extracted by the artifacts reading the logarchive table, as in
+# LIKE '%pattern%'. The follow-on artifacts only keep the rows extracted by logarchive_artifacts.
+logarchive_artifacts_patterns = {
+    'logarchive_artifacts': (
+        'Take screenshot',
+        'Time change: Clock shifted by',
+        'BoutDetector (stepBout): Identified potential walking bout',
+        'Has contact name and phone number',
+        'charger connected state change',
+        'Motion State Transition:',
+        'CarPlay Connection Event:',
+        'CoreAnalytics event: com.apple.accessories.connection.added',
+        'CoreAnalytics event: com.apple.accessories.endpoint.accessroryInfoChanged',
+        'Start #SpeechRequest id',
+        'Received Orientation',
+        'Effective device orientation',
+        'Received: Match Started',
+        'Received: Face',
+        'Received: Authenticated',
+        'AppleAccount Authenticated:',
+        '=> Transitioning to state:',
+        'Received: Screen',
+        'Screen did lock',
+        'ScreenOn changed',
+        'Screen shut off',
+        'screen is locked',
+        'screen is unlocked',
+        'Device unlocked',
+        'Device lock status',
+        'Biometric match complete',
+        'SBIconView touches began with event:',
+        'Setting process visibility',
+        'WiFi state changed:',
+        'Toggled WiFi state',
+        'is WiFi associated?',
+        'link status changed',
+        'reachability changed',
+        'ISNetworkObserver',
+        'ForgetSSID',
+        'en0: SSID',
+        'Removing Lease SSID',
+        'SysMon: WiFi state changed:',
+        'WiFiManagerClientRemoveNetworkWithReason:',
+        'WiFiSecurityRemovePassword',
+        'AlwaysOnWifi:',
+        'WiFiDeviceManagerSetNetworks:',
+        'Scanning For Broadcast found:',
+        'Scanning Remaining Channels',
+        'WiFiSettlementObserver _handleScanResults',
+        'Attempting to join',
+        'WiFiLQAMgrSetCurrentNetwork: Joined SSID:',
+        'Preparing background scan request for ',
+        'WiFiNetworkPrepareKnownBssList',
+        'to list of known networks',
+        '{AUTOJOIN, SCAN*} Scanning 2Ghz Channels found:',
+        '{AUTOJOIN, SCAN*} Scanning 5Ghz Channels found:',
+        'ATXModeDrivingFeaturizer: Driving mode',
+        'ATXModeCorrelatedAppsDataSource: user',
+        'VEHICULAR:vehicularStartTime',
+        'Handling com.apple.vehiclePolicy.DNDMode notification',
+        'Get mode configuration, identifier=com.apple.donotdisturb.mode.driving',
+        'Engaging Driving',
+        'ATXModeDrivingFeaturizer: received new DNDWD event',
+        'Airplane Mode is now 1',
+        'Airplane Mode is now On',
+        'Setting airplane mode to true',
+        'Airplane mode now active',
+        'Airplane mode now active',
+        'enabling airplanemode',
+        'Airplane mode changed',
+        'Airplane Mode is now 0',
+        'Airplane Mode is now Off',
+        'Airplane Mode is now On',
+        'Setting airplane mode to false',
+        'Airplane mode now inactive',
+        'Airplane mode Disabled',
+        'Bluetooth state changed',
+        'Sending new bluetooth state',
+        'Bluetooth state changed PoweredOn',
+        'ServiceManager disconnection result for',
+        'Device type is',
+        'is asking to connect device',
+        'Received connection result for',
+        'Received disconnection result for',
+        'Received handsfree disconnection',
+        'Sending ring notification for call',
+        'Accepting incoming audio connection',
+        'Received voice audio connected',
+        'Stopping A2DP audio streaming',
+        'Bluetooth A2DP device',
+        'Bluetooth Daemon: A2DP streaming',
+        'Starting Media connection to device',
+        'Received voice disconnection',
+        'Disconnecting audio from device',
+        'Audio was already disconnected',
+        'Toggled Bluetooth state from',
+        'CUBluetoothDevice',
+        'handsfree device disconnected',
+        'handsfree device connected',
+        'Bluetooth state updated',
+        'Bluetooth power is now off',
+        'Bluetooth state',
+        'Sending call state update',
+        'A2DP LinkQualityReport',
+        'AudioQueueIsPlaying',
+        'VolumeIncrement',
+        'rawVolumeIncreasePress',
+        'rawVolumeDecreasePress',
+        'Volume active',
+        'PlaybackQueueInvalidation',
+        'volumeValueDidChange',
+        'SBVolumeControl',
+        'SBSOSClawGestureObserver - button press noted',
+        'brightness change:',
+        'SBRingerControl activateRingerHUD',
+        'SBRingerHUDViewController setRingerSilent:',
+        'ringer state changed to:',
+        'Allowing tap for icon view',
+        'Launching application',
+        'transition source:',
+        '[Flashlight Controller]',
+        '<<<<AVFlashlight>>>>-',
+        'Tethering is now enabled with',
+        'Received notification that wireless modem state changed',
+        'Previous tethering state was',
+        'Proceed to',
+        'Turn right',
+        'Turn left',
+        'roundabout',
+        'first exit',
+        'Stay in the',
+        'parking lot',
+        'of a mile',
+        'In about',
+        'Arrived',
+        'destination',
+        'At the light',
+        'Starting route to',
+    ),
+    'logarchive_time_change': (
+        'Time change: Clock shifted by',
+    ),
+    'logarchive_flashlight': (
+        '[Flashlight Controller]',
+        '<<<<AVFlashlight>>>>-',
+    ),
+    'logarchive_executed_apps': (
+        'Allowing tap for icon view',
+        'Launching application',
+        'transition source:',
+    ),
+    'logarchive_motionstate': (
+        'Motion State Transition:',
+    ),
+    'logarchive_tethering': (
+        'Tethering is now enabled with',
+        'Received notification that wireless modem state changed',
+        'Previous tethering state was',
+    ),
+    'logarchive_airplane_mode': (
+        'Airplane Mode is now 1',
+        'Airplane Mode is now On',
+        'Setting airplane mode to true',
+        'Airplane mode now active',
+        'Airplane mode now active',
+        'enabling airplanemode',
+        'Airplane mode changed',
+        'Airplane Mode is now 0',
+        'Airplane Mode is now Off',
+        'Airplane Mode is now On',
+        'Setting airplane mode to false',
+        'Airplane mode now inactive',
+        'Airplane mode Disabled',
+    ),
+    'logarchive_lock_status': (
+        'Screen did lock',
+        'ScreenOn changed',
+        'Screen shut off',
+        'screen is locked',
+        'screen is unlocked',
+        'Device unlocked',
+        'Device lock status',
+        'Biometric match complete',
+    ),
+    'logarchive_wifi_status': (
+        'WiFi state changed:',
+        'Toggled WiFi state',
+        'is WiFi associated?',
+        'link status changed',
+        'reachability changed',
+        'ISNetworkObserver',
+        'ForgetSSID',
+        'en0: SSID',
+        'Removing Lease SSID',
+        'SysMon: WiFi state changed:',
+        'WiFiManagerClientRemoveNetworkWithReason:',
+        'WiFiSecurityRemovePassword',
+        'AlwaysOnWifi:',
+        'WiFiDeviceManagerSetNetworks:',
+        'Scanning For Broadcast found:',
+        'Scanning Remaining Channels',
+        'WiFiSettlementObserver _handleScanResults',
+        'Attempting to join',
+        'WiFiLQAMgrSetCurrentNetwork: Joined SSID:',
+        'Preparing background scan request for ',
+        'WiFiNetworkPrepareKnownBssList',
+        'to list of known networks',
+        '{AUTOJOIN, SCAN*} Scanning 2Ghz Channels found:',
+        '{AUTOJOIN, SCAN*} Scanning 5Ghz Channels found:',
+    ),
+    'logarchive_bluetooth_status': (
+        'Bluetooth state changed',
+        'Sending new bluetooth state',
+        'Bluetooth state changed PoweredOn',
+        'ServiceManager disconnection result for',
+        'Device type is',
+        'is asking to connect device',
+        'Received connection result for',
+        'Received disconnection result for',
+        'Received handsfree disconnection',
+        'Sending ring notification for call',
+        'Accepting incoming audio connection',
+        'Received voice audio connected',
+        'Stopping A2DP audio streaming',
+        'Bluetooth A2DP device',
+        'Bluetooth Daemon: A2DP streaming',
+        'Starting Media connection to device',
+        'Received voice disconnection',
+        'Disconnecting audio from device',
+        'Audio was already disconnected',
+        'Toggled Bluetooth state from',
+        'CUBluetoothDevice',
+        'handsfree device disconnected',
+        'handsfree device connected',
+        'Bluetooth state updated',
+        'Bluetooth power is now off',
+        'Bluetooth state',
+        'Sending call state update',
+        'A2DP LinkQualityReport',
+    ),
+    'logarchive_audio_status': (
+        'AudioQueueIsPlaying',
+        'VolumeIncrement',
+        'rawVolumeIncreasePress',
+        'rawVolumeDecreasePress',
+        'Volume active',
+        'PlaybackQueueInvalidation',
+        'volumeValueDidChange',
+    ),
+    'logarchive_navigation': (
+        'Starting route to',
+        'Proceed to the',
+        'Proceed to\\',
+        'Turn right',
+        'Turn left',
+        'roundabout',
+        'first exit',
+        'Stay in the',
+        'parking lot for',
+        'of a mile',
+        'In about',
+        'then arrive',
+        'your destination',
+        'At the light',
+        'Arrived\\',
+    ),
+}
+
+logarchive_columns = 'timestamp, row_number, process_image_path, process_id, subsystem, category, event_message, trace_id'
+logarchive_tagged_query = f'''
+    SELECT {logarchive_columns}
+    FROM logarchive_artifact_tags INDEXED BY logarchive_artifact_tags_artifact
+    JOIN logarchive ON logarchive.rowid = logarchive_artifact_tags.event_rowid
+    WHERE logarchive_artifact_tags.artifact = ?
+    ORDER BY logarchive_artifact_tags.rowid
+    '''
 
 
 def convert_to_utc(timestamp):
@@ -188,48 +497,111 @@ def convert_to_utc(timestamp):
     return datetime.fromisoformat(timestamp).astimezone(timezone.utc)
 
 
-def truncate_after_last_bracket(file_path):
+def convert_timestamps_to_unix(timestamps):
+    '''
+    Converts a batch of timestamps (e.g. '2025-05-06 09:54:48.353285-0400') to the integer
+    Unix timestamps stored by LAVA for datetime columns. Consecutive log events mostly share
+    their second and UTC offset, which are parsed once per batch.
+    '''
+    seconds = {}
+    unix_timestamps = []
+    for timestamp in timestamps:
+        if not timestamp:
+            unix_timestamps.append('')
+            continue
+        if len(timestamp) == 31 and timestamp[19] == '.':
+            key = (timestamp[:19], timestamp[26:])
+        else:
+            key = timestamp
+        unix_timestamp = seconds.get(key)
+        if unix_timestamp is None:
+            unix_timestamp = seconds[key] = int(convert_to_utc(timestamp).timestamp())
+        unix_timestamps.append(unix_timestamp)
+    return unix_timestamps
+
+
+def truncate_after_last_bracket(file_path, block_size=65536):
     with open(file_path, 'rb+') as f:
-        # Start from the end of the file and scan backwards
+        # Start from the end of the file and scan backwards, one block at a time
         f.seek(0, 2)  # Move to end of file
-        file_size = f.tell()
+        end = f.tell()
 
-        for i in range(file_size - 1, -1, -1):
-            f.seek(i)
-            char = f.read(1)
-            if char == b']':
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            i = f.read(end - start).rfind(b']')
+            if i >= 0:
                 # Truncate the file just after this bracket
-                f.truncate(i + 1)
-                logfunc(f"Truncated file after position {i+1}")
+                f.truncate(start + i + 1)
+                logfunc(f"Truncated file after position {start + i + 1}")
                 return
+            end = start
         print("No closing bracket `]` found.")
 
+def get_matched_artifacts(classifier, event_message):
+    '''
+    Returns the artifacts extracting an event message, stored in the Matched Artifacts column
+    of the logarchive table (e.g. ',logarchive_artifacts,logarchive_wifi_status,'), or None if
+    the message is not extracted by logarchive_artifacts.
+    '''
+    matched_artifacts = classifier.classify(event_message)
+    if not matched_artifacts or matched_artifacts[0] != 'logarchive_artifacts':
+        return None
+    return f",{','.join(matched_artifacts)},"
+
+def get_artifact_tags(records):
+    '''
+    Yields a (event rowid, artifact) row for each follow-on artifact extracting a tagged event
+    of the logarchive table, so that each artifact looks up its events through an index.
+    '''
+    for rowid, matched_artifacts in records:
+        for artifact_name in matched_artifacts.strip(',').split(',')[1:]:
+            yield rowid, artifact_name
+
+def get_tagged_logarchive_records(source_path, artifact_name):
+    '''Returns the events of the logarchive table extracted by a follow-on artifact of logarchive_artifacts'''
+    return get_sqlite_db_records(source_path, logarchive_tagged_query, params=(artifact_name,))
+
+def get_logarchive_records(source_path):
+    '''
+    Yields the rows of the events of a logarchive JSON export, decoded with the fastest ijson
+    backend available (yajl2_c when compiled) by batches of logarchive_batch_size events, so
+    that memory stays bounded whatever the size of the export.
+    '''
+    incval = 0
+    classifier = PatternClassifier(logarchive_artifacts_patterns)
+    truncate_after_last_bracket(source_path)
+    with open(source_path, 'rb') as f:
+        # if the json is a list
+        records = (record for record in ijson.items(f, 'item', multiple_values=True, use_float=True,
+                                                     buf_size=1024 * 1024)
+                   if isinstance(record, dict))
+        batch = list(islice(records, logarchive_batch_size))
+        while batch:
+            timestamps = convert_timestamps_to_unix([record.get('timestamp', '') for record in batch])
+            for timestamp, record in zip(timestamps, batch):
+                incval = incval + 1
+                processid = record.get('processID', '')
+                process_image_path = record.get('processImagePath', '')
+                subsystem = record.get('subsystem', '')
+                category = record.get('category', '')
+                eventmessage = str(record.get('eventMessage', ''))
+                traceid = str(record.get('traceID', ''))
+
+                matched_artifacts = get_matched_artifacts(classifier, eventmessage)
+
+                yield ( timestamp, incval,  process_image_path,  processid,  subsystem,  category,  eventmessage,  traceid,
+                        matched_artifacts)
+            batch = list(islice(records, logarchive_batch_size))
+
 @artifact_processor
 def logarchive(files_found, report_folder, seeker, wrap_text, timezone_offset):
     source_path = get_file_path(files_found, 'logarchive*.json')
-    data_list = []
-
-    incval = 0
-    if source_path:
-        truncate_after_last_bracket(source_path)
-        with open(source_path, 'rb') as f:
-            for record in ijson.items(f, 'item', multiple_values=True ): # if the json is a list
-                if isinstance(record, dict):
-                    incval = incval + 1
-                    timestamp = record.get('timestamp', '')
-                    timestamp = convert_to_utc(timestamp) if timestamp else ''
-                    processid = record.get('processID', '')
-                    process_image_path = record.get('processImagePath', '')
-                    subsystem = record.get('subsystem', '')
-                    category = record.get('category', '')
-                    eventmessage = str(record.get('eventMessage', ''))
-                    traceid = str(record.get('traceID', ''))
-                    
-                    t0 = ( timestamp, incval,  process_image_path,  processid,  subsystem,  category,  eventmessage,  traceid)
-                    data_list.append(t0)
+    # Records are yielded and written by chunks, logarchives can have millions of records
+    data_list = get_logarchive_records(source_path) if source_path else []
 
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID',
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
+                    'Subsystem', 'Category', 'Event Message', 'Trace ID', 'Matched Artifacts')
     return data_headers, data_list, source_path
 
 @artifact_processor
@@ -237,163 +609,42 @@ def logarchive_artifacts(files_found, report_folder, seeker, wrap_text, timezone
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
 
+    # Rows tagged when the logarchive was ingested, looked up through the index of the tags
     query = '''
     SELECT *
-    FROM logarchive
-    WHERE event_message LIKE '%Take screenshot%'
-        OR event_message LIKE '%Time change: Clock shifted by%'
-        OR event_message LIKE '%BoutDetector (stepBout): Identified potential walking bout%'
-        OR event_message LIKE '%Has contact name and phone number%'
-        OR event_message LIKE '%charger connected state change%'
-        OR event_message LIKE '%Motion State Transition:%'
-        OR event_message LIKE '%CarPlay Connection Event:%'
-        OR event_message LIKE '%CoreAnalytics event: com.apple.accessories.connection.added%'
-        OR event_message LIKE '%CoreAnalytics event: com.apple.accessories.endpoint.accessroryInfoChanged%'
-        OR event_message LIKE '%Start #SpeechRequest id%'
-        OR event_message LIKE '%Received Orientation%'
-        OR event_message LIKE '%Effective device orientation%'
-        OR event_message LIKE '%Received: Match Started%'
-        OR event_message LIKE '%Received: Face%'
-        OR event_message LIKE '%Received: Authenticated%'
-        OR event_message LIKE '%AppleAccount Authenticated:%'
-        OR event_message LIKE '%=> Transitioning to state:%'
-        OR event_message LIKE '%Received: Screen%'
-        OR event_message LIKE '%Screen did lock%'
-        OR event_message LIKE '%ScreenOn changed%'
-        OR event_message LIKE '%Screen shut off%'
-        OR event_message LIKE '%screen is locked%'
-        OR event_message LIKE '%screen is unlocked%'
-        OR event_message LIKE '%Device unlocked%'
-        OR event_message LIKE '%Device lock status%'
-        OR event_message LIKE '%Biometric match complete%'
-        OR event_message LIKE '%SBIconView touches began with event:%'
-        OR event_message LIKE '%Setting process visibility%'
-        OR event_message LIKE '%WiFi state changed:%'
-        OR event_message LIKE '%Toggled WiFi state%'
-        OR event_message LIKE '%is WiFi associated?%'
-        OR event_message LIKE '%link status changed%'
-        OR event_message LIKE '%reachability changed%'
-        OR event_message LIKE '%ISNetworkObserver%'
-        OR event_message LIKE '%ForgetSSID%'
-        OR event_message LIKE '%en0: SSID%'
-        OR event_message LIKE '%Removing Lease SSID%'
-        OR event_message LIKE '%SysMon: WiFi state changed:%'
-        OR event_message LIKE '%WiFiManagerClientRemoveNetworkWithReason:%'
-        OR event_message LIKE '%WiFiSecurityRemovePassword%'
-        OR event_message LIKE '%AlwaysOnWifi:%'
-        OR event_message LIKE '%WiFiDeviceManagerSetNetworks:%'
-        OR event_message LIKE '%Scanning For Broadcast found:%'
-        OR event_message LIKE '%Scanning Remaining Channels%'
-        OR event_message LIKE '%WiFiSettlementObserver _handleScanResults%'
-        OR event_message LIKE '%Attempting to join%'
-        OR event_message LIKE '%WiFiLQAMgrSetCurrentNetwork: Joined SSID:%'
-        OR event_message LIKE '%Preparing background scan request for %'
-        OR event_message LIKE '%WiFiNetworkPrepareKnownBssList%'
-        OR event_message LIKE '%to list of known networks%'
-        OR event_message LIKE '%{AUTOJOIN, SCAN*} Scanning 2Ghz Channels found:%'
-        OR event_message LIKE '%{AUTOJOIN, SCAN*} Scanning 5Ghz Channels found:%'
-        OR event_message LIKE '%ATXModeDrivingFeaturizer: Driving mode%'
-        OR event_message LIKE '%ATXModeCorrelatedAppsDataSource: user%'
-        OR event_message LIKE '%VEHICULAR:vehicularStartTime%'
-        OR event_message LIKE '%Handling com.apple.vehiclePolicy.DNDMode notification%'
-        OR event_message LIKE '%Get mode configuration, identifier=com.apple.donotdisturb.mode.driving%'
-        OR event_message LIKE '%Engaging Driving%'
-        OR event_message LIKE '%ATXModeDrivingFeaturizer: received new DNDWD event%'
-        OR event_message LIKE '%Airplane Mode is now 1%'
-        OR event_message LIKE '%Airplane Mode is now On%'
-        OR event_message LIKE '%Setting airplane mode to true%'
-        OR event_message LIKE '%Airplane mode now active%'
-        OR event_message LIKE '%Airplane mode now active%'
-        OR event_message LIKE '%enabling airplanemode%'
-        OR event_message LIKE '%Airplane mode changed%'
-        OR event_message LIKE '%Airplane Mode is now 0%'
-        OR event_message LIKE '%Airplane Mode is now Off%'
-        OR event_message LIKE '%Airplane Mode is now On%'
-        OR event_message LIKE '%Setting airplane mode to false%'
-        OR event_message LIKE '%Airplane mode now inactive%'
-        OR event_message LIKE '%Airplane mode Disabled%'
-        OR event_message LIKE '%Bluetooth state changed%'
-        OR event_message LIKE '%Sending new bluetooth state%'
-        OR event_message LIKE '%Bluetooth state changed PoweredOn%'
-        OR event_message LIKE '%ServiceManager disconnection result for%'
-        OR event_message LIKE '%Device type is%'
-        OR event_message LIKE '%is asking to connect device%'
-        OR event_message LIKE '%Received connection result for%'
-        OR event_message LIKE '%Received disconnection result for%'
-        OR event_message LIKE '%Received handsfree disconnection%'
-        OR event_message LIKE '%Sending ring notification for call%'
-        OR event_message LIKE '%Accepting incoming audio connection%'
-        OR event_message LIKE '%Received voice audio connected%'
-        OR event_message LIKE '%Stopping A2DP audio streaming%'
-        OR event_message LIKE '%Bluetooth A2DP device%'
-        OR event_message LIKE '%Bluetooth Daemon: A2DP streaming%'
-        OR event_message LIKE '%Starting Media connection to device%'
-        OR event_message LIKE '%Received voice disconnection%'
-        OR event_message LIKE '%Disconnecting audio from device%'
-        OR event_message LIKE '%Audio was already disconnected%'
-        OR event_message LIKE '%Toggled Bluetooth state from%'
-        OR event_message LIKE '%CUBluetoothDevice%'
-        OR event_message LIKE '%handsfree device disconnected%'
-        OR event_message LIKE '%handsfree device connected%'
-        OR event_message LIKE '%Bluetooth state updated%'
-        OR event_message LIKE '%Bluetooth power is now off%'
-        OR event_message LIKE '%Bluetooth state%'
-        OR event_message LIKE '%Sending call state update%'
-        OR event_message LIKE '%A2DP LinkQualityReport%'
-        OR event_message LIKE '%AudioQueueIsPlaying%'
-        OR event_message LIKE '%VolumeIncrement%'
-        OR event_message LIKE '%rawVolumeIncreasePress%'
-        OR event_message LIKE '%rawVolumeDecreasePress%'
-        OR event_message LIKE '%Volume active%'
-        OR event_message LIKE '%PlaybackQueueInvalidation%'
-        OR event_message LIKE '%volumeValueDidChange%'
-        OR event_message LIKE '%SBVolumeControl%'
-        OR event_message LIKE '%SBSOSClawGestureObserver - button press noted%'
-        OR event_message LIKE '%brightness change:%'
-        OR event_message LIKE '%SBRingerControl activateRingerHUD%'
-        OR event_message LIKE '%SBRingerHUDViewController setRingerSilent:%'
-        OR event_message LIKE '%ringer state changed to:%'
-        OR event_message LIKE '%Allowing tap for icon view%'
-        OR event_message LIKE '%Launching application%'
-        OR event_message LIKE '%transition source:%'
-        OR event_message LIKE '%[Flashlight Controller]%'
-        OR event_message LIKE '%<<<<AVFlashlight>>>>-%'
-        OR event_message LIKE '%Tethering is now enabled with%'
-        OR event_message LIKE '%Received notification that wireless modem state changed%'
-        OR event_message LIKE '%Previous tethering state was%'
-        OR event_message LIKE '%Proceed to%'
-        OR event_message LIKE '%Turn right%'
-        OR event_message LIKE '%Turn left%'
-        OR event_message LIKE '%roundabout%'
-        OR event_message LIKE '%first exit%'
-        OR event_message LIKE '%Stay in the%'
-        OR event_message LIKE '%parking lot%'
-        OR event_message LIKE '%of a mile%'
-        OR event_message LIKE '%In about%'
-        OR event_message LIKE '%Arrived%'
-        OR event_message LIKE '%destination%'
-        OR event_message LIKE '%At the light%'
-        OR event_message LIKE '%Starting route to%'
+    FROM logarchive INDEXED BY logarchive_matched_artifacts
+    WHERE matched_artifacts IS NOT NULL
+    ORDER BY rowid
     '''
 
     data_list = get_sqlite_db_records(source_path, query)
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
-                    'Subsystem', 'Category', 'Event Message', 'Trace ID')
+                    'Subsystem', 'Category', 'Event Message', 'Trace ID', 'Matched Artifacts')
 
     return data_headers, data_list, source_path
 
 @artifact_processor
-def logarchive_time_change(files_found, report_folder, seeker, wrap_text, timezone_offset):
+def logarchive_artifact_tags(files_found, report_folder, seeker, wrap_text, timezone_offset):
     source_path = get_file_path(files_found, '_lava_artifacts.db')
-    data_list = []
-    
+
     query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Time change: Clock shifted by%'
+    SELECT rowid, matched_artifacts
+    FROM logarchive INDEXED BY logarchive_matched_artifacts
+    WHERE matched_artifacts IS NOT NULL
+    ORDER BY rowid
     '''
+
+    data_list = get_artifact_tags(get_sqlite_db_records(source_path, query))
+    data_headers = ('Event Rowid', 'Artifact')
+
+    return data_headers, data_list, source_path
+
+@artifact_processor
+def logarchive_time_change(files_found, report_folder, seeker, wrap_text, timezone_offset):
+    source_path = get_file_path(files_found, '_lava_artifacts.db')
+    data_list = []
     
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_time_change')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -404,14 +655,7 @@ def logarchive_flashlight(files_found, report_folder, seeker, wrap_text, timezon
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%[Flashlight Controller]%' 
-    OR event_message LIKE '%<<<<AVFlashlight>>>>-%'
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_flashlight')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -422,15 +666,7 @@ def logarchive_executed_apps(files_found, report_folder, seeker, wrap_text, time
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Allowing tap for icon view%'
-        OR event_message LIKE '%Launching application%'
-        OR event_message LIKE '%transition source:%'
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_executed_apps')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -441,13 +677,7 @@ def logarchive_motionstate(files_found, report_folder, seeker, wrap_text, timezo
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Motion State Transition:%'
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_motionstate')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -458,15 +688,7 @@ def logarchive_tethering(files_found, report_folder, seeker, wrap_text, timezone
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Tethering is now enabled with%'
-        OR event_message LIKE '%Received notification that wireless modem state changed%'
-        OR event_message LIKE '%Previous tethering state was%'
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_tethering')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -477,25 +699,7 @@ def logarchive_airplane_mode(files_found, report_folder, seeker, wrap_text, time
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Airplane Mode is now 1%'
-        OR event_message LIKE '%Airplane Mode is now On%'
-        OR event_message LIKE '%Setting airplane mode to true%'
-        OR event_message LIKE '%Airplane mode now active%'
-        OR event_message LIKE '%Airplane mode now active%'
-        OR event_message LIKE '%enabling airplanemode%'
-        OR event_message LIKE '%Airplane mode changed%'
-        OR event_message LIKE '%Airplane Mode is now 0%'
-        OR event_message LIKE '%Airplane Mode is now Off%'
-        OR event_message LIKE '%Airplane Mode is now On%'
-        OR event_message LIKE '%Setting airplane mode to false%'
-        OR event_message LIKE '%Airplane mode now inactive%'
-        OR event_message LIKE '%Airplane mode Disabled%'
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_airplane_mode')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -506,21 +710,7 @@ def logarchive_lock_status(files_found, report_folder, seeker, wrap_text, timezo
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Screen did lock%'
-        OR event_message LIKE '%ScreenOn changed%'
-        OR event_message LIKE '%Screen shut off%'
-        OR event_message LIKE '%screen is locked%'
-        OR event_message LIKE '%screen is unlocked%'
-        OR event_message LIKE '%Device unlocked%'
-        OR event_message LIKE '%Device lock status%'
-        OR event_message LIKE '%Biometric match complete%'
-
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_lock_status')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -531,36 +721,7 @@ def logarchive_wifi_status(files_found, report_folder, seeker, wrap_text, timezo
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%WiFi state changed:%'
-        OR event_message LIKE '%Toggled WiFi state%'
-        OR event_message LIKE '%is WiFi associated?%'
-        OR event_message LIKE '%link status changed%'
-        OR event_message LIKE '%reachability changed%'
-        OR event_message LIKE '%ISNetworkObserver%'
-        OR event_message LIKE '%ForgetSSID%'
-        OR event_message LIKE '%en0: SSID%'
-        OR event_message LIKE '%Removing Lease SSID%'
-        OR event_message LIKE '%SysMon: WiFi state changed:%'
-        OR event_message LIKE '%WiFiManagerClientRemoveNetworkWithReason:%'
-        OR event_message LIKE '%WiFiSecurityRemovePassword%'
-        OR event_message LIKE '%AlwaysOnWifi:%'
-        OR event_message LIKE '%WiFiDeviceManagerSetNetworks:%'
-        OR event_message LIKE '%Scanning For Broadcast found:%'
-        OR event_message LIKE '%Scanning Remaining Channels%'
-        OR event_message LIKE '%WiFiSettlementObserver _handleScanResults%'
-        OR event_message LIKE '%Attempting to join%'
-        OR event_message LIKE '%WiFiLQAMgrSetCurrentNetwork: Joined SSID:%'
-        OR event_message LIKE '%Preparing background scan request for %'
-        OR event_message LIKE '%WiFiNetworkPrepareKnownBssList%'
-        OR event_message LIKE '%to list of known networks%'
-        OR event_message LIKE '%{AUTOJOIN, SCAN*} Scanning 2Ghz Channels found:%'
-        OR event_message LIKE '%{AUTOJOIN, SCAN*} Scanning 5Ghz Channels found:%'
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_wifi_status')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -571,41 +732,7 @@ def logarchive_bluetooth_status(files_found, report_folder, seeker, wrap_text, t
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Bluetooth state changed%'
-        OR event_message LIKE '%Sending new bluetooth state%'
-        OR event_message LIKE '%Bluetooth state changed PoweredOn%'
-        OR event_message LIKE '%ServiceManager disconnection result for%'
-        OR event_message LIKE '%Device type is%'
-        OR event_message LIKE '%is asking to connect device%'
-        OR event_message LIKE '%Received connection result for%'
-        OR event_message LIKE '%Received disconnection result for%'
-        OR event_message LIKE '%Received handsfree disconnection%'
-        OR event_message LIKE '%Sending ring notification for call%'
-        OR event_message LIKE '%Accepting incoming audio connection%'
-        OR event_message LIKE '%Received voice audio connected%'
-        OR event_message LIKE '%Stopping A2DP audio streaming%'
-        OR event_message LIKE '%Bluetooth A2DP device%'
-        OR event_message LIKE '%Bluetooth Daemon: A2DP streaming%'
-        OR event_message LIKE '%Starting Media connection to device%'
-        OR event_message LIKE '%Received voice disconnection%'
-        OR event_message LIKE '%Disconnecting audio from device%'
-        OR event_message LIKE '%Audio was already disconnected%'
-        OR event_message LIKE '%Toggled Bluetooth state from%'
-        OR event_message LIKE '%CUBluetoothDevice%'
-        OR event_message LIKE '%handsfree device disconnected%'
-        OR event_message LIKE '%handsfree device connected%'
-        OR event_message LIKE '%Bluetooth state updated%'
-        OR event_message LIKE '%Bluetooth power is now off%'
-        OR event_message LIKE '%Bluetooth state%'
-        OR event_message LIKE '%Sending call state update%'
-        OR event_message LIKE '%A2DP LinkQualityReport%'
-
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_bluetooth_status')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -616,19 +743,7 @@ def logarchive_audio_status(files_found, report_folder, seeker, wrap_text, timez
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%AudioQueueIsPlaying%'
-        OR event_message LIKE '%VolumeIncrement%'
-        OR event_message LIKE '%rawVolumeIncreasePress%'
-        OR event_message LIKE '%rawVolumeDecreasePress%'
-        OR event_message LIKE '%Volume active%'
-        OR event_message LIKE '%PlaybackQueueInvalidation%'
-        OR event_message LIKE '%volumeValueDidChange%'
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_audio_status')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -641,27 +756,7 @@ def logarchive_navigation(files_found, report_folder, seeker, wrap_text, timezon
     source_path = get_file_path(files_found, '_lava_artifacts.db')
     data_list = []
     
-    query = '''
-    SELECT *
-    FROM logarchive_artifacts
-    WHERE event_message LIKE '%Starting route to%'
-        OR event_message LIKE '%Proceed to the%'
-        OR event_message LIKE '%Proceed to\\%'
-        OR event_message LIKE '%Turn right%'
-        OR event_message LIKE '%Turn left%'
-        OR event_message LIKE '%roundabout%'
-        OR event_message LIKE '%first exit%'
-        OR event_message LIKE '%Stay in the%'
-        OR event_message LIKE '%parking lot for%'
-        OR event_message LIKE '%of a mile%'
-        OR event_message LIKE '%In about%'
-        OR event_message LIKE '%then arrive%'
-        OR event_message LIKE '%your destination%'
-        OR event_message LIKE '%At the light%'
-        OR event_message LIKE '%Arrived\\%'
-    '''
-    
-    data_list = get_sqlite_db_records(source_path, query)
+    data_list = get_tagged_logarchive_records(source_path, 'logarchive_navigation')
     data_headers = (('Timestamp', 'datetime'), 'Row Number', 'Process Image Path', 'Process ID', 
                     'Subsystem', 'Category', 'Event Message', 'Trace ID')
     
@@ -24,9 +24,8 @@ import sqlite3
 import json
 import textwrap
  
-from packaging import version
 from scripts.artifact_report import ArtifactHtmlReport
-from scripts.ilapfuncs import logfunc, tsv, timeline, convert_ts_human_to_utc, convert_utc_human_to_timezone, attach_sqlite_db_readonly, is_platform_windows, open_sqlite_db_readonly, iOS
+from scripts.ilapfuncs import logfunc, tsv, timeline, convert_ts_human_to_utc, convert_utc_human_to_timezone, attach_sqlite_db_readonly, is_platform_windows, open_sqlite_db_readonly, iOS, parse_version
 from scripts.lavafuncs import lava_process_artifact, lava_insert_sqlite_data
 from scripts.parse3 import ParseProto
 
@@ -44,11 +43,16 @@ def get_mailprotect(files_found, report_folder, seeker, wrap_text, timezone_offs
         else:
             continue
 
-    if version.parse(iOSversion) <= version.parse("11"):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for iOS emails")
+        return ()
+
+    if ios_version <= parse_version("11"):
         logfunc("Unsupported version for iOS emails in iOS " + iOSversion)
         return ()
 
-    if version.parse(iOSversion) < version.parse("13"):
+    if ios_version < parse_version("13"):
         head, end = os.path.split(envelope_db)
         db = sqlite3.connect(os.path.join(report_folder, "emails.db"))
         cursor = db.cursor()
@@ -211,7 +215,7 @@ def get_mailprotect(files_found, report_folder, seeker, wrap_text, timezone_offs
                 logfunc("No iOS emails available")
         db.close()
 
-    if version.parse(iOSversion) >= version.parse("13"):
+    if ios_version >= parse_version("13"):
         head, end = os.path.split(envelope_db)
         with open_sqlite_db_readonly(os.path.join(head, "Envelope Index")) as db:
             attach_query = attach_sqlite_db_readonly(f"{head}/Protected Index", 'PI')
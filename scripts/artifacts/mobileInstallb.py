@@ -1,8 +1,7 @@
 import os
 import re
-from packaging import version
 from scripts.artifact_report import ArtifactHtmlReport
-from scripts.ilapfuncs import logfunc, tsv, timeline, is_platform_windows, iOS
+from scripts.ilapfuncs import logfunc, tsv, timeline, is_platform_windows, iOS, parse_version
 
 def month_converter(month):
   months = [
@@ -57,8 +56,11 @@ def line_splitting(line):
       pass
 
 def get_mobileInstallb(files_found, report_folder, seeker, wrap_text, timezone_offset):
-    iosversion = iOS.get_version()
-    if (version.parse(iosversion) >= version.parse("17")):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+      logfunc('Unknown iOS version for the Mobile Installation Logs')
+      return
+    if (ios_version >= parse_version("17")):
       data_list = []
       data_list_reboot = []
       for file_found in files_found:
@@ -7,9 +7,8 @@ import sqlite3
 import nska_deserialize as nd
 import shutil
 
-from packaging import version
 from scripts.artifact_report import ArtifactHtmlReport
-from scripts.ilapfuncs import logfunc, tsv, kmlgen, timeline, is_platform_windows, generate_thumbnail, \
+from scripts.ilapfuncs import parse_version, logfunc, tsv, kmlgen, timeline, is_platform_windows, generate_thumbnail, \
     open_sqlite_db_readonly, iOS
 
 
@@ -23,9 +22,13 @@ def get_photosMetadata(files_found, report_folder, seeker, wrap_text, timezone_o
     if report_folder.endswith('/') or report_folder.endswith('\\'):
         report_folder = report_folder[:-1]
     iOSversion = iOS.get_version()
-    if version.parse(iOSversion) < version.parse("12"):
+    ios_version = iOS.get_version_tuple()
+    if ios_version is None:
+        logfunc("Unknown iOS version for Photos.sqlite metadata")
+        return
+    if ios_version < parse_version("12"):
         logfunc("Unsupported version for Photos.sqlite metadata on iOS " + iOSversion)
-    if (version.parse(iOSversion) >= version.parse("12")) & (version.parse(iOSversion) < version.parse("13")):
+    if (ios_version >= parse_version("12")) & (ios_version < parse_version("13")):
         file_found = str(files_found[0])
         db = open_sqlite_db_readonly(file_found)
         cursor = db.cursor()
@@ -364,7 +367,7 @@ def get_photosMetadata(files_found, report_folder, seeker, wrap_text, timezone_o
         db.close()
         return
 
-    elif (version.parse(iOSversion) >= version.parse("13")) & (version.parse(iOSversion) < version.parse("14")):
+    elif (ios_version >= parse_version("13")) & (ios_version < parse_version("14")):
         file_found = str(files_found[0])
         # os.chmod(file_found, 0o0777)
         db = open_sqlite_db_readonly(file_found)
@@ -699,7 +702,7 @@ def get_photosMetadata(files_found, report_folder, seeker, wrap_text, timezone_o
 
         db.close()
         return
-    elif version.parse(iOSversion) >= version.parse("14"):
+    elif ios_version >= parse_version("14"):
         file_found = str(files_found[0])
         # os.chmod(file_found, 0o0777)
         db = open_sqlite_db_readonly(file_found)
@@ -122,10 +122,12 @@ def sms(files_found, report_folder, seeker, wrap_text, timezone_offset):
                           record[9], record[10], record[11], record[12], attachment_timestamp, record[14], record[15], record[16], record[17],
                           record[18]))
 
+    attachment_files = seeker.resolve_many(record[12].replace('~', '', 1) for record in data_list if record[12])
+
     def copyAttachments(rec):
         pathToAttachment = None
         if rec["Attachment Path"]:
-            pathToAttachment = seeker.search('*'+rec["Attachment Path"].replace('~', '', 1), return_on_first_hit=True)
+            pathToAttachment = attachment_files[rec["Attachment Path"].replace('~', '', 1)]
             if not pathToAttachment:
                 logfunc(' [!] Unable to extract attachment file: "{}"'.format(rec["Attachment Path"]))
                 return
@@ -1,23 +1,14 @@
 import sqlite3
 import json
-import plistlib
-import os
 import base64
 from scripts.artifact_report import ArtifactHtmlReport
+from scripts.context import Context
 from scripts.ilapfuncs import logfunc, tsv, timeline, open_sqlite_db_readonly, media_to_html
 
 def get_teleguard(files_found, report_folder, seeker, wrap_text, time_offset):
     
-    #datos =  seeker.search('**/*com.apple.mobile_container_manager.metadata.plist')
-    for file_foundm in files_found:
-        if file_foundm.endswith('.com.apple.mobile_container_manager.metadata.plist'):
-            with open(file_foundm, 'rb') as f:
-                pl = plistlib.load(f)
-                if pl['MCMMetadataIdentifier'] == 'ch.swisscows.messenger.teleguardapp':
-                    fulldir = (os.path.dirname(file_foundm))
-                    identifier = (os.path.basename(fulldir))
-                    mediafilepaths = seeker.search(f'*/{identifier}/Library/Caches/images/**')
-                    break
+    for app_container in Context.get_app_containers('ch.swisscows.messenger.teleguardapp', 'Application')[:1]:
+        mediafilepaths = seeker.search(f'*/{app_container.guid}/Library/Caches/images/**')
                     
     for file_found in files_found:
         if file_found.endswith('teleguard_database.db'):
@@ -197,6 +188,6 @@ def get_teleguard(files_found, report_folder, seeker, wrap_text, time_offset):
 __artifacts__ = {
         "Teleguard": (
                 "Teleguard",
-                ('*/Shared/AppGroup/*/Library/teleguard_database.db*','*/.com.apple.mobile_container_manager.metadata.plist'),
+                ('*/Shared/AppGroup/*/Library/teleguard_database.db*',),
                 get_teleguard)
 }
\ No newline at end of file
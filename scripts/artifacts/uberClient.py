@@ -8,7 +8,9 @@ __artifacts_v2__ = {
         "requirements": "none",
         "category": "Uber",
         "notes": "",
-        "paths": ('*/mobile/Containers/Data/Application/*/.com.apple.mobile_container_manager.metadata.plist'),          
+        "paths": ('*/mobile/Containers/Data/Application/*/Library/Application Support/PersistentStorage/BootstrapStore/RealtimeRider.StreamModelKey/*',
+                  '*/mobile/Containers/Data/Application/*/Library/Application Support/PersistentStorage/Store/PaymentFoundation.PaymentStreamModelKey/profiles',
+                  '*/mobile/Containers/Data/Application/*/Library/Application Support/com.ubercab.UberClient/__METADATA/*.ldb'),
         "function": "get_uber_client"
     }
 }
@@ -26,6 +28,7 @@ import textwrap
 from pathlib import Path
 from scripts import ccl_leveldb
 from scripts.artifact_report import ArtifactHtmlReport
+from scripts.context import Context
 from scripts.ilapfuncs import logfunc, tsv, timeline, open_sqlite_db_readonly, convert_ts_int_to_utc, convert_utc_human_to_timezone
 
 # format timestamp
@@ -634,19 +637,16 @@ def parse_leveldb(manifest_path, report_folder, timezone_offset):
 def get_uber_client(files_found, report_folder, seeker, wrap_text, timezone_offset):
     identifier = ''
 
-    for file_found in files_found:
-        if file_found.endswith('.com.apple.mobile_container_manager.metadata.plist'):
-            with open(file_found, 'rb') as f:
-                pl = plistlib.load(f)
-                if pl['MCMMetadataIdentifier'] == 'com.ubercab.UberClient':
-                    fulldir = (os.path.dirname(file_found))
-                    identifier = (os.path.basename(fulldir))
-                    break
-                f.close()
+    for app_container in Context.get_app_containers('com.ubercab.UberClient', 'Application')[:1]:
+        identifier = app_container.guid
 
     if bool(identifier):
-        # */Library/Application Support/PersistentStorage/BootstrapStore/RealtimeRider.StreamModelKey/**
-        source_files = seeker.search(f'*/{identifier}/Library/Application Support/PersistentStorage/BootstrapStore/RealtimeRider.StreamModelKey/**')
+        # the files found in the containers of the other apps are left out
+        app_files = [str(file_found) for file_found in files_found if f'{os.sep}{identifier}{os.sep}' in str(file_found)]
+
+        # */Library/Application Support/PersistentStorage/BootstrapStore/RealtimeRider.StreamModelKey/*
+        source_files = [file_found for file_found in app_files
+                        if f'{os.sep}RealtimeRider.StreamModelKey{os.sep}' in file_found]
         if bool(source_files) and len(source_files) > 0:
             for source_file in source_files:
                 file_path = Path(source_file)
@@ -658,8 +658,8 @@ def get_uber_client(files_found, report_folder, seeker, wrap_text, timezone_offs
                     get_eyeball(source_file, report_folder, timezone_offset)
 
         # */Library/Application Support/PersistentStorage/Store/PaymentFoundation.PaymentStreamModelKey/profiles
-        source_files = seeker.search(f'*/{identifier}/Library/Application Support/PersistentStorage/Store/PaymentFoundation.PaymentStreamModelKey/profiles',
-                                     return_on_first_hit=True)
+        source_files = next((file_found for file_found in app_files
+                             if file_found.endswith(os.path.join('PaymentFoundation.PaymentStreamModelKey', 'profiles'))), None)
         if bool(source_files) and len(source_files) > 0:
             get_payment_profiles(source_files, report_folder, timezone_offset)
 
@@ -692,8 +692,8 @@ def get_uber_client(files_found, report_folder, seeker, wrap_text, timezone_offs
                     finally:
                         db.close()
                         
-        # */Library/Application Support/com.ubercab.UberClient/__METADATA/**
-        source_files = seeker.search(f'*/{identifier}/Library/Application Support/com.ubercab.UberClient/__METADATA/*.ldb', 
-                                     return_on_first_hit=True)
+        # */Library/Application Support/com.ubercab.UberClient/__METADATA/*.ldb
+        source_files = next((file_found for file_found in app_files
+                             if f'{os.sep}__METADATA{os.sep}' in file_found and file_found.endswith('.ldb')), None)
         if bool(source_files) and len(source_files) > 0:
             parse_leveldb(os.path.dirname(source_files), report_folder, timezone_offset)
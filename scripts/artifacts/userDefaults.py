@@ -15,11 +15,11 @@ __artifacts_v2__ = {
 }
 
 import biplist
-import pathlib
 import plistlib
 from plistlib import InvalidFileException
 import sys
 import datetime
+from scripts.context import Context
 from scripts.ilapfuncs import artifact_processor
 
 @artifact_processor
@@ -27,19 +27,8 @@ def user_defaults(files_found, report_folder, seeker, wrap_text, timezone_offset
     data_list = []
     apps = {}
     found_apps = []
-    for file_found in files_found:
-        file_found = str(file_found)
-        if not file_found.endswith('mobile_container_manager.metadata.plist'):
-            continue
-        with open(file_found, "rb") as fp:
-            if sys.version_info >= (3, 9):
-                plist = plistlib.load(fp)
-            else:
-                plist = biplist.readPlist(fp)
-            bundleid = plist['MCMMetadataIdentifier']
-            p = pathlib.Path(file_found)
-            appgroupid = p.parent.name
-            apps[appgroupid] = bundleid
+    for app_container in Context.get_app_containers(container_type='Application'):
+        apps[app_container.guid] = app_container.bundle_id
 
     for file_found in files_found:
         file_found = str(file_found)
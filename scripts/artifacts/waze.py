@@ -9,15 +9,12 @@ __artifacts_v2__ = {
         "requirements": "none",
         "category": "Waze",
         "notes": "",
-        "paths": ('*/mobile/Containers/Data/Application/*/Documents/user.db*',
-                  '*/mobile/Containers/Data/Application/*/.com.apple.mobile_container_manager.metadata.plist'),
+        "paths": ('*/mobile/Containers/Data/Application/*/Documents/user.db*',),
         "function": "get_waze"
     }
 }
 
-import os
 import re
-import plistlib
 import pathlib
 import shutil
 import sqlite3
@@ -25,6 +22,7 @@ import textwrap
 import datetime
 
 from scripts.artifact_report import ArtifactHtmlReport
+from scripts.context import Context
 from scripts.ilapfuncs import logfunc, tsv, timeline, kmlgen, open_sqlite_db_readonly, convert_ts_int_to_utc, convert_utc_human_to_timezone
 
 # format location
@@ -562,36 +560,30 @@ def get_gps_quality(files_found, report_folder, timezone_offset):
 
 # waze
 def get_waze(files_found, report_folder, seeker, wrap_text, timezone_offset):
-    #datos =  seeker.search('**/*com.apple.mobile_container_manager.metadata.plist')
-    for file_foundm in files_found:
-        if file_foundm.endswith('.com.apple.mobile_container_manager.metadata.plist'):
-            with open(file_foundm, 'rb') as f:
-                pl = plistlib.load(f)
-                if pl['MCMMetadataIdentifier'] == 'com.waze.iphone':
-                    fulldir = (os.path.dirname(file_foundm))
-                    identifier = (os.path.basename(fulldir))
-                    
-                    # user
-                    path_list = seeker.search(f'*/{identifier}/Documents/user', True)
-                    if len(path_list) > 0:
-                        get_account(path_list, report_folder, timezone_offset)
-
-                    # session
-                    path_list = seeker.search(f'*/{identifier}/Documents/session', True)
-                    if len(path_list) > 0:
-                        get_session(path_list, report_folder, timezone_offset)
-
-                    # tts.db
-                    path_list = seeker.search(f'*/{identifier}/Library/Caches/tts/tts.db', True)
-                    if len(path_list) > 0:
-                        get_tts(path_list, report_folder, timezone_offset)
-
-                    # spdlog.*logdata
-                    path_list = seeker.search(f'*/{identifier}/Documents/spdlog.*logdata')
-                    if len(path_list) > 0:
-                        get_gps_quality(path_list, report_folder, timezone_offset)
-
-                    break
+    for app_container in Context.get_app_containers('com.waze.iphone', 'Application')[:1]:
+        identifier = app_container.guid
+
+        user_path = f'/{identifier}/Documents/user'
+        session_path = f'/{identifier}/Documents/session'
+        tts_path = f'/{identifier}/Library/Caches/tts/tts.db'
+        app_files = seeker.resolve_many((user_path, session_path, tts_path))
+
+        # user
+        if app_files[user_path]:
+            get_account(app_files[user_path], report_folder, timezone_offset)
+
+        # session
+        if app_files[session_path]:
+            get_session(app_files[session_path], report_folder, timezone_offset)
+
+        # tts.db
+        if app_files[tts_path]:
+            get_tts(app_files[tts_path], report_folder, timezone_offset)
+
+        # spdlog.*logdata
+        path_list = seeker.search(f'*/{identifier}/Documents/spdlog.*logdata')
+        if len(path_list) > 0:
+            get_gps_quality(path_list, report_folder, timezone_offset)
 
     for file_found in files_found:
         # user.db
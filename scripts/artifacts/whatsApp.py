@@ -53,7 +53,7 @@ import blackboxprotobuf
 from pathlib import Path
 from scripts.ilapfuncs import artifact_processor, \
     get_file_path, get_sqlite_db_records, attach_sqlite_db_readonly, \
-    check_in_media, convert_cocoa_core_data_ts_to_utc, logfunc
+    check_in_media_many, convert_cocoa_core_data_ts_to_utc, logfunc
 
 
 @artifact_processor
@@ -173,6 +173,7 @@ def whatsAppMessages(files_found, report_folder, seeker, wrap_text, timezone_off
     source_path = get_file_path(files_found, 'ChatStorage.sqlite')
     contacts_db = get_file_path(files_found, 'ContactsV2.sqlite')
     data_list = []
+    media_files = []
 
     query = '''
     SELECT
@@ -210,17 +211,20 @@ def whatsAppMessages(files_found, report_folder, seeker, wrap_text, timezone_off
         sender = 'Local User' if record['ZISFROMME'] == 1 else record['ZPARTNERNAME']
         receiver = record['ZPARTNERNAME'] if record['ZISFROMME'] == 1 else 'Local User'
 
+        # media are checked in together once all the messages are read, by their index in media_files
         attach_file = ''
         media_local_path = record['ZMEDIALOCALPATH']
         if media_local_path:
             attach_file_name = Path(media_local_path).name
-            attach_file = check_in_media(media_local_path, attach_file_name)
+            attach_file = len(media_files)
+            media_files.append((media_local_path, attach_file_name))
 
         thumb = ''
         thumb_path = record['ZXMPPTHUMBPATH']
         if thumb_path:
             thumb_name = Path(thumb_path).name
-            thumb = check_in_media(thumb_path, thumb_name)
+            thumb = len(media_files)
+            media_files.append((thumb_path, thumb_name))
 
         metadata = record['ZMETADATA']
         number_forward = ''
@@ -251,8 +255,14 @@ def whatsAppMessages(files_found, report_folder, seeker, wrap_text, timezone_off
         lon = record['ZLONGITUDE'] if record['ZMESSAGETYPE'] == 5 else ''
         lat = record['ZLATITUDE'] if record['ZMESSAGETYPE'] == 5 else ''
 
-        data_list.append((message_date, sender, record['ZFROMJID'], receiver, record['ZTOJID'],
+        data_list.append([message_date, sender, record['ZFROMJID'], receiver, record['ZTOJID'],
                           record['ZTEXT'], attach_file, thumb, record['ZSTARRED'],
-                          number_forward, from_forward, lat, lon,))
+                          number_forward, from_forward, lat, lon,])
+
+    media_ref_ids = check_in_media_many(media_files)
+    for row in data_list:
+        for column in (6, 7):
+            if row[column] != '':
+                row[column] = media_ref_ids[row[column]]
 
     return data_headers, data_list, source_path
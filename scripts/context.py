@@ -28,6 +28,7 @@ class Context:
     _device_boards = {}
     _os_builds = {}
     _installed_os_version = ""
+    _app_containers = {}
 
     @staticmethod
     def set_output_params(output_params):
@@ -120,6 +121,19 @@ class Context:
 
         Context._files_found = files_found
 
+    @staticmethod
+    def set_app_containers(app_containers):
+        """
+        Sets the app containers of the extraction, read once for the case when
+        the seeker is created.
+
+        Args:
+            app_containers (dict): A mapping of bundle ids to the list of their
+            AppContainer objects, as returned by get_app_containers.
+        """
+
+        Context._app_containers = app_containers
+
     @staticmethod
     def _set_device_ids():
         """
@@ -372,6 +386,31 @@ class Context:
 
         return None
 
+    @staticmethod
+    def get_app_containers(bundle_id=None, container_type=None):
+        """
+        Retrieves the containers of an app, app group or plugin of the
+        extraction without reading their metadata plists again.
+
+        Args:
+            bundle_id (str, optional): The bundle id to look up. Defaults to
+            None, which returns the containers of all bundle ids.
+            container_type (str, optional): The type of containers to return
+            ('Application', 'AppGroup' or 'PluginKitPlugin'). Defaults to None,
+            which returns all types.
+
+        Returns:
+            list: The matching AppContainer objects, empty if none was found.
+        """
+
+        if bundle_id is None:
+            app_containers = [app_container for containers in Context._app_containers.values()
+                              for app_container in containers]
+        else:
+            app_containers = Context._app_containers.get(bundle_id, [])
+        return [app_container for app_container in app_containers
+                if container_type is None or app_container.container_type == container_type]
+
     @staticmethod
     def get_device_model(identifier):
         """
@@ -0,0 +1,167 @@
+"""
+Cost model of the artifacts, learnt from the performance metrics recorded by previous runs
+(the performance.json files written by artifact_profiler in the _Script_Logs of the reports).
+
+The processing time of an artifact (its run and the replay of its report writes) is modelled
+as a linear function of the size of its input files, fitted by least squares on the runs of
+the artifact. When the runs of an artifact do not tell how its time grows with the size of its
+inputs (e.g. they all had the same inputs), the median rate of the other artifacts is used.
+Artifacts never run before are given the median time of the known artifacts.
+
+Global Variables:
+    history_size: The number of most recent runs of an artifact used to fit its model.
+
+Classes:
+    CostModel: Predicts the search and processing times of the artifacts.
+
+Functions:
+    parse_duration: Parses a duration such as '90', '45s', '30m' or '1h30m' into seconds.
+    find_performance_files: Returns the performance.json files found in files or report folders.
+"""
+
+import glob
+import json
+import os
+import re
+
+from statistics import median
+
+import scripts.artifact_profiler as artifact_profiler
+
+history_size = 20
+
+_duration_units = {'h': 3600, 'm': 60, 's': 1}
+
+
+def parse_duration(duration):
+    '''
+    Parses a duration into seconds.
+    Args:
+        duration: A number of seconds, or numbers followed by h, m or s (e.g. '30m', '1h30m', '90s').
+    Returns:
+        The duration in seconds (float).
+    Raises:
+        ValueError: If the duration is not valid.
+    '''
+    duration = duration.strip().lower()
+    if re.fullmatch(r'\d+(\.\d+)?', duration):
+        return float(duration)
+    parts = re.findall(r'(\d+(?:\.\d+)?)([hms])', duration)
+    if not parts or ''.join(number + unit for number, unit in parts) != duration:
+        raise ValueError(f'Invalid duration: {duration}')
+    return sum(float(number) * _duration_units[unit] for number, unit in parts)
+
+
+def find_performance_files(paths):
+    '''
+    Returns the performance.json files found in the given paths, oldest first.
+    Args:
+        paths: performance.json files, report folders or folders holding report folders (e.g. an OUTPUT folder).
+    Returns:
+        A list of file paths.
+    '''
+    performance_files = set()
+    relative_path = os.path.join('_HTML', '_Script_Logs', artifact_profiler.performance_file_name)
+    for path in paths:
+        if os.path.isfile(path):
+            performance_files.add(os.path.abspath(path))
+            continue
+        for pattern in (artifact_profiler.performance_file_name, relative_path, os.path.join('*', relative_path)):
+            performance_files.update(os.path.abspath(file_path)
+                                     for file_path in glob.glob(os.path.join(glob.escape(path), pattern)))
+    return sorted(performance_files, key=os.path.getmtime)
+
+
+class CostModel:
+    '''
+    Predicts the search and processing times of the artifacts from the metrics of previous runs.
+    Attributes:
+        run_count: The number of performance.json files the model was learnt from.
+    '''
+
+    def __init__(self, runs=()):
+        '''
+        Args:
+            runs: The metrics of the artifacts of each run, oldest first, as returned by artifact_profiler.get_report().
+        '''
+        self.run_count = 0
+        history = {}
+        searches = {}
+        for artifacts in runs:
+            self.run_count += 1
+            for artifact in artifacts:
+                searches.setdefault(artifact['artifact_name'], []).append(artifact.get('search_seconds', 0))
+                # artifacts without files or skipped, cached results and failed runs do not tell the time of the artifact
+                if not artifact.get('run_seconds') or artifact.get('cached') or artifact.get('errors'):
+                    continue
+                history.setdefault(artifact['artifact_name'], []).append(artifact)
+
+        self._models = {}
+        self._search_seconds = {artifact_name: sum(seconds[-history_size:]) / len(seconds[-history_size:])
+                                for artifact_name, seconds in searches.items()}
+        rates = []
+        for artifact_name, artifacts in history.items():
+            artifacts = artifacts[-history_size:]
+            sizes = [artifact.get('input_bytes', 0) for artifact in artifacts]
+            seconds = [artifact.get('run_seconds', 0) + artifact.get('replay_seconds', 0) for artifact in artifacts]
+            mean_size = sum(sizes) / len(sizes)
+            mean_seconds = sum(seconds) / len(seconds)
+            size_variance = sum((size - mean_size) ** 2 for size in sizes)
+            rate = None
+            if size_variance:
+                rate = sum((size - mean_size) * (second - mean_seconds)
+                           for size, second in zip(sizes, seconds)) / size_variance
+                if rate >= 0:
+                    rates.append(rate)
+                else:
+                    rate = None  # noise, larger inputs do not take less time
+            self._models[artifact_name] = (mean_size, mean_seconds, rate)
+
+        self._default_rate = median(rates) if rates else 0
+        self._default_seconds = median(model[1] for model in self._models.values()) if self._models else 0
+        self._default_search_seconds = median(self._search_seconds.values()) if self._search_seconds else 0
+
+    @classmethod
+    def load(cls, paths):
+        '''
+        Learns the model from the performance.json files found in the given paths.
+        Args:
+            paths: performance.json files, report folders or folders holding report folders.
+        Returns:
+            A CostModel, without history if no valid file was found.
+        '''
+        runs = []
+        for performance_file in find_performance_files(paths):
+            try:
+                with open(performance_file, 'r', encoding='utf-8') as file:
+                    runs.append(json.load(file)['artifacts'])
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        return cls(runs)
+
+    def has_history(self, artifact_name):
+        '''Returns True if the artifact was run (with files) in the runs the model was learnt from'''
+        return artifact_name in self._models
+
+    def predict(self, artifact_name, input_bytes=None):
+        '''
+        Predicts the processing time (run and replay of the report writes) of an artifact.
+        Args:
+            artifact_name: The name of the artifact function.
+            input_bytes: The size of the files found for the artifact, None if it is not known yet.
+        Returns:
+            The predicted time in seconds.
+        '''
+        model = self._models.get(artifact_name)
+        if model is None:
+            return self._default_seconds
+        mean_size, mean_seconds, rate = model
+        if input_bytes is None:
+            return mean_seconds
+        if rate is None:
+            rate = self._default_rate
+        return max(mean_seconds + rate * (input_bytes - mean_size), 0)
+
+    def predict_search(self, artifact_name):
+        '''Predicts the time spent searching the files of an artifact, in seconds'''
+        return self._search_seconds.get(artifact_name, self._default_search_seconds)
@@ -111,6 +111,29 @@ body_sidebar_dynamic_data = \
                         </li>
 """
 body_sidebar_dynamic_data_placeholder = '<!--__INSERT-NAV-BAR-DATA-HERE__-->'
+# The sidebar data of the artifact pages is shared in _sidebar.js, written by report.generate_report
+body_sidebar_include = \
+"""
+                        <script src="_sidebar.js"></script>
+                        <script>
+                            if (window.leappMarkActivePage)
+                                leappMarkActivePage();
+                        </script>
+"""
+# Variables in sidebar_js = {nav_list_data}
+sidebar_js = \
+"""document.write({0});
+
+function leappMarkActivePage() {{
+    var page = decodeURIComponent(window.location.pathname.split('/').pop());
+    var links = document.querySelectorAll('#sidebar_id a.nav-link');
+    for (var i = 0; i < links.length; i++) {{
+        if (links[i].getAttribute('href') === page) {{
+            links[i].classList.add('active');
+        }}
+    }}
+}}
+"""
 body_sidebar_trailer = \
 """
                     </ul>
@@ -342,6 +365,19 @@ default_responsive_table_script = \
     </script>
 """
 
+# Variables in paged_table_script = {table_id}, {chunk_folder}, {total}, {chunk_size}
+paged_table_script = \
+"""
+    <script type="text/javascript" src="_elements/paged_table.js"></script>
+    <script>
+        $(document).ready(function() {{
+            leappPagedTable('{0}', '{1}', {2}, {3});
+            $('.dataTables_length').addClass('bs-select');
+            $('#mySpinner').remove();
+        }});
+    </script>
+"""
+
 page_footer = \
 """
     </body>
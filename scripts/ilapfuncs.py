@@ -7,24 +7,34 @@ import json
 import math
 import nska_deserialize
 import os
+import pickle
 import plistlib
 import re
 import shutil
 import sqlite3
 import sys
+import tempfile
+import threading
 import xml
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import *
 from functools import lru_cache
+from itertools import islice
+from packaging.version import InvalidVersion, Version
 from pathlib import Path
 from urllib.parse import quote
+import scripts.artifact_cache as artifact_cache
+import scripts.artifact_profiler as artifact_profiler
 import scripts.artifact_report as artifact_report
+import scripts.write_journal as write_journal
 from scripts.context import Context
 
 # common third party imports
 import pytz
 import simplekml
-from scripts.filetype import guess_mime, guess_extension
+from scripts.filetype import guess_mime, guess_extension, get_signature_bytes
 from functools import wraps
 
 # LEAPP version unique imports
@@ -33,17 +43,34 @@ from PIL import Image
 
 from scripts.lavafuncs import lava_process_artifact, lava_insert_sqlite_data, lava_get_media_item, \
     lava_insert_sqlite_media_item, lava_insert_sqlite_media_references, lava_get_media_references, \
-    lava_get_full_media_info
+    lava_get_full_media_info, lava_set_record_count
+
+if sys.platform.startswith('linux'):
+    import fcntl
+else:  # the files are only cloned on Linux
+    fcntl = None
 
 os.path.basename = lru_cache(maxsize=None)(os.path.basename)
 
 thumbnail_root = '**/Media/PhotoData/Thumbnails/**/'
 media_root = '**/Media/'
 thumb_size = 256, 256
+stream_chunk_size = 10000
+html_paged_table_threshold = 10000
 
 identifiers = {}
 icons = {}
 lava_only_artifacts = {}
+media_bytes_copied = 0
+_media_bytes_lock = threading.Lock()
+sqlite_db_pool_size = 64
+sqlite_db_cache_size_kib = 65536
+sqlite_db_mmap_size = 268435456
+_sqlite_db_pool = threading.local()
+photos_db_cache_size_kib = 262144
+sqlite_db_schemas = {}
+sqlite_supported_queries = {}
+_FICLONE = 0x40049409  # Linux ioctl cloning a file on file systems supporting reflinks
 
 class iOS:
     _version = None
@@ -53,13 +80,39 @@ class iOS:
         """Return the value of the class property."""
         return iOS._version
 
+    @staticmethod
+    def get_version_tuple():
+        """Return the version as a tuple of integers (e.g. (17, 6) for '17.6.0'), None if it is not known."""
+        return parse_version(iOS._version)
+
     @staticmethod
     def set_version(os_version):
         """Assign a value to the class property once."""
         if iOS._version is None:
+            write_journal.note_write()
             iOS._version = os_version
 
 
+@lru_cache(maxsize=None)
+def parse_version(version_string):
+    '''
+    Parses a version once, as a tuple of integers without the trailing zeros, so that it can be
+    compared to other parsed versions like packaging versions (e.g. parse_version('17.0') == parse_version('17')).
+    Unlike packaging versions, only the release numbers are kept: pre-release, post-release and dev segments
+    are dropped, so that parse_version('18.0b1') == parse_version('18') while Version('18.0b1') < Version('18').
+    Returns None if the version is not known or not valid.
+    '''
+    if not version_string:
+        return None
+    try:
+        release = list(Version(str(version_string)).release)
+    except InvalidVersion:
+        return None
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+    return tuple(release)
+
+
 class OutputParameters:
     '''Defines the parameters that are common for '''
     # static parameters
@@ -201,6 +254,60 @@ def set_media_references(media_ref_id, media_id, module_name, artifact_name, nam
     ))
     lava_insert_sqlite_media_references(media_references)
 
+def add_copied_media_bytes(byte_count):
+    '''Counts the bytes of media files copied, rather than linked, to the media folders'''
+    global media_bytes_copied
+    if write_journal.record(add_copied_media_bytes, byte_count):
+        return
+    with _media_bytes_lock:
+        media_bytes_copied += byte_count
+
+def get_copied_media_bytes():
+    '''Returns the number of bytes of media files copied to the media folders during the run'''
+    return media_bytes_copied
+
+def _reflink_file(source, destination):
+    '''Clones source to destination without copying its data, returns False if the file system does not support it'''
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        with open(source, 'rb') as source_file, open(destination, 'xb') as destination_file:
+            try:
+                fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+            except OSError:
+                destination_file.close()
+                os.remove(destination)
+                return False
+    except OSError:
+        return False
+    shutil.copystat(source, destination)
+    return True
+
+def link_media_file(source, destination):
+    '''
+    Creates a media file as a hard link or, where hard links are not possible, a reflink
+    of another file, and copies the file only when neither is supported (e.g. across file systems).
+    Args:
+        source: The path of the file.
+        destination: The path of the media file, left as is if it already exists.
+    Returns:
+        The number of bytes copied, 0 if the file was linked.
+    '''
+    destination = Path(destination)
+    if destination.exists():
+        return 0
+    try:
+        destination.hardlink_to(source)
+        return 0
+    except OSError:
+        pass
+    if _reflink_file(source, destination):
+        return 0
+    shutil.copy2(source, destination)
+    byte_count = destination.stat().st_size
+    add_copied_media_bytes(byte_count)
+    return byte_count
+
 def _check_in_media(media_id, source_path, is_embedded, name, media_data=None, converted_file_path=None, force_type=None,
                     force_extension=None, force_creation_date=None, force_modification_date=None):
     '''
@@ -219,91 +326,101 @@ def _check_in_media(media_id, source_path, is_embedded, name, media_data=None, c
     Returns:
         The media reference ID or None.
     '''
-    output_params = Context.get_output_params()
-    seeker = Context.get_seeker()
-
     media_ref_id = get_media_references_id(media_id, Context.get_artifact_name(), name)
     if lava_get_media_references(media_ref_id):
         return media_ref_id # Reference already exists, we're done.
 
     # If media item doesn't exist, create it.
     if not lava_get_media_item(media_id):
-        media_item = MediaItem(media_id)
-
-        if force_type:
-            media_item.mimetype = force_type
-        else:
-            media_item.mimetype = guess_mime(media_data)
-
-        if force_extension:
-            suffix = force_extension
-        elif name and len(name.split('.')[-1]) < 5:
-            suffix = name.split('.')[-1]
-        elif not is_embedded and len(source_path.split('.')[-1]) < 5:
-            suffix = source_path.split('.')[-1]
-        else:
-            suffix = f".{guess_extension(media_data)}"
-        if suffix and not suffix.startswith('.'):
-            suffix = f".{suffix}"
-
-        extraction_path = Context.get_source_file_path(source_path)
-        file_info = seeker.file_infos.get(extraction_path)
-        if file_info:
-            media_item.source_path = file_info.source_path
-        else:
-            media_item.source_path = source_path
+        media_item = _create_media_item(media_id, source_path, is_embedded, name, media_data, converted_file_path,
+                                        force_type, force_extension, force_creation_date, force_modification_date)
+        if not media_item:
+            return None
+        lava_insert_sqlite_media_item(media_item)
 
-        if is_embedded:
-            media_item.created_at = force_creation_date if force_creation_date else 0
-            media_item.updated_at = force_modification_date if force_modification_date else 0
-        else:
-            if not extraction_path:
-                return None
+    # Always set the reference
+    set_media_references(media_ref_id, media_id, Context.get_module_name(), Context.get_artifact_name(), name)
+    return media_ref_id
 
-            file_to_copy = Path(converted_file_path) if converted_file_path else Path(extraction_path)
-            if not file_to_copy.is_file():
-                return None
+def _create_media_item(media_id, source_path, is_embedded, name, media_data=None, converted_file_path=None,
+                       force_type=None, force_extension=None, force_creation_date=None, force_modification_date=None):
+    '''
+    Creates the media files of a media item, without registering it in the LAVA database,
+    so that it can run on a thread pool. Takes the arguments of _check_in_media.
+    Returns:
+        The MediaItem, or None if the file of the media was not found.
+    '''
+    output_params = Context.get_output_params()
+    seeker = Context.get_seeker()
+    extraction_path = Context.get_source_file_path(source_path)
+    if not is_embedded:
+        if not extraction_path:
+            return None
+        if media_data is None and not (force_type and force_extension):
+            # the type of the media is guessed from the signature in the header of the file
+            media_data = get_signature_bytes(extraction_path)
+
+    media_item = MediaItem(media_id)
+
+    if force_type:
+        media_item.mimetype = force_type
+    else:
+        media_item.mimetype = guess_mime(media_data)
+
+    if force_extension:
+        suffix = force_extension
+    elif name and len(name.split('.')[-1]) < 5:
+        suffix = name.split('.')[-1]
+    elif not is_embedded and len(source_path.split('.')[-1]) < 5:
+        suffix = source_path.split('.')[-1]
+    else:
+        suffix = f".{guess_extension(media_data)}"
+    if suffix and not suffix.startswith('.'):
+        suffix = f".{suffix}"
 
-            if force_creation_date:
-                media_item.created_at = force_creation_date
-            elif file_info:
-                media_item.created_at = file_info.creation_date
-            else:
-                media_item.created_at = 0
+    file_info = seeker.file_infos.get(extraction_path)
+    if file_info:
+        media_item.source_path = file_info.source_path
+    else:
+        media_item.source_path = source_path
 
-            if force_modification_date:
-                media_item.updated_at = force_modification_date
-            elif file_info:
-                media_item.updated_at = file_info.modification_date
-            else:
-                media_item.updated_at = 0
+    if is_embedded:
+        media_item.created_at = force_creation_date if force_creation_date else 0
+        media_item.updated_at = force_modification_date if force_modification_date else 0
+    else:
+        file_to_copy = Path(converted_file_path) if converted_file_path else Path(extraction_path)
+        if not file_to_copy.is_file():
+            return None
+
+        if force_creation_date:
+            media_item.created_at = force_creation_date
+        elif file_info:
+            media_item.created_at = file_info.creation_date
+        else:
+            media_item.created_at = 0
 
-        # 1. Create the canonical media file
-        canonical_media_path = Path(output_params.media_folder).joinpath(media_id).with_suffix(suffix)
-        if is_embedded:
-            canonical_media_path.write_bytes(media_data)
+        if force_modification_date:
+            media_item.updated_at = force_modification_date
+        elif file_info:
+            media_item.updated_at = file_info.modification_date
         else:
-            try:
-                canonical_media_path.hardlink_to(file_to_copy)
-            except OSError:
-                shutil.copy2(file_to_copy, canonical_media_path)
+            media_item.updated_at = 0
 
-        # 2. Create the HTML media file link/copy
-        html_media_path = Path(output_params.html_media_folder).joinpath(media_id).with_suffix(suffix)
-        if not html_media_path.exists():
-            try:
-                html_media_path.hardlink_to(canonical_media_path)
-            except OSError:
-                shutil.copy2(canonical_media_path, html_media_path)
+    # 1. Create the canonical media file
+    canonical_media_path = Path(output_params.media_folder).joinpath(media_id).with_suffix(suffix)
+    if is_embedded:
+        canonical_media_path.write_bytes(media_data)
+    else:
+        link_media_file(file_to_copy, canonical_media_path)
 
-        media_item.extraction_path = f"media/{media_id}{suffix}"
-        media_item.metadata = "not parsed yet"
-        media_item.is_embedded = 1 if is_embedded else 0
-        lava_insert_sqlite_media_item(media_item)
+    # 2. Create the HTML media file link/copy
+    html_media_path = Path(output_params.html_media_folder).joinpath(media_id).with_suffix(suffix)
+    link_media_file(canonical_media_path, html_media_path)
 
-    # Always set the reference
-    set_media_references(media_ref_id, media_id, Context.get_module_name(), Context.get_artifact_name(), name)
-    return media_ref_id
+    media_item.extraction_path = f"media/{media_id}{suffix}"
+    media_item.metadata = "not parsed yet"
+    media_item.is_embedded = 1 if is_embedded else 0
+    return media_item
 
 def check_in_media(file_path, name="", converted_file_path=False, force_type=None, force_extension=None,
                    force_creation_date=None, force_modification_date=None):
@@ -328,13 +445,72 @@ def check_in_media(file_path, name="", converted_file_path=False, force_type=Non
     file_info = Context.get_seeker().file_infos.get(extraction_path)
     if file_info:
         media_id = hashlib.sha1(f"{file_info.source_path}".encode()).hexdigest()
-        with open(extraction_path, "rb") as f:
-            file_data = f.read()
-        return _check_in_media(media_id, file_path, False, name, media_data=file_data, converted_file_path=converted_file_path,
+        return _check_in_media(media_id, file_path, False, name, converted_file_path=converted_file_path,
                                force_type=force_type, force_extension=force_extension,
                                force_creation_date=force_creation_date, force_modification_date=force_modification_date)
     return None
 
+def check_in_media_many(media_files, max_workers=None):
+    '''
+    Checks in many media files at once. The media already checked in and the
+    duplicates of the list are set aside first, then the media files of the
+    remaining ones are created on a thread pool.
+    Args:
+        media_files: The media to check in, each one given as a file path or as a tuple of
+            the arguments of check_in_media (file_path, name, converted_file_path, force_type, ...).
+        max_workers: The number of threads (optional).
+    Returns:
+        The list of the media reference IDs (or None), in the order of media_files.
+    '''
+    seeker = Context.get_seeker()
+    artifact_name = Context.get_artifact_name()
+    signature = inspect.signature(check_in_media)
+    media_ref_ids = []
+    references = []
+    new_media = {}
+    for media_file in media_files:
+        arguments = signature.bind(*(media_file if isinstance(media_file, tuple) else (media_file,)))
+        arguments.apply_defaults()
+        arguments = arguments.arguments
+        media_ref_ids.append(None)
+        extraction_path = Context.get_source_file_path(arguments['file_path'])
+        if not extraction_path:
+            logfunc(f'No matching file found for "{arguments["file_path"]}"')
+            continue
+        file_info = seeker.file_infos.get(extraction_path)
+        if not file_info:
+            continue
+        media_id = hashlib.sha1(f"{file_info.source_path}".encode()).hexdigest()
+        media_ref_id = get_media_references_id(media_id, artifact_name, arguments['name'])
+        if lava_get_media_references(media_ref_id):
+            media_ref_ids[-1] = media_ref_id
+            continue
+        if media_id not in new_media and not lava_get_media_item(media_id):
+            new_media[media_id] = arguments
+        references.append((len(media_ref_ids) - 1, media_ref_id, media_id, arguments['name']))
+
+    def create_media_item(media_id):
+        arguments = new_media[media_id]
+        return _create_media_item(media_id, arguments['file_path'], False, arguments['name'],
+                                  converted_file_path=arguments['converted_file_path'],
+                                  force_type=arguments['force_type'], force_extension=arguments['force_extension'],
+                                  force_creation_date=arguments['force_creation_date'],
+                                  force_modification_date=arguments['force_modification_date'])
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        media_items = dict(zip(new_media, executor.map(create_media_item, new_media)))
+    for media_item in media_items.values():
+        if media_item:
+            lava_insert_sqlite_media_item(media_item)
+
+    for index, media_ref_id, media_id, name in references:
+        if media_id in media_items and not media_items[media_id]:
+            continue
+        if not lava_get_media_references(media_ref_id):
+            set_media_references(media_ref_id, media_id, Context.get_module_name(), artifact_name, name)
+        media_ref_ids[index] = media_ref_id
+    return media_ref_ids
+
 def check_in_embedded_media(source_file, data, name="", force_type=None, force_extension=None,
                             force_creation_date=None, force_modification_date=None):
     '''
@@ -444,95 +620,239 @@ def get_data_list_with_media(media_header_info, data_list):
         
     return html_data_list, txt_data_list
 
-def artifact_processor(func):
-    @wraps(func)
-    def wrapper(files_found, report_folder, seeker, wrap_text, timezone_offset):
-        module_name = func.__module__.split('.')[-1]
-        func_name = func.__name__
-        module_file_path = inspect.getfile(func)
-
-        all_artifacts_info = func.__globals__.get('__artifacts_v2__', {})
-        artifact_info = all_artifacts_info.get(func_name, {})
-
-        artifact_name = artifact_info.get('name', func_name)
-        category = artifact_info.get('category', '')
-        description = artifact_info.get('description', '')
-        icon = artifact_info.get('artifact_icon', '')
-        html_columns = artifact_info.get('html_columns', [])
-
-        output_types = artifact_info.get('output_types', ['html', 'tsv', 'timeline', 'lava', 'kml'])
-        is_lava_only = 'lava_only' in output_types
-
-        Context.clear()
-        Context.set_report_folder(report_folder)
-        Context.set_seeker(seeker)
-        Context.set_files_found(files_found)
-        Context.set_artifact_info(artifact_info)
-        Context.set_module_name(module_name)
-        Context.set_module_file_path(module_file_path)
-        Context.set_artifact_name(artifact_name)
-
-        sig = inspect.signature(func)
-        if len(sig.parameters) == 1:
-            data_headers, data_list, source_path = func(Context)
+def set_artifact_context(func, files_found, report_folder, seeker):
+    '''
+    Sets the Context for an artifact function, before running it or writing its output.
+    Args:
+        func: The artifact function, not wrapped by artifact_processor.
+        files_found: The files found for the artifact.
+        report_folder: The folder of the HTML report of the artifact.
+        seeker: The seeker of the extraction.
+    '''
+    all_artifacts_info = func.__globals__.get('__artifacts_v2__', {})
+    artifact_info = all_artifacts_info.get(func.__name__, {})
+
+    Context.clear()
+    Context.set_report_folder(report_folder)
+    Context.set_seeker(seeker)
+    Context.set_files_found(files_found)
+    Context.set_artifact_info(artifact_info)
+    Context.set_module_name(func.__module__.split('.')[-1])
+    Context.set_module_file_path(inspect.getfile(func))
+    Context.set_artifact_name(artifact_info.get('name', func.__name__))
+
+def write_artifact_output(func_name, data_headers, data_list, source_path):
+    '''
+    Writes the output of the artifact set in the Context (HTML, TSV, timeline, LAVA and KML).
+    Args:
+        func_name: The name of the artifact function.
+        data_headers: The headers returned by the artifact function.
+        data_list: The rows returned by the artifact function.
+        source_path: The source path returned by the artifact function.
+    '''
+    if not isinstance(data_list, (list, tuple)):
+        if write_journal.is_recording():
+            # The rows are spooled to a file read back chunk by chunk by the main process
+            spool_path = spool_rows(data_list)
+            write_journal.record(write_spooled_artifact_output, func_name, data_headers, spool_path, source_path)
         else:
-            data_headers, data_list, source_path = func(files_found, report_folder, seeker, wrap_text, timezone_offset)
+            write_artifact_output_stream(func_name, data_headers, data_list, source_path)
+        return
+
+    if write_journal.record(write_artifact_output, func_name, data_headers, data_list, source_path):
+        return
 
-        if not source_path:
-            logfunc("No source_path provided")
+    html_data_list = None
+    if isinstance(data_list, tuple):
+        data_list, html_data_list = data_list
+    write_artifact_output_stream(func_name, data_headers, data_list, source_path,
+                                 html_rows=html_data_list, record_count=len(data_list))
 
-        if len(data_list):
-            if isinstance(data_list, tuple):
-                data_list, html_data_list = data_list
-            else:
-                html_data_list = data_list
-            logfunc(f"Found {len(data_list):,} {'records' if len(data_list)>1 else 'record'} for {artifact_name}")
-            icons.setdefault(category, {artifact_name: icon}).update({artifact_name: icon})
-
-            # Strip tuples from headers for HTML, TSV, and timeline
-            stripped_headers = strip_tuple_from_headers(data_headers)
-
-            # Check if headers contains a 'media' type
-            media_header_info = get_media_header_info(data_headers)
-            if media_header_info:
-                html_columns.extend([data_headers[idx][0] for idx in media_header_info])
-                html_data_list, txt_data_list = get_data_list_with_media(media_header_info, data_list)
-
-            if check_output_types('html', output_types):
-                report = artifact_report.ArtifactHtmlReport(artifact_name)
-                report.start_artifact_report(report_folder, artifact_name, description)
-                report.add_script()
-                report.write_artifact_data_table(stripped_headers, html_data_list, source_path, html_no_escape=html_columns)
-                report.end_artifact_report()
-
-            if check_output_types('tsv', output_types):
-                tsv(report_folder, stripped_headers, txt_data_list if media_header_info else data_list, artifact_name)
-
-            if check_output_types('timeline', output_types):
-                timeline(report_folder, artifact_name, txt_data_list if media_header_info else data_list, stripped_headers)
-
-            if check_output_types('lava', output_types):
-                table_name, object_columns, column_map = lava_process_artifact(category,
-                                                                               module_name,
-                                                                               artifact_name,
-                                                                               data_headers,
-                                                                               len(data_list),
-                                                                               func_name=func_name,
-                                                                               data_views=artifact_info.get("data_views"),
-                                                                               artifact_icon=icon,
-                                                                               source_path=source_path)
-                if is_lava_only:
-                    lava_only_info(category, artifact_name, table_name, len(data_list))
-                lava_insert_sqlite_data(table_name, data_list, object_columns, data_headers, column_map)
-
-            if check_output_types('kml', output_types):
-                kmlgen(report_folder, artifact_name, txt_data_list if media_header_info else data_list, stripped_headers)
+def spool_rows(rows):
+    '''
+    Writes rows yielded by an artifact function in a worker process to a spool file in the
+    report folder, by chunks of stream_chunk_size rows, and returns the path of the file.
+    '''
+    spool_file, spool_path = tempfile.mkstemp('.spool', dir=Context.get_output_params().output_folder_base)
+    try:
+        with os.fdopen(spool_file, 'wb') as spool_file:
+            rows = iter(rows)
+            chunk = list(islice(rows, stream_chunk_size))
+            while chunk:
+                pickle.dump([tuple(row) for row in chunk], spool_file, pickle.HIGHEST_PROTOCOL)
+                chunk = list(islice(rows, stream_chunk_size))
+    except BaseException:
+        os.remove(spool_path)
+        raise
+    return spool_path
+
+def read_spooled_rows(spool_path):
+    '''Yields the rows of a spool file written by spool_rows'''
+    with open(spool_path, 'rb') as spool_file:
+        while True:
+            try:
+                chunk = pickle.load(spool_file)
+            except EOFError:
+                return
+            yield from chunk
+
+def write_spooled_artifact_output(func_name, data_headers, spool_path, source_path):
+    '''Writes the output of an artifact from the rows spooled by a worker process, then removes the spool file'''
+    try:
+        write_artifact_output_stream(func_name, data_headers, read_spooled_rows(spool_path), source_path)
+    finally:
+        os.remove(spool_path)
+
+def write_artifact_output_stream(func_name, data_headers, rows, source_path, html_rows=None, record_count=None):
+    '''
+    Writes the output of the artifact set in the Context (HTML, TSV, timeline, LAVA and KML) from the
+    rows returned or yielded by the artifact function. The rows are written by chunks of
+    stream_chunk_size rows, so rows yielded are never all held in memory, except the rows with
+    coordinates written in the KML export.
+    Args:
+        func_name: The name of the artifact function.
+        data_headers: The headers returned by the artifact function.
+        rows: An iterable of rows, e.g. a list or a generator.
+        source_path: The source path returned by the artifact function.
+        html_rows: The rows written to the HTML report instead of rows, in the same order, if the
+            artifact function returned them separately. None to write rows.
+        record_count: The number of rows if it is known (rows returned in a list), None for a generator.
+    '''
+    report_folder = Context.get_report_folder()
+    module_name = Context.get_module_name()
+    artifact_info = Context.get_artifact_info()
+    artifact_name = Context.get_artifact_name()
+    category = artifact_info.get('category', '')
+    description = artifact_info.get('description', '')
+    icon = artifact_info.get('artifact_icon', '')
+    html_columns = artifact_info.get('html_columns', [])
+
+    output_types = artifact_info.get('output_types', ['html', 'tsv', 'timeline', 'lava', 'kml'])
+    is_lava_only = 'lava_only' in output_types
+
+    if not source_path:
+        logfunc("No source_path provided")
+
+    rows = iter(rows)
+    if html_rows is not None:
+        html_rows = iter(html_rows)
+    chunk = list(islice(rows, stream_chunk_size))
+    if not chunk:
+        if output_types != 'none':
+            logfunc(f"No data found for {artifact_name}")
+            if is_lava_only:
+                lava_only_info(category, artifact_name, artifact_name, 0)
+        return
+
+    icons.setdefault(category, {artifact_name: icon}).update({artifact_name: icon})
+    stripped_headers = strip_tuple_from_headers(data_headers)
+    media_header_info = get_media_header_info(data_headers)
+    if media_header_info:
+        html_columns.extend([data_headers[idx][0] for idx in media_header_info])
+
+    report = None
+    if record_count is not None:
+        paged = record_count > html_paged_table_threshold
+    else:
+        # More rows may follow a full chunk, the table is paged
+        paged = len(chunk) == stream_chunk_size
+    if check_output_types('html', output_types):
+        report = artifact_report.ArtifactHtmlReport(artifact_name)
+        report.start_artifact_report(report_folder, artifact_name, description)
+        if paged:
+            report.start_paged_data_table(stripped_headers, source_path)
+        else:
+            report.add_script()
+            report.start_artifact_data_table(stripped_headers, source_path, record_count)
+
+    table_name = object_columns = column_map = None
+    if check_output_types('lava', output_types):
+        table_name, object_columns, column_map = lava_process_artifact(category,
+                                                                       module_name,
+                                                                       artifact_name,
+                                                                       data_headers,
+                                                                       record_count,
+                                                                       func_name=func_name,
+                                                                       data_views=artifact_info.get("data_views"),
+                                                                       artifact_icon=icon,
+                                                                       source_path=source_path)
+
+    kml_rows = []
+    write_kml = check_output_types('kml', output_types) and \
+        'Longitude' in stripped_headers and 'Latitude' in stripped_headers
+    record_count = 0
+    while chunk:
+        if media_header_info:
+            html_chunk, txt_chunk = get_data_list_with_media(media_header_info, chunk)
+        elif html_rows is not None:
+            html_chunk = list(islice(html_rows, len(chunk)))
+            txt_chunk = chunk
+        else:
+            html_chunk = txt_chunk = chunk
+        if report and paged:
+            report.write_paged_data_rows(stripped_headers, html_chunk, html_no_escape=html_columns)
+        elif report:
+            report.write_artifact_data_rows(stripped_headers, html_chunk, html_no_escape=html_columns)
+        if check_output_types('tsv', output_types):
+            tsv(report_folder, stripped_headers, txt_chunk, artifact_name, write_header=not record_count)
+        if check_output_types('timeline', output_types):
+            timeline(report_folder, artifact_name, txt_chunk, stripped_headers)
+        if table_name:
+            lava_insert_sqlite_data(table_name, chunk, object_columns, data_headers, column_map)
+        if write_kml:
+            longitude_index = stripped_headers.index('Longitude')
+            latitude_index = stripped_headers.index('Latitude')
+            kml_rows.extend(row for row in txt_chunk if row[longitude_index] and row[latitude_index])
+        record_count += len(chunk)
+        chunk = list(islice(rows, stream_chunk_size))
+
+    logfunc(f"Found {record_count:,} {'records' if record_count>1 else 'record'} for {artifact_name}")
+    artifact_profiler.add(func_name, rows=record_count)
+    if report and paged:
+        report.end_paged_data_table(stripped_headers)
+        report.end_artifact_report()
+    elif report:
+        report.end_artifact_data_table(stripped_headers)
+        report.end_artifact_report()
+    if table_name:
+        lava_set_record_count(category, table_name, record_count)
+        if is_lava_only:
+            lava_only_info(category, artifact_name, table_name, record_count)
+    if kml_rows:
+        kmlgen(report_folder, artifact_name, kml_rows, stripped_headers)
 
+def artifact_processor(func):
+    @wraps(func)
+    def wrapper(files_found, report_folder, seeker, wrap_text, timezone_offset):
+        set_artifact_context(func, files_found, report_folder, seeker)
+
+        cache_key = artifact_cache.get_cache_key(func.__name__, Context.get_module_file_path(), files_found, seeker,
+                                                 (timezone_offset, wrap_text))
+        output_folder_base = Context.get_output_params().output_folder_base if cache_key else None
+        cached_result = artifact_cache.get_cached_result(cache_key, output_folder_base) if cache_key else None
+        if cached_result:
+            logfunc(f"Results of {Context.get_artifact_name()} loaded from the case cache")
+            data_headers, data_list, source_path = cached_result
+            artifact_profiler.add(func.__name__, cached=1)
         else:
-            if output_types != 'none':
-                logfunc(f"No data found for {artifact_name}")
-                if is_lava_only:
-                    lava_only_info(category, artifact_name, artifact_name, 0)
+            write_count = write_journal.get_write_count()
+            sig = inspect.signature(func)
+            with artifact_profiler.measure(func.__name__, 'parse_seconds'):
+                if len(sig.parameters) == 1:
+                    data_headers, data_list, source_path = func(Context)
+                else:
+                    data_headers, data_list, source_path = func(files_found, report_folder, seeker, wrap_text, timezone_offset)
+            # Artifacts with side effects (device info, media, their own reports) and
+            # artifacts yielding their rows are not cached
+            if cache_key and write_journal.get_write_count() == write_count and \
+                    isinstance(data_list, (list, tuple)):
+                artifact_cache.store_result(cache_key, output_folder_base, data_headers, data_list, source_path)
+            if not isinstance(data_list, (list, tuple)):
+                # the rows of a generator are parsed while they are written
+                data_list = artifact_profiler.timed_rows(func.__name__, data_list)
+
+        with artifact_profiler.measure(func.__name__, 'write_seconds', exclude='parse_seconds'):
+            write_artifact_output(func.__name__, data_headers, data_list, source_path)
 
         return data_headers, data_list, source_path
     return wrapper
@@ -689,15 +1009,67 @@ def attach_sqlite_db_readonly(path, db_name):
     path = get_sqlite_db_path(path)
     return  f'''ATTACH DATABASE "file:{path}?mode=ro" AS {db_name}'''
 
-def get_sqlite_db_records(path, query, attach_query=None):
+def get_sqlite_db_connection(path):
+    '''
+    Returns the read-only connection to a sqlite db from the pool of the current thread, so that the
+    dbs read by several modules (e.g. knowledgeC.db, sms.db, Photos.sqlite) are opened once per run
+    and keep their page cache between the modules. The least recently used connections are closed
+    beyond sqlite_db_pool_size dbs. The connection is owned by the pool and must not be closed,
+    nor altered (e.g. by attaching a db); use open_sqlite_db_readonly for a connection of your own.
+    Args:
+        path: The path of the sqlite db.
+    Returns:
+        The connection (with sqlite3.Row rows), or None if the db cannot be opened.
+    '''
+    if getattr(_sqlite_db_pool, 'pid', None) != os.getpid():
+        # connections inherited from the parent process are not used after a fork
+        _sqlite_db_pool.connections = OrderedDict()
+        _sqlite_db_pool.pid = os.getpid()
+    connections = _sqlite_db_pool.connections
+    path = str(path)
+    db = connections.get(path)
+    if db is not None:
+        connections.move_to_end(path)
+        return db
     db = open_sqlite_db_readonly(path)
+    if db is None:
+        return None
+    db.row_factory = sqlite3.Row
+    try:
+        db.execute('PRAGMA query_only = ON')
+        db.execute(f'PRAGMA cache_size = -{sqlite_db_cache_size_kib}')
+        db.execute(f'PRAGMA mmap_size = {sqlite_db_mmap_size}')
+    except sqlite3.Error:
+        # e.g. not a sqlite db, the error is logged by the query
+        pass
+    connections[path] = db
+    if len(connections) > sqlite_db_pool_size:
+        _, evicted_db = connections.popitem(last=False)
+        evicted_db.close()
+    return db
+
+def close_sqlite_dbs():
+    '''Closes the pooled connections of the current thread, at the end of the run or before forking workers'''
+    if getattr(_sqlite_db_pool, 'pid', None) == os.getpid():
+        for db in _sqlite_db_pool.connections.values():
+            db.close()
+    _sqlite_db_pool.connections = OrderedDict()
+    _sqlite_db_pool.pid = os.getpid()
+
+def get_sqlite_db_records(path, query, attach_query=None, params=()):
+    if attach_query:
+        # the attached db would stay attached to a pooled connection
+        db = open_sqlite_db_readonly(path)
+        if db:
+            db.row_factory = sqlite3.Row  # For fetching columns by name
+    else:
+        db = get_sqlite_db_connection(path) if path else None
     if db:
-        db.row_factory = sqlite3.Row  # For fetching columns by name
         try:
             cursor = db.cursor()
             if attach_query:
                 cursor.execute(attach_query)
-            cursor.execute(query)
+            cursor.execute(query, params)
             records = cursor.fetchall()
             return records
         except sqlite3.OperationalError as e:
@@ -706,6 +1078,31 @@ def get_sqlite_db_records(path, query, attach_query=None):
         except sqlite3.ProgrammingError as e:
             logfunc(f"Error with {path}:")
             logfunc(f" - {str(e)}")
+        finally:
+            if attach_query:
+                db.close()
+    return []
+
+def get_photos_db_records(path, query):
+    '''
+    Returns the records of a query on a Photos.sqlite database, like get_sqlite_db_records, with a
+    page cache large enough to keep the asset tables in memory between the Ph modules. The
+    queries run as written: the ZASSET/ZADDITIONALASSETATTRIBUTES join is not materialised in a
+    shared table, each branch selecting its own columns and version-specific tables.
+    Args:
+        path: The path of the Photos.sqlite database.
+        query: The query.
+    Returns:
+        The list of records (sqlite3.Row), empty if the query failed.
+    '''
+    db = get_sqlite_db_connection(path) if path else None
+    if db:
+        try:
+            db.execute(f'PRAGMA cache_size = -{photos_db_cache_size_kib}')
+            return db.execute(query).fetchall()
+        except (sqlite3.OperationalError, sqlite3.ProgrammingError) as e:
+            logfunc(f"Error with {path}:")
+            logfunc(f" - {str(e)}")
     return []
 
 def get_sqlite_multiple_db_records(path_list, query, data_headers):
@@ -729,52 +1126,87 @@ def get_sqlite_multiple_db_records(path_list, query, data_headers):
             data_list.append(record)
     return data_headers, data_list, source_path
 
+def _get_sqlite_db_signature(path):
+    signature = []
+    for file_path in (path, f'{path}-wal'):
+        try:
+            stat = os.stat(file_path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+def get_sqlite_db_schema(path):
+    '''
+    Returns the schema of a sqlite db, read once per db from its pooled connection and kept until
+    the db (or its WAL) changes.
+    Args:
+        path: The path of the sqlite db.
+    Returns:
+        A dict of table or view name (lowercase) -> (type, frozenset of column names in lowercase),
+        empty if the db cannot be read.
+    '''
+    if not path:
+        return {}
+    path = str(path)
+    signature = _get_sqlite_db_signature(path)
+    cached = sqlite_db_schemas.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    schema = {}
+    db = get_sqlite_db_connection(path)
+    if db:
+        try:
+            for name, type_ in db.execute("SELECT name, type FROM sqlite_master WHERE type IN ('table', 'view')").fetchall():
+                columns = db.execute(f"pragma table_info('{name}')").fetchall()
+                schema[name.lower()] = (type_, frozenset(column[1].lower() for column in columns))
+        except sqlite3.Error as ex:
+            logfunc(f"Schema error, path={path} Error={str(ex)}")
+    sqlite_db_schemas[path] = (signature, schema)
+    return schema
+
 def does_column_exist_in_db(path, table_name, col_name):
     '''Checks if a specific col exists'''
-    db = open_sqlite_db_readonly(path)
-    col_name = col_name.lower()
-    try:
-        db.row_factory = sqlite3.Row # For fetching columns by name
-        query = f"pragma table_info('{table_name}');"
-        cursor = db.cursor()
-        cursor.execute(query)
-        all_rows = cursor.fetchall()
-        for row in all_rows:
-            if row['name'].lower() == col_name:
-                return True
-    except sqlite3.Error as ex:
-        logfunc(f"Query error, query={query} Error={str(ex)}")
-        pass
-    return False
+    _, columns = get_sqlite_db_schema(path).get(table_name.lower(), (None, ()))
+    return col_name.lower() in columns
 
 def does_table_exist_in_db(path, table_name):
     '''Checks if a table with specified name exists in an sqlite db'''
-    db = open_sqlite_db_readonly(path)
-    if db:    
-        try:
-            query = f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'"
-            cursor = db.execute(query)
-            for row in cursor:
-                return True
-        except sqlite3.Error as ex:
-            logfunc(f"Query error, query={query} Error={str(ex)}")
-    return False
+    type_, _ = get_sqlite_db_schema(path).get(table_name.lower(), (None, None))
+    return type_ == 'table'
 
 def does_view_exist_in_db(path, table_name):
     '''Checks if a table with specified name exists in an sqlite db'''
-    db = open_sqlite_db_readonly(path)
+    type_, _ = get_sqlite_db_schema(path).get(table_name.lower(), (None, None))
+    return type_ == 'view'
+
+def is_query_supported_by_db(path, query):
+    '''
+    Checks that the tables and columns used by a query exist in a sqlite db, by compiling the query
+    without running it. The result is kept until the db changes.
+    '''
+    path = str(path)
+    schema = get_sqlite_db_schema(path)
+    key = (path, query)
+    cached = sqlite_supported_queries.get(key)
+    if cached and cached[0] is schema:
+        return cached[1]
+    supported = False
+    db = get_sqlite_db_connection(path) if schema else None
     if db:
         try:
-            query = f"SELECT name FROM sqlite_master WHERE type='view' AND name='{table_name}'"
-            cursor = db.execute(query)
-            for row in cursor:
-                return True
-        except sqlite3.Error as ex:
-            logfunc(f"Query error, query={query} Error={str(ex)}")
-    return False
+            db.execute(f'EXPLAIN {query}')
+            supported = True
+        except sqlite3.Error:
+            pass
+    sqlite_supported_queries[key] = (schema, supported)
+    return supported
 
 
-def tsv(report_folder, data_headers, data_list, tsvname, source_file=None):
+def tsv(report_folder, data_headers, data_list, tsvname, source_file=None, write_header=True):
+    if write_journal.record(tsv, report_folder, data_headers, data_list, tsvname, source_file, write_header):
+        return
+
     report_folder = report_folder.rstrip('/')
     report_folder = report_folder.rstrip('\\')
     report_folder_base = os.path.dirname(os.path.dirname(report_folder))
@@ -785,14 +1217,20 @@ def tsv(report_folder, data_headers, data_list, tsvname, source_file=None):
     else:
         os.makedirs(tsv_report_folder)
     
-    with codecs.open(os.path.join(tsv_report_folder, tsvname + '.tsv'), 'a', 'utf-8-sig') as tsvfile:
+    # The BOM is only written with the header, before the first rows
+    with codecs.open(os.path.join(tsv_report_folder, tsvname + '.tsv'), 'a',
+                     'utf-8-sig' if write_header else 'utf-8') as tsvfile:
         tsv_writer = csv.writer(tsvfile, delimiter='\t')
-        tsv_writer.writerow(data_headers)
+        if write_header:
+            tsv_writer.writerow(data_headers)
         
         for i in data_list:
             tsv_writer.writerow(i)
             
 def timeline(report_folder, tlactivity, data_list, data_headers):
+    if write_journal.record(timeline, report_folder, tlactivity, data_list, data_headers):
+        return
+
     report_folder = report_folder.rstrip('/')
     report_folder = report_folder.rstrip('\\')
     report_folder_base = os.path.dirname(os.path.dirname(report_folder))
@@ -831,6 +1269,9 @@ def timeline(report_folder, tlactivity, data_list, data_headers):
     db.close()
 
 def kmlgen(report_folder, kmlactivity, data_list, data_headers):
+    if write_journal.record(kmlgen, report_folder, kmlactivity, data_list, data_headers):
+        return
+
     if 'Longitude' not in data_headers or 'Latitude' not in data_headers:
         return
 
@@ -1060,14 +1501,21 @@ def device_info(category, label, value, source_file=""):
         func_name = frame.function
     except:
         func_name = 'unknown'
-    
+
+    add_device_info(category, label, value, source_file, func_name)
+
+def add_device_info(category, label, value, source_file, artifact):
+    '''Stores device information of an artifact in the identifiers dictionary'''
+    if write_journal.record(add_device_info, category, label, value, source_file, artifact):
+        return
+
     values = identifiers.get(category, {})
     
     # Create value object with both the value and source module
     value_obj = {
         'value': value,
         'source_file': source_file,
-        'artifact': func_name
+        'artifact': artifact
     }
     
     if label in values:
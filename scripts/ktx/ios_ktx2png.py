@@ -212,6 +212,54 @@ class KTX_reader:
             return True
         return False
 
+def convert_ktx_file_to_png(ktx_path, save_to_path, skip_blank=False):
+    '''Exports the KTX file at ktx_path as a PNG file. Being a module
+        function, it can run in a process pool.
+        Arguments
+        ---------
+        ktx_path     : Path of the KTX file
+
+        save_to_path : Path of file to save to, written under a temporary
+        name until complete.
+
+        skip_blank   : True to not export all black or all white images,
+        which are reported as not decodable
+
+        Returns
+        -------
+        tuple : (None, False) if the file was exported, else the reason it
+        was not and whether the file itself could not be decoded (an
+        invalid header, LZFSE or ASTC data), as opposed to a read or write
+        error that may not happen again
+    '''
+    temp_path = f'{save_to_path}.tmp'
+    error_message = 'Conversion to PNG failed'
+    invalid = True
+    try:
+        with open(ktx_path, 'rb') as f:
+            ktx = KTX_reader()
+            if ktx.validate_header(f):
+                data = ktx.get_uncompressed_texture_data(f)
+                dec_img = Image.frombytes('RGBA', (ktx.pixelWidth, ktx.pixelHeight), data, 'astc', (4, 4, False))
+                if skip_blank:
+                    # the extrema of the color bands are found without the cost of the PNG encoding
+                    extrema = dec_img.getextrema()[:3]
+                    if all(high == 0 for _, high in extrema) or all(low == 255 for low, _ in extrema):
+                        return 'Blank image (all black or all white)', True
+                # compress_type as per https://github.com/python-pillow/Pillow/issues/5986
+                dec_img.save(temp_path, "PNG", compress_type=3)
+                os.replace(temp_path, save_to_path)
+                return None, False
+            error_message = ktx.error_message or error_message
+    except (ValueError, liblzfse.error) as ex:
+        error_message = str(ex)
+    except OSError as ex:
+        error_message = str(ex)
+        invalid = False
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    return error_message, invalid
+
 def main():
     if sys.argv[0].lower().endswith('.exe'):
         executor = os.path.basename(sys.argv[0])
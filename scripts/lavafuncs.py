@@ -7,21 +7,36 @@ Global Variables:
     lava_data (dict): Main data structure containing artifacts, modules, and metadata.
     lava_db (sqlite3.Connection): SQLite database connection for artifact storage.
     lava_db_name (str): Name of the SQLite database file.
+    lava_writer (LavaWriter): Buffer of the rows to insert in the SQLite database.
     lava_json_name (str): Name of the JSON metadata file.
+    media_items (dict): Registry of the media items, by ID.
+    media_references (dict): Registry of the media references, by ID.
+    media_registry_complete (bool): True if the registry holds all the media of the database.
+
+Classes:
+    LavaWriter: Buffers inserted rows and writes them in batched transactions.
+    MediaInfo: Row of the _lava_media_info view.
 
 Functions:
     sanitize_sql_name: Sanitizes strings for use as SQL identifiers.
     get_sql_type: Maps Python types to SQL types.
     initialize_lava: Initializes the LAVA data structure and database.
+    lava_connect_readonly: Opens a read-only connection to the database in a worker process.
     lava_process_artifact: Processes and stores artifact data.
+    lava_set_record_count: Sets the number of records of a processed artifact.
     lava_add_module: Adds module information to the LAVA data.
+    lava_table_schema: Computes the table and column names of artifact data.
     lava_create_sqlite_table: Creates a SQLite table for artifact data.
+    lava_create_sqlite_index: Creates an index on a column of an artifact table.
     lava_insert_sqlite_data: Inserts data rows into a SQLite table.
-    lava_get_media_item: Retrieves media item information from database.
-    lava_insert_sqlite_media_item: Inserts media item metadata into database.
-    lava_get_media_references: Retrieves media reference information.
-    lava_insert_sqlite_media_references: Inserts media reference into database.
-    lava_get_full_media_info: Retrieves complete media information with joins.
+    lava_get_media_item: Retrieves media item information from the media registry.
+    lava_insert_sqlite_media_item: Inserts media item metadata into the registry and database.
+    lava_get_media_references: Retrieves media reference information from the media registry.
+    lava_insert_sqlite_media_references: Inserts media reference into the registry and database.
+    lava_get_full_media_info: Retrieves complete media information from the media registry.
+    lava_insert_sqlite_artifact_performance: Inserts the performance metrics of the artifacts.
+    lava_commit: Writes the buffered rows to the database.
+    lava_does_table_exist: Checks if a table exists in the database.
     lava_finalize_output: Finalizes and saves LAVA output files.
 """
 
@@ -34,6 +49,9 @@ from collections import OrderedDict
 import re
 import datetime
 
+from pathlib import Path
+
+import scripts.write_journal as write_journal
 from scripts.version_info import leapp_name, leapp_version
 from scripts.context import Context
 
@@ -42,6 +60,88 @@ lava_data = None
 lava_db = None
 lava_db_name = '_lava_artifacts.db'
 lava_json_name = '_lava_data.lava'
+media_items = {}
+media_references = {}
+media_registry_complete = False
+
+
+class LavaWriter:
+    '''
+    Buffers the rows inserted in the LAVA database per INSERT statement and
+    writes them with executemany in a single transaction, instead of
+    committing after each row.
+    Attributes:
+        batch_size (int): The number of buffered rows triggering a write.
+        pending (dict): The buffered rows, per INSERT statement.
+        pending_count (int): The number of buffered rows.
+    '''
+
+    def __init__(self, batch_size=10000):
+        self.batch_size = batch_size
+        self.pending = {}
+        self.pending_count = 0
+
+    def add(self, sql, rows):
+        '''
+        Buffers rows to insert, writing all the buffered rows once batch_size is reached.
+        Args:
+            sql: The INSERT statement.
+            rows: The parameters of the statement, one tuple per row.
+        '''
+        self.pending.setdefault(sql, []).extend(rows)
+        self.pending_count += len(rows)
+        if self.pending_count >= self.batch_size:
+            self.flush()
+
+    def clear(self):
+        '''Drops the buffered rows'''
+        self.pending = {}
+        self.pending_count = 0
+
+    def flush(self):
+        '''Writes the buffered rows in one transaction'''
+        if not self.pending_count:
+            return
+        pending = self.pending
+        self.clear()
+        with lava_db:
+            cursor = lava_db.cursor()
+            if not lava_db.in_transaction:
+                cursor.execute('BEGIN')
+            for sql, rows in pending.items():
+                cursor.execute('SAVEPOINT lava_batch')
+                try:
+                    cursor.executemany(sql, rows)
+                except sqlite3.IntegrityError:
+                    # Insert the batch row by row, so only the duplicate rows are skipped
+                    cursor.execute('ROLLBACK TO lava_batch')
+                    for row in rows:
+                        try:
+                            cursor.execute(sql, row)
+                        except sqlite3.IntegrityError as e:
+                            # ilapfuncs imports this module
+                            from scripts.ilapfuncs import logfunc  # pylint: disable=import-outside-toplevel
+                            table_name = sql.split(' INTO ', 1)[1].split(None, 1)[0]
+                            logfunc(f"Skipped a row of {table_name} in the LAVA database: {str(e)}")
+                cursor.execute('RELEASE lava_batch')
+
+
+lava_writer = LavaWriter()
+
+
+class MediaInfo(tuple):
+    '''Row of the _lava_media_info view, indexed by position or by column name like a sqlite3.Row'''
+
+    columns = ('media_ref_id', 'media_item_id', 'module_name', 'artifact_name', 'name', 'source_path',
+               'extraction_path', 'type', 'metadata', 'created_at', 'updated_at', 'is_embedded')
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self.columns.index(key)
+        return tuple.__getitem__(self, key)
+
+    def keys(self):
+        return list(self.columns)
 
 
 def sanitize_sql_name(name):
@@ -93,7 +193,7 @@ def initialize_lava(input_path, output_path, input_type):
         selected_artifacts: List of selected artifacts.
     '''
 
-    global lava_data, lava_db
+    global lava_data, lava_db, lava_writer, media_items, media_references, media_registry_complete
 
     lava_data = {
         "parser_info": {
@@ -118,6 +218,17 @@ def initialize_lava(input_path, output_path, input_type):
 
     db_path = os.path.join(output_path, lava_db_name)
     lava_db = sqlite3.connect(db_path)
+    lava_writer = LavaWriter()
+    # The media are checked in by this process only, so the registry holds all of them
+    media_items = {}
+    media_references = {}
+    media_registry_complete = True
+
+    # The database is written by this process only, the journal is switched back in lava_finalize_output
+    lava_db.execute('PRAGMA journal_mode=WAL')
+    lava_db.execute('PRAGMA synchronous=NORMAL')
+    lava_db.execute('PRAGMA temp_store=MEMORY')
+    lava_db.execute('PRAGMA cache_size=-65536')
 
     cursor = lava_db.cursor()
     cursor.execute('''CREATE TABLE _artifact_search_patterns (
@@ -168,6 +279,24 @@ def initialize_lava(input_path, output_path, input_type):
                         LEFT JOIN _lava_media_items as lmi ON lmr.media_item_id = lmi.id''')
 
 
+def lava_connect_readonly(db_path):
+    '''
+    Replaces the LAVA database connection inherited by a worker process with
+    a read-only one. The writes of the worker are recorded in the write
+    journal and replayed by the main process.
+    Args:
+        db_path: The path to the _lava_artifacts.db database.
+    '''
+
+    global lava_db, media_registry_complete
+
+    lava_db = sqlite3.connect(f'{Path(db_path).absolute().as_uri()}?mode=ro', uri=True)
+    # Rows buffered by the main process when it forked are written by the main process
+    lava_writer.clear()
+    # Media checked in by the main process after the fork are looked up in the database
+    media_registry_complete = False
+
+
 def lava_process_artifact(
         category,
         module_name,
@@ -194,6 +323,12 @@ def lava_process_artifact(
     '''
     global lava_data
 
+    if write_journal.record(lava_process_artifact, category, module_name, artifact_name, data, record_count,
+                            func_name, data_views, artifact_icon, source_path):
+        # The table and the metadata are created when the main process replays the call
+        sanitized_table_name, _, column_map, object_columns = lava_table_schema(func_name or artifact_name, data)
+        return sanitized_table_name, object_columns, column_map
+
     if category not in lava_data["artifacts"]:
         lava_data["artifacts"][category] = []
 
@@ -205,6 +340,8 @@ def lava_process_artifact(
 
     # Add artifact metadata
     artifact_info = Context.get_artifact_info()
+    for column_name in artifact_info.get('lava_indexes', ()):
+        lava_create_sqlite_index(sanitized_table_name, column_name)
     module_info = next((m for m in lava_data['meta']['modules'] if m['module_name'] == module_name), None)
 
     if not module_info:
@@ -287,6 +424,24 @@ def lava_process_artifact(
     return sanitized_table_name, object_columns, column_map
 
 
+def lava_set_record_count(category, table_name, record_count):
+    """
+    Sets the number of records of an artifact processed before its rows were counted,
+    when the rows are streamed.
+    Args:
+        category (str): The category of the artifact.
+        table_name (str): The name of the table returned by lava_process_artifact.
+        record_count (int): The number of records in the artifact.
+    """
+
+    if write_journal.record(lava_set_record_count, category, table_name, record_count):
+        return
+
+    for artifact in lava_data["artifacts"].get(category, []):
+        if artifact["tablename"] == table_name:
+            artifact["record_count"] = record_count
+
+
 def lava_add_module(module_name, module_status, file_count=None):
     """
     Adds a module to the global lava_data structure.
@@ -311,29 +466,24 @@ def lava_add_module(module_name, module_status, file_count=None):
     lava_data["modules"].append(module)
 
 
-def lava_create_sqlite_table(table_name, data):
+def lava_table_schema(table_name, data):
     """
-    Creates a SQLite table with the specified name and columns based on the provided data.
+    Computes the sanitized table name and the columns of the table storing artifact data.
     Parameters:
-        table_name (str): The name of the table to be created in the SQLite database.
+        table_name (str): The name of the table.
         data (list): A list of tuples or strings representing the columns of the table.
-                     Each tuple should contain the original column name and its data type.
-                     If a string is provided, it is treated as a column name with a default type of TEXT.
     Returns:
         tuple: A tuple containing:
-            - sanitized_table_name (str): The sanitized name of the created table.
+            - sanitized_table_name (str): The sanitized name of the table.
+            - columns (list): The column definitions for the CREATE TABLE statement.
             - column_map (dict): A mapping of sanitized column names to their original names.
             - object_columns (dict): A mapping of sanitized column names to their data types.
-    Raises:
-        Exception: If there is an error during the table creation process.
     """
-    global lava_db
 
     if not data:
-        return None, None, None
+        return None, None, None, None
 
     sanitized_table_name = sanitize_sql_name(table_name)
-    cursor = lava_db.cursor()
 
     columns = []
     column_map = {}
@@ -353,6 +503,34 @@ def lava_create_sqlite_table(table_name, data):
 
         column_map[sanitized_name] = original_name
 
+    return sanitized_table_name, columns, column_map, object_columns
+
+
+def lava_create_sqlite_table(table_name, data):
+    """
+    Creates a SQLite table with the specified name and columns based on the provided data.
+    Parameters:
+        table_name (str): The name of the table to be created in the SQLite database.
+        data (list): A list of tuples or strings representing the columns of the table.
+                     Each tuple should contain the original column name and its data type.
+                     If a string is provided, it is treated as a column name with a default type of TEXT.
+    Returns:
+        tuple: A tuple containing:
+            - sanitized_table_name (str): The sanitized name of the created table.
+            - column_map (dict): A mapping of sanitized column names to their original names.
+            - object_columns (dict): A mapping of sanitized column names to their data types.
+    Raises:
+        Exception: If there is an error during the table creation process.
+    """
+    global lava_db
+
+    if not data:
+        return None, None, None
+
+    sanitized_table_name, columns, column_map, object_columns = lava_table_schema(table_name, data)
+    lava_writer.flush()
+    cursor = lava_db.cursor()
+
     columns_sql = ', '.join(columns)
     cursor.execute(f"CREATE TABLE IF NOT EXISTS {sanitized_table_name} ({columns_sql})")
     lava_db.commit()
@@ -360,6 +538,28 @@ def lava_create_sqlite_table(table_name, data):
     return sanitized_table_name, column_map, object_columns
 
 
+def lava_create_sqlite_index(table_name, column_name):
+    """
+    Creates an index on a column of an artifact table, for the artifacts that look up
+    the rows of another artifact instead of scanning its whole table. Only the rows
+    where the column is not NULL are indexed, so that sparse columns (e.g. tags set on
+    a few rows of millions) cost nothing to the other rows when they are inserted.
+    Parameters:
+        table_name (str): The sanitized name of the table.
+        column_name (str): The original name of the column, as in the data headers.
+    Returns:
+        str: The name of the index, to be used in an INDEXED BY clause.
+    """
+
+    sanitized_column_name = sanitize_sql_name(column_name)
+    index_name = f"{table_name}_{sanitized_column_name}"
+    lava_writer.flush()
+    lava_db.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({sanitized_column_name}) "
+                    f"WHERE {sanitized_column_name} IS NOT NULL")
+    lava_db.commit()
+    return index_name
+
+
 def lava_insert_sqlite_data(table_name, data, object_columns, headers, column_map):
     """
     Insert data into a SQLite database table with automatic column sanitization and type conversion.
@@ -378,12 +578,11 @@ def lava_insert_sqlite_data(table_name, data, object_columns, headers, column_ma
         None
     """
 
-    global lava_db
-
     if not data:
         return
 
-    cursor = lava_db.cursor()
+    if write_journal.record(lava_insert_sqlite_data, table_name, data, object_columns, headers, column_map):
+        return
 
     # Use the sanitized column names directly
     sanitized_columns = [sanitize_sql_name(h[0] if isinstance(h, tuple) else h) for h in headers]
@@ -413,30 +612,48 @@ def lava_insert_sqlite_data(table_name, data, object_columns, headers, column_ma
             processed_row.append(value)
         rows_to_insert.append(tuple(processed_row))
 
-    # Execute the insert
-    cursor.executemany(query, rows_to_insert)
-    lava_db.commit()
+    lava_writer.add(query, rows_to_insert)
+
+
+def _lava_lookup_media(table_name, registry, row_id):
+    """
+    Looks up a row of a media table in the media registry, falling back to the
+    database when the registry does not hold all the rows (in a worker process).
+    Args:
+        table_name (str): The name of the media table.
+        registry (dict): The registry of the rows of the table, by ID.
+        row_id (str): The ID of the row.
+    Returns:
+        tuple or None: The row, None if it does not exist.
+    """
+
+    if row_id in registry:
+        return registry[row_id]
+    if media_registry_complete or not row_id:
+        return None
+    cursor = lava_db.cursor()
+    row = cursor.execute(f"SELECT * FROM {table_name} WHERE id = ?", (row_id,)).fetchone()
+    if row:
+        registry[row_id] = tuple(row)
+        return registry[row_id]
+    return None
 
 
 def lava_get_media_item(media_id):
     """
-    Retrieve a media item from the lava database by its ID.
+    Retrieve a media item from the media registry by its ID.
     Args:
         media_id (str): The unique identifier of the media item to retrieve.
     Returns:
-        sqlite3.Row or None: A row object containing all columns from the _lava_media_items table
+        tuple or None: The columns of the _lava_media_items table
     """
 
-    global lava_db
-    cursor = lava_db.cursor()
-    query = f"SELECT * FROM _lava_media_items WHERE id='{media_id}'"
-    return cursor.execute(query).fetchone()
-    # return result.fetchone()
+    return _lava_lookup_media('_lava_media_items', media_items, media_id)
 
 
 def lava_insert_sqlite_media_item(media_item):
     """
-    Insert a media item record into the _lava_media_items SQLite table.
+    Insert a media item record into the media registry and the _lava_media_items SQLite table.
     Args:
         media_item: A media item object containing the following attributes:
             - id: Unique identifier for the media item
@@ -450,8 +667,6 @@ def lava_insert_sqlite_media_item(media_item):
         None
     """
 
-    global lava_db
-    cursor = lava_db.cursor()
     sql = '''INSERT INTO _lava_media_items
                 ("id", "source_path", "extraction_path", "type", "metadata", "created_at", "updated_at", "is_embedded")
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)'''
@@ -467,82 +682,82 @@ def lava_insert_sqlite_media_item(media_item):
         media_item.is_embedded
     )
 
-    try:
-        cursor.execute(sql, params)
-        lava_db.commit()
-    except sqlite3.IntegrityError as e:
-        print(str(e))
+    if write_journal.record(lava_insert_sqlite_media_item, media_item):
+        media_items[media_item.id] = params
+        return
+
+    if media_item.id in media_items:
+        # Also checked in by another artifact running in parallel
+        return
+    media_items[media_item.id] = params
+    lava_writer.add(sql, [params])
 
 
 def lava_get_media_references(media_ref):
     """
-    Retrieves a single media reference record from the _lava_media_references table.
+    Retrieves a single media reference record from the media registry.
     Args:
         media_ref (str): The ID of the media reference to retrieve.
     Returns:
         tuple or None: A tuple containing the row data if found, None otherwise.
     """
 
-    global lava_db
-    cursor = lava_db.cursor()
-    query = f"SELECT * FROM _lava_media_references WHERE id='{media_ref}'"
-    return cursor.execute(query).fetchone()
+    return _lava_lookup_media('_lava_media_references', media_references, media_ref)
 
 
-def lava_insert_sqlite_media_references(media_references):
+def lava_insert_sqlite_media_references(media_reference):
     """
-    Insert a media reference record into the _lava_media_references table.
+    Insert a media reference record into the media registry and the _lava_media_references table.
     Args:
-        media_references: An object containing media reference data with the following attributes:
+        media_reference: An object containing media reference data with the following attributes:
             - id: Unique identifier for the media reference
             - media_item_id: ID of the associated media item
             - module_name: Name of the module containing the artifact
             - artifact_name: Name of the artifact
             - name: Name/description of the media reference
-            - media_path: File path to the media item
     Returns:
         None
     """
 
-    global lava_db
-    cursor = lava_db.cursor()
     sql = '''INSERT INTO _lava_media_references
                 ("id", "media_item_id", "module_name", "artifact_name", "name")
                 VALUES (?, ?, ?, ?, ?)'''
 
     params = (
-        media_references.id,
-        media_references.media_item_id,
-        media_references.module_name,
-        media_references.artifact_name,
-        media_references.name
+        media_reference.id,
+        media_reference.media_item_id,
+        media_reference.module_name,
+        media_reference.artifact_name,
+        media_reference.name
     )
-    cursor.execute(sql, params)
-    lava_db.commit()
+
+    if write_journal.record(lava_insert_sqlite_media_references, media_reference):
+        media_references[media_reference.id] = params
+        return
+
+    if media_reference.id in media_references:
+        return
+    media_references[media_reference.id] = params
+    lava_writer.add(sql, [params])
 
 
 def lava_get_full_media_info(media_ref_id):
     """
-    Retrieves complete media information for a given media reference ID from the LAVA database.
-    This function queries the _lava_media_info table to fetch all columns for a specific
-    media item identified by its reference ID. The function uses a global database connection
-    and sets the row factory to sqlite3.Row for dictionary-like access to results.
+    Retrieves complete media information for a given media reference ID from the media registry,
+    as a row of the _lava_media_info view.
     Args:
-        media_ref_id (str): The unique media reference identifier to look up in the database.
+        media_ref_id (str): The unique media reference identifier to look up.
     Returns:
-        sqlite3.Row or None: A Row object containing all media information fields if found,
-                            None if no matching media_ref_id exists in the database.
+        MediaInfo or None: A row containing all media information fields if found, accessed by
+                           index or by column name like a sqlite3.Row. None if no matching
+                           media_ref_id exists.
     """
 
-    global lava_db
-    lava_db.row_factory = sqlite3.Row
-    cursor = lava_db.cursor()
-    query = f'''
-    SELECT *
-    FROM _lava_media_info
-    WHERE media_ref_id = '{media_ref_id}'
-    '''
-    return cursor.execute(query).fetchone()
+    media_reference = lava_get_media_references(media_ref_id)
+    if not media_reference:
+        return None
+    media_item = lava_get_media_item(media_reference[1]) or (None,) * 8
+    return MediaInfo(tuple(media_reference) + tuple(media_item)[1:])
 
 
 def lava_insert_sqlite_artifact_search_pattern(artifact_regex_id, module_name, artifact_name, regex):
@@ -555,19 +770,13 @@ def lava_insert_sqlite_artifact_search_pattern(artifact_regex_id, module_name, a
         regex (str): The regular expression for the artifact search pattern.
     """
 
-    global lava_db
-    cursor = lava_db.cursor()
     sql = '''INSERT INTO _artifact_search_patterns
                 ("id", "module_name", "artifact_name", "regex")
                 VALUES (?, ?, ?, ?)'''
 
     data = (artifact_regex_id, module_name, artifact_name, regex)
 
-    try:
-        cursor.execute(sql, data)
-        lava_db.commit()
-    except sqlite3.IntegrityError as e:
-        print(str(e))
+    lava_writer.add(sql, [data])
 
 
 def lava_insert_sqlite_file_path(file_id, file_path):
@@ -578,19 +787,13 @@ def lava_insert_sqlite_file_path(file_id, file_path):
         file_path (str): Relative file path to store.
     """
 
-    global lava_db
-    cursor = lava_db.cursor()
     sql = '''INSERT INTO _file_path_list
                 ("id", "file_path")
                 VALUES (?, ?)'''
 
     data = (file_id, file_path)
 
-    try:
-        cursor.execute(sql, data)
-        lava_db.commit()
-    except sqlite3.IntegrityError as e:
-        print(str(e))
+    lava_writer.add(sql, [data])
 
 
 def lava_insert_sqlite_artifact_link_pattern_to_file(artifact_regex_id, file_id):
@@ -601,19 +804,73 @@ def lava_insert_sqlite_artifact_link_pattern_to_file(artifact_regex_id, file_id)
         file_id (int): ID of the related file path entry.
     """
 
-    global lava_db
-    cursor = lava_db.cursor()
     sql = '''INSERT INTO _artifact_pattern_to_file
                 ("artifact_search_pattern_id", "file_path_id")
                 VALUES (?, ?)'''
 
     data = (artifact_regex_id, file_id)
 
-    try:
-        cursor.execute(sql, data)
-        lava_db.commit()
-    except sqlite3.IntegrityError as e:
-        print(str(e))
+    lava_writer.add(sql, [data])
+
+
+def lava_insert_sqlite_artifact_performance(artifacts):
+    """
+    Creates the _artifact_performance table and inserts the performance metrics of the artifacts.
+    Args:
+        artifacts (list): The metrics of each artifact, as returned by artifact_profiler.get_report().
+    """
+
+    lava_db.execute('''CREATE TABLE IF NOT EXISTS _artifact_performance (
+                        artifact_name TEXT PRIMARY KEY,
+                        module_name TEXT,
+                        category TEXT,
+                        search_seconds REAL,
+                        files_found INTEGER,
+                        input_bytes INTEGER,
+                        extracted_bytes INTEGER,
+                        parse_seconds REAL,
+                        rows INTEGER,
+                        write_seconds REAL,
+                        replay_seconds REAL,
+                        run_seconds REAL,
+                        total_seconds REAL,
+                        peak_rss_bytes INTEGER,
+                        rss_increase_bytes INTEGER,
+                        cached INTEGER,
+                        errors INTEGER)''')
+
+    columns = ('artifact_name', 'module_name', 'category', 'search_seconds', 'files_found', 'input_bytes',
+               'extracted_bytes', 'parse_seconds', 'rows', 'write_seconds', 'replay_seconds', 'run_seconds',
+               'total_seconds', 'peak_rss_bytes', 'rss_increase_bytes', 'cached', 'errors')
+    sql = f'''INSERT OR REPLACE INTO _artifact_performance
+                ({", ".join(f'"{column}"' for column in columns)})
+                VALUES ({", ".join("?" for _ in columns)})'''
+
+    lava_writer.add(sql, [tuple(artifact.get(column) for column in columns) for artifact in artifacts])
+
+
+def lava_commit():
+    """
+    Writes the rows buffered by lava_writer to the database, so that they can be
+    read by other connections (e.g. the artifacts reading the LAVA database).
+    """
+
+    lava_writer.flush()
+
+
+def lava_does_table_exist(table_name):
+    """
+    Checks if a table exists in the LAVA database. The tables are created while the
+    artifacts run, so sqlite_master is queried on each call instead of using the
+    schema cache of the sqlite dbs read by the artifacts.
+    Args:
+        table_name (str): The sanitized name of the table.
+    Returns:
+        bool: True if the table exists.
+    """
+
+    return lava_db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                           (table_name,)).fetchone() is not None
 
 
 def lava_finalize_output(output_path):
@@ -625,7 +882,7 @@ def lava_finalize_output(output_path):
     3. Sorts artifact categories alphabetically
     4. Sorts artifacts within each category alphabetically by name
     5. Saves the LAVA data structure to a JSON file
-    6. Closes the SQLite database connection
+    6. Writes the buffered rows and closes the SQLite database connection
     Args:
         output_path (str): The directory path where the LAVA JSON output file will be saved
     Global Variables:
@@ -655,5 +912,14 @@ def lava_finalize_output(output_path):
     with open(os.path.join(output_path, lava_json_name), 'w', encoding='utf-8') as f:
         json.dump(lava_data, f, indent=4)
 
+    # Write the buffered rows and merge the WAL back into a single database file
+    lava_writer.flush()
+    lava_db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    try:
+        lava_db.execute('PRAGMA journal_mode=DELETE')
+    except sqlite3.OperationalError:
+        # Another connection to the database is still open, the database stays in WAL mode
+        pass
+
     # Close the SQLite database
     lava_db.close()
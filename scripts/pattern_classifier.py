@@ -0,0 +1,116 @@
+"""
+This module provides the classification of strings against many patterns in a
+single scan of each string, with an Aho-Corasick automaton, instead of testing
+the patterns one after the other (e.g. a long list of LIKE predicates in SQL).
+
+The patterns match like the SQLite LIKE operator wrapped in '%', so that they
+return the same rows as the queries they replace:
+    - a pattern matches if it is found anywhere in the string,
+    - '_' matches any single character and '%' any sequence of characters,
+    - the case of ASCII letters is ignored (and only of ASCII letters).
+
+Classes:
+    PatternClassifier: Tags strings with the categories of the patterns they match.
+"""
+
+import re
+from collections import deque
+
+# LIKE only folds the case of ASCII letters
+_ascii_lowercase = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+def _ascii_lower(text):
+    return text.lower() if text.isascii() else text.translate(_ascii_lowercase)
+
+
+class PatternClassifier:
+    '''
+    Tags strings with the categories of the patterns found in them, in a single scan.
+    The literal part of each pattern is a keyword of the automaton; patterns holding
+    wildcards are confirmed with a regular expression once their keyword is found.
+    Attributes:
+        categories (list): The names of the categories, in the order they were given.
+    '''
+
+    def __init__(self, categories):
+        '''
+        Args:
+            categories: A dict of category name -> iterable of patterns.
+        '''
+        self.categories = list(categories)
+        self._patterns = []
+        keywords = {}
+        for category_index, patterns in enumerate(categories.values()):
+            for pattern in patterns:
+                pattern = _ascii_lower(pattern)
+                parts = re.split('[_%]', pattern)
+                if len(parts) > 1:
+                    expression = re.compile('.*'.join(
+                        '.'.join(re.escape(literal) for literal in part.split('_'))
+                        for part in pattern.split('%')), re.DOTALL)
+                else:
+                    expression = None
+                keyword = max(parts, key=len)
+                keywords.setdefault(keyword, []).append(len(self._patterns))
+                self._patterns.append((category_index, expression))
+        self._build_automaton(keywords)
+
+    def _build_automaton(self, keywords):
+        # Trie of the keywords, then the transitions of each state to the longest suffix in the trie
+        children = [{}]
+        outputs = [set()]
+        for keyword, pattern_indexes in keywords.items():
+            state = 0
+            for character in keyword:
+                if character not in children[state]:
+                    children.append({})
+                    outputs.append(set())
+                    children[state][character] = len(children) - 1
+                state = children[state][character]
+            outputs[state].update(pattern_indexes)
+
+        transitions = [dict(children[0])] + [None] * (len(children) - 1)
+        fallbacks = [0] * len(children)
+        queue = deque(children[0].values())
+        while queue:
+            state = queue.popleft()
+            transitions[state] = dict(transitions[fallbacks[state]])
+            transitions[state].update(children[state])
+            outputs[state].update(outputs[fallbacks[state]])
+            for character, child in children[state].items():
+                # states are visited by depth, the transitions of the fallback are already complete
+                fallbacks[child] = transitions[fallbacks[state]].get(character, 0)
+                queue.append(child)
+
+        self._transitions = transitions
+        self._outputs = [tuple(output) if output else None for output in outputs]
+
+    def classify(self, text):
+        '''
+        Returns the categories of the patterns found in a string.
+        Args:
+            text: The string to classify.
+        Returns:
+            A list of category names, in the order of the categories, empty if no pattern matches.
+        '''
+        if not text:
+            return []
+        text = _ascii_lower(text)
+        transitions = self._transitions
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for character in text:
+            state = transitions[state].get(character, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        if not found:
+            return []
+
+        category_indexes = set()
+        for pattern_index in found:
+            category_index, expression = self._patterns[pattern_index]
+            if category_index not in category_indexes and (expression is None or expression.search(text)):
+                category_indexes.add(category_index)
+        return [self.categories[index] for index in sorted(category_indexes)]
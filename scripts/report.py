@@ -1,9 +1,10 @@
 import html
+import json
 import os
 from pathlib import Path
 import shutil
 
-from collections import OrderedDict
+import scripts.artifact_report as artifact_report
 from scripts.html_parts import *
 from scripts.ilapfuncs import logfunc
 from scripts.version_info import leapp_version, ileapp_contributors
@@ -80,60 +81,37 @@ def generate_report(reportfolderbase, time_in_secs, time_HMS, extraction_type, i
             </a>
         </li>
         """
-    # Populate the sidebar dynamic data (depends on data/files generated by parsers)
+    # Populate the sidebar dynamic data (depends on the artifact pages written by parsers)
     # Start with the 'saved reports' (home) page link and then append elements
     nav_list_data = side_heading.format('Saved Reports') + list_item.format('', 'index.html', 'home', 'Report Home')
-    # Get all files
-    side_list = OrderedDict() # { Category1 : [path1, path2, ..], Cat2:[..] } Dictionary containing paths as values, key=category
-
-    for root, dirs, files in sorted(os.walk(reportfolderbase)):
-        files = sorted(files)
-        for file in files:
-            if file.startswith('._'):
-                continue
-            if file.endswith(".temphtml"):
-                fullpath = (os.path.join(root, file))
-                head, tail = os.path.split(fullpath)
-                filename = tail.replace(".temphtml", "")
-                p = Path(fullpath)
-                SectionHeader = (p.parts[-2])
-                if SectionHeader == '_elements':
-                    pass
-                else:
-                    if control != SectionHeader:
-                        control = SectionHeader
-                        side_list[SectionHeader] = []
-                        nav_list_data += side_heading.format(SectionHeader)
-                    side_list[SectionHeader].append(fullpath)
-                    icon_name = icons.get(SectionHeader, {}).get(filename, "")
-                    icon = icon_name if icon_name else get_icon_name(SectionHeader, filename)
-                    icon = icon if icon in feather_icon_names else 'alert-triangle'
-                    nav_list_data += list_item.format('', tail.replace(".temphtml", ".html").replace(" ", "_"), 
-                                                      icon, filename.replace("_", " "))
-
-    # Now that we have all the file paths, start writing the files
-
-    for category, path_list in side_list.items():
-        for path in path_list:
-            old_filename = os.path.basename(path)
-            filename = old_filename.replace(".temphtml", ".html").replace(" ", "_")
-            # search for it in nav_list_data, then mark that one as 'active' tab
-            active_nav_list_data = mark_item_active(nav_list_data, filename) + nav_bar_script
-            artifact_data = get_file_content(path)
-
-            # Now write out entire html page for artifact
-            f = open(os.path.join(reportfolderbase, '_HTML', filename), 'w', encoding='utf8')
-            artifact_data = insert_sidebar_code(artifact_data, active_nav_list_data, path)
-            f.write(artifact_data)
-            f.close()
-
-            # Now delete .temphtml
-            os.remove(path)
-            # If dir is empty, delete it
-            try:
-                os.rmdir(os.path.dirname(path))
-            except OSError:
-                pass # Perhaps it was not empty!
+    html_folder = os.path.join(reportfolderbase, '_HTML')
+    category_folders = set()
+
+    # Pages registered during the run, the artifact pages were written to their final name
+    pages = sorted((category, page_name) for folder, category, page_name in artifact_report.report_pages
+                   if os.path.exists(os.path.join(html_folder, artifact_report.get_page_file_name(page_name))))
+    artifact_report.report_pages.clear()
+    for category, page_name in pages:
+        if control != category:
+            control = category
+            nav_list_data += side_heading.format(category)
+        category_folders.add(os.path.join(html_folder, category))
+        icon_name = icons.get(category, {}).get(page_name, "")
+        icon = icon_name if icon_name else get_icon_name(category, page_name)
+        icon = icon if icon in feather_icon_names else 'alert-triangle'
+        nav_list_data += list_item.format('', artifact_report.get_page_file_name(page_name),
+                                          icon, page_name.replace("_", " "))
+
+    # The sidebar is shared by the artifact pages
+    with open(os.path.join(html_folder, '_sidebar.js'), 'w', encoding='utf8') as f:
+        f.write(sidebar_js.format(json.dumps(nav_list_data)))
+
+    # Remove the empty category folders
+    for category_folder in category_folders:
+        try:
+            os.rmdir(category_folder)
+        except OSError:
+            pass # Perhaps it was not empty!
 
     # Create index.html's page content
     create_index_html(reportfolderbase, time_in_secs, time_HMS, extraction_type, image_input_path, nav_list_data, casedata, profile_filename, lava_only)
@@ -321,15 +299,6 @@ def generate_key_val_table_without_headings(title, data_list, agency_logo_mimety
 
     return code
 
-def insert_sidebar_code(data, sidebar_code, filename):
-    pos = data.find(body_sidebar_dynamic_data_placeholder)
-    if pos < 0:
-        logfunc(f'Error, could not find {body_sidebar_dynamic_data_placeholder} in file {filename}')
-        return data
-    else:
-        ret = data[0: pos] + sidebar_code + data[pos + len(body_sidebar_dynamic_data_placeholder):]
-        return ret
-
 def mark_item_active(data, itemname):
     '''Finds itemname in data, then marks that node as active. Return value is changed data'''
     pos = data.find(f'" href="{itemname}"')
@@ -6,6 +6,9 @@ metadata (creation/modification dates), and decrypting encrypted iTunes backups.
 
 Classes:
     FileInfo: Container for file metadata (source path, creation date, modification date)
+    AppContainer: Container of an app, app group or plugin (bundle id, type, GUID, path)
+    PathIndex: Index of literal path components used to resolve search patterns
+    PatternSet: Set of search patterns matched against one path at a time
     FileSeekerBase: Abstract base class for file searching implementations
     FileSeekerDir: File seeker for local directories
     FileSeekerItunes: File seeker for iTunes backups (supports encryption)
@@ -18,17 +21,28 @@ Functions:
     get_itunes_backup_encryption: Checks if iTunes backup is encrypted
     check_itunes_backup_status: Validates iTunes backup status and encryption
     decrypt_itunes_backup: Decrypts encrypted iTunes backups using provided passcode
+    decrypt_itunes_file: Decrypts a file of an encrypted iTunes backup by chunks
+    decode_manifest_file_metadata: Decodes the metadata of a file of an iTunes backup Manifest.db
+    get_app_containers: Reads the metadata of the app containers of an extraction
 """
 
 import time as timex
-import fnmatch
+import glob
 import os
+import plistlib
+import re
 import tarfile
 import hashlib
+import sqlite3
 import struct
+import threading
 
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from pathlib import Path
-from shutil import copy2
+from shutil import copy2, copyfileobj
 from zipfile import ZipFile
 from fnmatch import _compile_pattern
 from functools import lru_cache
@@ -42,6 +56,7 @@ from scripts.ilapfuncs import get_plist_file_content, get_plist_content, logfunc
     is_platform_windows, open_sqlite_db_readonly, sanitize_file_path
 
 normcase = lru_cache(maxsize=None)(os.path.normcase)
+itunes_decryption_chunk_size = 1048576  # a multiple of the AES block size
 domains = {
     "AppDomain-": "private/var/mobile/Containers/Data/Application",
     "AppDomainGroup-": "private/var/mobile/Containers/Shared/AppGroup",
@@ -258,6 +273,72 @@ def decrypt_itunes_backup(directory, passcode):
     return (protection_classes, unwrapped_manifest_key), "Decryption successful"
 
 
+def decrypt_itunes_file(source_path, destination_path, key, size=None):
+    """
+    Decrypts a file of an encrypted iTunes backup by chunks of itunes_decryption_chunk_size
+    bytes, so that files of any size are decrypted with a fixed amount of memory.
+    Args:
+        source_path (str): The path of the encrypted file.
+        destination_path (str): The path of the decrypted file.
+        key (bytes): The unwrapped AES key of the file.
+        size (int): The size of the file, the padding after it is not written. None to write everything.
+    """
+    # Apple uses a 0'd out 16-byte IV
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(b'\x00' * 16)).decryptor()
+    remaining = size
+    with open(source_path, 'rb') as source_file, open(destination_path, 'wb') as destination_file:
+        while True:
+            chunk = source_file.read(itunes_decryption_chunk_size)
+            decrypted_chunk = decryptor.update(chunk) if chunk else decryptor.finalize()
+            if remaining is not None:
+                decrypted_chunk = decrypted_chunk[:remaining]
+                remaining -= len(decrypted_chunk)
+            destination_file.write(decrypted_chunk)
+            if not chunk:
+                break
+
+
+def decode_manifest_file_metadata(file_metadata):
+    """
+    Decodes the metadata of a file from the 'file' column of Manifest.db, an NSKeyedArchiver
+    archive of an MBFile. The values are read from the objects of the archive, which is only
+    fully deserialized when it does not have the expected layout.
+    Args:
+        file_metadata (bytes): The 'file' blob of the file in Manifest.db.
+    Returns:
+        dict: The 'Birth', 'LastModified' and 'Size' of the file and, if it is encrypted,
+              its protection 'Class' and wrapped 'Key'.
+    """
+    try:
+        archive = plistlib.loads(file_metadata)
+        if archive.get('$archiver') == 'NSKeyedArchiver':
+            objects = archive['$objects']
+
+            def resolve(value):
+                return objects[value.data] if isinstance(value, plistlib.UID) else value
+
+            mb_file = resolve(archive['$top']['root'])
+            values = {name: resolve(mb_file.get(name)) for name in ('Birth', 'LastModified', 'Size', 'EncryptionKey')}
+            if isinstance(values['EncryptionKey'], dict):
+                values['EncryptionKey'] = resolve(values['EncryptionKey']['NS.data'])
+        else:
+            values = {name: archive.get(name) for name in ('Birth', 'LastModified', 'Size', 'EncryptionKey')}
+            if isinstance(values['EncryptionKey'], dict):
+                values['EncryptionKey'] = values['EncryptionKey']['NS.data']
+    except (plistlib.InvalidFileException, ValueError, KeyError, IndexError, TypeError, AttributeError):
+        mb_file = get_plist_content(file_metadata)
+        encryption_key = mb_file.get('EncryptionKey')
+        values = {name: mb_file.get(name) for name in ('Birth', 'LastModified', 'Size')}
+        values['EncryptionKey'] = encryption_key.get('NS.data') if isinstance(encryption_key, dict) else None
+
+    metadata = {'Birth': values['Birth'] or 0, 'LastModified': values['LastModified'] or 0, 'Size': values['Size']}
+    wrapped_key = values['EncryptionKey']
+    if isinstance(wrapped_key, bytes):
+        metadata['Class'] = int.from_bytes(wrapped_key[0:4], byteorder="little")
+        metadata['Key'] = wrapped_key[4:]
+    return metadata
+
+
 class FileInfo:
     """
     A class to store file metadata information.
@@ -273,14 +354,346 @@ class FileInfo:
         self.modification_date = modification_date
 
 
+class AppContainer:
+    """
+    A class to store the metadata of an app, app group or plugin container, read
+    from its .com.apple.mobile_container_manager.metadata.plist file.
+    Attributes:
+        bundle_id (str): The identifier (MCMMetadataIdentifier) of the app, group or plugin.
+        container_type (str): The type of container ('Application', 'AppGroup' or 'PluginKitPlugin').
+        guid (str): The GUID naming the folder of the container.
+        path (str): The path of the folder of the container in the data folder.
+    """
+
+    def __init__(self, bundle_id, container_type, guid, path):
+        self.bundle_id = bundle_id
+        self.container_type = container_type
+        self.guid = guid
+        self.path = path
+
+
+app_container_patterns = {
+    'Application': '*/mobile/Containers/Data/Application/*/.com.apple.mobile_container_manager.metadata.plist',
+    'AppGroup': '*/Containers/Shared/AppGroup/*/.com.apple.mobile_container_manager.metadata.plist',
+    'PluginKitPlugin': '*/Containers/Data/PluginKitPlugin/*/.com.apple.mobile_container_manager.metadata.plist',
+}
+
+
+def get_app_containers(seeker):
+    '''
+    Reads the metadata plists of the app, app group and plugin containers of an
+    extraction, once for the case.
+    Args:
+        seeker: The seeker of the extraction.
+    Returns:
+        A dict mapping each bundle id to the list of its AppContainer objects.
+    '''
+    app_containers = {}
+    matches = seeker.search_many(app_container_patterns.values())
+    for container_type, filepattern in app_container_patterns.items():
+        for metadata_path in matches[filepattern]:
+            plist = get_plist_file_content(metadata_path)
+            if not isinstance(plist, dict) or not plist.get('MCMMetadataIdentifier'):
+                continue
+            path = os.path.dirname(metadata_path)
+            app_container = AppContainer(plist['MCMMetadataIdentifier'], container_type, os.path.basename(path), path)
+            app_containers.setdefault(app_container.bundle_id, []).append(app_container)
+    return app_containers
+
+
+_wildcards = re.compile(r'[*?]')
+
+
+def pattern_constraints(filepattern):
+    '''
+    Yields (kind, literal) tuples describing the path components that any path
+    matching the normcased filepattern contains: 'exact' for a component equal
+    to literal, 'prefix' or 'suffix' for a component starting or ending with it.
+    '''
+    if '[' in filepattern:
+        return  # character classes may contain separators
+    for piece in filepattern.split(os.sep):
+        if not piece:
+            continue
+        piece_wildcards = list(_wildcards.finditer(piece))
+        if not piece_wildcards:
+            yield 'exact', piece
+            continue
+        start, end = piece_wildcards[0].start(), piece_wildcards[-1].end()
+        if start:
+            yield 'prefix', piece[:start]
+        if end < len(piece):
+            yield 'suffix', piece[end:]
+
+
+class PathIndex:
+    """
+    Index of the literal path components of every path of an extraction.
+    Search patterns are resolved by looking up the most selective literal
+    component of the pattern (e.g. 'sms.db' in '*/Library/SMS/sms.db') instead
+    of running the pattern against every path. Candidates are then verified
+    with the compiled fnmatch pattern, so results are identical to a linear
+    scan, in the same order.
+    Attributes:
+        paths (list): The indexed paths, in their original order.
+        prefix (str): String prepended to each normcased path before matching (e.g. 'root/').
+    Methods:
+        match(filepattern): Returns the positions of the paths matching the pattern.
+        match_many(filepatterns): Returns the positions of the paths matching each
+            pattern, resolving all the patterns without a literal component in one pass.
+        match_suffixes(suffixes): Returns the positions of the paths ending with each
+            literal suffix, looked up by its last component.
+    """
+
+    def __init__(self, paths, prefix=''):
+        self.paths = paths if isinstance(paths, list) else list(paths)
+        self.prefix = prefix
+        self._components = {}
+        self._sorted_components = None
+        self._sorted_reversed_components = None
+        for position in range(len(self.paths)):
+            for component in self._key(position).split(os.sep):
+                postings = self._components.get(component)
+                if postings is None:
+                    self._components[component] = array('I', (position,))
+                elif postings[-1] != position:
+                    postings.append(position)
+
+    def _key(self, position):
+        return self.prefix + normcase(self.paths[position])
+
+    def _components_in_range(self, sorted_components, literal):
+        start = bisect_left(sorted_components, literal)
+        end = start
+        while end < len(sorted_components) and sorted_components[end].startswith(literal):
+            end += 1
+        return sorted_components[start:end]
+
+    def _lookup(self, kind, literal):
+        '''Returns the list of postings of the components satisfying a constraint'''
+        if kind == 'exact':
+            postings = self._components.get(literal)
+            return [postings] if postings is not None else []
+        if kind == 'prefix':
+            if self._sorted_components is None:
+                self._sorted_components = sorted(self._components)
+            components = self._components_in_range(self._sorted_components, literal)
+        else:
+            if self._sorted_reversed_components is None:
+                self._sorted_reversed_components = sorted(c[::-1] for c in self._components)
+            components = [c[::-1] for c in self._components_in_range(
+                self._sorted_reversed_components, literal[::-1])]
+        return [self._components[component] for component in components]
+
+    def candidates(self, filepattern):
+        '''
+        Returns the sorted positions of the paths that may match filepattern,
+        or None if the pattern has no literal component to look up.
+        filepattern must already be normcased.
+        '''
+        best = None
+        best_size = 0
+        for kind, literal in pattern_constraints(filepattern):
+            postings_list = self._lookup(kind, literal)
+            size = sum(len(postings) for postings in postings_list)
+            if best is None or size < best_size:
+                best, best_size = postings_list, size
+                if not size:
+                    break
+        if best is None:
+            return None
+        if len(best) == 1:
+            return best[0]
+        return sorted(set(chain.from_iterable(best)))
+
+    def match(self, filepattern):
+        '''Returns the list of positions of the paths matching filepattern'''
+        return self.match_many([filepattern])[filepattern]
+
+    def match_many(self, filepatterns):
+        '''Returns a dict mapping each pattern to the positions of the paths it matches'''
+        results = {}
+        unindexed = []
+        for filepattern in dict.fromkeys(filepatterns):
+            normcased_pattern = normcase(filepattern)
+            pat = _compile_pattern(normcased_pattern)
+            candidates = self.candidates(normcased_pattern)
+            if candidates is None:
+                literal = max(_wildcards.split(normcased_pattern), key=len)
+                unindexed.append((filepattern, literal, pat))
+                results[filepattern] = []
+            else:
+                results[filepattern] = [position for position in candidates
+                                        if pat(self._key(position)) is not None]
+        if unindexed:
+            for position in range(len(self.paths)):
+                key = self._key(position)
+                for filepattern, literal, pat in unindexed:
+                    if literal in key and pat(key) is not None:
+                        results[filepattern].append(position)
+        return results
+
+    def match_suffixes(self, suffixes):
+        '''
+        Returns a dict mapping each literal suffix (e.g. an attachment path stored
+        in a database, taken as is without wildcards) to the positions of the paths
+        ending with it. Only the paths holding the last component of the suffix are
+        verified, so resolving many suffixes costs about one lookup each.
+        '''
+        results = {}
+        for suffix in dict.fromkeys(suffixes):
+            normcased_suffix = normcase(suffix)
+            parent, _, last_component = normcased_suffix.rpartition(os.sep)
+            if not last_component:
+                results[suffix] = []
+                continue
+            # without a separator, the suffix may end a component instead of being one
+            postings_list = self._lookup('exact' if parent or normcased_suffix.startswith(os.sep) else 'suffix',
+                                         last_component)
+            if len(postings_list) == 1:
+                candidates = postings_list[0]
+            else:
+                candidates = sorted(set(chain.from_iterable(postings_list)))
+            results[suffix] = [position for position in candidates
+                               if self._key(position).endswith(normcased_suffix)]
+        return results
+
+
+class PatternSet:
+    """
+    Set of search patterns compiled to be matched against one path at a time,
+    as when streaming an archive. Each pattern is keyed on one of its literal
+    components so that only the patterns sharing a component with the path
+    are run against it.
+    Methods:
+        match(path): Returns the patterns matching the path.
+    """
+
+    def __init__(self, filepatterns, prefix=''):
+        self.prefix = prefix
+        self._exact = {}
+        self._prefixes = {}
+        self._suffixes = {}
+        self._unkeyed = []
+        for filepattern in dict.fromkeys(filepatterns):
+            normcased_pattern = normcase(filepattern)
+            entry = (filepattern, _compile_pattern(normcased_pattern))
+            constraints = list(pattern_constraints(normcased_pattern))
+            exact = [literal for kind, literal in constraints if kind == 'exact']
+            if exact:
+                self._exact.setdefault(exact[-1], []).append(entry)
+            elif constraints:
+                kind, literal = max(constraints, key=lambda constraint: len(constraint[1]))
+                table = self._prefixes if kind == 'prefix' else self._suffixes
+                table.setdefault(literal, []).append(entry)
+            else:
+                self._unkeyed.append(entry)
+        self._prefix_lengths = sorted({len(literal) for literal in self._prefixes})
+        self._suffix_lengths = sorted({len(literal) for literal in self._suffixes})
+
+    def match(self, path):
+        '''Returns the list of patterns matching path'''
+        key = self.prefix + normcase(path)
+        candidates = list(self._unkeyed)
+        for component in set(key.split(os.sep)):
+            candidates.extend(self._exact.get(component, ()))
+            for length in self._prefix_lengths:
+                if length > len(component):
+                    break
+                candidates.extend(self._prefixes.get(component[:length], ()))
+            for length in self._suffix_lengths:
+                if length > len(component):
+                    break
+                candidates.extend(self._suffixes.get(component[-length:], ()))
+        return [filepattern for filepattern, pat in dict(candidates).items() if pat(key) is not None]
+
+
 class FileSeekerBase:
     """
     Abstract base class for file seeking operations.
     This class provides an interface for searching files and performing cleanup operations
     in different storage contexts (e.g., filesystem, archives, databases).
+    Attributes:
+        path_index (PathIndex): Index of the paths of the extraction, if the seeker builds one.
+        prefetched (dict): Pattern matches resolved by prefetch() and not yet consumed by search().
+        searched (dict): The results of the patterns already searched.
     """
+    def __init__(self):
+        self.path_index = None
+        self.prefetched = {}
+        self.searched = {}
+
     def search(self, filepattern, return_on_first_hit=False):
         '''Returns a list of paths for files/folders that matched'''
+        raise NotImplementedError
+
+    def prefetch(self, filepatterns):
+        '''Resolves the matches of all the patterns in one go, ahead of their search() calls'''
+        if self.path_index is None:
+            return
+        pending = [filepattern for filepattern in filepatterns
+                   if filepattern not in self.searched and filepattern not in self.prefetched]
+        if pending:
+            self.prefetched.update(self.path_index.match_many(pending))
+
+    def search_many(self, filepatterns):
+        '''
+        Searches all the patterns at once and returns a dict mapping each
+        pattern to the list of paths that matched, as search() would.
+        '''
+        self.prefetch(filepatterns)
+        return {filepattern: self.search(filepattern) for filepattern in filepatterns}
+
+    def resolve_many(self, paths):
+        '''
+        Resolves paths stored by apps (e.g. message attachments) to the first file of
+        the extraction ending with each of them, as search('*' + path, True) would but
+        with the paths taken literally and looked up in the index instead of scanned.
+        Args:
+            paths: The paths to resolve, empty values are ignored.
+        Returns:
+            A dict mapping each path to the data path of the file found, or None.
+        '''
+        patterns = {path: '*' + glob.escape(path) for path in dict.fromkeys(paths) if path}
+        if self.path_index is not None:
+            pending = {path: pattern for path, pattern in patterns.items()
+                       if pattern not in self.searched and pattern not in self.prefetched}
+            for path, positions in self.path_index.match_suffixes(pending).items():
+                self.prefetched[pending[path]] = positions
+        results = {}
+        for path, pattern in patterns.items():
+            found = self.search(pattern, return_on_first_hit=True)
+            if isinstance(found, list):
+                found = found[0] if found else None
+            results[path] = found
+        return results
+
+    def pre_extract(self, filepatterns):
+        '''
+        Copies or extracts the union of the files matching the patterns to the
+        data folder ahead of the search() calls, which then only return the
+        already staged paths. Returns the number of files staged.
+        '''
+        if self.path_index is None:
+            return 0
+        self.prefetch(filepatterns)
+        positions = sorted(set(chain.from_iterable(
+            self.prefetched.get(filepattern, ()) for filepattern in filepatterns)))
+        return self.stage(positions)
+
+    def stage(self, positions):  # pylint: disable=unused-argument
+        '''Copies the files at the given positions of path_index.paths to the data folder, none by default'''
+        return 0
+
+    def matching_positions(self, filepattern):
+        '''Returns the positions in path_index.paths of the paths matching filepattern'''
+        positions = self.prefetched.pop(filepattern, None)
+        if positions is None:
+            positions = self.path_index.match(filepattern)
+        return positions
+
+    def reopen(self):
+        '''Reopens the handles of a seeker inherited by a forked worker process, which must not share them'''
 
     def cleanup(self):
         '''close any open handles'''
@@ -298,10 +711,12 @@ class FileSeekerDir(FileSeekerBase):
         searched (dict): Cache of search results, mapping file patterns to lists of matched paths.
         copied (dict): Mapping of source file paths to their copied destination paths.
         file_infos (dict): Dictionary storing FileInfo objects with metadata for copied files.
+        path_index (PathIndex): Index of _all_files used to resolve search patterns.
     Methods:
         build_files_list(directory): Recursively scans directory and populates _all_files list.
         search(filepattern, return_on_first_hit=False, force=False): Searches for files matching
             the given pattern, copies them to data_folder, and returns matching paths.
+        stage(positions): Copies files to data_folder using a thread pool.
     """
 
     def __init__(self, directory, data_folder):
@@ -312,6 +727,7 @@ class FileSeekerDir(FileSeekerBase):
         logfunc('Building files listing...')
         self.build_files_list(directory)
         logfunc(f'File listing complete - {len(self._all_files)} files')
+        self.path_index = PathIndex(self._all_files, normcase("root/"))
         self.searched = {}
         self.copied = {}
         self.file_infos = {}
@@ -327,42 +743,67 @@ class FileSeekerDir(FileSeekerBase):
         except OSError as ex:
             logfunc(f'Error reading {directory} ' + str(ex))
 
+    def get_data_path(self, item):
+        '''Returns the path in data_folder where item is copied'''
+        item_rel_path = item.replace(self.directory, '')
+        data_path = os.path.join(self.data_folder, item_rel_path[1:])
+        if is_platform_windows():
+            data_path = data_path.replace('/', '\\')
+        return data_path
+
+    @staticmethod
+    def copy_file(item, data_path):
+        '''Copies item to data_path and returns its FileInfo'''
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        copy2(item, data_path)
+        stat = Path(item).stat()
+        return FileInfo(item, stat.st_ctime, stat.st_mtime)
+
+    def stage(self, positions):
+        '''Copies the files at the given positions of _all_files to data_folder using a thread pool'''
+        to_copy = {}
+        for position in positions:
+            item = self._all_files[position]
+            if item not in self.copied and os.path.isfile(item):
+                to_copy[item] = self.get_data_path(item)
+        with ThreadPoolExecutor() as executor:
+            futures = {executor.submit(self.copy_file, item, data_path): item for item, data_path in to_copy.items()}
+            for future in as_completed(futures):
+                item = futures[future]
+                data_path = to_copy[item]
+                try:
+                    self.file_infos[data_path] = future.result()
+                    self.copied[item] = data_path
+                except OSError as ex:
+                    logfunc(f'Could not copy {item} to {data_path} ' + str(ex))
+        return len(self.copied.keys() & to_copy.keys())
+
     def search(self, filepattern, return_on_first_hit=False, force=False):
         if filepattern in self.searched and not force:
             pathlist = self.searched[filepattern]
             return self.searched[filepattern][0] if return_on_first_hit and pathlist else pathlist
         pathlist = []
-        pat = _compile_pattern(normcase(filepattern))
-        root = normcase("root/")
-        for item in self._all_files:
-            if pat(root + normcase(item)) is not None:
-                item_rel_path = item.replace(self.directory, '')
-                data_path = os.path.join(self.data_folder, item_rel_path[1:])
-                if is_platform_windows():
-                    data_path = data_path.replace('/', '\\')
-                if item not in self.copied or force:
-                    try:
-                        if os.path.isdir(item):
-                            pathlist.append(data_path)
-                        elif os.path.isfile(item):
-                            os.makedirs(os.path.dirname(data_path), exist_ok=True)
-                            copy2(item, data_path)
-                            self.copied[item] = data_path
-                            creation_date = Path(item).stat().st_ctime
-                            modification_date = Path(item).stat().st_mtime
-                            file_info = FileInfo(item, creation_date, modification_date)
-                            self.file_infos[data_path] = file_info
-                        else:
-                            logfunc(f"INFO: Item '{item}' is neither a file nor a directory "
-                                    "(e.g. symlink not followed, or broken). Skipped.")
-                    except OSError as ex:
-                        logfunc(f'Could not copy {item} to {data_path} ' + str(ex))
-                else:
-                    data_path = self.copied[item]
-                pathlist.append(data_path)
-                if return_on_first_hit:
-                    self.searched[filepattern] = pathlist
-                    return data_path
+        for position in self.matching_positions(filepattern):
+            item = self._all_files[position]
+            data_path = self.get_data_path(item)
+            if item not in self.copied or force:
+                try:
+                    if os.path.isdir(item):
+                        pathlist.append(data_path)
+                    elif os.path.isfile(item):
+                        self.file_infos[data_path] = self.copy_file(item, data_path)
+                        self.copied[item] = data_path
+                    else:
+                        logfunc(f"INFO: Item '{item}' is neither a file nor a directory "
+                                "(e.g. symlink not followed, or broken). Skipped.")
+                except OSError as ex:
+                    logfunc(f'Could not copy {item} to {data_path} ' + str(ex))
+            else:
+                data_path = self.copied[item]
+            pathlist.append(data_path)
+            if return_on_first_hit:
+                self.searched[filepattern] = pathlist
+                return data_path
         self.searched[filepattern] = pathlist
         return pathlist
 
@@ -379,11 +820,12 @@ class FileSeekerItunes(FileSeekerBase):
         backup_type (str): The type of backup, either 'db' or 'mbdb'.
         decryption_keys (list): A list of keys used for decrypting files, if applicable.
         _all_files (dict): A dictionary mapping full file paths to their corresponding hash filenames.
-        _all_file_meta (dict): A dictionary storing metadata for each file.
-        files_metadata (dict): A dictionary mapping hash filenames to their metadata.
+        _all_file_meta (dict): A dictionary caching the decoded metadata of the files found.
+        files_metadata (dict): A dictionary mapping hash filenames to their Manifest.db metadata blobs.
         searched (dict): A dictionary storing search results for file patterns.
         copied (dict): A dictionary tracking copied files and their destinations.
         file_infos (dict): A dictionary storing file information such as creation and modification dates.
+        path_index (PathIndex): Index of the full paths of _all_files used to resolve search patterns.
     Methods:
         __init__(directory, data_folder, backup_type, decryption_keys):
             Initializes the FileSeekerItunes instance and builds the file listing based on the backup type.
@@ -393,6 +835,12 @@ class FileSeekerItunes(FileSeekerBase):
             Populates paths from Manifest.db files into _all_files.
         build_files_list_from_manifest_mbdb(manifest_path):
             Populates paths from Manifest.mbdb files into _all_files.
+        get_file_metadata(relative_path):
+            Returns the decoded metadata of a file, decoding it on first use.
+        extract_file(relative_path, original_location, data_path):
+            Copies a file to data_path, decrypting it by chunks in encrypted backups.
+        stage(positions, force=False):
+            Copies or decrypts files to data_folder using a thread pool.
         search(filepattern, return_on_first_hit=False, force=False):
             Searches for files matching the given pattern and returns their paths.
     """
@@ -411,20 +859,16 @@ class FileSeekerItunes(FileSeekerBase):
             manifest_path = os.path.join(directory, "Manifest.db")
             if decryption_keys:
                 unwrapped_manifest_key = decryption_keys[1]
-                with open(manifest_path, "rb") as manifest_contents:
-                    cipher = Cipher(algorithms.AES(unwrapped_manifest_key),
-                                    modes.CBC(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'))
-                    decryptor = cipher.decryptor()
-                    decrypted_manifest_contents = decryptor.update(manifest_contents.read()) + decryptor.finalize()
-                    manifest_path = os.path.join(data_folder, "Manifest.db")
-                    with open(manifest_path, "wb") as new_manifest_contents:
-                        new_manifest_contents.write(decrypted_manifest_contents)
+                decrypted_manifest_path = os.path.join(data_folder, "Manifest.db")
+                decrypt_itunes_file(manifest_path, decrypted_manifest_path, unwrapped_manifest_key)
+                manifest_path = decrypted_manifest_path
 
             self.build_files_list_from_manifest_db(manifest_path)
         elif backup_type == "mbdb":
             manifest_path = os.path.join(directory, "Manifest.mbdb")
             self.build_files_list_from_manifest_mbdb(manifest_path)
         logfunc(f'File listing complete - {len(self._all_files)} files')
+        self.path_index = PathIndex(list(self._all_files))
         self.searched = {}
         self.copied = {}
         self.file_infos = {}
@@ -468,16 +912,7 @@ class FileSeekerItunes(FileSeekerBase):
                 file_metadata = row[3]
                 full_path = os.path.join(root_path, relative_path)
                 self._all_files[full_path] = hash_filename
-                if self.decryption_keys:
-                    # Load the file's plist and find the encryption key
-                    tmp_file_plist = get_plist_content(row[3])
-                    tmp_wrapped_key = tmp_file_plist["EncryptionKey"]["NS.data"]
-
-                    # Store the results into a dict for future
-                    self._all_file_meta[full_path] = {}
-                    self._all_file_meta[full_path]['Class'] = int.from_bytes(tmp_wrapped_key[0:4], byteorder="little")
-                    self._all_file_meta[full_path]['Key'] = tmp_wrapped_key[4:]
-                    self._all_file_meta[full_path]['Size'] = tmp_file_plist["Size"]
+                # decoded by get_file_metadata for the files found only
                 self.files_metadata[hash_filename] = file_metadata
             db.close()
         except Exception as ex:
@@ -548,75 +983,120 @@ class FileSeekerItunes(FileSeekerBase):
             logfunc(f'Error opening Manifest.mbdb from {self.directory}, ' + str(ex))
             raise ex
 
+    def get_original_location(self, hash_filename):
+        '''Returns the path of a file in the backup folder'''
+        if self.backup_type == "db":
+            return os.path.join(self.directory, hash_filename[:2], hash_filename)
+        return os.path.join(self.directory, hash_filename)
+
+    def get_data_path(self, relative_path):
+        '''Returns the path in data_folder where a file is copied or decrypted'''
+        data_path = os.path.join(self.data_folder, sanitize_file_path(relative_path))
+        if is_platform_windows():
+            data_path = data_path.replace('/', '\\')
+        return data_path
+
+    def get_file_metadata(self, relative_path):
+        '''
+        Returns the metadata of a file of a Manifest.db backup (dates, size, protection class and
+        wrapped key), decoded on first use and cached in _all_file_meta.
+        '''
+        metadata = self._all_file_meta.get(relative_path)
+        if metadata is None:
+            metadata = decode_manifest_file_metadata(self.files_metadata[self._all_files[relative_path]])
+            self._all_file_meta[relative_path] = metadata
+        return metadata
+
+    def extract_file(self, relative_path, original_location, data_path):
+        '''Copies or decrypts a file of the backup to data_path and returns its FileInfo'''
+        if self.backup_type == "db":
+            metadata = self.get_file_metadata(relative_path)
+            creation_date = metadata['Birth']
+            modification_date = metadata['LastModified']
+        else:
+            # TO DO: extract creation and modification dates from manifest.mbdb
+            creation_date = 0
+            modification_date = 0
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+        # Handle encrypted backups differently, don't just copy the encrypted files
+        if self.decryption_keys:
+            protection_classes = self.decryption_keys[0]
+            # Snag the right protection class
+            tmp_file_meta = self.get_file_metadata(relative_path)
+            if 'Key' not in tmp_file_meta:
+                logfunc(f'Can\'t locate the encryption key of {relative_path}')
+                raise KeyError
+            if tmp_file_meta['Class'] not in protection_classes:
+                logfunc(f'Can\'t locate the protection class for {relative_path}: {tmp_file_meta["Class"]}')
+                raise KeyError
+            tmp_protection_class = protection_classes[tmp_file_meta['Class']]
+
+            # Grab the file's key
+            tmp_file_wrapped_key = tmp_file_meta['Key']
+            tmp_file_unwrapped_key = crypt.aes_key_unwrap(tmp_protection_class['Unwrapped'],
+                                                          tmp_file_wrapped_key)
+
+            # Decrypt into the expected location, only the expected size is written, no padding
+            decrypt_itunes_file(original_location, data_path, tmp_file_unwrapped_key, tmp_file_meta['Size'])
+
+        # If not encrypted, just copy the thing
+        else:
+            copy2(original_location, data_path)
+
+        return FileInfo(original_location, creation_date, modification_date)
+
+    def stage(self, positions, force=False):
+        '''
+        Copies or decrypts the files at the given positions of path_index.paths to data_folder
+        using a thread pool, as the decryption of large files is bound by the disk.
+        Returns the number of files staged.
+        '''
+        to_extract = {}
+        for position in positions:
+            relative_path = self.path_index.paths[position]
+            original_location = self.get_original_location(self._all_files[relative_path])
+            if (original_location not in self.copied or force) and original_location not in to_extract:
+                to_extract[original_location] = (relative_path, self.get_data_path(relative_path))
+
+        def extract(item):
+            original_location, (relative_path, data_path) = item
+            try:
+                return self.extract_file(relative_path, original_location, data_path), None
+            except OSError as ex:
+                return None, ex
+
+        if len(to_extract) > 1:
+            with ThreadPoolExecutor() as executor:
+                results = list(executor.map(extract, to_extract.items()))
+        else:
+            results = [extract(item) for item in to_extract.items()]
+        staged_files = 0
+        for (original_location, (_, data_path)), (file_info, error) in zip(to_extract.items(), results):
+            if error:
+                logfunc(f'Could not copy {original_location} to {data_path} ' + str(error))
+                continue
+            self.file_infos[data_path] = file_info
+            self.copied[original_location] = data_path
+            staged_files += 1
+        return staged_files
+
     def search(self, filepattern, return_on_first_hit=False, force=False):
         if filepattern in self.searched and not force:
             pathlist = self.searched[filepattern]
             return self.searched[filepattern][0] if return_on_first_hit and pathlist else pathlist
+        positions = self.matching_positions(filepattern)
+        if return_on_first_hit:
+            positions = positions[:1]
+        self.stage(positions, force=force)
         pathlist = []
-        matching_keys = fnmatch.filter(self._all_files, filepattern)
-        for relative_path in matching_keys:
-            hash_filename = self._all_files[relative_path]
-            if self.backup_type == "db":
-                original_location = os.path.join(self.directory, hash_filename[:2], hash_filename)
-                metadata = get_plist_content(self.files_metadata[hash_filename])
-                creation_date = metadata.get('Birth', 0)
-                modification_date = metadata.get('LastModified', 0)
-            else:
-                original_location = os.path.join(self.directory, hash_filename)
-                # TO DO: extract creation and modification dates from manifest.mbdb
-                creation_date = 0
-                modification_date = 0
-            data_path = os.path.join(self.data_folder, sanitize_file_path(relative_path))
-            if is_platform_windows():
-                data_path = data_path.replace('/', '\\')
-            if original_location not in self.copied or force:
-                try:
-                    os.makedirs(os.path.dirname(data_path), exist_ok=True)
-
-                    # Handle encrypted backups differently, don't just copy the encrypted files
-                    if self.decryption_keys:
-                        protection_classes = self.decryption_keys[0]
-                        # Snag the right protection class
-                        tmp_file_meta = self._all_file_meta[relative_path]
-                        if tmp_file_meta['Class'] not in protection_classes:
-                            logfunc(f'Can\'t locate the protection class for {relative_path}: {tmp_file_meta["Class"]}')
-                            raise KeyError
-                        tmp_protection_class = protection_classes[tmp_file_meta['Class']]
-
-                        # Grab the file's key
-                        tmp_file_wrapped_key = tmp_file_meta['Key']
-                        tmp_file_unwrapped_key = crypt.aes_key_unwrap(tmp_protection_class['Unwrapped'],
-                                                                      tmp_file_wrapped_key)
-
-                        # Open the file and snag the contents
-                        with open(original_location, "rb") as temp_original_file:
-                            # Decrypt the contents, Apple uses a 0'd out 16-byte IV
-                            cipher = Cipher(
-                                algorithms.AES(tmp_file_unwrapped_key),
-                                modes.CBC(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'))
-                            decryptor = cipher.decryptor()
-                            decrypted_contents = decryptor.update(temp_original_file.read()) + decryptor.finalize()
-
-                            # Write the decrypt into the expected located, only write the expected size, no padding
-                            with open(data_path, "wb") as temp_new_file:
-                                temp_new_file.write(decrypted_contents[0:tmp_file_meta['Size']])
-
-                    # If not encrypted, just copy the thing
-                    else:
-                        copy2(original_location, data_path)
-
-                    file_info = FileInfo(original_location, creation_date, modification_date)
-                    self.file_infos[data_path] = file_info
-                    self.copied[original_location] = data_path
-                except OSError as ex:
-                    logfunc(f'Could not copy {original_location} to {data_path} ' + str(ex))
-            else:
-                data_path = self.copied[original_location]
-            pathlist.append(data_path)
-            if return_on_first_hit:
-                self.searched[filepattern] = pathlist
-                return data_path
+        for position in positions:
+            relative_path = self.path_index.paths[position]
+            original_location = self.get_original_location(self._all_files[relative_path])
+            pathlist.append(self.copied.get(original_location) or self.get_data_path(relative_path))
         self.searched[filepattern] = pathlist
+        if return_on_first_hit:
+            return pathlist[0] if pathlist else pathlist
         return pathlist
 
 
@@ -624,81 +1104,215 @@ class FileSeekerTar(FileSeekerBase):
     """
     This is a class that extends FileSeekerBase to facilitate searching and extracting files
     from a tar archive. It supports both gzip and regular tar files.
+    When search patterns are given at creation, the archive is read in a single forward
+    pass (streaming mode): members matching any of the patterns are extracted as they
+    are read, and every member is recorded in an on-disk member index, so that later
+    searches never rescan the archive.
     Attributes:
         tar_file_path (str): The path to the tar file.
         data_folder (str): The directory where extracted files will be stored.
         is_gzip (bool): Indicates if the tar file is gzipped.
-        tar_file (tarfile.TarFile): The opened tar file object.
+        mode (str): The mode used to open the tar file for random access.
+        tar_file (tarfile.TarFile): The opened tar file object (opened on first use in streaming mode).
+        members (list): The TarInfo objects of the archive members (None in streaming mode).
+        member_index (sqlite3.Connection): The on-disk member index (None unless in streaming mode).
+        path_index (PathIndex): Index of the member names used to resolve search patterns.
         searched (dict): A dictionary to keep track of searched file patterns and their results.
         copied (dict): A dictionary to keep track of files that have been copied.
         file_infos (dict): A dictionary to store file information for extracted files.
     Methods:
-        __init__(tar_file_path, data_folder):
+        __init__(tar_file_path, data_folder, filepatterns=None):
             Initializes the FileSeekerTar instance with the specified tar file path and data folder.
+            If filepatterns is given, the archive is streamed once and matching members are extracted.
         search(filepattern, return_on_first_hit=False, force=False):
             Searches for files matching the given pattern in the tar archive and extracts them to the data folder.
             Returns a list of paths to the extracted files or the first hit if specified.
+        stream_extract(filepatterns):
+            Reads the archive in one forward pass, extracting matching members and building the member index.
+        get_member(position):
+            Returns the TarInfo of a member, reading its header from the archive in streaming mode.
+        stage(positions):
+            Extracts members to the data folder in one sequential pass over the archive.
+        reopen():
+            Reopens the tar file and the member index in a forked worker process.
         cleanup():
-            Closes the tar file to free up resources.
+            Closes the tar file and the member index to free up resources.
     """
 
-    def __init__(self, tar_file_path, data_folder):
+    member_index_name = '_tar_member_index.db'
+
+    def __init__(self, tar_file_path, data_folder, filepatterns=None):
         FileSeekerBase.__init__(self)
+        self.tar_file_path = tar_file_path
         self.is_gzip = tar_file_path.lower().endswith('gz')
-        mode = 'r:gz' if self.is_gzip else 'r'
-        self.tar_file = tarfile.open(tar_file_path, mode)
+        self.mode = 'r:gz' if self.is_gzip else 'r'
         self.data_folder = data_folder
         self.searched = {}
         self.copied = {}
         self.file_infos = {}
+        self.tar_file = None
+        self.members = None
+        self.member_index = None
+        if filepatterns is None:
+            self.tar_file = tarfile.open(tar_file_path, self.mode)
+            self.members = self.tar_file.getmembers()
+            names = [member.name for member in self.members]
+        else:
+            logfunc('Streaming tar archive...')
+            names = self.stream_extract(filepatterns)
+            logfunc(f'Tar archive streamed - {len(names)} members, {len(self.copied)} files extracted')
+        self.path_index = PathIndex(names, normcase("root/"))
+
+    def get_full_path(self, name):
+        '''Returns the path in data_folder where a member is extracted'''
+        return os.path.join(self.data_folder, Path(sanitize_file_path(name)))
+
+    def get_member_index_path(self):
+        '''Returns the path of the member index, next to data_folder'''
+        return os.path.join(os.path.dirname(os.path.normpath(self.data_folder)), self.member_index_name)
+
+    def stream_extract(self, filepatterns):
+        '''
+        Reads the archive in one forward pass. Members matching any of the
+        patterns are streamed to data_folder and every member (name, offset,
+        size, mtime, type) is recorded in the member index.
+        Returns the list of member names, in archive order.
+        '''
+        pattern_set = PatternSet(filepatterns, normcase("root/"))
+        matches = {filepattern: [] for filepattern in filepatterns}
+        names = []
+        rows = []
+        self.member_index = sqlite3.connect(self.get_member_index_path(), check_same_thread=False)
+        self.member_index.execute('''CREATE TABLE IF NOT EXISTS members (
+                                        id INTEGER PRIMARY KEY,
+                                        name TEXT,
+                                        offset INTEGER,
+                                        size INTEGER,
+                                        mtime INTEGER,
+                                        type BLOB)''')
+        self.member_index.execute('DELETE FROM members')
+        sql = 'INSERT INTO members (id, name, offset, size, mtime, type) VALUES (?, ?, ?, ?, ?, ?)'
+        with tarfile.open(self.tar_file_path, 'r|gz' if self.is_gzip else 'r|') as stream:
+            while True:
+                member = stream.next()
+                if member is None:
+                    break
+                stream.members = []  # do not keep every TarInfo in memory
+                position = len(names)
+                names.append(member.name)
+                rows.append((position, member.name, member.offset, member.size, member.mtime, member.type))
+                if len(rows) >= 10000:
+                    self.member_index.executemany(sql, rows)
+                    rows = []
+                matched_patterns = pattern_set.match(member.name)
+                if not matched_patterns:
+                    continue
+                for filepattern in matched_patterns:
+                    matches[filepattern].append(position)
+                try:
+                    self.extract_member(member, self.get_full_path(member.name), stream)
+                except OSError as ex:
+                    logfunc(f'Could not write file to filesystem, path was {member.name} ' + str(ex))
+        self.member_index.executemany(sql, rows)
+        self.member_index.commit()
+        self.prefetched.update(matches)
+        return names
+
+    def get_member(self, position):
+        '''Returns the TarInfo of the member at the given position of path_index.paths'''
+        if self.members is not None:
+            return self.members[position]
+        name, offset, mtime, member_type = self.member_index.execute(
+            'SELECT name, offset, mtime, type FROM members WHERE id = ?', (position,)).fetchone()
+        if member_type == tarfile.DIRTYPE:
+            # No need to read the archive to recreate a folder
+            member = tarfile.TarInfo(name)
+            member.type = member_type
+            member.mtime = mtime
+            return member
+        if self.tar_file is None:
+            self.tar_file = tarfile.open(self.tar_file_path, self.mode)
+        self.tar_file.fileobj.seek(offset)
+        return tarfile.TarInfo.fromtarfile(self.tar_file)
 
     def search(self, filepattern, return_on_first_hit=False, force=False):
         if filepattern in self.searched and not force:
             pathlist = self.searched[filepattern]
             return self.searched[filepattern][0] if return_on_first_hit and pathlist else pathlist
         pathlist = []
-        pat = _compile_pattern(normcase(filepattern))
-        root = normcase("root/")
-        for member in self.tar_file.getmembers():
-            if pat(root + normcase(member.name)) is not None:
-                clean_name = sanitize_file_path(member.name)
-                full_path = os.path.join(self.data_folder, Path(clean_name))
-                if member.name not in self.copied or force:
-                    try:
-                        if member.isdir():
-                            os.makedirs(full_path, exist_ok=True)
-                        else:
-                            parent_dir = os.path.dirname(full_path)
-                            if not os.path.exists(parent_dir):
-                                os.makedirs(parent_dir)
-                            with open(full_path, "wb") as fout:
-                                fout.write(tarfile.ExFileObject(self.tar_file, member).read())
-                                fout.close()
-                                file_info = FileInfo(member.name, 0, member.mtime)
-                                self.file_infos[full_path] = file_info
-                                self.copied[member.name] = full_path
-                            os.utime(full_path, (member.mtime, member.mtime))
-                    except OSError as ex:
-                        logfunc(f'Could not write file to filesystem, path was {member.name} ' + str(ex))
-                else:
-                    full_path = self.copied[member.name]
-                pathlist.append(full_path)
-                if return_on_first_hit:
-                    self.searched[filepattern] = pathlist
-                    return full_path
+        for position in self.matching_positions(filepattern):
+            name = self.path_index.paths[position]
+            full_path = self.get_full_path(name)
+            if name not in self.copied or force:
+                try:
+                    self.extract_member(self.get_member(position), full_path)
+                except OSError as ex:
+                    logfunc(f'Could not write file to filesystem, path was {name} ' + str(ex))
+            else:
+                full_path = self.copied[name]
+            pathlist.append(full_path)
+            if return_on_first_hit:
+                self.searched[filepattern] = pathlist
+                return full_path
         self.searched[filepattern] = pathlist
         return pathlist
 
+    def extract_member(self, member, full_path, tar_file=None):
+        '''Writes a member of the archive to full_path'''
+        if member.isdir():
+            os.makedirs(full_path, exist_ok=True)
+        else:
+            parent_dir = os.path.dirname(full_path)
+            if not os.path.exists(parent_dir):
+                os.makedirs(parent_dir)
+            with open(full_path, "wb") as fout:
+                copyfileobj(tarfile.ExFileObject(tar_file or self.tar_file, member), fout)
+                file_info = FileInfo(member.name, 0, member.mtime)
+                self.file_infos[full_path] = file_info
+                self.copied[member.name] = full_path
+            os.utime(full_path, (member.mtime, member.mtime))
+
+    def stage(self, positions):
+        '''
+        Extracts the members at the given positions in one sequential forward
+        pass over the archive, as random access is costly on gzip streams.
+        '''
+        staged = 0
+        for position in positions:
+            if self.path_index.paths[position] in self.copied:
+                continue
+            member = self.get_member(position)
+            if not member.isfile():
+                continue
+            try:
+                self.extract_member(member, self.get_full_path(member.name))
+                staged += 1
+            except OSError as ex:
+                logfunc(f'Could not write file to filesystem, path was {member.name} ' + str(ex))
+        return staged
+
+    def reopen(self):
+        if self.tar_file:
+            self.tar_file.close()
+            self.tar_file = tarfile.open(self.tar_file_path, self.mode)
+        if self.member_index:
+            self.member_index = sqlite3.connect(self.get_member_index_path(), check_same_thread=False)
+
     def cleanup(self):
-        self.tar_file.close()
+        if self.tar_file:
+            self.tar_file.close()
+        if self.member_index:
+            self.member_index.close()
 
 
 class FileSeekerZip(FileSeekerBase):
     """
     This is a class that extends FileSeekerBase to facilitate searching and extracting files from a ZIP archive.
     Attributes:
+        zip_file_path (str): The path to the ZIP archive.
         zip_file (ZipFile): The ZIP file object representing the archive.
         name_list (list): A list of file names contained in the ZIP archive.
+        path_index (PathIndex): Index of the file names (excluding __MACOSX) used to resolve search patterns.
         data_folder (str): The directory where extracted files will be stored.
         searched (dict): A dictionary to keep track of searched file patterns and their corresponding paths.
         copied (dict): A dictionary to keep track of files that have been extracted and their paths.
@@ -710,15 +1324,22 @@ class FileSeekerZip(FileSeekerBase):
             Decodes the extended timestamp information from the extra data of a file in the ZIP archive.
         search(filepattern, return_on_first_hit=False, force=False):
             Searches for files matching the specified pattern in the ZIP archive and extracts them if found.
+        stage(positions):
+            Extracts members to the data folder using a thread pool.
+        reopen():
+            Reopens the ZIP file in a forked worker process.
         cleanup():
             Closes the ZIP file to free up resources.
     """
 
     def __init__(self, zip_file_path, data_folder):
         FileSeekerBase.__init__(self)
+        self.zip_file_path = zip_file_path
         self.zip_file = ZipFile(zip_file_path)
         self.name_list = self.zip_file.namelist()
         self.data_folder = data_folder
+        self.path_index = PathIndex([member for member in self.name_list if not member.startswith("__MACOSX")],
+                                    normcase("root/"))
         self.searched = {}
         self.copied = {}
         self.file_infos = {}
@@ -760,34 +1381,74 @@ class FileSeekerZip(FileSeekerBase):
             pathlist = self.searched[filepattern]
             return self.searched[filepattern][0] if return_on_first_hit and pathlist else pathlist
         pathlist = []
-        pat = _compile_pattern(normcase(filepattern))
-        root = normcase("root/")
-        for member in self.name_list:
-            if member.startswith("__MACOSX"):
-                continue
-            if pat(root + normcase(member)) is not None:
-                if member not in self.copied or force:
+        for position in self.matching_positions(filepattern):
+            member = self.path_index.paths[position]
+            if member not in self.copied or force:
+                try:
+                    extracted_path, file_info = self.extract_member(self.zip_file, member)
+                    self.file_infos[extracted_path] = file_info
+                    self.copied[member] = extracted_path
+                except OSError as ex:
+                    logfunc(f'Could not write file to filesystem, path was {member} ' + str(ex))
+            else:
+                extracted_path = self.copied[member]
+            pathlist.append(extracted_path)
+            if return_on_first_hit:
+                self.searched[filepattern] = pathlist
+                return extracted_path
+        self.searched[filepattern] = pathlist
+        return pathlist
+
+    def extract_member(self, zip_file, member):
+        '''Extracts a member with the given ZipFile handle and returns its path and FileInfo'''
+        # already replaces illegal chars with _ when exporting
+        try:
+            extracted_path = zip_file.extract(member, path=self.data_folder)
+        except FileExistsError:
+            # Another thread created the same parent folder concurrently
+            extracted_path = zip_file.extract(member, path=self.data_folder)
+        f = zip_file.getinfo(member)
+        creation_date, modification_date = self.decode_extended_timestamp(f.extra)
+        file_info = FileInfo(member, creation_date, modification_date)
+        date_time = f.date_time
+        date_time = timex.mktime(date_time + (0, 0, -1))
+        os.utime(extracted_path, (date_time, date_time))
+        return extracted_path, file_info
+
+    def stage(self, positions):
+        '''Extracts the members at the given positions using a thread pool, one ZipFile handle per thread'''
+        handles = []
+        local = threading.local()
+
+        def extract(member):
+            if not hasattr(local, 'zip_file'):
+                local.zip_file = ZipFile(self.zip_file_path)
+                handles.append(local.zip_file)
+            return self.extract_member(local.zip_file, member)
+
+        members = [self.path_index.paths[position] for position in positions]
+        members = [member for member in members if member not in self.copied and not member.endswith('/')]
+        staged = 0
+        try:
+            with ThreadPoolExecutor() as executor:
+                futures = {executor.submit(extract, member): member for member in members}
+                for future in as_completed(futures):
+                    member = futures[future]
                     try:
-                        # already replaces illegal chars with _ when exporting
-                        extracted_path = self.zip_file.extract(member, path=self.data_folder)
-                        f = self.zip_file.getinfo(member)
-                        creation_date, modification_date = self.decode_extended_timestamp(f.extra)
-                        file_info = FileInfo(member, creation_date, modification_date)
+                        extracted_path, file_info = future.result()
                         self.file_infos[extracted_path] = file_info
-                        date_time = f.date_time
-                        date_time = timex.mktime(date_time + (0, 0, -1))
-                        os.utime(extracted_path, (date_time, date_time))
                         self.copied[member] = extracted_path
+                        staged += 1
                     except OSError as ex:
                         logfunc(f'Could not write file to filesystem, path was {member} ' + str(ex))
-                else:
-                    extracted_path = self.copied[member]
-                pathlist.append(extracted_path)
-                if return_on_first_hit:
-                    self.searched[filepattern] = pathlist
-                    return extracted_path
-        self.searched[filepattern] = pathlist
-        return pathlist
+        finally:
+            for handle in handles:
+                handle.close()
+        return staged
+
+    def reopen(self):
+        self.zip_file.close()
+        self.zip_file = ZipFile(self.zip_file_path)
 
     def cleanup(self):
         self.zip_file.close()
@@ -0,0 +1,81 @@
+"""
+Journal of the report writes made by artifacts running in worker processes.
+
+When crunch_artifacts runs artifacts in a process pool, the workers must not
+write to the outputs shared by the whole case (_lava_artifacts.db, the TSV and
+KML exports, the timeline database). The writer functions call record() first:
+in a worker, the call is appended to the journal instead of being executed, and
+the main process replays the journal as the single writer of the outputs.
+
+Functions:
+    start: Starts recording the writes of the current process.
+    is_recording: Returns True if the writes of the current process are recorded.
+    record: Records a call to a writer function.
+    collect: Returns the recorded calls and empties the journal.
+    replay: Executes recorded calls in order.
+    note_write: Counts a write that is not journaled.
+    get_write_count: Returns the number of writes made by the current process.
+"""
+
+import copyreg
+import sqlite3
+
+_journal = None
+_write_count = 0
+
+
+def start():
+    '''Starts recording the writes of the current (worker) process'''
+    global _journal
+    _journal = []
+    # Rows returned by get_sqlite_db_records are sent to the main process as tuples
+    copyreg.pickle(sqlite3.Row, lambda row: (tuple, (tuple(row),)))
+
+
+def is_recording():
+    '''Returns True if the writes of the current process are recorded'''
+    return _journal is not None
+
+
+def record(func, *args, **kwargs):
+    '''
+    Records a call to a writer function if the writes of the process are recorded.
+    Args:
+        func: A module-level function, pickled by reference when the journal is sent to the main process.
+        *args: The positional arguments of the call.
+        **kwargs: The keyword arguments of the call.
+    Returns:
+        True if the call was recorded and must not be executed, False otherwise.
+    '''
+    global _write_count
+    _write_count += 1
+    if _journal is None:
+        return False
+    _journal.append((func, args, kwargs))
+    return True
+
+
+def collect():
+    '''Returns the calls recorded so far and empties the journal'''
+    global _journal
+    if _journal is None:
+        return []
+    entries, _journal = _journal, []
+    return entries
+
+
+def replay(entries):
+    '''Executes the recorded calls in the order they were made'''
+    for func, args, kwargs in entries:
+        func(*args, **kwargs)
+
+
+def note_write():
+    '''Counts a write that is not journaled, such as an HTML report created by an artifact itself'''
+    global _write_count
+    _write_count += 1
+
+
+def get_write_count():
+    '''Returns the number of writes (recorded or not) made by the current process, to detect side effects'''
+    return _write_count